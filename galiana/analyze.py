@@ -13,15 +13,23 @@ import json
 import sqlite3
 import subprocess
 import sys
-from collections import Counter, defaultdict
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 CLAVAIN_DIR = Path.home() / ".clavain"
 TELEMETRY_FILE = CLAVAIN_DIR / "telemetry.jsonl"
 KPI_FILE = CLAVAIN_DIR / "galiana-kpis.json"
 TOOL_TIME_EVENTS_FILE = Path.home() / ".claude" / "tool-time" / "events.jsonl"
+SOURCE_CACHE_DIR = CLAVAIN_DIR / "galiana-cache"
+STORE_DIR = CLAVAIN_DIR / "galiana-store"
+
+# External sources: (deadline seconds, cache freshness seconds).
+LANDED_DEADLINE_S, LANDED_TTL_S = 10, 300
+INTERSTAT_DEADLINE_S, INTERSTAT_TTL_S = 10, 300
+CASS_DEADLINE_S, CASS_TTL_S = 30, 900
+INTERSPECT_DEADLINE_S, INTERSPECT_TTL_S = 5, 60
 
 
 def parse_timestamp(raw: Any) -> datetime | None:
@@ -63,66 +71,95 @@ def safe_rate(numerator: int, denominator: int) -> float | None:
     return round(numerator / denominator, 4)
 
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import interspect_db
+from eventstore import Dataset, EventStore, Frame, scan
+from sources import Source, SourceCache, collect
 from utils import iter_jsonl
 
 
+def _text(value: Any) -> str:
+    return value if isinstance(value, str) else ""
+
+
+def _telemetry_row(event: dict[str, Any]) -> tuple[float, dict[str, str]] | None:
+    ts = parse_timestamp(event.get("timestamp"))
+    if ts is None:
+        return None
+    return ts.timestamp(), {
+        "event": _text(event.get("event")),
+        "phase": _text(event.get("phase")),
+        "bead": str(event.get("bead", "")).strip(),
+        "session": str(event.get("session_id", "")).strip(),
+        "decision": str(event.get("decision", "")).lower(),
+        "tier": str(event.get("tier") or "unknown"),
+    }
+
+
+def _tool_time_row(event: dict[str, Any]) -> tuple[float, dict[str, str]] | None:
+    if event.get("event") not in {"PreToolUse", "ToolUse"}:
+        return None
+    ts = parse_timestamp(event.get("ts"))
+    if ts is None:
+        return None
+    return ts.timestamp(), {"session": extract_session_id(str(event.get("id", ""))).strip()}
+
+
+TELEMETRY = Dataset("telemetry", ("event", "phase", "bead", "session", "decision", "tier"), _telemetry_row)
+TOOL_TIME = Dataset("tool_time", ("session",), _tool_time_row)
+
+
+def load_events(
+    dataset: Dataset,
+    source: Path,
+    since: datetime,
+    until: datetime,
+    store_dir: Path | None,
+    rebuild: bool = False,
+) -> Frame:
+    """Rows of `source` in period, via the columnar store under store_dir
+    (ingesting any new lines first), or by scanning the file when None."""
+    if store_dir is None:
+        return scan(dataset, source, since, until)
+    store = EventStore(store_dir, dataset, source)
+    store.ingest(rebuild=rebuild)
+    return store.query(since, until)
+
+
 def load_telemetry_events(
     since: datetime,
     until: datetime,
     bead_filter: str | None,
-) -> tuple[list[dict[str, Any]], dict[str, str]]:
+    store_dir: Path | None = None,
+    rebuild: bool = False,
+) -> tuple[Frame, dict[str, str]]:
     """Load telemetry events in period; optionally filter to one bead.
 
-    Returns (events, session_to_bead).
+    Returns (events, session_to_bead). A session belongs to the bead on
+    its last event that names both.
     """
-    events: list[dict[str, Any]] = []
-    session_to_bead: dict[str, str] = {}
-
-    for event in iter_jsonl(TELEMETRY_FILE):
-        ts = parse_timestamp(event.get("timestamp"))
-        if ts is None or ts < since or ts > until:
-            continue
-
-        event["_ts"] = ts
-        events.append(event)
-
-        sid = str(event.get("session_id", "")).strip()
-        bead = str(event.get("bead", "")).strip()
-        if sid and bead:
-            session_to_bead[sid] = bead
+    events = load_events(TELEMETRY, TELEMETRY_FILE, since, until, store_dir, rebuild)
+    session_to_bead = events.last_by("session", "bead", events.all(events.nonempty("session"), events.nonempty("bead")))
 
     if not bead_filter:
         return events, session_to_bead
 
-    filtered: list[dict[str, Any]] = []
-    for event in events:
-        if event.get("bead") == bead_filter:
-            filtered.append(event)
-            continue
-        sid = str(event.get("session_id", "")).strip()
-        if sid and session_to_bead.get(sid) == bead_filter:
-            filtered.append(event)
-
     filtered_sessions = {sid: bead for sid, bead in session_to_bead.items() if bead == bead_filter}
-    return filtered, filtered_sessions
+    keep = events.either(events.eq("bead", bead_filter), events.isin("session", filtered_sessions))
+    return events.select(keep), filtered_sessions
 
 
-def load_tool_time_events(since: datetime, until: datetime) -> list[dict[str, Any]] | None:
+def load_tool_time_events(
+    since: datetime,
+    until: datetime,
+    store_dir: Path | None = None,
+    rebuild: bool = False,
+) -> Frame | None:
     """Load PreToolUse/ToolUse events in period, or None if unavailable."""
     if not TOOL_TIME_EVENTS_FILE.exists():
         return None
-
-    events: list[dict[str, Any]] = []
-    for event in iter_jsonl(TOOL_TIME_EVENTS_FILE):
-        if event.get("event") not in {"PreToolUse", "ToolUse"}:
-            continue
-        ts = parse_timestamp(event.get("ts"))
-        if ts is None or ts < since or ts > until:
-            continue
-        event["_ts"] = ts
-        event["_session_id"] = extract_session_id(str(event.get("id", "")))
-        events.append(event)
-    return events
+    return load_events(TOOL_TIME, TOOL_TIME_EVENTS_FILE, since, until, store_dir, rebuild)
 
 
 def find_findings_files(project_root: Path) -> list[Path]:
@@ -168,45 +205,44 @@ def load_findings_docs(files: list[Path], since: datetime, until: datetime) -> l
     return docs
 
 
-def compute_defect_escape_rate(events: list[dict[str, Any]]) -> tuple[dict[str, Any], set[str], int]:
+def compute_defect_escape_rate(events: Frame) -> tuple[dict[str, Any], set[str], int]:
     """Defect escape rate = defect reports / unique beads that reached done."""
-    defects = sum(1 for e in events if e.get("event") == "defect_report")
-    shipped = {
-        str(e.get("bead", "")).strip()
-        for e in events
-        if e.get("event") == "phase_transition"
-        and e.get("phase") == "done"
-        and str(e.get("bead", "")).strip()
-    }
+    defects = events.count(events.eq("event", "defect_report"))
+    shipped = events.unique("bead", events.all(
+        events.eq("event", "phase_transition"), events.eq("phase", "done"), events.nonempty("bead"),
+    ))
     return ({"value": safe_rate(defects, len(shipped)), "numerator": defects, "denominator": len(shipped)}, shipped, defects)
 
 
-def compute_human_override_rate(events: list[dict[str, Any]]) -> tuple[dict[str, Any], int, int]:
+def compute_human_override_rate(events: Frame) -> tuple[dict[str, Any], int, int]:
     """Override rate = gate_enforce(decision=skip) / gate_enforce(total)."""
-    gate_events = [e for e in events if e.get("event") == "gate_enforce"]
-    total = len(gate_events)
-    skipped = sum(1 for e in gate_events if str(e.get("decision", "")).lower() == "skip")
-
-    tier_totals: Counter[str] = Counter()
-    tier_skips: Counter[str] = Counter()
-    for event in gate_events:
-        tier = str(event.get("tier") or "unknown")
-        tier_totals[tier] += 1
-        if str(event.get("decision", "")).lower() == "skip":
-            tier_skips[tier] += 1
+    gates = events.eq("event", "gate_enforce")
+    skips = events.all(gates, events.eq("decision", "skip"))
+    total = events.count(gates)
+    skipped = events.count(skips)
+
+    tier_totals = events.value_counts("tier", gates)
+    tier_skips = events.value_counts("tier", skips)
 
     by_type: dict[str, dict[str, Any]] = {}
     for tier in sorted(tier_totals):
-        num = tier_skips[tier]
+        num = tier_skips.get(tier, 0)
         denom = tier_totals[tier]
         by_type[tier] = {"value": safe_rate(num, denom), "numerator": num, "denominator": denom}
 
     return ({"value": safe_rate(skipped, total), "numerator": skipped, "denominator": total, "by_type": by_type}, skipped, total)
 
 
+def workflow_sessions(events: Frame) -> set[str]:
+    """Session ids that started or ended a workflow."""
+    return events.unique("session", events.all(
+        events.isin("event", ("workflow_start", "workflow_end")), events.nonempty("session"),
+    ))
+
+
 def load_interspect_overrides(project: Path, since: datetime, until: datetime) -> dict[str, Any]:
     """Query interspect evidence DB for routing override events in the time window."""
-    db_path = project / ".clavain" / "interspect" / "interspect.db"
+    db_path = interspect_db.project_db(project)
     if not db_path.exists():
         return {"available": False}
 
@@ -214,43 +250,22 @@ def load_interspect_overrides(project: Path, since: datetime, until: datetime) -
     until_iso = until.strftime("%Y-%m-%dT%H:%M:%SZ")
 
     try:
-        conn = sqlite3.connect(str(db_path), timeout=5)
-        conn.row_factory = sqlite3.Row
-
-        # Total override events (both direct and disagreement-sourced)
-        total = conn.execute(
-            "SELECT COUNT(*) FROM evidence WHERE event IN ('override', 'disagreement_override') AND ts >= ? AND ts <= ?",
-            (since_iso, until_iso),
-        ).fetchone()[0]
-
-        # Wrong/miscalibrated overrides (agent was wrong)
-        wrong = conn.execute(
-            "SELECT COUNT(*) FROM evidence WHERE event IN ('override', 'disagreement_override') "
-            "AND override_reason IN ('agent_wrong', 'severity_miscalibrated') AND ts >= ? AND ts <= ?",
-            (since_iso, until_iso),
-        ).fetchone()[0]
-
-        # By override_reason
-        reason_rows = conn.execute(
-            "SELECT override_reason, COUNT(*) as cnt FROM evidence "
-            "WHERE event IN ('override', 'disagreement_override') AND ts >= ? AND ts <= ? "
-            "GROUP BY override_reason ORDER BY cnt DESC",
-            (since_iso, until_iso),
-        ).fetchall()
-        by_reason = {row["override_reason"] or "unknown": row["cnt"] for row in reason_rows}
-
-        conn.close()
-
-        return {
-            "available": True,
-            "total_overrides": total,
-            "agent_wrong_count": wrong,
-            "wrong_rate": safe_rate(wrong, total),
-            "by_reason": by_reason,
-        }
+        conn = interspect_db.connect_readonly(db_path)
+        try:
+            summary = interspect_db.override_summary(conn, since_iso, until_iso)
+        finally:
+            conn.close()
     except (sqlite3.Error, OSError):
         return {"available": False}
 
+    return {
+        "available": True,
+        "total_overrides": summary["total_overrides"],
+        "agent_wrong_count": summary["agent_wrong_count"],
+        "wrong_rate": safe_rate(summary["agent_wrong_count"], summary["total_overrides"]),
+        "by_reason": summary["by_reason"],
+    }
+
 
 def _find_cost_query_script() -> str | None:
     """Locate interstat cost-query.sh in standard paths."""
@@ -279,23 +294,41 @@ def _find_cost_query_script() -> str | None:
     return None
 
 
-def _query_interstat_tokens(shipped_bead_ids: set[str]) -> dict[str, Any] | None:
-    """Query real token data from interstat via cost-query.sh."""
+def _run_json(cmd: list[str], timeout: float, empty: str) -> Any:
+    """Run an external tool and parse its JSON stdout.
+
+    Raises on a nonzero exit, timeout or unparseable output, so collect()
+    can fall back to a stale cache entry instead of caching the failure."""
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    if result.returncode != 0:
+        detail = result.stderr.strip().splitlines()[-1:] or [""]
+        raise RuntimeError(f"{cmd[0]} {cmd[1]} exited {result.returncode}: {detail[0]}")
+    return json.loads(result.stdout.strip() or empty)
+
+
+def _or_none(fetch: Callable[..., Any], *args: Any) -> Any:
+    """Inline (uncollected) use of a raising fetcher: failure means no data."""
+    try:
+        return fetch(*args)
+    except Exception:
+        return None
+
+
+def _fetch_interstat_rows() -> list[dict[str, Any]] | None:
+    """Per-bead token rows from interstat via cost-query.sh.
+
+    None when interstat is not installed; raises when the query fails."""
     script = _find_cost_query_script()
     if not script:
         return None
+    rows = _run_json(["bash", script, "by-bead"], INTERSTAT_DEADLINE_S, "[]")
+    if not isinstance(rows, list):
+        raise ValueError(f"cost-query.sh by-bead: expected a list, got {type(rows).__name__}")
+    return rows
 
-    try:
-        result = subprocess.run(
-            ["bash", script, "by-bead"],
-            capture_output=True, text=True, timeout=10,
-        )
-        if result.returncode != 0:
-            return None
-        rows = json.loads(result.stdout.strip() or "[]")
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, OSError):
-        return None
 
+def _summarize_interstat_tokens(rows: list[dict[str, Any]] | None, shipped_bead_ids: set[str]) -> dict[str, Any] | None:
+    """Token statistics over the interstat rows for shipped beads."""
     if not rows:
         return None
 
@@ -322,60 +355,76 @@ def _query_interstat_tokens(shipped_bead_ids: set[str]) -> dict[str, Any] | None
     }
 
 
+def _query_interstat_tokens(shipped_bead_ids: set[str]) -> dict[str, Any] | None:
+    """Query real token data from interstat via cost-query.sh."""
+    return _summarize_interstat_tokens(_or_none(_fetch_interstat_rows), shipped_bead_ids)
+
+
 def _query_cass_analytics(workspace: str | None = None, days: int = 30) -> dict[str, Any] | None:
-    """Query cross-agent token analytics from cass (supplementary view)."""
+    """Query cross-agent token analytics from cass (supplementary view).
+
+    None when cass is not installed; raises when the query fails."""
     import shutil
     if not shutil.which("cass"):
         return None
-    try:
-        cmd = ["cass", "analytics", "tokens", f"--days={days}", "--json"]
-        if workspace:
-            cmd.extend(["--workspace", workspace])
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode != 0:
-            return None
-        return json.loads(result.stdout)
-    except Exception:
-        return None
+    cmd = ["cass", "analytics", "tokens", f"--days={days}", "--json"]
+    if workspace:
+        cmd.extend(["--workspace", workspace])
+    return _run_json(cmd, CASS_DEADLINE_S, "null")
 
 
 def _query_landed_changes(bead_filter: str | None = None) -> dict[str, Any] | None:
-    """Query canonical landed_changes via ic landed summary --json."""
-    try:
-        cmd = ["ic", "landed", "summary", "--json"]
-        if bead_filter:
-            cmd.append(f"--bead={bead_filter}")
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if result.returncode != 0:
-            return None
-        data = json.loads(result.stdout.strip() or "{}")
-        if not isinstance(data, dict) or data.get("total", 0) == 0:
-            return None
-        return data
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, OSError, FileNotFoundError):
+    """Query canonical landed_changes via ic landed summary --json.
+
+    None when ic is not installed or nothing has landed; raises when the
+    query fails."""
+    import shutil
+    if not shutil.which("ic"):
         return None
+    cmd = ["ic", "landed", "summary", "--json"]
+    if bead_filter:
+        cmd.append(f"--bead={bead_filter}")
+    data = _run_json(cmd, LANDED_DEADLINE_S, "{}")
+    if not isinstance(data, dict):
+        raise ValueError(f"ic landed summary: expected an object, got {type(data).__name__}")
+    return data if data.get("total", 0) else None
+
+
+_FETCH = object()  # compute_cost_per_landed_change: query the source inline
 
 
 def compute_cost_per_landed_change(
-    tool_events: list[dict[str, Any]] | None,
+    tool_events: Frame | None,
     shipped_beads: set[str],
     bead_sessions: set[str],
     bead_filter: str | None = None,
+    landed: Any = _FETCH,
+    interstat_rows: Any = _FETCH,
 ) -> dict[str, Any]:
     """Compute cost per landed change.
 
     Primary: ic landed summary (canonical landed_changes table) + interstat tokens.
     Fallback 1: interstat tokens correlated with shipped beads.
     Fallback 2: tool-time proxy (tool call count per bead).
+
+    `landed` / `interstat_rows` take already-collected source results
+    (None = unavailable); by default each is queried here.
     """
+    def token_rows() -> list[dict[str, Any]] | None:
+        nonlocal interstat_rows
+        if interstat_rows is _FETCH:
+            interstat_rows = _or_none(_fetch_interstat_rows)
+        return interstat_rows
+
     # Primary: canonical landed_changes
-    landed = _query_landed_changes(bead_filter)
+    if landed is _FETCH:
+        landed = _or_none(_query_landed_changes, bead_filter)
     if landed is not None:
         landed_count = landed["total"] - landed.get("reverted", 0)
         if landed_count > 0:
             # Get bead IDs from landed changes for interstat correlation
             landed_bead_ids = set(landed.get("by_bead", {}).keys())
-            token_data = _query_interstat_tokens(landed_bead_ids) if landed_bead_ids else None
+            token_data = _summarize_interstat_tokens(token_rows(), landed_bead_ids) if landed_bead_ids else None
             result: dict[str, Any] = {
                 "landed_changes": landed_count,
                 "source": "ic_landed",
@@ -391,7 +440,7 @@ def compute_cost_per_landed_change(
     if not shipped_beads:
         return {"avg_tools": None, "avg_sessions": None, "note": "no shipped beads in selected period", "source": "none"}
 
-    token_data = _query_interstat_tokens(shipped_beads)
+    token_data = _summarize_interstat_tokens(token_rows(), shipped_beads)
     if token_data is not None:
         result = {**token_data, "landed_changes": len(shipped_beads), "source": "interstat+shipped_beads"}
         if tool_events is not None:
@@ -405,14 +454,14 @@ def compute_cost_per_landed_change(
     scoped = tool_events
     note: str | None = None
     if bead_sessions:
-        matched = [e for e in tool_events if e.get("_session_id") in bead_sessions]
-        if matched:
-            scoped = matched
+        matched = tool_events.isin("session", bead_sessions)
+        if tool_events.count(matched):
+            scoped = tool_events.select(matched)
         else:
             note = "no telemetry session links to tool-time events; used full period"
 
     tool_count = len(scoped)
-    session_count = len({str(e.get("_session_id", "")).strip() for e in scoped if str(e.get("_session_id", "")).strip()})
+    session_count = len(scoped.unique("session", scoped.nonempty("session")))
     shipped_count = len(shipped_beads)
 
     result = {
@@ -613,39 +662,98 @@ def compute_eval_health(results: list[dict[str, Any]]) -> dict[str, Any]:
     }
 
 
-def run_analysis(since: datetime, project: Path, bead_filter: str | None = None) -> dict[str, Any]:
-    """Compute full KPI payload."""
+def analysis_sources(
+    since: datetime,
+    until: datetime,
+    project: Path,
+    bead_filter: str | None,
+    store_dir: Path | None = None,
+    rebuild_store: bool = False,
+) -> list[Source]:
+    """Every input run_analysis reads, for concurrent collection.
+
+    Local files are waited for (event streams via the columnar store);
+    external tools get their deadlines and a freshness-windowed cache.
+    Cache keys leave out `until` (always "now"), so a cached result may
+    trail the newest evidence by up to its TTL."""
+    days = (until - since).days or 30
+    window = since.strftime("%Y-%m-%d")
+
+    def findings() -> tuple[list[Path], list[dict[str, Any]]]:
+        files = find_findings_files(project)
+        return files, load_findings_docs(files, since, until)
+
+    return [
+        Source("telemetry", lambda: load_telemetry_events(since, until, bead_filter, store_dir, rebuild_store)),
+        Source("tool_time", lambda: load_tool_time_events(since, until, store_dir, rebuild_store)),
+        Source("findings", findings),
+        Source("topology", lambda: load_topology_results(since, until)),
+        Source("eval", lambda: load_eval_results(since, until)),
+        Source(
+            "interspect", lambda: load_interspect_overrides(project, since, until),
+            deadline_s=INTERSPECT_DEADLINE_S, ttl_s=INTERSPECT_TTL_S, key=[str(project), window],
+        ),
+        Source(
+            "landed", lambda: _query_landed_changes(bead_filter),
+            deadline_s=LANDED_DEADLINE_S, ttl_s=LANDED_TTL_S, key=[bead_filter],
+        ),
+        Source("interstat", _fetch_interstat_rows, deadline_s=INTERSTAT_DEADLINE_S, ttl_s=INTERSTAT_TTL_S),
+        Source(
+            "cass", lambda: _query_cass_analytics(workspace=str(project), days=days),
+            deadline_s=CASS_DEADLINE_S, ttl_s=CASS_TTL_S, key=[str(project), days],
+        ),
+    ]
+
+
+def run_analysis(
+    since: datetime,
+    project: Path,
+    bead_filter: str | None = None,
+    cache_dir: Path | None = SOURCE_CACHE_DIR,
+    refresh: bool = False,
+    store_dir: Path | None = STORE_DIR,
+    rebuild_store: bool = False,
+) -> dict[str, Any]:
+    """Compute full KPI payload.
+
+    Telemetry and tool-time events are read from the columnar store under
+    store_dir (None = scan the JSONL files directly). All sources are
+    collected concurrently first; a source that misses its deadline or
+    fails contributes nothing and is reported under "sources" (see
+    sources.collect for the status values)."""
     until = datetime.now(timezone.utc)
 
-    telemetry_events, _session_to_bead = load_telemetry_events(since, until, bead_filter)
+    collected, source_status = collect(
+        analysis_sources(since, until, project, bead_filter, store_dir, rebuild_store),
+        cache=SourceCache(cache_dir) if cache_dir is not None else None,
+        refresh=refresh,
+    )
+
+    telemetry_events, _session_to_bead = collected["telemetry"] or (Frame.empty(TELEMETRY.columns), {})
     defect_escape_rate, shipped_beads, defect_count = compute_defect_escape_rate(telemetry_events)
     human_override_rate, gate_skip_count, gate_total = compute_human_override_rate(telemetry_events)
 
-    bead_sessions = {
-        str(e.get("session_id", "")).strip()
-        for e in telemetry_events
-        if e.get("event") in {"workflow_start", "workflow_end"} and str(e.get("session_id", "")).strip()
-    }
+    bead_sessions = workflow_sessions(telemetry_events)
 
-    tool_events = load_tool_time_events(since, until)
-    cost_per_landed_change = compute_cost_per_landed_change(tool_events, shipped_beads, bead_sessions, bead_filter)
+    tool_events = collected["tool_time"]
+    cost_per_landed_change = compute_cost_per_landed_change(
+        tool_events, shipped_beads, bead_sessions, bead_filter,
+        landed=collected["landed"], interstat_rows=collected["interstat"],
+    )
 
-    days = (until - since).days or 30
-    repo_path_str = str(project)
-    cass_data = _query_cass_analytics(workspace=repo_path_str, days=days)
+    cass_data = collected["cass"]
     if cass_data:
         cost_per_landed_change["cross_agent_analytics"] = cass_data
 
-    findings_files = find_findings_files(project)
-    findings_docs = load_findings_docs(findings_files, since, until)
+    findings_files, findings_docs = collected["findings"] or ([], [])
     redundant_work_ratio, agent_scorecard = compute_findings_metrics(findings_docs)
 
-    interspect_overrides = load_interspect_overrides(project, since, until)
+    interspect_overrides = collected["interspect"] or {"available": False}
 
-    topology_results = load_topology_results(since, until)
+    topology_results = collected["topology"] or []
     topology_efficiency = compute_topology_efficiency(topology_results)
 
-    eval_results = load_eval_results(since, until)
+    eval_results = collected["eval"] or []
     eval_health = compute_eval_health(eval_results)
 
     advisories: list[dict[str, str]] = [{
@@ -676,6 +784,14 @@ def run_analysis(since: datetime, project: Path, bead_filter: str | None = None)
             "level": "info",
             "message": "No eval harness results. Run /clavain:galiana eval to test golden fixtures.",
         })
+    for name, state in source_status.items():
+        if state["status"] in {"timeout", "error", "stale"}:
+            detail = state.get("reason", state["status"])
+            advisories.append({
+                "level": "warning",
+                "message": f"Source '{name}' {detail}"
+                + (f" — using cached result from {state['age_s']:.0f}s ago." if state["status"] == "stale" else " — KPIs omit it."),
+            })
 
     return {
         "generated": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
@@ -697,6 +813,7 @@ def run_analysis(since: datetime, project: Path, bead_filter: str | None = None)
         },
         "agent_scorecard": agent_scorecard,
         "advisories": advisories,
+        "sources": source_status,
     }
 
 
@@ -705,12 +822,20 @@ def main() -> None:
     parser.add_argument("--since", type=parse_date_arg, help="Start date (YYYY-MM-DD), default: 30 days ago")
     parser.add_argument("--project", help="Project path for findings discovery (default: current directory)")
     parser.add_argument("--bead", help="Filter telemetry to a specific bead ID")
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached external-source results")
+    parser.add_argument("--no-cache", action="store_true", help="Neither read nor write the source cache")
+    parser.add_argument("--rebuild-store", action="store_true", help="Re-ingest the event store from scratch")
+    parser.add_argument("--no-store", action="store_true", help="Scan event JSONL directly instead of the event store")
     args = parser.parse_args()
 
     since = args.since or (datetime.now(timezone.utc) - timedelta(days=30))
     project = Path(args.project).expanduser().resolve() if args.project else Path.cwd()
 
-    result = run_analysis(since=since, project=project, bead_filter=args.bead)
+    result = run_analysis(
+        since=since, project=project, bead_filter=args.bead,
+        cache_dir=None if args.no_cache else SOURCE_CACHE_DIR, refresh=args.refresh,
+        store_dir=None if args.no_store else STORE_DIR, rebuild_store=args.rebuild_store,
+    )
     KPI_FILE.parent.mkdir(parents=True, exist_ok=True)
     KPI_FILE.write_text(json.dumps(result, indent=2) + "\n")
     print(str(KPI_FILE))
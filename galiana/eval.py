@@ -2,22 +2,28 @@
 """Galiana property-based agent evaluation harness.
 
 Runs golden fixtures through agent topologies, checks property assertions,
-scores via interbench, and detects regressions.
+and detects regressions natively against rolling baselines in
+eval-results.jsonl (see regression.py). Export to interbench is optional.
 """
 
 from __future__ import annotations
 
 import argparse
 import fnmatch
+import hashlib
 import json
+import os
+import re
 import shutil
 import subprocess
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
 from time import time
 from typing import Any
 
-from utils import normalize_title, titles_match
+from regression import ResultIndex, detect_regressions, format_regressions
+from utils import iter_jsonl, normalize_title, titles_match
 
 CLAVAIN_DIR = Path.home() / ".clavain"
 EVAL_RESULTS_FILE = CLAVAIN_DIR / "eval-results.jsonl"
@@ -34,7 +40,8 @@ def load_fixtures(golden_dir: Path, fixture_filter: str = "*") -> list[dict]:
         fixture_filter: fnmatch pattern to filter fixtures
 
     Returns:
-        List of dicts: {"name": str, "path": Path, "meta": dict, "baseline": dict}
+        List of dicts: {"name": str, "path": Path, "meta": dict, "baseline": dict,
+        "hash": str} — hash covers meta, baseline and the input files
     """
     fixtures: list[dict] = []
 
@@ -57,8 +64,10 @@ def load_fixtures(golden_dir: Path, fixture_filter: str = "*") -> list[dict]:
             continue
 
         try:
-            meta = json.loads(meta_file.read_text())
-            baseline = json.loads(baseline_file.read_text())
+            meta_bytes = meta_file.read_bytes()
+            baseline_bytes = baseline_file.read_bytes()
+            meta = json.loads(meta_bytes)
+            baseline = json.loads(baseline_bytes)
         except (OSError, json.JSONDecodeError) as e:
             print(f"WARN: Skipping {candidate.name}: {e}", file=sys.stderr)
             continue
@@ -67,12 +76,116 @@ def load_fixtures(golden_dir: Path, fixture_filter: str = "*") -> list[dict]:
             "name": candidate.name,
             "path": candidate,
             "meta": meta,
-            "baseline": baseline
+            "baseline": baseline,
+            "hash": hash_fixture(fixture_input_path(candidate, meta), meta_bytes, baseline_bytes)
         })
 
     return fixtures
 
 
+def fixture_input_path(fixture_path: Path, meta: dict) -> Path:
+    """Input a fixture's agents review (meta "input", default input/)."""
+    input_rel = meta.get("input", "input/")
+    if not input_rel.startswith("/"):
+        return fixture_path / input_rel
+    return Path(input_rel)
+
+
+def _hash_tree(digest: Any, root: Path) -> None:
+    """Feed relative paths and contents under root (or root itself) into digest."""
+    files = sorted(p for p in root.rglob("*") if p.is_file()) if root.is_dir() else [root]
+    for path in files:
+        rel = path.relative_to(root).as_posix() if root.is_dir() else path.name
+        try:
+            data = path.read_bytes()
+        except OSError:
+            data = b"<missing>"
+        digest.update(f"{rel}\0{len(data)}\0".encode())
+        digest.update(data)
+
+
+def hash_fixture(input_path: Path, meta_bytes: bytes, baseline_bytes: bytes) -> str:
+    """Content hash of a fixture: meta.json, baseline.json and its input files."""
+    digest = hashlib.sha256()
+    for part in (meta_bytes, baseline_bytes):
+        digest.update(f"{len(part)}\0".encode())
+        digest.update(part)
+    _hash_tree(digest, input_path)
+    return digest.hexdigest()[:16]
+
+
+def agent_search_roots(script_dir: Path) -> list[Path]:
+    """Plugin roots that may hold agent definitions, most specific first.
+
+    GALIANA_AGENT_ROOTS (colon-separated plugin roots) wins, then this
+    plugin, the monorepo's interverse/ checkouts, and the plugin cache."""
+    roots = [Path(p) for p in os.environ.get("GALIANA_AGENT_ROOTS", "").split(":") if p]
+    roots.append(script_dir.parent)
+    monorepo = script_dir.parent.parent.parent / "interverse"
+    if monorepo.is_dir():
+        roots.extend(sorted(p for p in monorepo.iterdir() if p.is_dir()))
+    cache = Path.home() / ".claude" / "plugins" / "cache"
+    if cache.is_dir():
+        # <marketplace>/<plugin>/<version>/ — each plugin's newest version first
+        for plugin in sorted(cache.glob("*/*")):
+            versions = [v for v in plugin.iterdir() if v.is_dir()] if plugin.is_dir() else []
+            roots.extend(sorted(versions, key=_version_key, reverse=True))
+    return roots
+
+
+def _version_key(path: Path) -> tuple[tuple[int, ...], float]:
+    """Plugin cache version dirs by release number (0.10.0 after 0.9.0),
+    then mtime — which alone orders non-numeric names like commit SHAs."""
+    m = re.match(r"v?(\d+(?:\.\d+)*)", path.name)
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        mtime = 0.0
+    return (tuple(int(x) for x in m.group(1).split(".")) if m else (), mtime)
+
+
+def resolve_agent_file(agent: str, roots: list[Path]) -> Path | None:
+    """Definition file for "plugin:category:name" (or a bare name)."""
+    parts = agent.split(":")
+    plugin, name = (parts[0] if len(parts) > 1 else None), parts[-1]
+    category = parts[1] if len(parts) > 2 else "*"
+    for root in roots:
+        if plugin and root.name != plugin and root.parent.name != plugin:
+            continue
+        matches = sorted(root.glob(f"agents/{category}/{name}.md"))
+        if matches:
+            return matches[0]
+    return None
+
+
+def hash_topology(agents: list[str], script_dir: Path, roots: list[Path] | None = None) -> str:
+    """Content hash of a topology: its agent definitions plus shadow-review.sh.
+
+    An agent whose definition can't be found hashes as missing, so the
+    pair re-runs once it appears."""
+    roots = agent_search_roots(script_dir) if roots is None else roots
+    digest = hashlib.sha256()
+    for agent in sorted(agents):
+        digest.update(f"{agent}\0".encode())
+        agent_file = resolve_agent_file(agent, roots)
+        if agent_file is None:
+            digest.update(b"<missing>")
+        else:
+            _hash_tree(digest, agent_file)
+    _hash_tree(digest, script_dir / "shadow-review.sh")
+    return digest.hexdigest()[:16]
+
+
+def load_prior_results() -> dict[tuple[str, str, str, str], dict]:
+    """Latest eval record per (fixture, topology, fixture_hash, topology_hash)."""
+    prior: dict[tuple[str, str, str, str], dict] = {}
+    for record in iter_jsonl(EVAL_RESULTS_FILE):
+        key = (record.get("fixture"), record.get("topology"), record.get("fixture_hash"), record.get("topology_hash"))
+        if all(isinstance(k, str) for k in key):
+            prior[key] = record
+    return prior
+
+
 def load_topologies() -> dict:
     """Read topologies.json from same directory as this script.
 
@@ -148,13 +261,7 @@ def run_fixture_eval(
     all_findings: list[dict[str, Any]] = []
     agents_completed: list[str] = []
 
-    # Determine input path
-    meta = fixture["meta"]
-    input_rel = meta.get("input", "input/")
-    if not input_rel.startswith("/"):
-        input_path = str(fixture_path / input_rel)
-    else:
-        input_path = input_rel
+    input_path = str(fixture_input_path(fixture_path, fixture["meta"]))
 
     start_time = time()
 
@@ -376,7 +483,7 @@ def score_via_interbench(
     property_results: list[dict],
     interbench_bin: Path
 ) -> str | None:
-    """Score run via interbench.
+    """Export one run's scores to interbench.
 
     Args:
         fixture_name: Name of fixture
@@ -447,48 +554,45 @@ def score_via_interbench(
         return None
 
 
-def detect_regression(
-    current_run_id: str,
-    previous_run_id: str,
-    interbench_bin: Path
-) -> list[dict]:
-    """Compare two interbench runs and detect regressions.
+def export_to_interbench(runs: list[dict], interbench_bin: Path) -> int:
+    """Batch-export finished runs to interbench, after gating is decided.
 
     Args:
-        current_run_id: Current run ID
-        previous_run_id: Previous run ID to compare against
+        runs: Dicts with fixture_name, topology, metrics, property_results
         interbench_bin: Path to interbench binary
 
     Returns:
-        List of regression dicts
+        Number of runs exported
     """
-    try:
-        result = subprocess.run(
-            [str(interbench_bin), "compare", current_run_id, previous_run_id],
-            capture_output=True,
-            text=True,
-            check=False
-        )
+    exported = 0
+    for run in runs:
+        if score_via_interbench(interbench_bin=interbench_bin, **run) is not None:
+            exported += 1
+    return exported
 
-        if result.returncode != 0:
-            print(f"WARN: interbench compare failed: {result.stderr[:200]}", file=sys.stderr)
-            return []
-
-        # Parse output for regressions (simplified - actual format may vary)
-        regressions: list[dict] = []
-        for line in result.stdout.splitlines():
-            # Look for lines indicating score deltas
-            if "worse" in line.lower() or "regression" in line.lower():
-                regressions.append({
-                    "description": line.strip(),
-                    "threshold_exceeded": True
-                })
 
-        return regressions
+def check_regressions(
+    date: str | None = None,
+    pairs: set[tuple[str, str]] | None = None,
+    window: int = 10,
+) -> list[dict]:
+    """Detect and print significant drops vs the rolling baseline.
 
-    except (OSError, subprocess.SubprocessError) as e:
-        print(f"WARN: regression detection failed: {e}", file=sys.stderr)
-        return []
+    Args:
+        date: Result date to check (default: latest in eval-results.jsonl)
+        pairs: (fixture, topology) combinations to check (default: all)
+        window: Baseline dates per series
+
+    Returns:
+        List of regression dicts (see regression.detect_regressions)
+    """
+    regressions = detect_regressions(ResultIndex.load(EVAL_RESULTS_FILE), date=date, pairs=pairs, window=window)
+    if regressions:
+        print(f"\nRegressions ({len(regressions)}): current vs baseline mean [95% CI]")
+        print(format_regressions(regressions))
+    else:
+        print("\nNo significant regressions vs rolling baseline")
+    return regressions
 
 
 def append_eval_result(
@@ -496,7 +600,9 @@ def append_eval_result(
     topology: str,
     property_results: list[dict],
     metrics: dict,
-    duration: float
+    duration: float,
+    fixture_hash: str = "",
+    topology_hash: str = ""
 ) -> None:
     """Append evaluation result to JSONL log.
 
@@ -506,9 +612,9 @@ def append_eval_result(
         property_results: Property check results
         metrics: Computed metrics
         duration: Duration in seconds
+        fixture_hash: hash_fixture of the fixture evaluated
+        topology_hash: hash_topology of the topology evaluated
     """
-    from datetime import datetime, timezone
-
     total_properties = len(property_results)
     passed_properties = sum(1 for p in property_results if p["passed"])
     property_pass_rate = passed_properties / total_properties if total_properties > 0 else 0.0
@@ -523,7 +629,9 @@ def append_eval_result(
         "avg_recall": metrics.get("recall"),
         "precision": metrics.get("precision"),
         "false_positive_rate": metrics.get("false_positive_rate"),
-        "duration_seconds": int(duration)
+        "duration_seconds": int(duration),
+        "fixture_hash": fixture_hash,
+        "topology_hash": topology_hash
     }
 
     EVAL_RESULTS_FILE.parent.mkdir(parents=True, exist_ok=True)
@@ -536,9 +644,10 @@ def run_eval(
     topologies: dict,
     fixture_filter: str,
     dry_run: bool,
-    no_interbench: bool,
+    interbench_export: bool,
     project_dir: Path,
-    previous_run: str | None
+    baseline_window: int = 10,
+    changed_only: bool = False
 ) -> int:
     """Main evaluation orchestrator.
 
@@ -547,9 +656,11 @@ def run_eval(
         topologies: Topology definitions
         fixture_filter: fnmatch pattern for fixtures
         dry_run: Print summary without running
-        no_interbench: Skip interbench scoring
+        interbench_export: Also export scores to interbench after gating
         project_dir: Project root directory
-        previous_run: Previous run ID for regression detection
+        baseline_window: Baseline dates per series for regression detection
+        changed_only: Re-run only pairs whose fixture or topology hash has
+            no recorded result; carry the recorded result forward otherwise
 
     Returns:
         Exit code (0=pass, 1=property fail, 2=regression)
@@ -565,24 +676,31 @@ def run_eval(
 
     print(f"Loaded {len(fixtures)} fixtures", file=sys.stderr)
 
+    roots = agent_search_roots(script_dir)
+    topology_hashes = {name: hash_topology(config.get("agents", []), script_dir, roots) for name, config in topologies.items()}
+    prior = load_prior_results() if changed_only else {}
+    carried = {
+        (f["name"], topo): prior[(f["name"], topo, f["hash"], topology_hashes[topo])]
+        for f in fixtures for topo in topologies
+        if (f["name"], topo, f["hash"], topology_hashes[topo]) in prior
+    }
+    if changed_only:
+        print(f"Unchanged since last recorded result: {len(carried)} of {len(fixtures) * len(topologies)} evaluations", file=sys.stderr)
+
     if dry_run:
-        print(f"\nDry run: would execute {len(fixtures) * len(topologies)} evaluations", file=sys.stderr)
+        print(f"\nDry run: would execute {len(fixtures) * len(topologies) - len(carried)} evaluations", file=sys.stderr)
         print(f"Fixtures: {', '.join(f['name'] for f in fixtures)}", file=sys.stderr)
         print(f"Topologies: {', '.join(topologies.keys())}", file=sys.stderr)
         return 0
 
-    # Find interbench
-    interbench_bin = None if no_interbench else find_interbench()
-    if not no_interbench and interbench_bin is None:
-        print("WARN: interbench not found, skipping benchmark scoring", file=sys.stderr)
-
     # Track results for summary
     all_results: list[dict] = []
+    exports: list[dict] = []
     property_failures = 0
     low_recall_count = 0
 
     # Run evaluations
-    total_runs = len(fixtures) * len(topologies)
+    total_runs = len(fixtures) * len(topologies) - len(carried)
     run_count = 0
 
     for fixture in fixtures:
@@ -593,6 +711,26 @@ def run_eval(
         expected_properties = meta.get("expected_properties", [])
 
         for topo_name in topologies:
+            record = carried.get((fixture_name, topo_name))
+            if record is not None:
+                passed_props = record.get("passed_properties", 0)
+                total_props = record.get("total_properties", 0)
+                if passed_props < total_props:
+                    property_failures += 1
+                recall = record.get("avg_recall")
+                if recall is not None and recall < 0.85:
+                    low_recall_count += 1
+                all_results.append({
+                    "fixture": fixture_name,
+                    "topology": topo_name,
+                    "properties": f"{passed_props}/{total_props}",
+                    "recall": recall,
+                    "precision": record.get("precision"),
+                    "duration": record.get("duration_seconds", 0),
+                    "carried_from": record.get("date")
+                })
+                continue
+
             run_count += 1
             print(f"\n[{run_count}/{total_runs}] Running {fixture_name} with {topo_name}...", file=sys.stderr)
 
@@ -618,16 +756,12 @@ def run_eval(
             # Compute metrics
             metrics = compute_baseline_metrics(findings, baseline_findings)
 
-            # Score via interbench
-            run_id = None
-            if interbench_bin:
-                run_id = score_via_interbench(
-                    fixture_name=fixture_name,
-                    topology=topo_name,
-                    metrics=metrics,
-                    property_results=property_results,
-                    interbench_bin=interbench_bin
-                )
+            exports.append({
+                "fixture_name": fixture_name,
+                "topology": topo_name,
+                "metrics": metrics,
+                "property_results": property_results
+            })
 
             # Append to JSONL
             append_eval_result(
@@ -635,7 +769,9 @@ def run_eval(
                 topology=topo_name,
                 property_results=property_results,
                 metrics=metrics,
-                duration=duration
+                duration=duration,
+                fixture_hash=fixture["hash"],
+                topology_hash=topology_hashes[topo_name]
             )
 
             # Track for summary
@@ -678,6 +814,7 @@ def run_eval(
             f"{recall_str:<7} "
             f"{prec_str:<7} "
             f"{result['duration']}s"
+            + (f"  (unchanged, from {result['carried_from']})" if result.get("carried_from") else "")
         )
 
     print("-"*80)
@@ -692,16 +829,26 @@ def run_eval(
     print(f"\nOverall: {passed_props_all}/{total_props_all} properties passed, avg recall {avg_recall:.2f}")
     print(f"\nResults appended to {EVAL_RESULTS_FILE}")
 
-    # Regression detection
-    if previous_run and interbench_bin:
-        # Note: This is simplified - would need to map fixtures to run IDs
-        print("\nRegression detection not fully implemented (needs run ID mapping)", file=sys.stderr)
+    # Regression detection against the rolling baseline (this run's date)
+    regressions = check_regressions(
+        pairs={(r["fixture"], r["topology"]) for r in all_results if not r.get("carried_from")},
+        date=datetime.now(timezone.utc).strftime("%Y-%m-%d"),
+        window=baseline_window
+    )
+
+    if interbench_export:
+        interbench_bin = find_interbench()
+        if interbench_bin is None:
+            print("WARN: interbench not found, skipping export", file=sys.stderr)
+        else:
+            exported = export_to_interbench(exports, interbench_bin)
+            print(f"Exported {exported}/{len(exports)} runs to interbench", file=sys.stderr)
 
     # Return appropriate exit code
     if property_failures > 0:
         return 1
 
-    if low_recall_count > 0:
+    if low_recall_count > 0 or regressions:
         return 2  # Recall regression
 
     return 0
@@ -725,22 +872,53 @@ def main() -> None:
         action="store_true",
         help="Print summary without running agents"
     )
+    parser.add_argument(
+        "--interbench",
+        action="store_true",
+        help="Also export scores to interbench (batch, after gating)"
+    )
     parser.add_argument(
         "--no-interbench",
         action="store_true",
-        help="Skip interbench scoring"
+        help=argparse.SUPPRESS  # export is opt-in now; kept for old invocations
     )
     parser.add_argument(
         "--project",
         help="Project root directory (default: current directory)"
     )
     parser.add_argument(
-        "--previous-run",
-        help="Previous run ID for regression detection"
+        "--changed-only",
+        action="store_true",
+        help="Re-run only fixture/topology pairs whose content hashes changed"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only check recorded results for regressions (no agents run)"
+    )
+    parser.add_argument(
+        "--date",
+        help="With --check: result date to check (default: latest recorded)"
+    )
+    parser.add_argument(
+        "--baseline-window",
+        type=int,
+        default=10,
+        help="Prior result dates per fixture/topology in the baseline (default: 10)"
     )
 
     args = parser.parse_args()
 
+    if args.check:
+        topo_filter = {t.strip() for t in args.topologies.split(",") if t.strip()} if args.topologies else None
+        index = ResultIndex.load(EVAL_RESULTS_FILE)
+        pairs = {
+            (fixture, topology) for fixture, topology in index.series
+            if fnmatch.fnmatch(fixture, args.fixtures) and (topo_filter is None or topology in topo_filter)
+        }
+        regressions = check_regressions(date=args.date, pairs=pairs, window=args.baseline_window)
+        sys.exit(2 if regressions else 0)
+
     # Parse topologies
     all_topologies = load_topologies()
     if args.topologies:
@@ -767,9 +945,10 @@ def main() -> None:
         topologies=selected_topologies,
         fixture_filter=args.fixtures,
         dry_run=args.dry_run,
-        no_interbench=args.no_interbench,
+        interbench_export=args.interbench,
         project_dir=project_dir,
-        previous_run=args.previous_run
+        baseline_window=args.baseline_window,
+        changed_only=args.changed_only
     )
 
     sys.exit(exit_code)
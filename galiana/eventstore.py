@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""Columnar, day-partitioned store for Galiana event streams.
+
+An append-only JSONL source (telemetry, tool-time) is ingested into
+typed columns: a float64 timestamp column plus one int32 column per
+string field, dictionary-encoded against a per-dataset string table
+(code 0 is always ""). Each UTC day is a directory of raw little-endian
+column files, so ingest only appends the bytes for new lines and a
+query only reads the days it covers:
+
+    <root>/<dataset>/manifest.json     strings, source offset, row counts
+    <root>/<dataset>/<YYYY-MM-DD>/ts.f64, <column>.i32 ...
+
+Queries return a Frame whose filters and group-bys run vectorized with
+NumPy when it is installed, and over the same typed arrays in plain
+Python otherwise — the on-disk format does not depend on NumPy.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import shutil
+import sys
+import tempfile
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+try:
+    import numpy as np
+except ImportError:  # optional: pure-Python column ops
+    np = None
+
+STORE_FORMAT = 1
+_LITTLE = sys.byteorder == "little"
+
+# A row: (unix seconds, {column: string}) or None to skip the record.
+RowFn = Callable[[dict[str, Any]], "tuple[float, dict[str, str]] | None"]
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """How to turn one JSONL record into a row."""
+
+    name: str
+    columns: tuple[str, ...]
+    row: RowFn
+
+
+def _read_column(path: Path, typecode: str, count: int):
+    """The first `count` values of a column file (extra tail bytes from an
+    interrupted append are ignored)."""
+    if np is not None:
+        dtype = "<f8" if typecode == "d" else "<i4"
+        return np.fromfile(path, dtype=dtype, count=count) if count else np.empty(0, dtype=dtype)
+    values = array(typecode)
+    with open(path, "rb") as f:
+        values.frombytes(f.read(count * values.itemsize))
+    if not _LITTLE:
+        values.byteswap()
+    return values
+
+
+def _to_bytes(values: array) -> bytes:
+    if not _LITTLE:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _encode(lines: Iterable[bytes], dataset: Dataset, strings: list[str]) -> dict[str, tuple[array, dict[str, array]]]:
+    """Rows for JSONL lines, grouped by UTC day. New strings are appended
+    to `strings` (the dataset's dictionary) in place."""
+    codes = {s: i for i, s in enumerate(strings)}
+    by_day: dict[str, tuple[array, dict[str, array]]] = {}
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(record, dict):
+            continue
+        row = dataset.row(record)
+        if row is None:
+            continue
+        ts, fields = row
+        day = datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d")
+        if day not in by_day:
+            by_day[day] = (array("d"), {c: array("i") for c in dataset.columns})
+        ts_col, cols = by_day[day]
+        ts_col.append(ts)
+        for column in dataset.columns:
+            value = fields.get(column, "")
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = len(strings)
+                strings.append(value)
+            cols[column].append(code)
+    return by_day
+
+
+def scan(dataset: Dataset, source: Path, since: datetime, until: datetime) -> Frame:
+    """Frame for a JSONL source read in full, without touching the store."""
+    strings = [""]
+    try:
+        with open(source, "rb") as f:
+            by_day = _encode(f, dataset, strings)
+    except OSError:
+        by_day = {}
+    parts = [by_day[day] for day in sorted(by_day)]
+    frame = Frame.concat(parts, dataset.columns, strings)
+    return frame.select(frame.between(since.timestamp(), until.timestamp()))
+
+
+class EventStore:
+    """One dataset's columns, kept in step with its JSONL source."""
+
+    def __init__(self, root: Path, dataset: Dataset, source: Path):
+        self.dir = root / dataset.name
+        self.dataset = dataset
+        self.source = source
+
+    # ─── Manifest ────────────────────────────────────────────────────
+
+    def _load_manifest(self) -> dict[str, Any]:
+        try:
+            manifest = json.loads((self.dir / "manifest.json").read_text())
+            if manifest.get("format") == STORE_FORMAT and manifest.get("columns") == list(self.dataset.columns):
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return {
+            "format": STORE_FORMAT, "columns": list(self.dataset.columns),
+            "strings": [""], "source": {}, "partitions": {},
+        }
+
+    def _save_manifest(self, manifest: dict[str, Any]) -> None:
+        with tempfile.NamedTemporaryFile("w", dir=self.dir, suffix=".tmp", delete=False) as tmp:
+            json.dump(manifest, tmp, separators=(",", ":"))
+        os.replace(tmp.name, self.dir / "manifest.json")
+
+    # ─── Ingest ──────────────────────────────────────────────────────
+
+    def ingest(self, rebuild: bool = False) -> int:
+        """Append rows for source lines added since the last ingest.
+
+        Rebuilds from scratch when the source was replaced or truncated
+        (different inode, or smaller than the ingested offset). Returns
+        the number of rows added."""
+        self.dir.mkdir(parents=True, exist_ok=True)
+        with open(self.dir / ".lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            return self._ingest_locked(rebuild)
+
+    def _ingest_locked(self, rebuild: bool) -> int:
+        manifest = self._load_manifest()
+        try:
+            st = self.source.stat()
+        except OSError:
+            return 0
+        seen = manifest["source"]
+        offset = seen.get("offset", 0)
+        if rebuild or seen.get("inode") != st.st_ino or st.st_size < offset:
+            for day in manifest["partitions"]:
+                shutil.rmtree(self.dir / day, ignore_errors=True)
+            manifest = {**self._load_manifest(), "strings": [""], "partitions": {}}
+            offset = 0
+        if st.st_size == offset:
+            return 0
+
+        with open(self.source, "rb") as f:
+            f.seek(offset)
+            chunk = f.read()
+        end = chunk.rfind(b"\n") + 1  # only whole lines; a partial tail waits
+        if end == 0:
+            return 0
+
+        strings: list[str] = manifest["strings"]
+        by_day = _encode(chunk[:end].splitlines(), self.dataset, strings)
+
+        # Strings first: a crash after this leaves only unused entries.
+        self._save_manifest(manifest)
+        added = 0
+        for day, (ts_col, cols) in by_day.items():
+            part = self.dir / day
+            part.mkdir(exist_ok=True)
+            count = manifest["partitions"].get(day, 0)
+            files = [("ts.f64", ts_col)] + [(f"{c}.i32", cols[c]) for c in self.dataset.columns]
+            for name, values in files:
+                with open(part / name, "ab") as f:
+                    f.truncate(count * values.itemsize)  # drop any interrupted tail
+                    f.write(_to_bytes(values))
+            manifest["partitions"][day] = count + len(ts_col)
+            added += len(ts_col)
+        manifest["source"] = {"inode": st.st_ino, "offset": offset + end}
+        self._save_manifest(manifest)
+        return added
+
+    # ─── Query ───────────────────────────────────────────────────────
+
+    def query(self, since: datetime, until: datetime) -> Frame:
+        """Rows with since <= ts <= until, reading only the covered days."""
+        manifest = self._load_manifest()
+        lo, hi = since.strftime("%Y-%m-%d"), until.strftime("%Y-%m-%d")
+        days = sorted(d for d in manifest["partitions"] if lo <= d <= hi)
+        parts = []
+        for day in days:
+            count = manifest["partitions"][day]
+            part = self.dir / day
+            ts = _read_column(part / "ts.f64", "d", count)
+            cols = {c: _read_column(part / f"{c}.i32", "i", count) for c in self.dataset.columns}
+            parts.append((ts, cols))
+        frame = Frame.concat(parts, self.dataset.columns, manifest["strings"])
+        return frame.select(frame.between(since.timestamp(), until.timestamp()))
+
+
+class Frame:
+    """Typed, dictionary-encoded columns (NumPy arrays or array.array).
+
+    Masks are NumPy bool arrays, or bytearrays of 0/1 without NumPy."""
+
+    def __init__(self, ts, cols: dict[str, Any], strings: list[str]):
+        self.ts = ts
+        self.cols = cols
+        self.strings = strings
+        self._codes: dict[str, int] | None = None
+
+    @classmethod
+    def concat(cls, parts: list, columns: Iterable[str], strings: list[str]) -> Frame:
+        columns = list(columns)
+        if np is not None:
+            if not parts:
+                return cls(np.empty(0), {c: np.empty(0, dtype=np.int32) for c in columns}, strings)
+            return cls(
+                np.concatenate([p[0] for p in parts]),
+                {c: np.concatenate([p[1][c] for p in parts]) for c in columns},
+                strings,
+            )
+        ts = array("d")
+        cols = {c: array("i") for c in columns}
+        for part_ts, part_cols in parts:
+            ts.extend(part_ts)
+            for c in columns:
+                cols[c].extend(part_cols[c])
+        return cls(ts, cols, strings)
+
+    @classmethod
+    def empty(cls, columns: Iterable[str]) -> Frame:
+        return cls.concat([], columns, [""])
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def code(self, value: str) -> int:
+        """Dictionary code for a string, -1 if it never occurs."""
+        if self._codes is None:
+            self._codes = {s: i for i, s in enumerate(self.strings)}
+        return self._codes.get(value, -1)
+
+    # ─── Masks ───────────────────────────────────────────────────────
+
+    def between(self, lo: float, hi: float):
+        if np is not None:
+            return (self.ts >= lo) & (self.ts <= hi)
+        return bytearray(lo <= t <= hi for t in self.ts)
+
+    def isin(self, column: str, values: Iterable[str]):
+        """Rows whose `column` is any of `values`."""
+        wanted = {self.code(v) for v in values} - {-1}
+        col = self.cols[column]
+        if np is not None:
+            return np.isin(col, np.fromiter(wanted, dtype=np.int32, count=len(wanted)))
+        return bytearray(c in wanted for c in col)
+
+    def eq(self, column: str, value: str):
+        return self.isin(column, (value,))
+
+    def nonempty(self, column: str):
+        col = self.cols[column]
+        if np is not None:
+            return col != 0
+        return bytearray(c != 0 for c in col)
+
+    def all(self, *masks):
+        """Row-wise AND of masks (all rows when none given)."""
+        if np is not None:
+            out = np.ones(len(self), dtype=bool)
+            for mask in masks:
+                out &= mask
+            return out
+        if not masks:
+            return bytearray(b"\x01" * len(self))
+        return bytearray(all(bits) for bits in zip(*masks))
+
+    def either(self, a, b):
+        if np is not None:
+            return a | b
+        return bytearray(x or y for x, y in zip(a, b))
+
+    # ─── Reductions ──────────────────────────────────────────────────
+
+    def count(self, mask=None) -> int:
+        if mask is None:
+            return len(self)
+        return int(mask.sum()) if np is not None else sum(mask)
+
+    def _codes_where(self, column: str, mask):
+        col = self.cols[column]
+        if mask is None:
+            return col
+        if np is not None:
+            return col[mask]
+        return [c for c, keep in zip(col, mask) if keep]
+
+    def unique(self, column: str, mask=None) -> set[str]:
+        codes = self._codes_where(column, mask)
+        found = np.unique(codes).tolist() if np is not None else set(codes)
+        return {self.strings[c] for c in found}
+
+    def value_counts(self, column: str, mask=None) -> dict[str, int]:
+        codes = self._codes_where(column, mask)
+        if np is not None:
+            values, counts = np.unique(codes, return_counts=True)
+            return {self.strings[v]: int(n) for v, n in zip(values.tolist(), counts.tolist())}
+        out: dict[str, int] = {}
+        for c in codes:
+            out[self.strings[c]] = out.get(self.strings[c], 0) + 1
+        return out
+
+    def last_by(self, key: str, value: str, mask=None) -> dict[str, str]:
+        """For each `key`, the `value` of its last row (ingest order)."""
+        keys = self._codes_where(key, mask)
+        values = self._codes_where(value, mask)
+        if np is not None:
+            if len(keys) == 0:
+                return {}
+            rev_keys = keys[::-1]
+            uniq, first = np.unique(rev_keys, return_index=True)
+            last_values = values[::-1][first]
+            return {self.strings[k]: self.strings[v] for k, v in zip(uniq.tolist(), last_values.tolist())}
+        return {self.strings[k]: self.strings[v] for k, v in zip(keys, values)}
+
+    def select(self, mask) -> Frame:
+        if np is not None:
+            return Frame(self.ts[mask], {c: v[mask] for c, v in self.cols.items()}, self.strings)
+        ts = array("d", (t for t, keep in zip(self.ts, mask) if keep))
+        cols = {c: array("i", (x for x, keep in zip(v, mask) if keep)) for c, v in self.cols.items()}
+        return Frame(ts, cols, self.strings)
@@ -2,16 +2,21 @@
 """Galiana topology experiment runner.
 
 Finds recent production flux-drive reviews, re-runs with fixed topologies,
-compares results.
+compares results. Each (review, agent) pair runs once however many
+topologies include the agent, through a bounded pool of shadow agents;
+topology results are assembled from those shared outputs.
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
 import subprocess
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from time import time
@@ -169,61 +174,128 @@ def select_diverse_tasks(reviews: list[tuple[Path, dict[str, Any]]], max_count:
     return selected[:max_count]
 
 
-def run_shadow_review(
-    input_path: str,
-    topology_name: str,
-    topology_agents: list[str],
-    project_dir: Path,
-    script_dir: Path
-) -> dict[str, Any]:
-    """Run shadow review with specified topology.
+@dataclass(frozen=True)
+class AgentJob:
+    """One agent reviewing one input; shared by every topology that lists it."""
 
-    Returns:
-        Dict with findings list and agents_completed list
-    """
-    shadow_dir = CLAVAIN_DIR / "shadow-runs" / topology_name
-    shadow_dir.mkdir(parents=True, exist_ok=True)
+    task_dir: str
+    input_path: str
+    agent: str
 
-    shadow_script = script_dir / "shadow-review.sh"
-    if not shadow_script.exists():
-        print(f"WARN: shadow-review.sh not found at {shadow_script}", file=sys.stderr)
-        return {"findings": [], "agents_completed": []}
+    @property
+    def agent_name(self) -> str:
+        return self.agent.split(":")[-1]
 
-    all_findings: list[dict[str, Any]] = []
-    agents_completed: list[str] = []
 
-    for agent in topology_agents:
-        # Extract agent name (strip prefix if present)
-        agent_name = agent.split(":")[-1]
-        output_file = shadow_dir / f"{agent_name}.json"
+def plan_agent_jobs(
+    tasks: list[tuple[str, str]],
+    topology_agents: dict[str, list[str]],
+) -> list[AgentJob]:
+    """Deduped (review, agent) work set for tasks × topologies.
 
+    tasks: (task_dir, input_path) pairs. An agent in several topologies
+    runs once per review; topology results are assembled from its output."""
+    jobs: dict[AgentJob, None] = {}
+    for task_dir, input_path in tasks:
+        for agents in topology_agents.values():
+            for agent in agents:
+                jobs.setdefault(AgentJob(task_dir, input_path, agent))
+    return list(jobs)
+
+
+def run_agent(
+    job: AgentJob,
+    run_dir: Path,
+    project_dir: Path,
+    shadow_script: Path,
+    timeout_s: float,
+    retries: int,
+) -> dict[str, Any]:
+    """Run one shadow agent, retrying when it produces no usable output.
+
+    Returns {"findings": list | None, "attempts", "duration_seconds"[, "error"]}."""
+    output_file = run_dir / job.task_dir / f"{job.agent_name}.json"
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    start_time = time()
+    error = ""
+    for attempt in range(1, retries + 2):
+        output_file.unlink(missing_ok=True)
         try:
-            # Call shadow-review.sh
             result = subprocess.run(
-                [str(shadow_script), agent, input_path, str(output_file)],
+                [str(shadow_script), job.agent, job.input_path, str(output_file)],
                 cwd=project_dir,
-                timeout=300,  # 5 minute timeout per agent
+                timeout=timeout_s,
                 capture_output=True,
                 text=True,
                 check=False
             )
-
             if result.returncode != 0:
-                print(f"WARN: Agent {agent_name} exited {result.returncode}: {result.stderr[:200]}", file=sys.stderr)
-
-            # Parse output
-            if output_file.exists():
-                agent_output = json.loads(output_file.read_text())
-                if isinstance(agent_output, dict):
-                    findings = agent_output.get("findings", [])
-                    if isinstance(findings, list):
-                        all_findings.extend(findings)
-                        agents_completed.append(agent_name)
+                print(f"WARN: Agent {job.agent_name} exited {result.returncode}: {result.stderr[:200]}", file=sys.stderr)
+
+            agent_output = json.loads(output_file.read_text())
+            findings = agent_output.get("findings") if isinstance(agent_output, dict) else None
+            if isinstance(findings, list):
+                return {"findings": findings, "attempts": attempt, "duration_seconds": int(time() - start_time)}
+            error = "output has no findings list"
         except (subprocess.TimeoutExpired, json.JSONDecodeError, OSError) as e:
-            print(f"WARN: Agent {agent_name} failed: {e}", file=sys.stderr)
-            continue
+            error = str(e)
+        print(f"WARN: Agent {job.agent_name} attempt {attempt} failed: {error}", file=sys.stderr)
+    return {"findings": None, "attempts": retries + 1, "duration_seconds": int(time() - start_time), "error": error}
+
+
+def run_agent_pool(
+    jobs: list[AgentJob],
+    run_dir: Path,
+    project_dir: Path,
+    script_dir: Path,
+    max_workers: int = 4,
+    timeout_s: float = 300,
+    retries: int = 1,
+) -> dict[AgentJob, dict[str, Any]]:
+    """Run every job through a bounded pool; outputs land under run_dir."""
+    shadow_script = script_dir / "shadow-review.sh"
+    if not shadow_script.exists():
+        print(f"WARN: shadow-review.sh not found at {shadow_script}", file=sys.stderr)
+        return {job: {"findings": None, "attempts": 0, "duration_seconds": 0, "error": "shadow-review.sh not found"} for job in jobs}
+
+    outcomes: dict[AgentJob, dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="shadow-agent") as pool:
+        futures = {
+            pool.submit(run_agent, job, run_dir, project_dir, shadow_script, timeout_s, retries): job
+            for job in jobs
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            job = futures[future]
+            outcomes[job] = future.result()
+            state = "ok" if outcomes[job]["findings"] is not None else "failed"
+            print(f"[{done}/{len(jobs)}] {job.task_dir} {job.agent_name}: {state}", file=sys.stderr)
+    return outcomes
+
+
+def assemble_shadow_review(
+    task_dir: str,
+    input_path: str,
+    topology_agents: list[str],
+    outcomes: dict[AgentJob, dict[str, Any]],
+) -> dict[str, Any]:
+    """One topology's shadow review from the shared agent outputs.
 
-    return {"findings": all_findings, "agents_completed": agents_completed}
+    Returns:
+        Dict with findings list, agents_completed list and duration_seconds
+        (summed agent time, i.e. the cost of running the topology alone)
+    """
+    all_findings: list[dict[str, Any]] = []
+    agents_completed: list[str] = []
+    duration = 0
+    for agent in topology_agents:
+        outcome = outcomes.get(AgentJob(task_dir, input_path, agent))
+        if outcome is None:
+            continue
+        duration += outcome["duration_seconds"]
+        if outcome["findings"] is not None:
+            all_findings.extend(outcome["findings"])
+            agents_completed.append(agent.split(":")[-1])
+    return {"findings": all_findings, "agents_completed": agents_completed, "duration_seconds": duration}
 
 
 def compute_overlap_metrics(
@@ -285,11 +357,34 @@ def compute_overlap_metrics(
     }
 
 
+def production_baseline(production_findings: list[dict[str, Any]]) -> dict[str, Any]:
+    """Agent and severity counts for the production review."""
+    # Count production agents (from unique agent names in findings)
+    prod_agents = set()
+    for f in production_findings:
+        if isinstance(f, dict):
+            agents_raw = f.get("agents") or f.get("agent", "")
+            if isinstance(agents_raw, list):
+                prod_agents.update(agents_raw)
+            elif isinstance(agents_raw, str):
+                prod_agents.update([a.strip() for a in agents_raw.split(",") if a.strip()])
+
+    return {
+        "agents_used": len(prod_agents),
+        "total_findings": len(production_findings),
+        "p0_findings": sum(1 for f in production_findings if str(f.get("severity", "")).upper() == "P0"),
+        "p1_findings": sum(1 for f in production_findings if str(f.get("severity", "")).upper() == "P1"),
+    }
+
+
 def run_experiment(
     project_root: Path,
     target_date: str,
     topology_names: list[str],
-    dry_run: bool
+    dry_run: bool,
+    max_workers: int = 4,
+    timeout_s: float = 300,
+    retries: int = 1,
 ) -> None:
     """Run topology experiment for target date."""
     script_dir = Path(__file__).parent
@@ -326,63 +421,45 @@ def run_experiment(
         finding_count = len(doc.get("findings", []))
         print(f"  - {task_type}: {input_path} ({finding_count} findings)", file=sys.stderr)
 
+    # Per-task output dirs are indexed: several reviews can share a parent name.
+    tasks = [(f"{i:02d}-{file_path.parent.name}", str(doc.get("input", ""))) for i, (file_path, doc) in enumerate(selected)]
+    topology_agents = {name: topologies[name].get("agents", []) for name in topology_names}
+    jobs = plan_agent_jobs(tasks, topology_agents)
+    total_runs = len(selected) * len(topology_names)
+
     if dry_run:
-        print(f"\nDry run: would execute {len(selected) * len(topology_names)} shadow reviews", file=sys.stderr)
+        print(f"\nDry run: would execute {total_runs} shadow reviews ({len(jobs)} unique agent runs)", file=sys.stderr)
         print(f"Topologies: {', '.join(topology_names)}", file=sys.stderr)
         return
 
-    # Run experiments
-    total_runs = len(selected) * len(topology_names)
-    run_count = 0
+    # Each experiment gets its own output tree so concurrent runs never collide.
+    run_id = f"{target_date}-{datetime.now(timezone.utc).strftime('%H%M%S')}-{os.getpid()}"
+    run_dir = CLAVAIN_DIR / "shadow-runs" / run_id
+    print(f"\nRunning {len(jobs)} agent reviews for {total_runs} shadow reviews ({max_workers} at a time)", file=sys.stderr)
+    outcomes = run_agent_pool(
+        jobs, run_dir, project_root, script_dir,
+        max_workers=max_workers, timeout_s=timeout_s, retries=retries,
+    )
 
     RESULTS_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-    for file_path, doc in selected:
+    for (file_path, doc), (task_dir, input_path) in zip(selected, tasks):
         task_type = classify_task_type(doc)
-        input_path = str(doc.get("input", ""))
         task_id = f"flux-drive/{file_path.parent.name}"
 
         production_findings = doc.get("findings", [])
         if not isinstance(production_findings, list):
             production_findings = []
-
-        # Count production agents (from unique agent names in findings)
-        prod_agents = set()
-        for f in production_findings:
-            if isinstance(f, dict):
-                agents_raw = f.get("agents") or f.get("agent", "")
-                if isinstance(agents_raw, list):
-                    prod_agents.update(agents_raw)
-                elif isinstance(agents_raw, str):
-                    prod_agents.update([a.strip() for a in agents_raw.split(",") if a.strip()])
-
-        prod_p0_count = sum(1 for f in production_findings if str(f.get("severity", "")).upper() == "P0")
-        prod_p1_count = sum(1 for f in production_findings if str(f.get("severity", "")).upper() == "P1")
+        baseline = production_baseline(production_findings)
 
         for topo_name in topology_names:
-            run_count += 1
-            print(f"\n[{run_count}/{total_runs}] Running {task_type} with {topo_name}...", file=sys.stderr)
-
-            topo_config = topologies[topo_name]
-            topo_agents = topo_config.get("agents", [])
-
-            # Time the shadow review
-            start_time = time()
-            shadow_result = run_shadow_review(
-                input_path=input_path,
-                topology_name=topo_name,
-                topology_agents=topo_agents,
-                project_dir=project_root,
-                script_dir=script_dir
-            )
-            duration = int(time() - start_time)
+            topo_agents = topology_agents[topo_name]
+            shadow_result = assemble_shadow_review(task_dir, input_path, topo_agents, outcomes)
 
             # Compute metrics
-            shadow_findings = shadow_result["findings"]
             agents_completed = shadow_result["agents_completed"]
-
-            metrics = compute_overlap_metrics(shadow_findings, production_findings)
-            metrics["duration_seconds"] = duration
+            metrics = compute_overlap_metrics(shadow_result["findings"], production_findings)
+            metrics["duration_seconds"] = shadow_result["duration_seconds"]
 
             # Build output record
             record = {
@@ -391,25 +468,23 @@ def run_experiment(
                 "task_type": task_type,
                 "input": input_path,
                 "topology": topo_name,
+                "run_id": run_id,
                 "agents_dispatched": [a.split(":")[-1] for a in topo_agents],
                 "agents_completed": agents_completed,
                 "metrics": metrics,
-                "production_baseline": {
-                    "agents_used": len(prod_agents),
-                    "total_findings": len(production_findings),
-                    "p0_findings": prod_p0_count,
-                    "p1_findings": prod_p1_count
-                }
+                "production_baseline": baseline,
             }
 
             # Append to JSONL
             with RESULTS_FILE.open("a") as f:
                 f.write(json.dumps(record) + "\n")
 
+            print(f"\n{task_type} with {topo_name}:", file=sys.stderr)
             print(f"  Completed: {len(agents_completed)}/{len(topo_agents)} agents", file=sys.stderr)
             print(f"  Recall: {metrics['recall']}, Precision: {metrics['precision']}", file=sys.stderr)
 
     print(f"\nResults appended to {RESULTS_FILE}", file=sys.stderr)
+    print(f"Agent outputs in {run_dir}", file=sys.stderr)
 
 
 def main() -> None:
@@ -433,6 +508,24 @@ def main() -> None:
         "--project",
         help="Project root directory (default: current directory)"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=4,
+        help="Shadow agents to run at once (default: 4)"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=300,
+        help="Per-agent timeout in seconds (default: 300)"
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=1,
+        help="Retries for an agent that times out or writes no findings (default: 1)"
+    )
 
     args = parser.parse_args()
 
@@ -467,7 +560,10 @@ def main() -> None:
         project_root=project_root,
         target_date=target_date,
         topology_names=topology_names,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        max_workers=args.jobs,
+        timeout_s=args.timeout,
+        retries=args.retries
     )
 
 
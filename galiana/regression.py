@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Native regression detection over Galiana eval results.
+
+eval-results.jsonl is indexed by (fixture, topology, date). For each
+metric the runs on the dates before the one being checked form a rolling
+baseline (the last `window` dated points); a point is a regression when
+it falls below the baseline's lower prediction bound — where a new run
+would land with the given confidence if nothing had changed — and the
+drop is also at least `min_delta`, so a flat baseline does not flag
+noise-free wobble.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from statistics import fmean, stdev
+from typing import Any
+
+from utils import iter_jsonl
+
+# Metric name in reports -> field in eval-results.jsonl records.
+METRICS = {
+    "recall": "avg_recall",
+    "precision": "precision",
+    "property_pass_rate": "property_pass_rate",
+}
+
+# Two-sided 95% Student t critical values by degrees of freedom.
+_T95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+    8: 2.306, 9: 2.262, 10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 30: 2.042,
+}
+
+
+def t_critical(df: int) -> float:
+    """95% two-sided t value, rounded toward the next tabulated (smaller) df."""
+    if df <= 0:
+        return math.inf
+    if df > 30:
+        return 1.96
+    return _T95[max(k for k in _T95 if k <= df)]
+
+
+@dataclass(frozen=True)
+class Baseline:
+    n: int
+    mean: float
+    stdev: float
+    ci_low: float   # confidence interval of the baseline mean
+    ci_high: float
+    floor: float    # lower prediction bound for one new point
+
+    @classmethod
+    def of(cls, values: list[float]) -> Baseline:
+        n = len(values)
+        mean = fmean(values)
+        sd = stdev(values) if n > 1 else 0.0
+        t = t_critical(n - 1)
+        half = t * sd / math.sqrt(n) if sd else 0.0
+        floor = mean - t * sd * math.sqrt(1 + 1 / n) if sd else mean
+        return cls(n, round(mean, 4), round(sd, 4), round(mean - half, 4), round(mean + half, 4), round(floor, 4))
+
+
+class ResultIndex:
+    """Eval results grouped as {(fixture, topology): {date: {metric: [values]}}}."""
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self.series: dict[tuple[str, str], dict[str, dict[str, list[float]]]] = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+        for record in records:
+            fixture, topology, date = record.get("fixture"), record.get("topology"), record.get("date")
+            if not (isinstance(fixture, str) and isinstance(topology, str) and isinstance(date, str)):
+                continue
+            point = self.series[(fixture, topology)][date]
+            for metric, field in METRICS.items():
+                value = record.get(field)
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    point[metric].append(float(value))
+
+    @classmethod
+    def load(cls, path: Path) -> ResultIndex:
+        return cls(iter_jsonl(path))
+
+    def latest_date(self) -> str | None:
+        dates = [d for by_date in self.series.values() for d in by_date]
+        return max(dates) if dates else None
+
+    def history(self, fixture: str, topology: str, metric: str, before: str, window: int) -> list[float]:
+        """Per-date mean of `metric` for the last `window` dates before `before`."""
+        by_date = self.series.get((fixture, topology), {})
+        dated = [(d, by_date[d][metric]) for d in sorted(by_date) if d < before and by_date[d][metric]]
+        return [fmean(values) for _, values in dated[-window:]]
+
+    def value(self, fixture: str, topology: str, metric: str, date: str) -> float | None:
+        values = self.series.get((fixture, topology), {}).get(date, {}).get(metric)
+        return fmean(values) if values else None
+
+
+def detect_regressions(
+    index: ResultIndex,
+    date: str | None = None,
+    pairs: set[tuple[str, str]] | None = None,
+    window: int = 10,
+    min_runs: int = 3,
+    min_delta: float = 0.05,
+) -> list[dict[str, Any]]:
+    """Significant metric drops on `date` (default: latest) vs the rolling baseline.
+
+    pairs limits the check to those (fixture, topology) combinations.
+    Series with fewer than min_runs baseline dates are skipped."""
+    date = date or index.latest_date()
+    if date is None:
+        return []
+    regressions: list[dict[str, Any]] = []
+    for fixture, topology in sorted(index.series):
+        if pairs is not None and (fixture, topology) not in pairs:
+            continue
+        for metric in METRICS:
+            current = index.value(fixture, topology, metric, date)
+            if current is None:
+                continue
+            history = index.history(fixture, topology, metric, date, window)
+            if len(history) < min_runs:
+                continue
+            baseline = Baseline.of(history)
+            delta = round(current - baseline.mean, 4)
+            if current < baseline.floor and -delta >= min_delta:
+                regressions.append({
+                    "fixture": fixture,
+                    "topology": topology,
+                    "metric": metric,
+                    "date": date,
+                    "current": round(current, 4),
+                    "delta": delta,
+                    "baseline": asdict(baseline),
+                })
+    return regressions
+
+
+def format_regressions(regressions: list[dict[str, Any]]) -> str:
+    lines = []
+    for r in regressions:
+        b = r["baseline"]
+        lines.append(
+            f"{r['fixture']:<24} {r['topology']:<6} {r['metric']:<19} "
+            f"{r['current']:.2f} vs {b['mean']:.2f} [{b['ci_low']:.2f}, {b['ci_high']:.2f}] n={b['n']} ({r['delta']:+.2f})"
+        )
+    return "\n".join(lines)
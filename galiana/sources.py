@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Concurrent data-source collection for Galiana analysis.
+
+Each source is a zero-argument callable with its own deadline. All
+sources start together; a source that misses its deadline (or raises)
+yields None and the analysis continues with what arrived. External
+sources can also be cached on disk with a freshness window: a fresh
+entry answers without running the source, and a stale entry stands in
+when the live call fails. A source signals failure by raising; a None
+it returns is a valid (empty) answer and counts as "ok".
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from time import monotonic, time
+from typing import Any, Callable
+
+
+@dataclass
+class Source:
+    """One input to the analysis.
+
+    deadline_s: seconds after collection starts that the result is waited
+    for (None = wait for it). ttl_s: freshness window for the on-disk
+    cache (None = never cached). key: anything the result depends on
+    besides the source name (arguments, paths)."""
+
+    name: str
+    fetch: Callable[[], Any]
+    deadline_s: float | None = None
+    ttl_s: float | None = None
+    key: Any = None
+
+
+class SourceCache:
+    """One JSON file per (source, key) under cache_dir, written atomically."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    def _path(self, source: Source) -> Path:
+        digest = hashlib.sha256(json.dumps(source.key, sort_keys=True, default=str).encode()).hexdigest()[:16]
+        return self.cache_dir / f"{source.name}-{digest}.json"
+
+    def get(self, source: Source) -> tuple[Any, float] | None:
+        """(value, age_s) for a cached result, or None."""
+        try:
+            entry = json.loads(self._path(source).read_text())
+            return entry["value"], max(0.0, time() - entry["fetched_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, source: Source, value: Any) -> None:
+        path = self._path(source)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", dir=path.parent, suffix=".tmp", delete=False) as tmp:
+                json.dump({"fetched_at": time(), "value": value}, tmp)
+            os.replace(tmp.name, path)
+        except (OSError, TypeError, ValueError):
+            pass  # caching is best-effort
+
+
+def collect(
+    sources: list[Source],
+    cache: SourceCache | None = None,
+    refresh: bool = False,
+    max_workers: int | None = None,
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Run sources concurrently. Returns (values, status) keyed by name.
+
+    status[name]["status"] is one of:
+      ok       — fetched live within its deadline
+      cached   — served from a cache entry younger than ttl_s
+      stale    — live fetch failed or timed out; an older cache entry was used
+      timeout  — missed its deadline, no cache entry (value None)
+      error    — raised, no cache entry (value None; "error" holds the message)
+    """
+    values: dict[str, Any] = {}
+    status: dict[str, dict[str, Any]] = {}
+    cached: dict[str, tuple[Any, float]] = {}
+    live: list[Source] = []
+
+    for source in sources:
+        hit = cache.get(source) if cache is not None and source.ttl_s is not None else None
+        if hit is not None:
+            cached[source.name] = hit
+            if not refresh and hit[1] <= source.ttl_s:
+                values[source.name] = hit[0]
+                status[source.name] = {"status": "cached", "age_s": round(hit[1], 1)}
+                continue
+        live.append(source)
+
+    if not live:
+        return values, status
+
+    start = monotonic()
+    pool = ThreadPoolExecutor(max_workers=max_workers or len(live), thread_name_prefix="galiana-source")
+    futures = {source.name: pool.submit(source.fetch) for source in live}
+    try:
+        for source in live:
+            future = futures[source.name]
+            timeout = None
+            if source.deadline_s is not None:
+                timeout = max(0.0, start + source.deadline_s - monotonic())
+            outcome: dict[str, Any]
+            try:
+                value = future.result(timeout=timeout)
+                outcome = {"status": "ok"}
+                if cache is not None and source.ttl_s is not None and value is not None:
+                    cache.put(source, value)
+            except TimeoutError:
+                value, outcome = None, {"status": "timeout", "deadline_s": source.deadline_s}
+            except Exception as exc:  # a failing source must not sink the report
+                value, outcome = None, {"status": "error", "error": f"{type(exc).__name__}: {exc}"}
+            if outcome["status"] != "ok" and source.name in cached:
+                value, age = cached[source.name]
+                outcome = {**outcome, "status": "stale", "reason": outcome["status"], "age_s": round(age, 1)}
+            outcome["elapsed_s"] = round(monotonic() - start, 3)
+            values[source.name] = value
+            status[source.name] = outcome
+    finally:
+        # Late sources keep running in their threads but nothing here waits
+        # for them. Pool threads are not daemons, so interpreter exit still
+        # joins them: a source must bound itself (the external fetchers
+        # set a subprocess timeout equal to their deadline).
+        pool.shutdown(wait=False, cancel_futures=True)
+    return values, status
@@ -14,20 +14,29 @@ _SPEC_LIB_SOURCED=1
 
 # ─── Cache state machine ────────────────────────────────────────────
 # _SPEC_LOADED=""         → never loaded
-# _SPEC_LOADED="ok"       → loaded successfully, _SPEC_JSON is valid
-# _SPEC_LOADED="failed"   → load attempted, failed. _SPEC_JSON is empty
+# _SPEC_LOADED="ok"       → loaded successfully, _SPEC_INDEX/_SPEC_JSON are valid
+# _SPEC_LOADED="failed"   → load attempted, failed. _SPEC_INDEX is empty
 # _SPEC_LOADED="fallback" → no spec file found. Functions return hardcoded defaults
 #
 # "failed" and "fallback" are sticky for the session — spec_load() won't retry.
 # Call spec_invalidate_cache() to reset and force a reload.
 #
-# Critical invariant: set _SPEC_JSON first, then _SPEC_LOADED="ok".
+# Critical invariant: set _SPEC_INDEX first, then _SPEC_LOADED="ok".
 # If Python call fails, set _SPEC_LOADED="failed". Never set guard before data.
+#
+# _SPEC_INDEX holds every accessor's answer, precomputed by one
+# `agency-spec-helper.py index` call (key → value, see build_index there),
+# so accessors are array lookups rather than a jq process each. The helper
+# keeps the compiled spec in an on-disk cache; _SPEC_CACHE_FILE is touched
+# on every load, so `spec -nt cache` is a process-free staleness test.
 
 _SPEC_LOADED=""  # Cache state: "" | "ok" | "failed" | "fallback"
 _SPEC_JSON=""
 _SPEC_MTIME=""
 _SPEC_PATH=""
+_SPEC_OVERRIDE_PATH=""
+_SPEC_CACHE_FILE=""
+declare -gA _SPEC_INDEX  # accessor key → value (-g: sourced from inside _sprint_ensure_spec)
 
 # ─── Path resolution ────────────────────────────────────────────────
 
@@ -36,24 +45,51 @@ _SPEC_CLAVAIN_DIR="$(cd "$_SPEC_LIB_DIR/.." && pwd)"
 _SPEC_SCHEMA_PATH="${_SPEC_CLAVAIN_DIR}/config/agency-spec.schema.json"
 _SPEC_HELPER="${_SPEC_CLAVAIN_DIR}/scripts/agency-spec-helper.py"
 
+# ─── Internals ───────────────────────────────────────────────────────
+
+_spec_mtime() {
+    stat -c %Y "$1" 2>/dev/null || stat -f %m "$1" 2>/dev/null
+}
+
+# Returns 0 if the loaded spec (or its override) changed since loading.
+_spec_stale() {
+    if [[ -n "$_SPEC_CACHE_FILE" && -f "$_SPEC_CACHE_FILE" ]]; then
+        [[ "$_SPEC_PATH" -nt "$_SPEC_CACHE_FILE" ]] && return 0
+        [[ -n "$_SPEC_OVERRIDE_PATH" && "$_SPEC_OVERRIDE_PATH" -nt "$_SPEC_CACHE_FILE" ]] && return 0
+        return 1
+    fi
+    local current_mtime
+    current_mtime=$(_spec_mtime "$_SPEC_PATH") || current_mtime=""
+    [[ "$current_mtime" != "$_SPEC_MTIME" ]]
+}
+
+# Look up an index key; print the fallback (and return 1) when spec is unavailable.
+_spec_lookup() {
+    local key="$1" fallback="$2"
+    spec_load
+    [[ "$_SPEC_LOADED" != "ok" ]] && { echo "$fallback"; return 1; }
+    if [[ -n "${_SPEC_INDEX[$key]+set}" ]]; then
+        echo "${_SPEC_INDEX[$key]}"
+    else
+        echo "$fallback"
+    fi
+}
+
 # ─── Public API ──────────────────────────────────────────────────────
 
-# Load + validate + cache the agency spec as JSON.
+# Load + validate + cache the agency spec.
 # Resolution order:
 #   1. Project override: ${PROJECT_DIR}/.clavain/agency-spec.yaml
 #   2. Default: ${CLAVAIN_DIR}/config/agency-spec.yaml
 #   3. Neither: _SPEC_LOADED=fallback
 spec_load() {
-    # Already loaded — check mtime for staleness
-    if [[ "$_SPEC_LOADED" == "ok" && -n "$_SPEC_PATH" && -n "$_SPEC_MTIME" ]]; then
-        local current_mtime
-        current_mtime=$(stat -c %Y "$_SPEC_PATH" 2>/dev/null || stat -f %m "$_SPEC_PATH" 2>/dev/null) || current_mtime=""
-        if [[ "$current_mtime" == "$_SPEC_MTIME" ]]; then
-            return 0  # Still fresh
-        fi
+    # Already loaded — check for staleness
+    if [[ "$_SPEC_LOADED" == "ok" && -n "$_SPEC_PATH" ]]; then
+        _spec_stale || return 0  # Still fresh
         # Stale — force reload
         _SPEC_LOADED=""
         _SPEC_JSON=""
+        _SPEC_INDEX=()
     fi
 
     # Skip if we already tried and failed (or fell back)
@@ -75,46 +111,50 @@ spec_load() {
         return 0
     fi
 
-    # Check Python + PyYAML availability
-    if ! python3 -c "import yaml" 2>/dev/null; then
-        echo "spec: python3 + PyYAML not available, cannot load spec" >&2
-        _SPEC_LOADED="failed"
-        return 0
-    fi
-
-    # Load via Python helper (handles YAML parse + merge + budget normalization)
-    local load_args=("$spec_path")
+    # One helper call: YAML parse + merge + budget normalization + schema
+    # validation (all cached on disk), answered as NUL-separated key/value
+    # records ending with @status.
+    local index_args=()
+    [[ -f "$_SPEC_SCHEMA_PATH" ]] && index_args+=(--schema "$_SPEC_SCHEMA_PATH")
+    index_args+=("$spec_path")
+    local override_path=""
     if [[ -f "$override_spec" ]]; then
-        load_args+=("$override_spec")
+        override_path="$override_spec"
+        index_args+=("$override_spec")
     fi
 
-    local json_output
-    json_output=$(python3 "$_SPEC_HELPER" load "${load_args[@]}") || {
-        echo "spec: helper load failed" >&2
-        _SPEC_LOADED="failed"
-        return 0
-    }
-
-    # Validate JSON is parseable
-    if ! echo "$json_output" | jq empty 2>/dev/null; then
-        echo "spec: helper produced invalid JSON" >&2
-        _SPEC_LOADED="failed"
-        return 0
-    fi
+    local -A index=()
+    local key value
+    while IFS= read -r -d '' key && IFS= read -r -d '' value; do
+        index[$key]="$value"
+    done < <(python3 "$_SPEC_HELPER" index "${index_args[@]}")
+
+    case "${index[@status]:-}" in
+        ok) ;;
+        no-yaml)
+            echo "spec: python3 + PyYAML not available, cannot load spec" >&2
+            _SPEC_LOADED="failed"
+            return 0
+            ;;
+        *)
+            echo "spec: helper load failed" >&2
+            _SPEC_LOADED="failed"
+            return 0
+            ;;
+    esac
 
     # Set data FIRST, then guard
-    _SPEC_JSON="$json_output"
+    _SPEC_INDEX=()
+    for key in "${!index[@]}"; do
+        _SPEC_INDEX[$key]="${index[$key]}"
+    done
+    _SPEC_JSON="${index[@spec]}"
     _SPEC_PATH="$spec_path"
-    _SPEC_MTIME=$(stat -c %Y "$spec_path" 2>/dev/null || stat -f %m "$spec_path" 2>/dev/null) || _SPEC_MTIME=""
+    _SPEC_OVERRIDE_PATH="$override_path"
+    _SPEC_CACHE_FILE="${index[@cache]:-}"
+    _SPEC_MTIME=$(_spec_mtime "$spec_path") || _SPEC_MTIME=""
     _SPEC_LOADED="ok"
 
-    # Validate against schema (non-blocking — warn only)
-    if [[ -f "$_SPEC_SCHEMA_PATH" ]]; then
-        if ! python3 "$_SPEC_HELPER" validate "$spec_path" "$_SPEC_SCHEMA_PATH"; then
-            echo "spec: schema validation failed (continuing with loaded spec)" >&2
-        fi
-    fi
-
     return 0
 }
 
@@ -130,69 +170,58 @@ spec_invalidate_cache() {
     _SPEC_JSON=""
     _SPEC_MTIME=""
     _SPEC_PATH=""
+    _SPEC_OVERRIDE_PATH=""
+    _SPEC_CACHE_FILE=""
+    _SPEC_INDEX=()
 }
 
 # Get a stage's full config as JSON.
 spec_get_stage() {
     local stage="$1"
     [[ -z "$stage" ]] && { echo "{}"; return 1; }
-    spec_load
-    [[ "$_SPEC_LOADED" != "ok" ]] && { echo "{}"; return 1; }
-    echo "$_SPEC_JSON" | jq -c --arg s "$stage" '.stages[$s] // {}' 2>/dev/null || { echo "{}"; return 1; }
+    _spec_lookup "stage:$stage" "{}"
 }
 
 # Get a specific gate's config.
 spec_get_gate() {
     local stage="$1" gate_name="$2"
     [[ -z "$stage" || -z "$gate_name" ]] && { echo "{}"; return 1; }
-    spec_load
-    [[ "$_SPEC_LOADED" != "ok" ]] && { echo "{}"; return 1; }
-    echo "$_SPEC_JSON" | jq -c --arg s "$stage" --arg g "$gate_name" '.stages[$s].gates[$g] // {}' 2>/dev/null || { echo "{}"; return 1; }
+    _spec_lookup "gate:$stage:$gate_name" "{}"
 }
 
 # Get all gates for a stage as JSON object.
 spec_get_stage_gates() {
     local stage="$1"
     [[ -z "$stage" ]] && { echo "{}"; return 1; }
-    spec_load
-    [[ "$_SPEC_LOADED" != "ok" ]] && { echo "{}"; return 1; }
-    echo "$_SPEC_JSON" | jq -c --arg s "$stage" '.stages[$s].gates // {}' 2>/dev/null || { echo "{}"; return 1; }
+    _spec_lookup "gates:$stage" "{}"
 }
 
 # Get a top-level defaults value.
 spec_get_default() {
     local key="$1"
     [[ -z "$key" ]] && { echo ""; return 1; }
-    spec_load
-    [[ "$_SPEC_LOADED" != "ok" ]] && { echo ""; return 1; }
-    echo "$_SPEC_JSON" | jq -r --arg k "$key" '.defaults[$k] // ""' 2>/dev/null || { echo ""; return 1; }
+    _spec_lookup "default:$key" ""
 }
 
 # Get budget config for a stage: {share, min_tokens, model_tier_hint}.
 spec_get_budget() {
     local stage="$1"
     [[ -z "$stage" ]] && { echo "{}"; return 1; }
-    spec_load
-    [[ "$_SPEC_LOADED" != "ok" ]] && { echo "{}"; return 1; }
-    echo "$_SPEC_JSON" | jq -c --arg s "$stage" '.stages[$s].budget // {}' 2>/dev/null || { echo "{}"; return 1; }
+    _spec_lookup "budget:$stage" "{}"
 }
 
 # Get agent roster for a stage: {required: [...], optional: [...]}.
 spec_get_agents() {
     local stage="$1"
     [[ -z "$stage" ]] && { echo '{"required":[],"optional":[]}'; return 1; }
-    spec_load
-    [[ "$_SPEC_LOADED" != "ok" ]] && { echo '{"required":[],"optional":[]}'; return 1; }
-    echo "$_SPEC_JSON" | jq -c --arg s "$stage" '.stages[$s].agents // {"required":[],"optional":[]}' 2>/dev/null || { echo '{"required":[],"optional":[]}'; return 1; }
+    _spec_lookup "agents:$stage" '{"required":[],"optional":[]}'
 }
 
 # Get companion config.
 spec_get_companion() {
     local name="$1"
     [[ -z "$name" ]] && { echo "{}"; return 1; }
-    spec_load
-    [[ "$_SPEC_LOADED" != "ok" ]] && { echo "{}"; return 1; }
-    echo "$_SPEC_JSON" | jq -c --arg n "$name" '.companions[$n] // {}' 2>/dev/null || { echo "{}"; return 1; }
+    _spec_lookup "companion:$name" "{}"
 }
 
 # Shadow-mode dispatch validation: log warning if agent not in spec roster.
@@ -207,14 +236,11 @@ spec_validate_dispatch() {
     cap_mode=$(spec_get_default "capability_mode") || cap_mode="shadow"
     [[ "$cap_mode" == "off" ]] && return 0
 
-    local agents_json
-    agents_json=$(spec_get_agents "$stage") || return 0
-
-    local in_roster
-    in_roster=$(echo "$agents_json" | jq --arg r "$agent_role" '
-        (.required // [] | map(.role) | index($r) != null) or
-        (.optional // [] | map(.role) | index($r) != null)
-    ' 2>/dev/null) || in_roster="true"
+    # roles:<stage> is " role1 role2 ... " (required + optional)
+    local roles
+    roles=$(_spec_lookup "roles:$stage" "") || return 0
+    local in_roster="false"
+    [[ "$roles" == *" $agent_role "* ]] && in_roster="true"
 
     if [[ "$in_roster" != "true" ]]; then
         echo "spec: agent '$agent_role' not in roster for stage '$stage' (capability_mode=$cap_mode)" >&2
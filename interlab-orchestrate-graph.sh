@@ -0,0 +1,63 @@
+#!/usr/bin/env bash
+set -euo pipefail
+cd "$(dirname "$0")"
+
+# Benchmark orchestrate.py's dependency-graph core on generated manifests:
+# compile + validate + a full dependency-driven schedule + one static-mode
+# failure propagation, at 10/100/1000/5000 tasks. Also reports the edge
+# count of the compact TaskGraph against the expanded build_graph() view,
+# which grows quadratically with the number of stages.
+#
+# Usage: interlab-orchestrate-graph.sh [SIZES...]   (default 10 100 1000 5000)
+
+SIZES="${*:-10 100 1000 5000}"
+
+python3 - "$SIZES" <<'PY'
+import sys, time
+sys.path.insert(0, "scripts")
+import orchestrate as orc
+
+def manifest(n):
+    per_stage = max(1, min(100, n // 10))
+    stages, made, s = [], 0, 0
+    while made < n:
+        tasks = []
+        for i in range(min(per_stage, n - made)):
+            deps = [f"s{s}-t{i - 1}"] if i % 4 else []
+            if s:
+                deps.append(f"s{s - 1}-t0")
+            tasks.append({"id": f"s{s}-t{i}", "title": "t", "depends": deps})
+        made += len(tasks)
+        stages.append({"name": f"S{s}", "tasks": tasks})
+        s += 1
+    tasks = {
+        t["id"]: orc.Task(id=t["id"], title=t["title"], stage=st["name"], depends=t["depends"])
+        for st in stages for t in st["tasks"]
+    }
+    return orc.Manifest(1, "dependency-driven", "deep", 5, 300, stages, tasks)
+
+for n in map(int, sys.argv[1].split()):
+    m = manifest(n)
+    t0 = time.perf_counter()
+    g = orc.compile_graph(m)
+    errors = orc.validate_graph(g, m)
+    assert not errors, errors
+    sched = orc.DependencyDrivenScheduler(g)
+    scheduled = 0
+    while sched.is_active:
+        ready = sched.get_ready()
+        if not ready:
+            break
+        for tid in ready:
+            sched.mark_done(tid)
+        scheduled += len(ready)
+    assert scheduled == n, (scheduled, n)
+    completed = {}
+    orc._propagate_failure(g.task_ids[0], g, completed)
+    ms = (time.perf_counter() - t0) * 1000
+    expanded = sum(len(d) for d in orc.build_graph(m).values()) if n <= 1000 else -1
+    print(f"METRIC graph_ms_{n}={ms:.1f}")
+    print(f"METRIC graph_edges_{n}={g.edge_count}")
+    if expanded >= 0:
+        print(f"METRIC expanded_edges_{n}={expanded}")
+PY
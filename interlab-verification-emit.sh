@@ -0,0 +1,47 @@
+#!/usr/bin/env bash
+set -euo pipefail
+cd "$(dirname "$0")"
+
+# Benchmark _routing_emit_verification — per-step emit latency of the spooled
+# path (printf into <log>.spool, drained by the resident collector) against
+# the direct path (one `python3 _verification.py emit` fork per step).
+# Routing emits on every dispatch, so this sits on the dispatch hot path.
+#
+# Usage: interlab-verification-emit.sh [N]   (default N=200 steps per path)
+
+N="${1:-200}"
+WORK="$(mktemp -d)"
+trap 'rm -rf "$WORK"' EXIT
+
+export CLAUDE_PROJECT_DIR="$WORK"
+source scripts/lib-routing.sh
+LOG="$WORK/.clavain/interspect/microrouter-shadow.jsonl"
+
+_bench() {
+  local mode="$1" i start end
+  start=$(date +%s%N)
+  for (( i = 0; i < N; i++ )); do
+    CLAVAIN_VERIFICATION_EMIT="$mode" _routing_emit_verification \
+      "bench-$mode" "VERIFIED" "bench step $i" "passthrough"
+  done
+  end=$(date +%s%N)
+  echo $(( (end - start) / N / 1000 ))
+}
+
+DIRECT_US=$(_bench direct)
+echo "METRIC emit_direct_us=$DIRECT_US"
+
+SPOOL_US=$(_bench spool)
+echo "METRIC emit_spool_us=$SPOOL_US"
+
+FLUSH_START=$(date +%s%N)
+_routing_flush_verification
+FLUSH_END=$(date +%s%N)
+echo "METRIC flush_ms=$(( (FLUSH_END - FLUSH_START) / 1000000 ))"
+
+LINES=$(wc -l < "$LOG")
+echo "METRIC log_lines=$LINES"
+if (( LINES != 2 * N )); then
+  echo "ERROR: expected $((2 * N)) log lines, got $LINES" >&2
+  exit 1
+fi
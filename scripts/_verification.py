@@ -38,16 +38,38 @@ CLI:
     python3 _verification.py --demo
     python3 _verification.py emit --name N --state S --evidence E \
         [--decision-type T] [--log-path P]
+    python3 _verification.py drain --log-path P [--spool S]
+    python3 _verification.py collect --log-path P [--spool S] \
+        [--interval SECS] [--idle-exit SECS]
 
 The `emit` subcommand is the Bash-callable bridge used by lib-routing.sh:
 constructs a step from CLI args and either appends to --log-path or writes
 the JSONL line to stdout. run_uuid auto-flows from FLUX_RUN_UUID env.
+
+Spooled emission (Clavain-local; the step schema is unchanged): forking an
+interpreter per routing decision costs tens of milliseconds, so
+lib-routing.sh instead appends one tab-separated spool line per step to
+``<log>.spool`` with a bare shell redirect (see SPOOL FORMAT below). The
+resident `collect` process tails the spool, turns lines into
+VerificationSteps, and group-commits them to the log; it exits after an
+idle period and is restarted by the next emit. `drain` does a single
+synchronous pass for readers that need the log current. Delivery is
+at-least-once: a crash between the log write and the offset update can
+repeat a batch.
+
+SPOOL FORMAT (one line, < PIPE_BUF, fields tab-separated; backslash,
+tab, CR and LF inside fields escaped as \\\\ \\t \\r \\n):
+
+    v1  timestamp_ms  name  state  decision_type  run_uuid  evidence
 """
 from __future__ import annotations
 
 import argparse
+import errno
+import fcntl
 import json
 import os
+import select
 import sys
 import time
 import uuid
@@ -199,6 +221,202 @@ def append_to_log(step: VerificationStep, log_path: str) -> None:
         f.write(step.to_jsonl_line() + "\n")
 
 
+# --- Spooled emission -----------------------------------------------------
+
+SPOOL_VERSION = "v1"
+# Rotate the spool once this much has been drained and the collector is idle.
+SPOOL_ROTATE_BYTES = 1 << 20
+# Time a writer may sit between open() and write() on a rotated spool.
+SPOOL_ROTATE_GRACE_S = 1.0
+_PIPE_BUF = getattr(select, "PIPE_BUF", 4096)
+
+_UNESCAPE = {"\\": "\\", "t": "\t", "n": "\n", "r": "\r"}
+
+
+def spool_path_for(log_path: str) -> str:
+    return log_path + ".spool"
+
+
+def _unescape_field(value: str) -> str:
+    if "\\" not in value:
+        return value
+    out: list[str] = []
+    i = 0
+    while i < len(value):
+        ch = value[i]
+        if ch == "\\" and i + 1 < len(value):
+            out.append(_UNESCAPE.get(value[i + 1], value[i + 1]))
+            i += 2
+        else:
+            out.append(ch)
+            i += 1
+    return "".join(out)
+
+
+def parse_spool_line(line: str) -> VerificationStep:
+    """Build a VerificationStep from one spool line (without trailing newline).
+
+    Raises ValueError for malformed lines; run_uuid is taken only from the
+    line, never from the collector's own environment.
+    """
+    fields = line.split("\t")
+    if len(fields) != 7 or fields[0] != SPOOL_VERSION:
+        raise ValueError(f"malformed spool line: {line[:80]!r}")
+    _, ts, name, state, decision_type, run_uuid, evidence = fields
+    return VerificationStep(
+        name=_unescape_field(name),
+        state=VerificationState(state),
+        evidence=_unescape_field(evidence),
+        decision_type=_unescape_field(decision_type) or None,
+        run_uuid=_unescape_field(run_uuid) or None,
+        timestamp_ms=int(ts),
+    )
+
+
+def _write_batch(log_path: str, lines: list[str]) -> None:
+    """Group-commit lines to the log, each write() < PIPE_BUF of whole lines.
+
+    Keeps the append_to_log contract — no write interleaves with another
+    appender mid-line — while paying one syscall per ~4KB instead of an
+    open/append/close per step.
+    """
+    os.makedirs(os.path.dirname(log_path) or ".", exist_ok=True)
+    fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        chunk = b""
+        for line in lines:
+            data = (line + "\n").encode("utf-8")
+            if chunk and len(chunk) + len(data) >= _PIPE_BUF:
+                os.write(fd, chunk)
+                chunk = b""
+            chunk += data
+        if chunk:
+            os.write(fd, chunk)
+    finally:
+        os.close(fd)
+
+
+def _read_offset(path: str) -> int:
+    try:
+        with open(path) as f:
+            return int(f.read().strip() or 0)
+    except (OSError, ValueError):
+        return 0
+
+
+def _write_offset(path: str, offset: int) -> None:
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(str(offset))
+    os.replace(tmp, path)
+
+
+def _drain_file(path: str, offset_path: str, log_path: str) -> tuple[int, int]:
+    """Commit complete lines past the stored offset. Returns (steps, new_offset)."""
+    offset = _read_offset(offset_path)
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < offset:
+                offset = 0  # spool was replaced underneath us
+            f.seek(offset)
+            data = f.read()
+    except FileNotFoundError:
+        return 0, 0
+    end = data.rfind(b"\n") + 1
+    if end == 0:
+        return 0, offset
+    lines: list[str] = []
+    for raw in data[:end].decode("utf-8", errors="replace").splitlines():
+        if not raw:
+            continue
+        try:
+            lines.append(parse_spool_line(raw).to_jsonl_line())
+        except (TypeError, ValueError) as exc:
+            print(f"[verification-emit-fail] spool: {exc}", file=sys.stderr)
+    if lines:
+        _write_batch(log_path, lines)
+    offset += end
+    _write_offset(offset_path, offset)
+    return len(lines), offset
+
+
+def drain_spool(log_path: str, spool_path: str | None = None, *, rotate: bool = False) -> int:
+    """Move every complete spooled step into the log. Returns steps written.
+
+    Serialized by an flock on ``<spool>.lock`` so `drain` and `collect` can
+    run concurrently. With rotate=True a large, fully drained spool is
+    renamed aside and finished after a grace period for in-flight writers.
+    """
+    spool = spool_path or spool_path_for(log_path)
+    offset_path = spool + ".offset"
+    if not os.path.isdir(os.path.dirname(spool) or "."):
+        return 0  # nothing was ever spooled here (or the project went away)
+    with open(spool + ".lock", "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        written, offset = _drain_file(spool, offset_path, log_path)
+        if rotate and offset >= SPOOL_ROTATE_BYTES:
+            rotated = spool + ".rotated"
+            try:
+                os.rename(spool, rotated)
+            except FileNotFoundError:
+                return written
+            time.sleep(SPOOL_ROTATE_GRACE_S)
+            more, _ = _drain_file(rotated, offset_path, log_path)
+            written += more
+            os.unlink(rotated)
+            _write_offset(offset_path, 0)
+        return written
+
+
+def collect(
+    log_path: str,
+    spool_path: str | None = None,
+    *,
+    interval: float = 0.2,
+    idle_exit: float = 30.0,
+) -> int:
+    """Resident collector loop; returns 0, or 0 immediately if one is running.
+
+    Holds an exclusive flock on ``<spool>.pid`` for its lifetime so exactly
+    one collector serves a spool.
+    """
+    spool = spool_path or spool_path_for(log_path)
+    # Spool lines carry their own run_uuid; never inherit the starter's.
+    os.environ.pop("FLUX_RUN_UUID", None)
+    os.makedirs(os.path.dirname(spool) or ".", exist_ok=True)
+    pid_path = spool + ".pid"
+    pid_file = open(pid_path, "a+")
+    try:
+        fcntl.flock(pid_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError as exc:
+        pid_file.close()
+        if exc.errno in (errno.EAGAIN, errno.EACCES):
+            return 0
+        raise
+    try:
+        pid_file.seek(0)
+        pid_file.truncate()
+        pid_file.write(str(os.getpid()))
+        pid_file.flush()
+        last_activity = time.monotonic()
+        spool_dir = os.path.dirname(spool) or "."
+        while os.path.isdir(spool_dir):
+            if drain_spool(log_path, spool, rotate=True):
+                last_activity = time.monotonic()
+            elif time.monotonic() - last_activity >= idle_exit:
+                break
+            time.sleep(interval)
+        # Final pass so nothing written during the last sleep is stranded.
+        drain_spool(log_path, spool)
+    finally:
+        try:
+            os.unlink(pid_path)
+        except OSError:
+            pass
+        pid_file.close()
+    return 0
+
+
 # --- CLI -------------------------------------------------------------------
 
 
@@ -271,6 +489,39 @@ def _emit(argv: list[str]) -> int:
     return 0
 
 
+def _spool_args(prog: str, argv: list[str], *, resident: bool) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog=f"_verification.py {prog}")
+    parser.add_argument("--log-path", required=True)
+    parser.add_argument("--spool", default=None, help="default: <log-path>.spool")
+    if resident:
+        parser.add_argument("--interval", type=float, default=0.2)
+        parser.add_argument("--idle-exit", type=float, default=30.0)
+    return parser.parse_args(argv)
+
+
+def _drain(argv: list[str]) -> int:
+    """`drain` subcommand — one synchronous spool pass (for log readers)."""
+    args = _spool_args("drain", argv, resident=False)
+    try:
+        drain_spool(args.log_path, args.spool)
+    except OSError as exc:
+        print(f"[verification-emit-fail] drain {args.log_path}: {exc}", file=sys.stderr)
+        return 3
+    return 0
+
+
+def _collect(argv: list[str]) -> int:
+    """`collect` subcommand — resident group-commit collector."""
+    args = _spool_args("collect", argv, resident=True)
+    try:
+        return collect(
+            args.log_path, args.spool, interval=args.interval, idle_exit=args.idle_exit
+        )
+    except OSError as exc:
+        print(f"[verification-emit-fail] collect {args.log_path}: {exc}", file=sys.stderr)
+        return 3
+
+
 def main(argv: list[str] | None = None) -> int:
     if argv is None:
         argv = sys.argv[1:]
@@ -278,6 +529,10 @@ def main(argv: list[str] | None = None) -> int:
         return _demo()
     if argv and argv[0] == "emit":
         return _emit(argv[1:])
+    if argv and argv[0] == "drain":
+        return _drain(argv[1:])
+    if argv and argv[0] == "collect":
+        return _collect(argv[1:])
     print(__doc__, file=sys.stderr)
     return 0
 
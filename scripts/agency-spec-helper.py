@@ -1,15 +1,33 @@
 #!/usr/bin/env python3
-"""Agency spec helper — YAML load/merge and JSON Schema validation.
+"""Agency spec helper — YAML load/merge, JSON Schema validation, cached lookups.
 
-Two subcommands:
-  load <spec_path> [override_path]  — Read YAML, merge override, normalize budget, output JSON
+Subcommands:
+  load <spec_path> [override_path]   — Read YAML, merge override, normalize budget, output JSON
   validate <spec_path> <schema_path> — Validate against JSON Schema, exit 0/1, errors to stderr
+  index [--schema P] <spec_path> [override_path]
+                                     — Every lib-spec.sh accessor precomputed, as NUL-separated
+                                       key/value records for one bash read (see lib-spec.sh)
+  query [--raw] [--override P] [--socket S] <spec_path> <path>...
+                                     — Answer many accessor paths in one call, one JSON per line
+  serve --socket <path>              — Resident mode: answer query requests over a Unix socket
 
-Called once per spec_load() in lib-spec.sh. All subsequent queries use jq on cached JSON.
+The merged, normalized spec is compiled once and cached as JSON under
+$CLAVAIN_SPEC_CACHE_DIR (default ~/.cache/clavain/agency-spec), keyed by a
+hash of the spec and override contents — a cache hit never imports PyYAML.
 """
+import hashlib
 import json
+import os
+import socket
+import socketserver
 import sys
-import yaml
+import threading
+
+CACHE_FORMAT = 1
+
+
+class SpecError(Exception):
+    """The base spec could not be read or parsed."""
 
 
 def deep_merge(base: dict, override: dict) -> dict:
@@ -23,15 +41,24 @@ def deep_merge(base: dict, override: dict) -> dict:
     return result
 
 
-def normalize_budget(spec: dict) -> dict:
-    """Scale budget shares to sum to 100 if they don't. Warn on overallocation of min_tokens."""
+def normalize_budget(spec: dict, warnings: list[str] | None = None) -> dict:
+    """Scale budget shares to sum to 100 if they don't. Warn on overallocation of min_tokens.
+
+    Warnings go to stderr, or onto ``warnings`` when given (so a cached
+    compile can replay them)."""
+    def warn(msg: str) -> None:
+        if warnings is None:
+            print(msg, file=sys.stderr)
+        else:
+            warnings.append(msg)
+
     stages = spec.get("stages", {})
     if not stages:
         return spec
 
     total_share = sum(s.get("budget", {}).get("share", 0) for s in stages.values())
     if total_share > 0 and total_share != 100:
-        print(f"spec: budget shares sum to {total_share}%, normalizing to 100%", file=sys.stderr)
+        warn(f"spec: budget shares sum to {total_share}%, normalizing to 100%")
         for stage in stages.values():
             budget = stage.get("budget", {})
             if "share" in budget:
@@ -44,25 +71,57 @@ def normalize_budget(spec: dict) -> dict:
 
     total_min = sum(s.get("budget", {}).get("min_tokens", 0) for s in stages.values())
     if total_min > 50000:
-        print(f"spec: min_tokens sum ({total_min}) exceeds 50000 floor — stages may compete for budget", file=sys.stderr)
+        warn(f"spec: min_tokens sum ({total_min}) exceeds 50000 floor — stages may compete for budget")
 
     return spec
 
 
-def cmd_load(args: list[str]) -> int:
-    if not args:
-        print("Usage: load <spec_path> [override_path]", file=sys.stderr)
-        return 1
+# ─── Compile + cache ─────────────────────────────────────────────────
+
+def _read_bytes(path: str | None) -> bytes | None:
+    if not path:
+        return None
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def cache_dir() -> str:
+    explicit = os.environ.get("CLAVAIN_SPEC_CACHE_DIR")
+    if explicit:
+        return explicit
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "clavain", "agency-spec")
 
-    spec_path = args[0]
-    override_path = args[1] if len(args) > 1 else None
 
+def _cache_key(*parts: tuple[str, bytes | None]) -> str:
+    h = hashlib.sha256(f"agency-spec/{CACHE_FORMAT}".encode())
+    for label, data in parts:
+        h.update(b"\0" + label.encode() + b"\0")
+        h.update(b"absent" if data is None else hashlib.sha256(data).digest())
+    return h.hexdigest()[:32]
+
+
+def _write_atomic(path: str, payload: dict) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(payload, f, separators=(",", ":"), ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def compile_spec(spec_path: str, override_path: str | None = None) -> tuple[dict, list[str]]:
+    """Parse, merge and normalize — the uncached path. Returns (spec, warnings)."""
+    import yaml  # only on a cache miss
+
+    warnings: list[str] = []
     try:
         with open(spec_path) as f:
             spec = yaml.safe_load(f) or {}
     except (FileNotFoundError, yaml.YAMLError) as e:
-        print(f"spec: failed to load {spec_path}: {e}", file=sys.stderr)
-        return 1
+        raise SpecError(f"spec: failed to load {spec_path}: {e}") from e
 
     if override_path:
         try:
@@ -72,26 +131,72 @@ def cmd_load(args: list[str]) -> int:
         except FileNotFoundError:
             pass  # No override is fine
         except yaml.YAMLError as e:
-            print(f"spec: failed to load override {override_path}: {e}", file=sys.stderr)
             # Continue with base spec
+            warnings.append(f"spec: failed to load override {override_path}: {e}")
 
-    spec = normalize_budget(spec)
-    json.dump(spec, sys.stdout, separators=(",", ":"))
-    return 0
+    return normalize_budget(spec, warnings), warnings
 
 
-def cmd_validate(args: list[str]) -> int:
-    if len(args) < 2:
-        print("Usage: validate <spec_path> <schema_path>", file=sys.stderr)
-        return 1
+def load_compiled(
+    spec_path: str, override_path: str | None = None, use_cache: bool = True,
+) -> tuple[dict, list[str], str | None]:
+    """The compiled spec, from cache when the inputs are unchanged.
+
+    Returns (spec, warnings, cache_path). The cache file is touched on a
+    hit, so its mtime is never older than the spec's — lib-spec.sh uses
+    `spec -nt cache` as a process-free staleness test. cache_path is None
+    when caching is off or the cache dir is unwritable."""
+    base = _read_bytes(spec_path)
+    if base is None:
+        raise SpecError(f"spec: failed to load {spec_path}: file not found")
+    if not use_cache:
+        spec, warnings = compile_spec(spec_path, override_path)
+        return spec, warnings, None
+
+    key = _cache_key(("spec", base), ("override", _read_bytes(override_path)))
+    path = os.path.join(cache_dir(), f"{key}.json")
+    try:
+        with open(path) as f:
+            cached = json.load(f)
+        os.utime(path)
+        return cached["spec"], cached.get("warnings", []), path
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    spec, warnings = compile_spec(spec_path, override_path)
+    try:
+        _write_atomic(path, {"spec": spec, "warnings": warnings})
+    except OSError:
+        return spec, warnings, None
+    return spec, warnings, path
+
+
+def validate_cached(spec_path: str, schema_path: str) -> list[str]:
+    """Schema errors for the BASE spec (as `validate`), cached by content."""
+    key = _cache_key(("validate", _read_bytes(spec_path)), ("schema", _read_bytes(schema_path)))
+    path = os.path.join(cache_dir(), f"{key}.validate.json")
+    try:
+        with open(path) as f:
+            return json.load(f)["errors"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    errors = _validation_errors(spec_path, schema_path)
+    if errors is None:
+        return []  # jsonschema unavailable — degrade, and don't cache that
+    try:
+        _write_atomic(path, {"errors": errors})
+    except OSError:
+        pass
+    return errors
 
-    spec_path, schema_path = args[0], args[1]
 
+def _validation_errors(spec_path: str, schema_path: str) -> list[str] | None:
     try:
         from jsonschema import validate, ValidationError
     except ImportError:
         print("spec: jsonschema not available, skipping validation", file=sys.stderr)
-        return 0  # Degrade gracefully
+        return None
+    import yaml
 
     try:
         with open(spec_path) as f:
@@ -99,33 +204,323 @@ def cmd_validate(args: list[str]) -> int:
         with open(schema_path) as f:
             schema = json.load(f)
     except (FileNotFoundError, json.JSONDecodeError, yaml.YAMLError) as e:
-        print(f"spec: failed to read files: {e}", file=sys.stderr)
-        return 1
-
+        return [f"spec: failed to read files: {e}"]
     try:
         validate(instance=spec, schema=schema)
-        return 0
+        return []
     except ValidationError as e:
         path = ".".join(str(p) for p in e.absolute_path) or "(root)"
-        print(f"spec: validation error at {path}: {e.message}", file=sys.stderr)
+        return [f"spec: validation error at {path}: {e.message}"]
+
+
+# ─── Lookups ─────────────────────────────────────────────────────────
+
+_MISSING = object()
+
+
+def _compact(value) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def _raw(value) -> str:
+    """jq -r rendering: strings bare, everything else as compact JSON."""
+    return value if isinstance(value, str) else _compact(value)
+
+
+def resolve(spec: dict, path: str):
+    """Look up ``a.b.c[//DEFAULT_JSON]`` — jq's ``.a.b.c // default``:
+    a missing, null or false value yields the default (null if none)."""
+    path, sep, default_text = path.partition("//")
+    default = json.loads(default_text) if sep else None
+    node = spec
+    for part in (p for p in path.strip(".").split(".") if p):
+        node = node.get(part, _MISSING) if isinstance(node, dict) else _MISSING
+        if node is _MISSING:
+            return default
+    return default if node is None or node is False else node
+
+
+def build_index(spec: dict) -> dict[str, str]:
+    """Every lib-spec.sh accessor's answer, precomputed.
+
+    Keys mirror the accessors: stage:<s>, gates:<s>, gate:<s>:<g>,
+    budget:<s>, agents:<s>, roles:<s>, companion:<n>, default:<k>, plus
+    @spec (the whole compiled spec). Values are what the accessor's jq
+    filter printed; accessors fall back to their defaults for absent keys.
+    """
+    index = {"@spec": _compact(spec)}
+    stages = spec.get("stages") or {}
+    for name, stage in stages.items():
+        if not isinstance(stage, dict):
+            continue
+        if stage:
+            index[f"stage:{name}"] = _compact(stage)
+        gates = stage.get("gates")
+        if gates:
+            index[f"gates:{name}"] = _compact(gates)
+            for gate, cfg in gates.items():
+                if cfg is not None and cfg is not False:
+                    index[f"gate:{name}:{gate}"] = _compact(cfg)
+        if stage.get("budget"):
+            index[f"budget:{name}"] = _compact(stage["budget"])
+        agents = stage.get("agents")
+        if agents:
+            index[f"agents:{name}"] = _compact(agents)
+            roles = [
+                a.get("role") for group in ("required", "optional")
+                for a in (agents.get(group) or []) if isinstance(a, dict) and a.get("role")
+            ]
+            index[f"roles:{name}"] = " " + " ".join(roles) + " "
+    for name, cfg in (spec.get("companions") or {}).items():
+        if cfg:
+            index[f"companion:{name}"] = _compact(cfg)
+    for key, value in (spec.get("defaults") or {}).items():
+        if value is not None and value is not False:
+            index[f"default:{key}"] = _raw(value)
+    return index
+
+
+def _emit_records(records: list[tuple[str, str]]) -> None:
+    out = sys.stdout.buffer
+    for key, value in records:
+        out.write(key.encode() + b"\0" + value.encode() + b"\0")
+    out.flush()
+
+
+# ─── Resident mode ───────────────────────────────────────────────────
+
+class SpecStore:
+    """Compiled specs held in memory, revalidated by (mtime_ns, size)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._specs: dict[tuple, dict] = {}
+
+    @staticmethod
+    def _stamp(path: str | None) -> tuple:
+        if not path:
+            return ()
+        try:
+            st = os.stat(path)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return ("absent",)
+
+    def get(self, spec_path: str, override_path: str | None) -> dict:
+        key = (spec_path, override_path, self._stamp(spec_path), self._stamp(override_path))
+        with self._lock:
+            spec = self._specs.get(key)
+        if spec is None:
+            spec, _, _ = load_compiled(spec_path, override_path)
+            with self._lock:
+                self._specs = {k: v for k, v in self._specs.items() if k[:2] != key[:2]}
+                self._specs[key] = spec
+        return spec
+
+    def answer(self, req: dict) -> dict:
+        try:
+            spec = self.get(req["spec"], req.get("override"))
+            fmt = _raw if req.get("raw") else _compact
+            return {"ok": True, "values": [fmt(resolve(spec, p)) for p in req.get("paths", [])]}
+        except (SpecError, KeyError, ValueError) as e:
+            return {"ok": False, "error": str(e)}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                reply = self.server.store.answer(json.loads(line))  # type: ignore[attr-defined]
+            except ValueError as e:
+                reply = {"ok": False, "error": f"bad request: {e}"}
+            self.wfile.write((json.dumps(reply, ensure_ascii=False) + "\n").encode())
+            self.wfile.flush()
+
+
+class SpecServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str):
+        if os.path.exists(path):
+            os.unlink(path)
+        super().__init__(path, _Handler)
+        self.store = SpecStore()
+
+
+class SpecClient:
+    """A persistent connection to a resident `serve` process."""
+
+    def __init__(self, socket_path: str):
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.connect(socket_path)
+        self._file = self._sock.makefile("rwb")
+
+    def query(
+        self, spec_path: str, paths: list[str], override_path: str | None = None, raw: bool = False,
+    ) -> list[str]:
+        req = {"spec": spec_path, "override": override_path, "paths": paths, "raw": raw}
+        self._file.write((json.dumps(req) + "\n").encode())
+        self._file.flush()
+        reply = json.loads(self._file.readline() or b'{"ok": false, "error": "server closed"}')
+        if not reply.get("ok"):
+            raise SpecError(reply.get("error", "query failed"))
+        return reply["values"]
+
+    def close(self) -> None:
+        self._file.close()
+        self._sock.close()
+
+
+# ─── Subcommands ─────────────────────────────────────────────────────
+
+def cmd_load(args: list[str]) -> int:
+    if not args:
+        print("Usage: load <spec_path> [override_path]", file=sys.stderr)
+        return 1
+
+    spec_path = args[0]
+    override_path = args[1] if len(args) > 1 else None
+
+    try:
+        spec, warnings, _ = load_compiled(spec_path, override_path)
+    except SpecError as e:
+        print(e, file=sys.stderr)
+        return 1
+    for w in warnings:
+        print(w, file=sys.stderr)
+    json.dump(spec, sys.stdout, separators=(",", ":"))
+    return 0
+
+
+def cmd_validate(args: list[str]) -> int:
+    if len(args) < 2:
+        print("Usage: validate <spec_path> <schema_path>", file=sys.stderr)
+        return 1
+
+    errors = _validation_errors(args[0], args[1])
+    for e in errors or []:
+        print(e, file=sys.stderr)
+    return 1 if errors else 0
+
+
+def cmd_index(args: list[str]) -> int:
+    """Records end with ("@status", ok|no-yaml|error) so the reader can
+    tell a complete index from a crashed helper."""
+    schema_path = None
+    if args[:1] == ["--schema"] and len(args) > 1:
+        schema_path, args = args[1], args[2:]
+    if not args:
+        print("Usage: index [--schema <schema_path>] <spec_path> [override_path]", file=sys.stderr)
+        return 1
+    spec_path = args[0]
+    override_path = args[1] if len(args) > 1 else None
+
+    try:
+        spec, warnings, cache_path = load_compiled(spec_path, override_path)
+    except ImportError:
+        _emit_records([("@status", "no-yaml")])
+        return 0
+    except SpecError as e:
+        print(e, file=sys.stderr)
+        _emit_records([("@status", "error")])
         return 1
+    for w in warnings:
+        print(w, file=sys.stderr)
+    if schema_path and os.path.isfile(schema_path):
+        try:
+            errors = validate_cached(spec_path, schema_path)
+        except ImportError:
+            errors = []
+        for e in errors:
+            print(e, file=sys.stderr)
+        if errors:
+            print("spec: schema validation failed (continuing with loaded spec)", file=sys.stderr)
+    records = list(build_index(spec).items())
+    records.append(("@cache", cache_path or ""))
+    records.append(("@status", "ok"))
+    _emit_records(records)
+    return 0
+
+
+def cmd_query(args: list[str]) -> int:
+    raw = False
+    override_path = None
+    socket_path = os.environ.get("CLAVAIN_SPEC_SOCKET")
+    while args and args[0].startswith("--"):
+        flag = args.pop(0)
+        if flag == "--raw":
+            raw = True
+        elif flag == "--override" and args:
+            override_path = args.pop(0)
+        elif flag == "--socket" and args:
+            socket_path = args.pop(0)
+        else:
+            print(f"query: unknown option {flag}", file=sys.stderr)
+            return 1
+    if len(args) < 2:
+        print("Usage: query [--raw] [--override P] [--socket S] <spec_path> <path>...", file=sys.stderr)
+        return 1
+    spec_path, paths = os.path.abspath(args[0]), args[1:]
+    if override_path:
+        override_path = os.path.abspath(override_path)
+
+    try:
+        values = None
+        if socket_path and os.path.exists(socket_path):
+            try:
+                client = SpecClient(socket_path)
+                try:
+                    values = client.query(spec_path, paths, override_path, raw)
+                finally:
+                    client.close()
+            except OSError:
+                values = None  # resident server gone — answer locally
+        if values is None:
+            spec, warnings, _ = load_compiled(spec_path, override_path)
+            for w in warnings:
+                print(w, file=sys.stderr)
+            fmt = _raw if raw else _compact
+            values = [fmt(resolve(spec, p)) for p in paths]
+    except (SpecError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    sys.stdout.write("".join(v + "\n" for v in values))
+    return 0
+
+
+def cmd_serve(args: list[str]) -> int:
+    if args[:1] != ["--socket"] or len(args) < 2:
+        print("Usage: serve --socket <path>", file=sys.stderr)
+        return 1
+    server = SpecServer(args[1])
+    print(f"spec: serving on {args[1]}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(args[1]):
+            os.unlink(args[1])
+    return 0
 
 
 def main() -> int:
+    commands = {
+        "load": cmd_load, "validate": cmd_validate, "index": cmd_index,
+        "query": cmd_query, "serve": cmd_serve,
+    }
     if len(sys.argv) < 2:
-        print("Usage: agency-spec-helper.py <load|validate> [args...]", file=sys.stderr)
+        print(f"Usage: agency-spec-helper.py <{'|'.join(commands)}> [args...]", file=sys.stderr)
         return 1
 
     cmd = sys.argv[1]
     args = sys.argv[2:]
 
-    if cmd == "load":
-        return cmd_load(args)
-    elif cmd == "validate":
-        return cmd_validate(args)
-    else:
-        print(f"Unknown command: {cmd}", file=sys.stderr)
-        return 1
+    if cmd in commands:
+        return commands[cmd](args)
+    print(f"Unknown command: {cmd}", file=sys.stderr)
+    return 1
 
 
 if __name__ == "__main__":
@@ -5,64 +5,333 @@ Scans all beads JSONL files across ~/projects, finds closed parents with >=3
 non-event children, computes decomposition metrics, and inserts them as
 retroactive evidence into the Interspect database.
 
+Ingestion is incremental: each file's (size, mtime, offset, hash of the
+ingested prefix) is tracked in a state table inside the Interspect DB and
+only appended lines are parsed on later runs. Parsed issues are kept in a
+compact table, one row per (issue, file) so the live export and its backup
+never clobber each other, and events are deduplicated by epic_id, so the
+backfill is cheap and safe to re-run from cron. Files are discovered and
+parsed before the write transaction, which only covers the inserts.
+
 Part of rsj.1.9 — decomposition quality calibration pipeline.
 Stage 2.5: retroactive data generation from historical beads.
 
 Usage:
-    python3 scripts/backfill-decomposition-events.py [--dry-run] [--db PATH]
+    python3 scripts/backfill-decomposition-events.py [--dry-run] [--db PATH] [--full] [--rediscover]
 """
 
 import argparse
 import glob
+import hashlib
 import json
 import os
 import sqlite3
 import subprocess
 import sys
+import time
 from collections import defaultdict
 from datetime import datetime, timezone
 
+import interspect_db
+
+# Directories never worth descending into when looking for .beads/ dirs.
+PRUNE_DIRS = {".git", "node_modules", "worktrees", ".venv", "venv", "__pycache__", "target", "dist"}
+
+# How long a discovered file list is reused before walking ~/projects again.
+DISCOVERY_TTL_SECONDS = 24 * 3600
+
+# File and issue state is a cache of the JSONL files: when its layout
+# changes, bump this and older tables are dropped and rebuilt by a full read.
+STATE_VERSION = 2
+CACHE_TABLES = ("decomposition_backfill_files", "decomposition_backfill_issues")
+
+META_SCHEMA = """
+CREATE TABLE IF NOT EXISTS decomposition_backfill_meta (
+  key   TEXT PRIMARY KEY,
+  value TEXT NOT NULL
+)"""
+
+STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS decomposition_backfill_files (
+  path         TEXT PRIMARY KEY,
+  project      TEXT NOT NULL,
+  size         INTEGER NOT NULL,
+  mtime_ns     INTEGER NOT NULL,
+  offset       INTEGER NOT NULL,
+  content_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS decomposition_backfill_issues (
+  id          TEXT NOT NULL,
+  source_path TEXT NOT NULL,
+  source_rank INTEGER NOT NULL,
+  parent_id   TEXT,
+  project     TEXT NOT NULL,
+  status      TEXT,
+  priority    INTEGER,
+  title       TEXT,
+  issue_type  TEXT,
+  PRIMARY KEY (id, source_path)
+);
+CREATE INDEX IF NOT EXISTS idx_decomposition_backfill_issues_parent
+  ON decomposition_backfill_issues(parent_id);
+CREATE TABLE IF NOT EXISTS decomposition_backfill_emitted (
+  epic_id    TEXT PRIMARY KEY,
+  emitted_at TEXT NOT NULL
+);
+"""
+
+
+def _walk_beads(root):
+    """Yield issues.jsonl paths under root, pruning heavy and irrelevant dirs."""
+    for dirpath, dirnames, _ in os.walk(root):
+        if os.path.basename(dirpath) == ".beads":
+            for rel in ("backup/issues.jsonl", "issues.jsonl"):
+                candidate = os.path.join(dirpath, rel)
+                if os.path.isfile(candidate):
+                    yield candidate
+            dirnames[:] = []
+            continue
+        dirnames[:] = [
+            d for d in dirnames
+            if d == ".beads" or (d not in PRUNE_DIRS and not (d == "cache" and dirpath.endswith("/plugins")))
+        ]
+
 
 def find_jsonl_files():
     """Find all beads JSONL files across projects."""
-    patterns = [
-        os.path.expanduser("~/projects/*/.beads/backup/issues.jsonl"),
-        os.path.expanduser("~/projects/*/.beads/issues.jsonl"),
-        os.path.expanduser("~/projects/Sylveste/**/.beads/backup/issues.jsonl"),
-        os.path.expanduser("~/projects/Sylveste/**/.beads/issues.jsonl"),
-        os.path.expanduser("~/projects/Sylveste/research/*/.beads/issues.jsonl"),
-        os.path.expanduser("~/projects/.beads/issues.jsonl"),
-    ]
+    projects = os.path.expanduser("~/projects")
+    candidates = []
+    for pat in (
+        os.path.join(projects, "*/.beads/backup/issues.jsonl"),
+        os.path.join(projects, "*/.beads/issues.jsonl"),
+        os.path.join(projects, ".beads/issues.jsonl"),
+    ):
+        candidates.extend(glob.glob(pat))
+    sylveste = os.path.join(projects, "Sylveste")
+    if os.path.isdir(sylveste):
+        candidates.extend(_walk_beads(sylveste))
+
     seen = set()
     files = []
-    for pat in patterns:
-        for f in glob.glob(pat, recursive=True):
-            if f in seen or "/worktrees/" in f or "/plugins/cache/" in f:
-                continue
-            seen.add(f)
-            files.append(f)
+    for f in candidates:
+        if f in seen or "/worktrees/" in f or "/plugins/cache/" in f:
+            continue
+        seen.add(f)
+        files.append(f)
     return files
 
 
-def load_all_issues(jsonl_files):
-    """Load and deduplicate all issues from JSONL files."""
-    all_issues = {}
-    for f in jsonl_files:
-        proj = f.split("/projects/")[-1].split("/.beads")[0] if "/projects/" in f else "unknown"
+def project_for_path(path):
+    """Derive the project label from a beads JSONL path."""
+    return path.split("/projects/")[-1].split("/.beads")[0] if "/projects/" in path else "unknown"
+
+
+def _meta(conn, key):
+    """A decomposition_backfill_meta value, or None (also before the table exists)."""
+    try:
+        row = conn.execute("SELECT value FROM decomposition_backfill_meta WHERE key = ?", (key,)).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return row[0] if row else None
+
+
+def ensure_state_schema(conn):
+    """Create the state tables inside the caller's write transaction,
+    dropping file/issue state written under another STATE_VERSION."""
+    conn.execute(META_SCHEMA)
+    if _meta(conn, "state_version") != str(STATE_VERSION):
+        for table in CACHE_TABLES:
+            conn.execute(f"DROP TABLE IF EXISTS {table}")
+    interspect_db.execute_script(conn, STATE_SCHEMA)
+    conn.execute(
+        "INSERT OR REPLACE INTO decomposition_backfill_meta (key, value) VALUES ('state_version', ?)",
+        (str(STATE_VERSION),),
+    )
+
+
+def load_file_states(conn):
+    """{path: (size, mtime_ns, offset, content_hash)} from earlier runs.
+
+    Empty when the state tables are missing or from another STATE_VERSION."""
+    if _meta(conn, "state_version") != str(STATE_VERSION):
+        return {}
+    return {
+        row[0]: tuple(row[1:])
+        for row in conn.execute("SELECT path, size, mtime_ns, offset, content_hash FROM decomposition_backfill_files")
+    }
+
+
+def _file_state(conn, path):
+    row = conn.execute(
+        "SELECT size, mtime_ns, offset, content_hash FROM decomposition_backfill_files WHERE path = ?",
+        (path,),
+    ).fetchone()
+    return tuple(row) if row else None
+
+
+def discover_files(conn, rediscover=False, now=None):
+    """Return (files, discovery): the beads JSONL file list, reusing a
+    recent discovery, and the new discovery record for store_discovery()
+    (None when the cached list was reused). Reads only.
+    """
+    now = time.time() if now is None else now
+    cached = _meta(conn, "discovered")
+    if cached and not rediscover:
+        cached = json.loads(cached)
+        if now - cached.get("at", 0) <= DISCOVERY_TTL_SECONDS:
+            return [f for f in cached.get("files", []) if os.path.isfile(f)], None
+    files = find_jsonl_files()
+    return files, {"at": now, "files": files}
+
+
+def store_discovery(conn, discovery):
+    conn.execute(
+        "INSERT OR REPLACE INTO decomposition_backfill_meta (key, value) VALUES ('discovered', ?)",
+        (json.dumps(discovery),),
+    )
+
+
+def _prefix_hash(data, length):
+    """Fingerprint everything ingested so far, so any edit before the
+    stored offset — even one that keeps the file's length — is caught."""
+    return hashlib.sha256(memoryview(data)[:length]).hexdigest()
+
+
+def _source_rank(path):
+    """Which copy of an issue wins: the live export before its backup."""
+    return 1 if "/backup/" in path else 0
+
+
+def _issue_row(issue, project, path):
+    iid = issue.get("id", "")
+    priority = issue.get("priority")
+    return (
+        iid,
+        path,
+        _source_rank(path),
+        get_parent_id(iid),
+        project,
+        issue.get("status"),
+        priority if isinstance(priority, int) else None,
+        issue.get("title", "") or "",
+        issue.get("issue_type", "") or issue.get("work_type", "") or "",
+    )
+
+
+def parse_file(path, state=None, full=False):
+    """Parse the lines appended to path since the last run; no DB access.
+
+    state is the file's entry from load_file_states(). A file that shrank,
+    was edited anywhere before the stored offset (prefix hash mismatch), or
+    is forced with full=True is re-read from the start, and the returned
+    update has reset=True so its previously ingested issues are replaced.
+    Returns None when the file is unchanged or unreadable.
+    """
+    try:
+        st = os.stat(path)
+        if state and not full and state[0] == st.st_size and state[1] == st.st_mtime_ns:
+            return None
+        with open(path, "rb") as fh:
+            data = fh.read()
+    except OSError:
+        return None
+
+    offset = 0
+    if state and not full and len(data) >= state[2] and _prefix_hash(data, state[2]) == state[3]:
+        offset = state[2]
+    # Only consume complete lines; a partially written tail is picked up next run.
+    end = data.rfind(b"\n", offset) + 1 or offset
+    project = project_for_path(path)
+    rows = []
+    for raw in data[offset:end].splitlines():
+        raw = raw.strip()
+        if not raw:
+            continue
         try:
-            with open(f) as fh:
-                for line in fh:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    issue = json.loads(line)
-                    iid = issue.get("id", "")
-                    if iid:
-                        issue["_project"] = proj
-                        all_issues[iid] = issue
-        except (json.JSONDecodeError, OSError):
-            pass
-    return all_issues
+            issue = json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+        if isinstance(issue, dict) and issue.get("id"):
+            rows.append(_issue_row(issue, project, path))
+    return {
+        "path": path,
+        "project": project,
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "offset": end,
+        "content_hash": _prefix_hash(data, end),
+        "reset": offset == 0,
+        "rows": rows,
+    }
+
+
+def apply_file_update(conn, update, state):
+    """Write one parse_file() result inside the write transaction.
+
+    Skipped (returns 0) when another run changed the file's state since
+    `state` was read; the next run picks the file up again. Returns the
+    number of issue rows upserted.
+    """
+    path = update["path"]
+    if _file_state(conn, path) != state:
+        return 0
+    if update["reset"]:
+        conn.execute("DELETE FROM decomposition_backfill_issues WHERE source_path = ?", (path,))
+    conn.executemany(
+        """INSERT OR REPLACE INTO decomposition_backfill_issues
+           (id, source_path, source_rank, parent_id, project, status, priority, title, issue_type)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        update["rows"],
+    )
+    conn.execute(
+        """INSERT OR REPLACE INTO decomposition_backfill_files
+           (path, project, size, mtime_ns, offset, content_hash) VALUES (?, ?, ?, ?, ?, ?)""",
+        (path, update["project"], update["size"], update["mtime_ns"], update["offset"], update["content_hash"]),
+    )
+    return len(update["rows"])
+
+
+def _issue_dict(row):
+    iid, project, status, priority, title, issue_type = row
+    return {
+        "id": iid,
+        "_project": project,
+        "status": status,
+        "priority": priority,
+        "title": title or "",
+        "issue_type": issue_type or "",
+    }
+
+
+# One row per issue id: the live export's copy before its backup's.
+_ISSUES_SQL = """
+    SELECT id, parent_id, project, status, priority, title, issue_type FROM (
+        SELECT *, ROW_NUMBER() OVER (PARTITION BY id ORDER BY source_rank, source_path) AS pick
+        FROM decomposition_backfill_issues
+    ) WHERE pick = 1"""
+
+
+def load_candidate_decompositions(conn):
+    """Return {parent_id: (parent, [children])} for closed, not-yet-emitted parents.
+
+    An issue present in several files is taken from the best-ranked one."""
+    rows = conn.execute(
+        f"""WITH issues AS ({_ISSUES_SQL})
+           SELECT p.id, p.project, p.status, p.priority, p.title, p.issue_type,
+                  c.id, c.project, c.status, c.priority, c.title, c.issue_type
+           FROM issues p
+           JOIN issues c ON c.parent_id = p.id
+           LEFT JOIN decomposition_backfill_emitted e ON e.epic_id = p.id
+           WHERE p.status = 'closed' AND e.epic_id IS NULL
+           ORDER BY p.id, c.id"""
+    ).fetchall()
+    grouped = {}
+    for row in rows:
+        pid = row[0]
+        if pid not in grouped:
+            grouped[pid] = (_issue_dict(row[:6]), [])
+        grouped[pid][1].append(_issue_dict(row[6:]))
+    return grouped
 
 
 def get_parent_id(issue_id):
@@ -118,83 +387,44 @@ def compute_decomposition_metrics(parent, real_children, baseline_p50=5):
     }
 
 
-def find_interspect_db(db_path=None):
-    """Find the Interspect database path.
+def seed_emitted_from_evidence(conn):
+    """Record epic_ids already present as retroactive evidence.
 
-    Mirrors lib-interspect.sh _interspect_db_path() priority:
-    CLAUDE_PROJECT_DIR > git root > hardcoded fallback.
+    Covers events written before the emitted table existed, so the first
+    incremental run does not duplicate a prior full backfill.
     """
-    if db_path:
-        return db_path
+    conn.execute(
+        """INSERT OR IGNORE INTO decomposition_backfill_emitted (epic_id, emitted_at)
+           SELECT json_extract(context, '$.epic_id'), ts FROM evidence
+           WHERE event = 'decomposition_outcome'
+             AND source_table = 'interspect-decomposition'
+             AND json_extract(context, '$.epic_id') IS NOT NULL"""
+    )
 
-    # 1. CLAUDE_PROJECT_DIR
-    project_dir = os.environ.get("CLAUDE_PROJECT_DIR", "")
-    if project_dir:
-        candidate = os.path.join(project_dir, ".clavain/interspect/interspect.db")
-        if os.path.isfile(candidate):
-            return candidate
 
-    # 2. Git root
+def _source_version():
     try:
         result = subprocess.run(
-            ["git", "rev-parse", "--show-toplevel"],
-            capture_output=True, text=True, timeout=5
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, cwd=os.path.expanduser("~/projects/Sylveste")
         )
         if result.returncode == 0:
-            candidate = os.path.join(result.stdout.strip(), ".clavain/interspect/interspect.db")
-            if os.path.isfile(candidate):
-                return candidate
-    except (OSError, subprocess.TimeoutExpired):
+            return result.stdout.strip()
+    except OSError:
         pass
+    return ""
 
-    # 3. Hardcoded fallback
-    candidate = os.path.expanduser("~/projects/Sylveste/.clavain/interspect/interspect.db")
-    if os.path.isfile(candidate):
-        return candidate
 
-    return None
-
-
-def get_existing_event_count(db_path):
-    """Count existing decomposition_outcome events."""
-    conn = sqlite3.connect(db_path)
-    count = conn.execute(
-        "SELECT COUNT(*) FROM evidence WHERE event = 'decomposition_outcome'"
-    ).fetchone()[0]
-    conn.close()
-    return count
+def insert_events(conn, metrics_list, source_version=""):
+    """Insert decomposition_outcome events and mark their epics as emitted.
 
-
-def get_next_seq(conn, session_id):
-    """Get next sequence number for a session."""
-    row = conn.execute(
-        "SELECT COALESCE(MAX(seq), 0) + 1 FROM evidence WHERE session_id = ?",
-        (session_id,),
-    ).fetchone()
-    return row[0]
-
-
-def insert_events(db_path, metrics_list, dry_run=False):
-    """Insert decomposition_outcome events into Interspect."""
-    if dry_run:
-        print(f"\n[DRY RUN] Would insert {len(metrics_list)} events into {db_path}")
-        return 0
-
-    conn = sqlite3.connect(db_path)
+    Runs inside the caller's transaction; one executemany per table.
+    """
     session_id = "backfill-decomposition-" + datetime.now(timezone.utc).strftime("%Y%m%d")
     ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    source_version = ""
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--short", "HEAD"],
-            capture_output=True, text=True, cwd=os.path.expanduser("~/projects/Sylveste")
-        )
-        if result.returncode == 0:
-            source_version = result.stdout.strip()
-    except OSError:
-        pass
+    first_seq = interspect_db.next_seq(conn, session_id)
 
-    inserted = 0
+    rows = []
     for i, m in enumerate(metrics_list):
         context = json.dumps({
             "epic_id": m["epic_id"],
@@ -208,24 +438,25 @@ def insert_events(db_path, metrics_list, dry_run=False):
             "retroactive": True,
             "source_project": m["project"],
         })
-        seq = i + 1
-        conn.execute(
-            """INSERT INTO evidence
-               (ts, session_id, seq, source, source_version, event,
-                override_reason, context, project, project_lang, project_type,
-                source_event_id, source_table, raw_override_reason, quarantine_until)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, NULL, NULL, ?, NULL, 0)""",
-            (
-                ts, session_id, seq, "decomposition", source_version,
-                "decomposition_outcome", "", context, "Sylveste",
-                "interspect-decomposition",
-            ),
-        )
-        inserted += 1
-
-    conn.commit()
-    conn.close()
-    return inserted
+        rows.append((
+            ts, session_id, first_seq + i, "decomposition", source_version,
+            "decomposition_outcome", "", context, "Sylveste",
+            "interspect-decomposition",
+        ))
+
+    conn.executemany(
+        """INSERT INTO evidence
+           (ts, session_id, seq, source, source_version, event,
+            override_reason, context, project, project_lang, project_type,
+            source_event_id, source_table, raw_override_reason, quarantine_until)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, NULL, NULL, ?, NULL, 0)""",
+        rows,
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO decomposition_backfill_emitted (epic_id, emitted_at) VALUES (?, ?)",
+        [(m["epic_id"], ts) for m in metrics_list],
+    )
+    return len(rows)
 
 
 def main():
@@ -234,41 +465,82 @@ def main():
     parser.add_argument("--db", type=str, help="Path to Interspect database (auto-detected if omitted)")
     parser.add_argument("--min-children", type=int, default=3, help="Minimum non-event children to qualify (default: 3)")
     parser.add_argument("--baseline-p50", type=int, default=5, help="Baseline p50 for prediction stand-in (default: 5)")
+    parser.add_argument("--full", action="store_true", help="Re-read every JSONL file from the start")
+    parser.add_argument("--rediscover", action="store_true", help="Walk ~/projects for JSONL files even if a recent list is cached")
     args = parser.parse_args()
 
-    # Find and load all JSONL data
-    jsonl_files = find_jsonl_files()
-    print(f"Found {len(jsonl_files)} JSONL files")
+    # Find database (ingest state lives alongside the evidence it feeds)
+    db_path = interspect_db.find_db(args.db)
+    if not db_path:
+        print("\nERROR: Could not find Interspect database. Use --db to specify path.")
+        sys.exit(1)
+    print(f"Interspect DB: {db_path}")
 
-    all_issues = load_all_issues(jsonl_files)
-    print(f"Loaded {len(all_issues)} issues")
-
-    # Build parent-child map
-    children_of = defaultdict(list)
-    for iid, issue in all_issues.items():
-        pid = get_parent_id(iid)
-        if pid and pid in all_issues:
-            children_of[pid].append(issue)
-
-    # Find qualifying decompositions
-    metrics_list = []
-    for pid, kids in children_of.items():
-        parent = all_issues[pid]
-        if parent.get("status") != "closed":
-            continue
-        real_kids = [k for k in kids if not is_event_child(k)]
-        if len(real_kids) < args.min_children:
-            continue
-        metrics = compute_decomposition_metrics(parent, real_kids, args.baseline_p50)
-        metrics_list.append(metrics)
+    conn = interspect_db.connect(db_path)
+    if not args.dry_run:
+        interspect_db.migrate(conn)
+    # Discover and parse with no lock held; hook writers only wait on the
+    # write transaction below.
+    states = load_file_states(conn)
+    jsonl_files, discovery = discover_files(conn, rediscover=args.rediscover or args.full)
+    print(f"Found {len(jsonl_files)} JSONL files")
+    updates = [u for u in (parse_file(f, states.get(f), full=args.full) for f in jsonl_files) if u]
+    source_version = _source_version()
 
-    print(f"Found {len(metrics_list)} qualifying decompositions")
+    # One transaction for state, issues and events; dry-run rolls it back.
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        ensure_state_schema(conn)
+        seed_emitted_from_evidence(conn)
+        if discovery:
+            store_discovery(conn, discovery)
+
+        parsed = sum(apply_file_update(conn, u, states.get(u["path"])) for u in updates)
+        total_issues = conn.execute("SELECT COUNT(DISTINCT id) FROM decomposition_backfill_issues").fetchone()[0]
+        print(f"Parsed {parsed} new/changed issue lines ({total_issues} issues indexed)")
+
+        # Find qualifying decompositions not yet emitted
+        metrics_list = []
+        for pid, (parent, kids) in load_candidate_decompositions(conn).items():
+            real_kids = [k for k in kids if not is_event_child(k)]
+            if len(real_kids) < args.min_children:
+                continue
+            metrics_list.append(compute_decomposition_metrics(parent, real_kids, args.baseline_p50))
+
+        print(f"Found {len(metrics_list)} new qualifying decompositions")
+        existing = interspect_db.count_events(conn, "decomposition_outcome")
+
+        if metrics_list:
+            print_distribution(metrics_list)
+            print(f"\nExisting decomposition_outcome events: {existing}")
+            inserted = insert_events(conn, metrics_list, source_version)
+        else:
+            print("Nothing to backfill.")
+            inserted = 0
+
+        conn.execute("ROLLBACK" if args.dry_run else "COMMIT")
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        conn.close()
+        raise
+
+    if args.dry_run:
+        if inserted:
+            print(f"\n[DRY RUN] Would insert {inserted} events into {db_path}")
+            projected = existing + inserted
+            print(f"\n[DRY RUN] Would bring total to {projected} events")
+            print(f"Calibration threshold: 30 — {'READY' if projected >= 30 else f'need {30 - projected} more'}")
+    elif inserted:
+        print(f"\nInserted {inserted} decomposition_outcome events")
+        final = interspect_db.count_events(conn, "decomposition_outcome")
+        print(f"Total decomposition_outcome events: {final}")
+        print(f"Calibration threshold: 30 — {'READY' if final >= 30 else f'need {30 - final} more'}")
+    conn.close()
 
-    if not metrics_list:
-        print("Nothing to backfill.")
-        return
 
-    # Distribution summary
+def print_distribution(metrics_list):
+    """Print child-count, completion and per-project summaries."""
     child_counts = sorted(m["actual_children"] for m in metrics_list)
     n = len(child_counts)
     print(f"\nChild count distribution (N={n}):")
@@ -288,33 +560,6 @@ def main():
     if len(proj_counts) > 10:
         print(f"  ... and {len(proj_counts) - 10} more")
 
-    # Find database
-    db_path = find_interspect_db(args.db)
-    if not db_path:
-        print("\nERROR: Could not find Interspect database. Use --db to specify path.")
-        sys.exit(1)
-    print(f"\nInterspect DB: {db_path}")
-
-    existing = get_existing_event_count(db_path)
-    print(f"Existing decomposition_outcome events: {existing}")
-
-    if existing > 0 and not args.dry_run:
-        print(f"WARNING: {existing} events already exist. Backfill is additive.")
-        print("  If re-running, consider clearing existing retroactive events first:")
-        print(f"  sqlite3 '{db_path}' \"DELETE FROM evidence WHERE event='decomposition_outcome' AND context LIKE '%retroactive%true%';\"")
-
-    # Insert
-    inserted = insert_events(db_path, metrics_list, dry_run=args.dry_run)
-    if not args.dry_run:
-        print(f"\nInserted {inserted} decomposition_outcome events")
-        final = get_existing_event_count(db_path)
-        print(f"Total decomposition_outcome events: {final}")
-        print(f"Calibration threshold: 30 — {'READY' if final >= 30 else f'need {30 - final} more'}")
-    else:
-        projected = existing + len(metrics_list)
-        print(f"\n[DRY RUN] Would bring total to {projected} events")
-        print(f"Calibration threshold: 30 — {'READY' if projected >= 30 else f'need {30 - projected} more'}")
-
 
 if __name__ == "__main__":
     main()
@@ -1,95 +1,279 @@
 #!/usr/bin/env python3
 """Stage 3 calibration: recompute decomposition quality parameters from Interspect evidence.
 
-Reads all decomposition_outcome events from Interspect, computes calibrated
-percentiles and thresholds, and writes the `calibrated:` section into
-decomposition-calibration.yaml.
+Aggregates decomposition_outcome events inside SQLite (JSON1 extraction,
+grouped by value), folds them into mergeable histogram sketches persisted in
+the Interspect DB, computes calibrated percentiles and thresholds, and writes
+the `calibrated:` section into decomposition-calibration.yaml.
+
+Recalibration is incremental: only events that became eligible since the last
+run (new rows, or rows whose quarantine expired) are aggregated and merged into
+the stored sketches. Sketches are kept per project and per complexity too, so
+`--by project|complexity` breakdowns need no extra scan. Sketches only
+grow, so each run also counts the currently eligible rows; when a row was
+deleted or re-quarantined the counts differ and the sketches are rebuilt.
 
 Part of rsj.1.9 — decomposition quality calibration pipeline.
 Stage 3: auto-calibrate from accumulated evidence.
 
 Usage:
     python3 scripts/calibrate-decomposition.py [--dry-run] [--db PATH] [--config PATH]
+                                               [--by project|complexity] [--rebuild]
 """
 
 import argparse
 import json
 import os
-import sqlite3
-import subprocess
 import sys
 from datetime import datetime, timezone
 
+import interspect_db
+
+
+STATE_SCHEMA = """
+CREATE INDEX IF NOT EXISTS idx_evidence_event_quarantine
+  ON evidence(event, quarantine_until);
+CREATE TABLE IF NOT EXISTS decomposition_calibration_sketches (
+  dimension TEXT NOT NULL,
+  grp       TEXT NOT NULL,
+  sketch    TEXT NOT NULL,
+  PRIMARY KEY (dimension, grp)
+);
+CREATE TABLE IF NOT EXISTS decomposition_calibration_state (
+  key   TEXT PRIMARY KEY,
+  value INTEGER NOT NULL
+);
+"""
 
-def percentile(sorted_arr, p):
-    """Compute percentile from a sorted array."""
-    if not sorted_arr:
-        return 0
-    idx = int(len(sorted_arr) * p / 100)
-    return sorted_arr[min(idx, len(sorted_arr) - 1)]
+# Groups each event is folded into: ("all", "*"), ("project", <name>), ("complexity", <n>).
+DIMENSIONS = ("all", "project", "complexity")
 
 
-def load_events(db_path, min_threshold=30):
-    """Load decomposition_outcome events from Interspect."""
-    conn = sqlite3.connect(db_path)
-    now_epoch = int(datetime.now(timezone.utc).timestamp())
+class QuantileSketch:
+    """Mergeable value -> count histogram.
+
+    Decomposition metrics are small integers or rates rounded to 3 decimals,
+    so a histogram over observed values is exact, tiny, and merges by adding
+    counts. quantile() reproduces the old sorted-array index semantics.
+    """
+
+    def __init__(self, counts=None):
+        self.counts = dict(counts or {})
+
+    @property
+    def n(self):
+        return sum(self.counts.values())
+
+    def add(self, value, count=1):
+        self.counts[value] = self.counts.get(value, 0) + count
+
+    def merge(self, other):
+        for value, count in other.counts.items():
+            self.add(value, count)
+
+    def quantile(self, p):
+        n = self.n
+        if not n:
+            return 0
+        idx = min(int(n * p / 100), n - 1)
+        seen = 0
+        for value in sorted(self.counts):
+            seen += self.counts[value]
+            if seen > idx:
+                return value
+        return max(self.counts)
+
+    def total(self):
+        return sum(value * count for value, count in self.counts.items())
+
+    def mean(self):
+        n = self.n
+        return self.total() / n if n else 0
+
+    def min(self):
+        return min(self.counts) if self.counts else 0
+
+    def max(self):
+        return max(self.counts) if self.counts else 0
+
+    def to_json(self):
+        return sorted([value, count] for value, count in self.counts.items())
+
+    @classmethod
+    def from_json(cls, pairs):
+        return cls({value: count for value, count in pairs})
+
+
+class CalibrationSketch:
+    """The three metric sketches plus provenance counts for one group."""
+
+    def __init__(self, child=None, completion=None, replan=None, retroactive=0):
+        self.child = child or QuantileSketch()
+        self.completion = completion or QuantileSketch()
+        self.replan = replan or QuantileSketch()
+        self.retroactive = retroactive
+
+    @property
+    def n(self):
+        return self.child.n
+
+    def merge(self, other):
+        self.child.merge(other.child)
+        self.completion.merge(other.completion)
+        self.replan.merge(other.replan)
+        self.retroactive += other.retroactive
+
+    def to_json(self):
+        return json.dumps({
+            "child": self.child.to_json(),
+            "completion": self.completion.to_json(),
+            "replan": self.replan.to_json(),
+            "retroactive": self.retroactive,
+        })
+
+    @classmethod
+    def from_json(cls, text):
+        data = json.loads(text)
+        return cls(
+            QuantileSketch.from_json(data["child"]),
+            QuantileSketch.from_json(data["completion"]),
+            QuantileSketch.from_json(data["replan"]),
+            data.get("retroactive", 0),
+        )
+
+
+def ensure_schema(conn):
+    interspect_db.execute_script(conn, STATE_SCHEMA)
+
+
+def _get_state(conn, key, default=0):
+    row = conn.execute(
+        "SELECT value FROM decomposition_calibration_state WHERE key = ?", (key,)
+    ).fetchone()
+    return row[0] if row else default
+
+
+def _set_state(conn, key, value):
+    conn.execute(
+        "INSERT OR REPLACE INTO decomposition_calibration_state (key, value) VALUES (?, ?)",
+        (key, value),
+    )
+
+
+def load_sketches(conn):
+    sketches = {}
+    for dimension, grp, text in conn.execute(
+        "SELECT dimension, grp, sketch FROM decomposition_calibration_sketches"
+    ):
+        sketches[(dimension, grp)] = CalibrationSketch.from_json(text)
+    return sketches
+
+
+def save_sketches(conn, sketches):
+    conn.executemany(
+        "INSERT OR REPLACE INTO decomposition_calibration_sketches (dimension, grp, sketch) VALUES (?, ?, ?)",
+        [(dimension, grp, sketch.to_json()) for (dimension, grp), sketch in sketches.items()],
+    )
+
+
+def aggregate_new_events(conn, now_epoch, rebuild=False):
+    """Fold newly eligible events into the persisted sketches.
+
+    Eligible-since-last-run means: rows past the id watermark that are out of
+    quarantine, plus older rows whose quarantine expired since the last run.
+    Aggregation happens in SQL; Python only sees one row per distinct value
+    combination. If the folded total then differs from the number of
+    eligible rows (rows deleted or re-quarantined since they were counted),
+    the sketches are rebuilt from scratch. Returns (sketches, events_added).
+    """
+    if rebuild:
+        conn.execute("DELETE FROM decomposition_calibration_sketches")
+        conn.execute("DELETE FROM decomposition_calibration_state")
+    watermark = _get_state(conn, "max_id")
+    last_now = _get_state(conn, "last_now")
+
     rows = conn.execute(
-        """SELECT context FROM evidence
+        """SELECT COALESCE(json_extract(context, '$.source_project'), project) AS proj,
+                  COALESCE(json_extract(context, '$.complexity'), 0) AS complexity,
+                  COALESCE(json_extract(context, '$.actual_children'), 0) AS child,
+                  COALESCE(json_extract(context, '$.completion_rate'), 0) AS completion,
+                  COALESCE(json_extract(context, '$.replan_count'), 0) AS replan,
+                  COALESCE(json_extract(context, '$.retroactive'), 0) AS retroactive,
+                  COUNT(*)
+           FROM evidence
            WHERE event = 'decomposition_outcome'
-             AND quarantine_until <= ?""",
-        (now_epoch,),
+             AND json_valid(context)
+             AND quarantine_until <= :now
+             AND (id > :watermark OR quarantine_until > :last_now)
+           GROUP BY proj, complexity, child, completion, replan, retroactive""",
+        {"now": now_epoch, "watermark": watermark, "last_now": last_now},
     ).fetchall()
-    conn.close()
-
-    events = []
-    for (ctx_str,) in rows:
-        try:
-            ctx = json.loads(ctx_str)
-            events.append(ctx)
-        except (json.JSONDecodeError, TypeError):
-            pass
-
-    if len(events) < min_threshold:
-        print(f"Only {len(events)} events (threshold: {min_threshold}). Calibration not ready.")
-        sys.exit(1)
-
-    return events
-
 
-def compute_calibration(events):
-    """Compute calibrated parameters from events."""
-    child_counts = sorted(e.get("actual_children", 0) for e in events)
-    completion_rates = sorted(e.get("completion_rate", 0) for e in events)
-    replan_counts = sorted(e.get("replan_count", 0) for e in events)
-    n = len(events)
+    sketches = load_sketches(conn)
+    added = 0
+    for proj, complexity, child, completion, replan, retroactive, count in rows:
+        for key in (("all", "*"), ("project", str(proj)), ("complexity", str(complexity))):
+            sketch = sketches.setdefault(key, CalibrationSketch())
+            sketch.child.add(child, count)
+            sketch.completion.add(completion, count)
+            sketch.replan.add(replan, count)
+            if retroactive:
+                sketch.retroactive += count
+        added += count
+
+    eligible = conn.execute(
+        """SELECT COUNT(*) FROM evidence
+           WHERE event = 'decomposition_outcome' AND quarantine_until <= ? AND json_valid(context)""",
+        (now_epoch,),
+    ).fetchone()[0]
+    folded = sketches[("all", "*")].n if ("all", "*") in sketches else 0
+    if not rebuild and folded != eligible:
+        print(f"Sketches hold {folded} events but {eligible} are eligible; rebuilding")
+        return aggregate_new_events(conn, now_epoch, rebuild=True)
+
+    max_id = conn.execute(
+        "SELECT COALESCE(MAX(id), 0) FROM evidence WHERE event = 'decomposition_outcome'"
+    ).fetchone()[0]
+    _set_state(conn, "max_id", max(watermark, max_id))
+    _set_state(conn, "last_now", now_epoch)
+    save_sketches(conn, sketches)
+    return sketches, added
+
+
+def compute_calibration(sketch):
+    """Compute calibrated parameters from a CalibrationSketch."""
+    child_counts = sketch.child
+    completion_rates = sketch.completion
+    replan_counts = sketch.replan
+    n = sketch.n
 
     # Separate retroactive from live events for weighting info
-    retroactive = sum(1 for e in events if e.get("retroactive"))
+    retroactive = sketch.retroactive
     live = n - retroactive
 
     calibrated = {
         "child_count": {
-            "p25": percentile(child_counts, 25),
-            "p50": percentile(child_counts, 50),
-            "p75": percentile(child_counts, 75),
-            "p90": percentile(child_counts, 90),
-            "mean": round(sum(child_counts) / n, 1),
-            "range": [min(child_counts), max(child_counts)],
+            "p25": child_counts.quantile(25),
+            "p50": child_counts.quantile(50),
+            "p75": child_counts.quantile(75),
+            "p90": child_counts.quantile(90),
+            "mean": round(child_counts.mean(), 1),
+            "range": [child_counts.min(), child_counts.max()],
         },
         "thresholds": {
-            "under_decomposition": max(2, percentile(child_counts, 5)),
-            "over_decomposition": percentile(child_counts, 90),
+            "under_decomposition": max(2, child_counts.quantile(5)),
+            "over_decomposition": child_counts.quantile(90),
             "prediction_accuracy_warn": 0.5,
         },
         "completion": {
-            "expected_rate": round(sum(completion_rates) / n, 3),
+            "expected_rate": round(completion_rates.mean(), 3),
             # p10 can be 1.0 when most decompositions complete fully — use p5 with a floor
-            "warn_below": round(min(percentile(completion_rates, 5), 0.75), 2),
+            "warn_below": round(min(completion_rates.quantile(5), 0.75), 2),
         },
         "replanning": {
             # Retroactive events use baseline p50 as prediction stand-in, so replan
             # counts are inflated. Only trust this when live_count > 0.
-            "expected_rate": round(sum(replan_counts) / n / max(sum(child_counts) / n, 1), 2) if live > 0 else 0.15,
+            "expected_rate": round(replan_counts.mean() / max(child_counts.mean(), 1), 2) if live > 0 else 0.15,
             "warn_above": 0.40,
         },
         "last_calibrated": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
@@ -100,6 +284,21 @@ def compute_calibration(events):
     return calibrated
 
 
+def print_breakdown(sketches, dimension):
+    """Print per-group child-count and completion summaries for one dimension."""
+    groups = sorted(
+        ((grp, sk) for (dim, grp), sk in sketches.items() if dim == dimension and sk.n),
+        key=lambda item: -item[1].n,
+    )
+    print(f"\nBy {dimension} ({len(groups)} groups):")
+    print(f"  {dimension[:30]:30s} {'n':>5s} {'p50':>5s} {'p90':>5s} {'mean':>6s} {'compl':>6s}")
+    for grp, sk in groups:
+        print(
+            f"  {grp[:30]:30s} {sk.n:5d} {sk.child.quantile(50):5} {sk.child.quantile(90):5} "
+            f"{sk.child.mean():6.1f} {sk.completion.mean():6.3f}"
+        )
+
+
 def format_yaml_section(calibrated):
     """Format the calibrated section as YAML."""
     c = calibrated
@@ -150,52 +349,17 @@ def find_config_path(config_path=None):
     return None
 
 
-def find_interspect_db(db_path=None):
-    """Find the Interspect database path.
-
-    Mirrors lib-interspect.sh _interspect_db_path() priority:
-    CLAUDE_PROJECT_DIR > git root > hardcoded fallback.
-    """
-    if db_path:
-        return db_path
-
-    # 1. CLAUDE_PROJECT_DIR (set by Claude Code for the active project)
-    project_dir = os.environ.get("CLAUDE_PROJECT_DIR", "")
-    if project_dir:
-        candidate = os.path.join(project_dir, ".clavain/interspect/interspect.db")
-        if os.path.isfile(candidate):
-            return candidate
-
-    # 2. Git root
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--show-toplevel"],
-            capture_output=True, text=True, timeout=5
-        )
-        if result.returncode == 0:
-            candidate = os.path.join(result.stdout.strip(), ".clavain/interspect/interspect.db")
-            if os.path.isfile(candidate):
-                return candidate
-    except (OSError, subprocess.TimeoutExpired):
-        pass
-
-    # 3. Hardcoded fallback
-    candidate = os.path.expanduser("~/projects/Sylveste/.clavain/interspect/interspect.db")
-    if os.path.isfile(candidate):
-        return candidate
-
-    return None
-
-
 def main():
     parser = argparse.ArgumentParser(description="Calibrate decomposition quality parameters")
     parser.add_argument("--dry-run", action="store_true", help="Print calibrated values without writing")
     parser.add_argument("--db", type=str, help="Path to Interspect database")
     parser.add_argument("--config", type=str, help="Path to decomposition-calibration.yaml")
     parser.add_argument("--min-events", type=int, default=30, help="Minimum events for calibration (default: 30)")
+    parser.add_argument("--by", choices=("project", "complexity"), help="Also print a per-group breakdown")
+    parser.add_argument("--rebuild", action="store_true", help="Discard stored sketches and re-aggregate all events")
     args = parser.parse_args()
 
-    db_path = find_interspect_db(args.db)
+    db_path = interspect_db.find_db(args.db)
     if not db_path:
         print("ERROR: Could not find Interspect database.")
         sys.exit(1)
@@ -208,12 +372,35 @@ def main():
     print(f"Interspect DB: {db_path}")
     print(f"Config: {config_path}")
 
-    # Load events
-    events = load_events(db_path, args.min_events)
-    print(f"Loaded {len(events)} decomposition_outcome events")
+    # Aggregate newly eligible events into the persisted sketches
+    conn = interspect_db.connect(db_path)
+    if not args.dry_run:
+        interspect_db.migrate(conn)
+    now_epoch = int(datetime.now(timezone.utc).timestamp())
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        ensure_schema(conn)
+        sketches, added = aggregate_new_events(conn, now_epoch, rebuild=args.rebuild)
+        # Sketch state is cheap to recompute, but a dry run should leave no trace.
+        conn.execute("ROLLBACK" if args.dry_run else "COMMIT")
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
+    overall = sketches.get(("all", "*"), CalibrationSketch())
+    print(f"Aggregated {added} new decomposition_outcome events ({overall.n} total)")
+    if overall.n < args.min_events:
+        print(f"Only {overall.n} events (threshold: {args.min_events}). Calibration not ready.")
+        sys.exit(1)
+
+    if args.by:
+        print_breakdown(sketches, args.by)
 
     # Compute calibration
-    calibrated = compute_calibration(events)
+    calibrated = compute_calibration(overall)
     yaml_section = format_yaml_section(calibrated)
 
     print(f"\nCalibrated values:")
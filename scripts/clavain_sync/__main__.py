@@ -1,4 +1,4 @@
-"""CLI entry point: python3 -m clavain_sync sync [--upstream NAME] [--dry-run] [--auto] [--no-ai] [--report [FILE]]"""
+"""CLI entry point: python3 -m clavain_sync sync [--upstream NAME] [--dry-run] [--auto] [--no-ai] [--refresh-ai] [--report [FILE]]"""
 from __future__ import annotations
 
 import argparse
@@ -6,6 +6,7 @@ import os
 import sys
 from pathlib import Path
 
+from .cache import CACHE_FILENAME, DEFAULT_TTL_SECONDS, DecisionCache
 from .classify import Classification, classify_file
 from .config import load_config, Upstream
 from .filemap import resolve_local_path
@@ -74,6 +75,7 @@ def sync_upstream(
     mode: str,
     use_ai: bool,
     report: SyncReport,
+    ai_cache: DecisionCache | None = None,
 ) -> list[str]:
     """Sync a single upstream. Returns list of modified local file paths."""
     clone_dir = upstreams_dir / upstream.name
@@ -201,8 +203,11 @@ def sync_upstream(
                     upstream_content=upstream_transformed,
                     ancestor_content=ancestor_transformed,
                     blocklist=blocklist,
+                    cache=ai_cache,
                 )
                 report.add_ai_decision(local_path, ai_result.decision, ai_result.risk, ai_result.rationale)
+                if ai_result.cached:
+                    print(f"           {CYAN}(cached decision){NC}")
 
                 if ai_result.decision == "accept_upstream" and ai_result.risk == "low":
                     apply_file(upstream_content, local_full, namespace_replacements)
@@ -274,6 +279,11 @@ def main() -> None:
     sync_parser.add_argument("--auto", action="store_true", help="Non-interactive (CI)")
     sync_parser.add_argument("--upstream", type=str, default="", help="Sync single upstream")
     sync_parser.add_argument("--no-ai", action="store_true", help="Disable AI conflict analysis")
+    sync_parser.add_argument("--refresh-ai", action="store_true", help="Ignore cached AI decisions and re-analyze")
+    sync_parser.add_argument(
+        "--ai-cache-ttl-days", type=float, default=DEFAULT_TTL_SECONDS / 86400,
+        help="Max age of cached AI decisions (default: %(default)s)",
+    )
     sync_parser.add_argument("--report", nargs="?", const=True, default=False, help="Generate report")
 
     args = parser.parse_args()
@@ -305,6 +315,14 @@ def main() -> None:
 
         all_modified: list[str] = []
         report = SyncReport()
+        ai_cache = None
+        if not args.no_ai and mode == "auto":
+            cache_path = Path(os.environ.get("CLAVAIN_SYNC_AI_CACHE") or upstreams_dir / CACHE_FILENAME)
+            ai_cache = DecisionCache(
+                cache_path,
+                ttl_seconds=int(args.ai_cache_ttl_days * 86400),
+                refresh=args.refresh_ai,
+            )
 
         for upstream in cfg.upstreams:
             if args.upstream and upstream.name != args.upstream:
@@ -323,10 +341,16 @@ def main() -> None:
                 mode=mode,
                 use_ai=not args.no_ai,
                 report=report,
+                ai_cache=ai_cache,
             )
             all_modified.extend(modified)
             print()
 
+        if ai_cache is not None:
+            ai_cache.save()
+            report.ai_cache_hits = ai_cache.hits
+            report.ai_cache_misses = ai_cache.misses
+
         # Contamination check
         if all_modified:
             run_contamination_check(all_modified, project_root, cfg.blocklist, cfg.namespace_replacements)
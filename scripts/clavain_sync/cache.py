@@ -0,0 +1,98 @@
+"""Persistent cache for LLM conflict decisions.
+
+A conflict left as needs_human is seen again on every sync run until someone
+acts on it. Caching the decision keyed by the exact inputs the model saw means
+an unchanged conflict resolves instantly instead of paying for another call.
+"""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from .resolve import ConflictDecision
+
+DEFAULT_TTL_SECONDS = 14 * 24 * 3600
+CACHE_FILENAME = ".clavain-sync-ai-cache.json"
+_SCHEMA_VERSION = 1
+
+
+class DecisionCache:
+    """JSON-file cache of ConflictDecisions with a TTL.
+
+    Entries are loaded once and written back atomically (tempfile + rename)
+    by save(). A missing or corrupt file is treated as an empty cache.
+    """
+
+    def __init__(self, path: Path, *, ttl_seconds: int = DEFAULT_TTL_SECONDS, refresh: bool = False):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._entries: dict[str, dict] = self._load()
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _SCHEMA_VERSION:
+            return {}
+        entries = data.get("entries", {})
+        return entries if isinstance(entries, dict) else {}
+
+    def get(self, key: str, *, now: float | None = None) -> ConflictDecision | None:
+        """Return a fresh cached decision, or None (counted as a miss)."""
+        entry = None if self.refresh else self._entries.get(key)
+        now = time.time() if now is None else now
+        if entry is not None and now - entry.get("cached_at", 0) <= self.ttl_seconds:
+            try:
+                decision = ConflictDecision(
+                    decision=entry["decision"],
+                    risk=entry["risk"],
+                    rationale=entry["rationale"],
+                    blocklist_found=list(entry.get("blocklist_found", [])),
+                    cached=True,
+                )
+            except KeyError:
+                decision = None
+            if decision is not None:
+                self.hits += 1
+                return decision
+        self.misses += 1
+        return None
+
+    def put(self, key: str, decision: ConflictDecision, *, now: float | None = None) -> None:
+        self._entries[key] = {
+            "decision": decision.decision,
+            "risk": decision.risk,
+            "rationale": decision.rationale,
+            "blocklist_found": decision.blocklist_found,
+            "cached_at": time.time() if now is None else now,
+        }
+        self._dirty = True
+
+    def save(self, *, now: float | None = None) -> None:
+        """Prune expired entries and write the cache if anything changed."""
+        if not self._dirty:
+            return
+        now = time.time() if now is None else now
+        live = {
+            k: v for k, v in self._entries.items()
+            if now - v.get("cached_at", 0) <= self.ttl_seconds
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="w", dir=self.path.parent, suffix=".tmp", delete=False
+        ) as tmp:
+            json.dump({"version": _SCHEMA_VERSION, "entries": live}, tmp, indent=2, sort_keys=True)
+            tmp.write("\n")
+            tmp_path = Path(tmp.name)
+        os.replace(tmp_path, self.path)
+        self._entries = live
+        self._dirty = False
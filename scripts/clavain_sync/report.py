@@ -19,6 +19,8 @@ class SyncReport:
     """Collects sync results and generates a markdown report."""
     entries: list[tuple[str, Classification]] = field(default_factory=list)
     ai_decisions: list[_AiEntry] = field(default_factory=list)
+    ai_cache_hits: int = 0
+    ai_cache_misses: int = 0
 
     def add_entry(self, file: str, classification: Classification) -> None:
         self.entries.append((file, classification))
@@ -65,6 +67,12 @@ class SyncReport:
             "",
         ]
 
+        if self.ai_cache_hits or self.ai_cache_misses:
+            lines.append(
+                f"AI decision cache: {self.ai_cache_hits} hit(s), {self.ai_cache_misses} miss(es)"
+            )
+            lines.append("")
+
         if self.ai_decisions:
             lines.append("## AI Decisions")
             for entry in self.ai_decisions:
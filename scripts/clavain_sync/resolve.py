@@ -5,10 +5,18 @@ resolved deterministically. The LLM is only called when both sides diverge.
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import shutil
 import subprocess
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cache import DecisionCache
+
+# Bump whenever the prompt or schema changes so cached decisions are invalidated.
+PROMPT_VERSION = "1"
 
 
 @dataclass
@@ -18,6 +26,7 @@ class ConflictDecision:
     risk: str  # low | medium | high
     rationale: str
     blocklist_found: list[str]
+    cached: bool = False
 
 
 _FALLBACK = ConflictDecision(
@@ -89,6 +98,32 @@ def _try_deterministic(
     return None
 
 
+def conflict_key(
+    *,
+    local_content: str,
+    upstream_content: str,
+    ancestor_content: str,
+    blocklist: list[str],
+    prompt_version: str = PROMPT_VERSION,
+) -> str:
+    """SHA-256 over everything that shapes the LLM's answer.
+
+    Each field is length-prefixed so content boundaries can't collide.
+    """
+    h = hashlib.sha256()
+    for part in (
+        prompt_version,
+        "\x00".join(sorted(blocklist)),
+        ancestor_content,
+        local_content,
+        upstream_content,
+    ):
+        data = part.encode("utf-8")
+        h.update(len(data).to_bytes(8, "big"))
+        h.update(data)
+    return h.hexdigest()
+
+
 def analyze_conflict(
     *,
     local_path: str,
@@ -96,6 +131,7 @@ def analyze_conflict(
     upstream_content: str,
     ancestor_content: str,
     blocklist: list[str],
+    cache: DecisionCache | None = None,
 ) -> ConflictDecision:
     """Analyze a conflict, using deterministic checks first, LLM fallback second.
 
@@ -104,7 +140,9 @@ def analyze_conflict(
     - Only upstream changed → accept_upstream
     - Only local changed → keep_local
 
-    LLM (Claude Haiku) is only called when both sides diverged.
+    LLM (Claude Haiku) is only called when both sides diverged. When a cache
+    is given, LLM decisions are looked up and stored by input hash; failed
+    analyses (the fallback) are never cached.
     """
     # Try deterministic resolution first.
     deterministic = _try_deterministic(
@@ -117,6 +155,18 @@ def analyze_conflict(
         return deterministic
 
     # Both sides changed — need LLM for semantic merge analysis.
+    key = None
+    if cache is not None:
+        key = conflict_key(
+            local_content=local_content,
+            upstream_content=upstream_content,
+            ancestor_content=ancestor_content,
+            blocklist=blocklist,
+        )
+        hit = cache.get(key)
+        if hit is not None:
+            return hit
+
     if not shutil.which("claude"):
         return _FALLBACK
 
@@ -160,7 +210,7 @@ Check for blocklist terms in the upstream changes."""
             timeout=120,
         )
         data = json.loads(result.stdout)
-        return ConflictDecision(
+        decision = ConflictDecision(
             decision=data.get("decision", "needs_human"),
             risk=data.get("risk", "high"),
             rationale=data.get("rationale", ""),
@@ -168,3 +218,7 @@ Check for blocklist terms in the upstream changes."""
         )
     except (subprocess.SubprocessError, json.JSONDecodeError, KeyError, ValueError, OSError):
         return _FALLBACK
+
+    if cache is not None and key is not None:
+        cache.put(key, decision)
+    return decision
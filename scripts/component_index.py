@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""Incremental index of plugin components (skills, agents, commands).
+
+Each component markdown file is parsed once: its frontmatter (both the
+flat string fields gen-catalog.py reads and the full YAML mapping the
+structural tests read), a hash of its body, and the `clavain:` cross-
+reference tokens it contains. Entries are cached on disk keyed by
+(path, mtime_ns, size), so a run re-parses only files that changed.
+
+The same cache records "fresh" results for generators: a --check whose
+inputs are stat-identical to the last passing run is answered without
+regenerating anything.
+
+Cache location: $CLAVAIN_COMPONENT_INDEX_DIR, else
+${XDG_CACHE_HOME:-~/.cache}/clavain/component-index, one file per
+checkout root.
+
+Usage as a script (debugging): component_index.py [--root DIR] [--json]
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+INDEX_FORMAT = 1
+ROOT = Path(__file__).resolve().parent.parent
+AGENT_CATEGORIES = ("review", "research", "workflow")
+
+# Any clavain:<name> token, and the /clavain:<name> slash-command form.
+REF_RE = re.compile(r"clavain:([a-z0-9][-a-z0-9]*)")
+SLASH_REF_RE = re.compile(r"/clavain:([a-z0-9][-a-z0-9]*)")
+
+_UNPARSED = object()
+
+
+def unquote_scalar(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in {'"', "'"}:
+        quote = value[0]
+        inner = value[1:-1]
+        if quote == '"':
+            return inner.replace(r"\\", "\\").replace(r'\"', '"')
+        return inner.replace("''", "'")
+    return value
+
+
+def parse_flat_frontmatter(text: str, path: Path | str) -> dict[str, str]:
+    """Top-level frontmatter keys as strings (block scalars joined).
+
+    Dependency-free; what gen-catalog.py needs. Raises ValueError when the
+    start or end marker is missing."""
+    lines = text.splitlines()
+    if not lines or lines[0].strip() != "---":
+        raise ValueError(f"Missing YAML frontmatter start marker in {path}")
+
+    frontmatter: dict[str, str] = {}
+    index = 1
+    while index < len(lines):
+        line = lines[index]
+        stripped = line.strip()
+        if stripped == "---":
+            return frontmatter
+
+        if not stripped or stripped.startswith("#"):
+            index += 1
+            continue
+
+        if ":" not in line:
+            index += 1
+            continue
+
+        key, raw_value = line.split(":", 1)
+        key = key.strip()
+        value = raw_value.strip()
+
+        if value in {"|", ">", "|-", "|+", ">-", ">+"}:
+            block_lines: list[str] = []
+            index += 1
+            while index < len(lines):
+                block_line = lines[index]
+                if block_line.strip() == "---":
+                    break
+                if block_line.startswith((" ", "\t")):
+                    block_lines.append(block_line.lstrip(" \t"))
+                    index += 1
+                    continue
+                break
+            frontmatter[key] = "\n".join(block_lines).strip()
+            continue
+
+        frontmatter[key] = unquote_scalar(value)
+        index += 1
+
+    raise ValueError(f"Missing YAML frontmatter end marker in {path}")
+
+
+def split_frontmatter(text: str) -> tuple[str | None, str]:
+    """(frontmatter_block, body), or (None, text) when there is none.
+
+    Same split the structural tests have always used: on the first two
+    `---` occurrences."""
+    if not text.startswith("---"):
+        return None, text
+    parts = text.split("---", 2)
+    if len(parts) < 3:
+        return None, text
+    return parts[1], parts[2]
+
+
+def _json_safe(value: Any) -> bool:
+    try:
+        return json.loads(json.dumps(value)) == value
+    except (TypeError, ValueError):
+        return False
+
+
+@dataclass
+class Component:
+    """One indexed markdown file. `meta` is the YAML frontmatter mapping
+    (None without frontmatter); `fields`/`error` are the flat parse."""
+
+    path: str
+    stamp: list[int]
+    fields: dict[str, str] | None = None
+    error: str | None = None
+    body_sha: str = ""
+    refs: list[str] = field(default_factory=list)
+    slash_refs: list[str] = field(default_factory=list)
+    meta: Any = _UNPARSED
+    meta_error: str | None = None
+
+    def require(self, name: str) -> str:
+        """A non-empty flat frontmatter field, or ValueError (gen-catalog's contract)."""
+        if self.error:
+            raise ValueError(self.error)
+        value = (self.fields or {}).get(name, "").strip()
+        if not value:
+            raise ValueError(f"Missing or empty frontmatter field '{name}' in {self.path}")
+        return value
+
+
+def _stamp(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def cache_path(root: Path) -> Path:
+    base = os.environ.get("CLAVAIN_COMPONENT_INDEX_DIR")
+    if not base:
+        xdg = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        base = os.path.join(xdg, "clavain", "component-index")
+    digest = hashlib.sha256(str(root.resolve()).encode()).hexdigest()[:16]
+    return Path(base) / f"{digest}.json"
+
+
+class ComponentIndex:
+    """Parsed components for one checkout, loaded from and saved to disk.
+
+    Lookups revalidate by stat, so one instance can outlive edits; call
+    save() to persist whatever was (re)parsed."""
+
+    def __init__(self, root: Path = ROOT, cache_file: Path | None = None, persist: bool = True):
+        self.root = root.resolve()
+        self.cache_file = cache_file or cache_path(self.root)
+        self.persist = persist
+        self._entries: dict[str, Component] = {}
+        self._fresh: dict[str, str] = {}
+        self._dirty = False
+        self.parsed = 0  # files (re)parsed by this instance
+        if persist:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if payload.get("format") != INDEX_FORMAT:
+            return
+        for rel, raw in payload.get("entries", {}).items():
+            if "meta" not in raw:
+                raw["meta"] = _UNPARSED
+            try:
+                self._entries[rel] = Component(**raw)
+            except TypeError:
+                continue
+        self._fresh = payload.get("fresh", {})
+
+    def save(self) -> None:
+        if not (self.persist and self._dirty):
+            return
+        entries = {}
+        for rel, comp in self._entries.items():
+            raw = asdict(comp)
+            if comp.meta is _UNPARSED or not _json_safe(comp.meta):
+                raw.pop("meta")  # re-derived on demand
+            entries[rel] = raw
+        payload = {"format": INDEX_FORMAT, "entries": entries, "fresh": self._fresh}
+        tmp = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.cache_file)
+            self._dirty = False
+        except OSError:
+            tmp.unlink(missing_ok=True)  # a read-only cache dir only costs speed
+
+    def _rel(self, path: Path) -> str:
+        path = Path(path)
+        if not path.is_absolute():
+            path = self.root / path
+        try:
+            return path.resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            return path.resolve().as_posix()
+
+    def get(self, path: Path) -> Component:
+        """The indexed component for `path`, re-parsed if its stat changed."""
+        rel = self._rel(path)
+        full = self.root / rel
+        stamp = _stamp(full)
+        if stamp is None:
+            raise FileNotFoundError(full)
+        comp = self._entries.get(rel)
+        if comp is not None and comp.stamp == stamp:
+            return comp
+
+        text = full.read_text(encoding="utf-8")
+        comp = Component(path=rel, stamp=stamp)
+        try:
+            comp.fields = parse_flat_frontmatter(text, full)
+        except ValueError as exc:
+            comp.error = str(exc)
+        _, body = split_frontmatter(text)
+        comp.body_sha = hashlib.sha256(body.encode("utf-8")).hexdigest()
+        comp.refs = sorted(set(REF_RE.findall(text)))
+        comp.slash_refs = sorted(set(SLASH_REF_RE.findall(text)))
+        self._entries[rel] = comp
+        self._dirty = True
+        self.parsed += 1
+        return comp
+
+    def meta(self, path: Path) -> Any:
+        """YAML frontmatter mapping (None without frontmatter); PyYAML on a miss.
+
+        A block PyYAML rejects re-raises its error on every call."""
+        comp = self.get(path)
+        if comp.meta is _UNPARSED and comp.meta_error is None:
+            import yaml
+
+            block, _ = split_frontmatter((self.root / comp.path).read_text(encoding="utf-8"))
+            try:
+                comp.meta = yaml.safe_load(block) if block is not None else None
+            except yaml.YAMLError as exc:
+                comp.meta_error = str(exc)
+            self._dirty = True
+        if comp.meta_error is not None:
+            import yaml
+
+            raise yaml.YAMLError(comp.meta_error)
+        return comp.meta
+
+    # ─── Component sets ──────────────────────────────────────────────
+
+    def skill_files(self) -> list[Path]:
+        return sorted((self.root / "skills").glob("*/SKILL.md"))
+
+    def agent_files(self) -> dict[str, list[Path]]:
+        """Agent files per category (only categories whose dir exists)."""
+        return {
+            category: sorted((self.root / "agents" / category).glob("*.md"))
+            for category in AGENT_CATEGORIES
+            if (self.root / "agents" / category).is_dir()
+        }
+
+    def command_files(self) -> list[Path]:
+        return sorted((self.root / "commands").glob("*.md"))
+
+    def component_files(self) -> list[Path]:
+        files = self.skill_files() + self.command_files()
+        for paths in self.agent_files().values():
+            files.extend(paths)
+        return files
+
+    def resolves(self, name: str) -> bool:
+        """Whether a clavain:<name> reference names a skill or command."""
+        return (self.root / "skills" / name / "SKILL.md").exists() or (
+            self.root / "commands" / f"{name}.md"
+        ).exists()
+
+    # ─── Fresh-check memo ────────────────────────────────────────────
+
+    def inputs_digest(self, paths: Iterable[Path]) -> str:
+        """Hash of the paths and their stats (absent files included)."""
+        h = hashlib.sha256(f"component-index/{INDEX_FORMAT}".encode())
+        for path in sorted({self._rel(p) for p in paths}):
+            h.update(f"{path}\0{_stamp(self.root / path)}\0".encode())
+        return h.hexdigest()
+
+    def is_fresh(self, check: str, paths: Iterable[Path]) -> bool:
+        """True if `check` last passed with stat-identical inputs."""
+        return self.persist and self._fresh.get(check) == self.inputs_digest(paths)
+
+    def mark_fresh(self, check: str, paths: Iterable[Path]) -> None:
+        digest = self.inputs_digest(paths)
+        if self._fresh.get(check) != digest:
+            self._fresh[check] = digest
+            self._dirty = True
+
+    def forget_fresh(self, check: str) -> None:
+        if self._fresh.pop(check, None) is not None:
+            self._dirty = True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Show the component index for a checkout.")
+    parser.add_argument("--root", type=Path, default=ROOT)
+    parser.add_argument("--json", action="store_true", help="Dump entries as JSON.")
+    args = parser.parse_args()
+
+    index = ComponentIndex(args.root)
+    components = [index.get(path) for path in index.component_files()]
+    index.save()
+    if args.json:
+        print(json.dumps([{k: v for k, v in asdict(c).items() if k != "meta"} for c in components], indent=2))
+    else:
+        errors = [c for c in components if c.error]
+        print(f"{len(components)} components, {index.parsed} re-parsed, {len(errors)} with frontmatter errors")
+        print(f"cache: {index.cache_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,11 +3,20 @@
 
 The normal path is deliberately split into three stages:
 
-1. Run the same JSONL prompts through the cheap and stronger backends.
+1. Run the same JSONL prompts through the cheap and stronger backends,
+   concurrently under per-backend limits. Each response is appended to a
+   durable JSONL record store keyed by (prompt_id, backend, input hash),
+   so an interrupted run resumes where it stopped. The input hash covers
+   the prompt text and parse mode: an edited prompt is dispatched again
+   rather than answered from a stale record.
 2. Compute mechanical yield/coverage/agreement metrics and write a blind,
    interleaved judge queue whose rows contain only an opaque id and response.
-3. After a human or external judge fills defensibility scores, apply the
-   explicit PARITY/PIN_STRONGER threshold.
+   The id -> (backend, prompt_id, response digest) assignment map is sealed
+   in a separate file that is never handed to the judge; the queue is
+   rebuilt whenever any response it holds was re-dispatched.
+3. After a human or external judge fills defensibility scores, re-run with
+   ``--judge-results``. Stored records and the sealed map are reused, so
+   this is an offline scoring step with no backend dispatch.
 
 Use ``--self-test`` for a backend-free check of the metric and blinding paths.
 The real-run path is opt-in and is not used by Clavain's routing tests.
@@ -18,17 +27,22 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+import os
 import random
 import secrets
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable, Mapping, Optional, Sequence
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence
 
 
 DEFAULT_MARGIN = 0.05
+DEFAULT_CONCURRENCY = 2
 PARSE_MODES = ("json-array", "json-object", "raw")
 
 
@@ -96,6 +110,7 @@ class ResponseRecord:
     stderr: str = ""
     comparable_set: Optional[frozenset[str]] = None
     parse_error: str = ""
+    input_hash: str = ""
 
     @property
     def yielded(self) -> bool:
@@ -105,6 +120,91 @@ class ResponseRecord:
     def dropped(self) -> bool:
         return not self.yielded
 
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "prompt_id": self.prompt_id,
+            "backend": self.backend,
+            "output": self.output,
+            "returncode": self.returncode,
+            "elapsed_seconds": self.elapsed_seconds,
+            "stderr": self.stderr,
+            "comparable_set": (
+                sorted(self.comparable_set) if self.comparable_set is not None else None
+            ),
+            "parse_error": self.parse_error,
+            "input_hash": self.input_hash,
+        }
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> "ResponseRecord":
+        comparable = data.get("comparable_set")
+        return cls(
+            prompt_id=str(data["prompt_id"]),
+            backend=str(data["backend"]),
+            output=str(data.get("output", "")),
+            returncode=int(data["returncode"]),
+            elapsed_seconds=float(data.get("elapsed_seconds", 0.0)),
+            stderr=str(data.get("stderr", "")),
+            comparable_set=frozenset(comparable) if comparable is not None else None,
+            parse_error=str(data.get("parse_error", "")),
+            input_hash=str(data.get("input_hash", "")),
+        )
+
+
+def input_hash(prompt: str, parse_mode: str) -> str:
+    """Identity of what a record answered: the prompt text and parse mode."""
+    return hashlib.sha256(f"{parse_mode}\0{prompt}".encode("utf-8")).hexdigest()[:16]
+
+
+def response_digest(record: "ResponseRecord") -> str:
+    """Identity of a judged response: what it answered and the text itself."""
+    return hashlib.sha256(
+        f"{record.input_hash}\0{record.output}".encode("utf-8")
+    ).hexdigest()[:16]
+
+
+class RecordStore:
+    """Append-only JSONL store of responses keyed by (prompt_id, backend,
+    input_hash), so a record only answers the exact prompt it was run for.
+
+    Each record is written and flushed as soon as its dispatch finishes, so a
+    killed run loses at most the in-flight prompts. A torn final line from a
+    crash is ignored on load; later lines win for duplicate keys.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self.records: dict[tuple[str, str, str], ResponseRecord] = {}
+        self._torn_tail = False
+        if path.is_file():
+            text = path.read_text(encoding="utf-8")
+            self._torn_tail = bool(text) and not text.endswith("\n")
+            for line in text.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    record = ResponseRecord.from_json(json.loads(line))
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    continue
+                self.records[(record.prompt_id, record.backend, record.input_hash)] = record
+
+    def get(self, prompt_id: str, backend: str, digest: str) -> Optional[ResponseRecord]:
+        return self.records.get((prompt_id, backend, digest))
+
+    def append(self, record: ResponseRecord) -> None:
+        line = json.dumps(record.to_json(), ensure_ascii=False) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                if self._torn_tail:
+                    handle.write("\n")
+                    self._torn_tail = False
+                handle.write(line)
+                handle.flush()
+                os.fsync(handle.fileno())
+            self.records[(record.prompt_id, record.backend, record.input_hash)] = record
+
 
 def compute_metrics(records: Sequence[ResponseRecord], comparable: bool) -> dict[str, Any]:
     """Compute yield, coverage, drops, and wall-clock metrics for a backend."""
@@ -190,25 +290,28 @@ def build_blind_judge_queue(
     cheap: Sequence[ResponseRecord],
     strong: Sequence[ResponseRecord],
     seed: int = 0,
-) -> tuple[list[dict[str, str]], dict[str, tuple[str, str]]]:
-    """Return interleaved source-free rows and an in-memory assignment map.
+) -> tuple[list[dict[str, str]], dict[str, tuple[str, str, str]]]:
+    """Return interleaved source-free rows and a separate assignment map.
 
-    The assignment map is intentionally returned separately and is never
-    serialized. This is what lets the evaluator aggregate scores without
-    handing the judge a ``source`` or ``backend`` key.
+    The assignment map is intentionally returned separately and never enters
+    the queue; it is only persisted through ``write_sealed_assignments``.
+    This is what lets the evaluator aggregate scores without handing the
+    judge a ``source`` or ``backend`` key.
     """
 
     if len(cheap) != len(strong):
         raise ValueError("judge queue requires aligned prompt records")
     rows: list[dict[str, str]] = []
-    assignments: dict[str, tuple[str, str]] = {}
+    assignments: dict[str, tuple[str, str, str]] = {}
     ordinal = 0
     for cheap_record, strong_record in zip(cheap, strong):
         for record in (cheap_record, strong_record):
             judge_id = _opaque_id(seed, ordinal)
             ordinal += 1
             rows.append({"id": judge_id, "response": record.output})
-            assignments[judge_id] = (record.backend, record.prompt_id)
+            assignments[judge_id] = (
+                record.backend, record.prompt_id, response_digest(record)
+            )
     random.Random(seed).shuffle(rows)
     return rows, assignments
 
@@ -222,6 +325,59 @@ def write_judge_queue(path: Path, rows: Iterable[Mapping[str, str]]) -> None:
             handle.write(json.dumps(dict(row), ensure_ascii=False) + "\n")
 
 
+def _file_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def write_sealed_assignments(
+    path: Path, queue_path: Path, assignments: Mapping[str, tuple[str, str, str]]
+) -> None:
+    """Persist the assignment map beside, never inside, the judge queue.
+
+    The file is owner-only and bound to the queue by its sha256, so a stale
+    map can't silently score a regenerated queue. Each id also carries the
+    ``response_digest`` of its record, so a re-dispatched response (edited
+    prompt, other parse mode) invalidates the queue that held the old text.
+    """
+
+    payload = {
+        "queue_sha256": _file_sha256(queue_path),
+        "assignments": {key: list(value) for key, value in assignments.items()},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, sort_keys=True)
+            handle.write("\n")
+        os.chmod(tmp_name, 0o600)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def load_sealed_assignments(
+    path: Path, queue_path: Path
+) -> Optional[dict[str, tuple[str, str, str]]]:
+    """Return the sealed map if it still matches the queue on disk."""
+
+    if not path.is_file() or not queue_path.is_file():
+        return None
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return None
+    if payload.get("queue_sha256") != _file_sha256(queue_path):
+        return None
+    assignments: dict[str, tuple[str, str, str]] = {}
+    for key, value in payload.get("assignments", {}).items():
+        if len(value) != 3:
+            return None  # sealed before response digests were recorded
+        assignments[str(key)] = (str(value[0]), str(value[1]), str(value[2]))
+    return assignments
+
+
 def load_judge_scores(path: Path) -> dict[str, float]:
     """Load ``id`` + ``defensibility`` values from JSONL or a JSON list/map."""
 
@@ -250,7 +406,7 @@ def load_judge_scores(path: Path) -> dict[str, float]:
 
 
 def aggregate_defensibility(
-    assignments: Mapping[str, tuple[str, str]], scores: Mapping[str, float]
+    assignments: Mapping[str, tuple[str, str, str]], scores: Mapping[str, float]
 ) -> dict[str, float]:
     """Aggregate blind scores by backend only after the judge is finished."""
 
@@ -258,7 +414,7 @@ def aggregate_defensibility(
     for identifier, score in scores.items():
         if identifier not in assignments:
             raise ValueError(f"judge score id not present in queue: {identifier}")
-        backend, _ = assignments[identifier]
+        backend = assignments[identifier][0]
         grouped.setdefault(backend, []).append(float(score))
     return {
         backend: sum(values) / len(values)
@@ -367,6 +523,74 @@ def run_prompt(
     return record
 
 
+def dispatch_all(
+    store: RecordStore,
+    prompts: Sequence[Mapping[str, str]],
+    limits: Mapping[str, int],
+    runner: Callable[[str, Mapping[str, str]], ResponseRecord],
+    parse_mode: str = "raw",
+) -> int:
+    """Run every (prompt, backend) pair missing from ``store`` concurrently.
+
+    A stored record only counts when its input hash matches the prompt's
+    current text and ``parse_mode``. Each backend gets its own pool sized
+    by ``limits`` so a slow backend cannot starve the other. Returns the
+    number of dispatched pairs.
+    """
+
+    pending: dict[str, list[Mapping[str, str]]] = {
+        backend: [
+            p for p in prompts
+            if store.get(p["id"], backend, input_hash(p["prompt"], parse_mode)) is None
+        ]
+        for backend in limits
+    }
+    for backend, todo in pending.items():
+        skipped = len(prompts) - len(todo)
+        if skipped:
+            print(
+                f"progress backend={backend} resumed={skipped} pending={len(todo)}",
+                file=sys.stderr,
+                flush=True,
+            )
+
+    def _run(backend: str, prompt: Mapping[str, str]) -> None:
+        print(
+            f"progress id={prompt['id']} backend={backend} starting",
+            file=sys.stderr,
+            flush=True,
+        )
+        record = runner(backend, prompt)
+        record.input_hash = input_hash(prompt["prompt"], parse_mode)
+        store.append(record)
+        print(
+            f"progress id={prompt['id']} backend={backend} "
+            f"rc={record.returncode} elapsed={record.elapsed_seconds:.2f}s",
+            file=sys.stderr,
+            flush=True,
+        )
+
+    pools = {
+        backend: ThreadPoolExecutor(
+            max_workers=limits[backend], thread_name_prefix=f"parity-{backend}"
+        )
+        for backend, todo in pending.items()
+        if todo
+    }
+    try:
+        futures = [
+            pools[backend].submit(_run, backend, prompt)
+            for backend, todo in pending.items()
+            for prompt in todo
+        ]
+        for future in futures:
+            future.result()
+    finally:
+        for pool in pools.values():
+            pool.shutdown(wait=True, cancel_futures=True)
+    return sum(len(todo) for todo in pending.values())
+
+
 def _metrics_by_backend(
     records: Sequence[ResponseRecord],
     backend: str,
@@ -412,6 +636,49 @@ def run_self_test() -> None:
     assert result["verdict"] == "PARITY"
     assert parse_comparable_set('{"x": 1}', "json-object") == frozenset({"\"x\"=1"})
     assert parse_comparable_set("free text", "raw") is None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        store = RecordStore(root / "records.jsonl")
+        calls: list[tuple[str, str]] = []
+
+        def fake_runner(backend: str, prompt: Mapping[str, str]) -> ResponseRecord:
+            calls.append((prompt["id"], backend))
+            return ResponseRecord(prompt["id"], backend, '["a"]', 0, 0.1,
+                                  comparable_set=frozenset({"a"}))
+
+        prompts = [{"id": "one", "prompt": "p1"}, {"id": "two", "prompt": "p2"}]
+        first = fake_runner("cheap", prompts[0])
+        first.input_hash = input_hash("p1", "raw")
+        store.append(first)
+        calls.clear()
+        with (root / "records.jsonl").open("a", encoding="utf-8") as handle:
+            handle.write('{"prompt_id": "torn"')
+        resumed = RecordStore(root / "records.jsonl")
+        assert resumed.get("one", "cheap", input_hash("p1", "raw")) is not None
+        dispatched = dispatch_all(resumed, prompts, {"cheap": 2, "strong": 2}, fake_runner)
+        assert dispatched == 3 and ("one", "cheap") not in calls
+        assert len(RecordStore(root / "records.jsonl").records) == 4
+        # An edited prompt or another parse mode is not answered from the store.
+        calls.clear()
+        edited = [{"id": "one", "prompt": "p1 (edited)"}, prompts[1]]
+        assert dispatch_all(resumed, edited, {"cheap": 2, "strong": 2}, fake_runner) == 2
+        assert sorted(calls) == [("one", "cheap"), ("one", "strong")]
+        assert dispatch_all(resumed, edited, {"cheap": 2}, fake_runner, "json-array") == 2
+
+        queue = root / "queue.jsonl"
+        sealed = root / "queue.jsonl.assignments.json"
+        write_judge_queue(queue, rows)
+        write_sealed_assignments(sealed, queue, assignments)
+        assert load_sealed_assignments(sealed, queue) == assignments
+        assert "backend" not in queue.read_text() and "cheap" not in queue.read_text()
+        # A re-dispatched response no longer matches what was sealed.
+        redone = [ResponseRecord(r.prompt_id, r.backend, r.output + " (v2)", 0, 0.1)
+                  for r in cheap]
+        assert {(r.backend, r.prompt_id, response_digest(r)) for r in redone + strong} \
+            != set(load_sealed_assignments(sealed, queue).values())
+        queue.write_text("")
+        assert load_sealed_assignments(sealed, queue) is None
     print("SELFTEST_OK")
 
 
@@ -426,7 +693,23 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--timeout", type=float, default=900.0)
     parser.add_argument("--margin", type=float, default=DEFAULT_MARGIN)
     parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--cheap-concurrency", type=int, default=DEFAULT_CONCURRENCY,
+        help="max in-flight dispatches for the cheap backend",
+    )
+    parser.add_argument(
+        "--strong-concurrency", type=int, default=DEFAULT_CONCURRENCY,
+        help="max in-flight dispatches for the strong backend",
+    )
+    parser.add_argument(
+        "--records", type=Path,
+        help="durable JSONL response store; existing records are reused",
+    )
     parser.add_argument("--judge-queue", type=Path)
+    parser.add_argument(
+        "--assignments", type=Path,
+        help="sealed judge-id map (default: <judge-queue>.assignments.json)",
+    )
     parser.add_argument("--judge-results", type=Path)
     parser.add_argument("--self-test", action="store_true")
     return parser
@@ -437,53 +720,64 @@ def run_evaluation(args: argparse.Namespace) -> int:
         raise ValueError("--prompts is required unless --self-test is used")
     if not 0 <= args.margin:
         raise ValueError("--margin must be non-negative")
+    if args.cheap_concurrency < 1 or args.strong_concurrency < 1:
+        raise ValueError("backend concurrency must be at least 1")
+    if args.cheap == args.strong:
+        raise ValueError("--cheap and --strong must name different backends")
     prompts = _load_prompts(args.prompts)
     dispatch = args.dispatch or Path(__file__).with_name("dispatch.sh")
     if not dispatch.is_file():
         raise ValueError(f"dispatch script not found: {dispatch}")
 
-    records: list[ResponseRecord] = []
-    for prompt in prompts:
-        for backend in (args.cheap, args.strong):
-            print(
-                f"progress id={prompt['id']} backend={backend} starting",
-                file=sys.stderr,
-                flush=True,
-            )
-            record = run_prompt(
-                dispatch,
-                backend,
-                prompt["id"],
-                prompt["prompt"],
-                args.parse_mode,
-                args.workdir,
-                args.timeout,
-            )
-            records.append(record)
-            print(
-                f"progress id={prompt['id']} backend={backend} "
-                f"rc={record.returncode} elapsed={record.elapsed_seconds:.2f}s",
-                file=sys.stderr,
-                flush=True,
-            )
+    records_path = args.records or Path.cwd() / "executor-parity-records.jsonl"
+    store = RecordStore(records_path)
+    dispatch_all(
+        store,
+        prompts,
+        {args.cheap: args.cheap_concurrency, args.strong: args.strong_concurrency},
+        lambda backend, prompt: run_prompt(
+            dispatch,
+            backend,
+            prompt["id"],
+            prompt["prompt"],
+            args.parse_mode,
+            args.workdir,
+            args.timeout,
+        ),
+        args.parse_mode,
+    )
+
+    def stored(prompt: Mapping[str, str], backend: str) -> ResponseRecord:
+        return store.records[(prompt["id"], backend, input_hash(prompt["prompt"], args.parse_mode))]
 
-    cheap_records = [record for record in records if record.backend == args.cheap]
-    strong_records = [record for record in records if record.backend == args.strong]
+    cheap_records = [stored(prompt, args.cheap) for prompt in prompts]
+    strong_records = [stored(prompt, args.strong) for prompt in prompts]
     comparable = args.parse_mode != "raw"
     cheap_metrics = compute_metrics(cheap_records, comparable)
     strong_metrics = compute_metrics(strong_records, comparable)
     agreement = tiered_agreement(cheap_records, strong_records)
-    rows, assignments = build_blind_judge_queue(
-        cheap_records, strong_records, seed=args.seed
-    )
     queue_path = args.judge_queue or Path.cwd() / "executor-parity-judge-queue.jsonl"
-    write_judge_queue(queue_path, rows)
+    assignments_path = args.assignments or queue_path.with_name(
+        queue_path.name + ".assignments.json"
+    )
+    expected = {
+        (record.backend, record.prompt_id, response_digest(record))
+        for record in cheap_records + strong_records
+    }
+    assignments = load_sealed_assignments(assignments_path, queue_path)
+    if assignments is None or set(assignments.values()) != expected:
+        rows, assignments = build_blind_judge_queue(
+            cheap_records, strong_records, seed=args.seed
+        )
+        write_judge_queue(queue_path, rows)
+        write_sealed_assignments(assignments_path, queue_path, assignments)
 
     result: dict[str, Any] = {
         "cheap": cheap_metrics,
         "strong": strong_metrics,
         "agreement": agreement,
         "judge_queue": str(queue_path),
+        "records": str(records_path),
         "margin": args.margin,
     }
     if args.judge_results is None:
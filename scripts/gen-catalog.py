@@ -9,6 +9,8 @@ import sys
 from pathlib import Path
 from typing import Any
 
+from component_index import ComponentIndex
+
 ROOT = Path(__file__).resolve().parent.parent
 CATALOG_PATH = ROOT / "docs" / "catalog.json"
 TARGET_FILES = (
@@ -30,118 +32,50 @@ def read_text(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
 
-def unquote_scalar(value: str) -> str:
-    if len(value) >= 2 and value[0] == value[-1] and value[0] in {'"', "'"}:
-        quote = value[0]
-        inner = value[1:-1]
-        if quote == '"':
-            return inner.replace(r"\\", "\\").replace(r'\"', '"')
-        return inner.replace("''", "'")
-    return value
-
-
-def parse_frontmatter(path: Path) -> dict[str, str]:
-    lines = read_text(path).splitlines()
-    if not lines or lines[0].strip() != "---":
-        raise ValueError(f"Missing YAML frontmatter start marker in {path}")
-
-    frontmatter: dict[str, str] = {}
-    index = 1
-    while index < len(lines):
-        line = lines[index]
-        stripped = line.strip()
-        if stripped == "---":
-            return frontmatter
-
-        if not stripped or stripped.startswith("#"):
-            index += 1
-            continue
-
-        if ":" not in line:
-            index += 1
-            continue
-
-        key, raw_value = line.split(":", 1)
-        key = key.strip()
-        value = raw_value.strip()
-
-        if value in {"|", ">", "|-", "|+", ">-", ">+"}:
-            block_lines: list[str] = []
-            index += 1
-            while index < len(lines):
-                block_line = lines[index]
-                if block_line.strip() == "---":
-                    break
-                if block_line.startswith((" ", "\t")):
-                    block_lines.append(block_line.lstrip(" \t"))
-                    index += 1
-                    continue
-                break
-            frontmatter[key] = "\n".join(block_lines).strip()
-            continue
-
-        frontmatter[key] = unquote_scalar(value)
-        index += 1
-
-    raise ValueError(f"Missing YAML frontmatter end marker in {path}")
-
-
-def require_field(frontmatter: dict[str, str], field: str, path: Path) -> str:
-    value = frontmatter.get(field, "").strip()
-    if not value:
-        raise ValueError(f"Missing or empty frontmatter field '{field}' in {path}")
-    return value
-
-
-def collect_skills(root: Path) -> tuple[list[dict[str, str]], int]:
-    skill_files = sorted((root / "skills").glob("*/SKILL.md"))
+def collect_skills(index: ComponentIndex) -> tuple[list[dict[str, str]], int]:
+    skill_files = index.skill_files()
     skills: list[dict[str, str]] = []
     for path in skill_files:
-        frontmatter = parse_frontmatter(path)
+        component = index.get(path)
         skills.append(
             {
-                "name": require_field(frontmatter, "name", path),
-                "description": require_field(frontmatter, "description", path),
+                "name": component.require("name"),
+                "description": component.require("description"),
             }
         )
     skills.sort(key=lambda item: item["name"])
     return skills, len(skill_files)
 
 
-def collect_agents(root: Path) -> tuple[list[dict[str, str]], int, dict[str, int]]:
+def collect_agents(index: ComponentIndex) -> tuple[list[dict[str, str]], int, dict[str, int]]:
     agents: list[dict[str, str]] = []
     count = 0
     category_counts: dict[str, int] = {}
-    for category in ("review", "research", "workflow"):
-        category_dir = root / "agents" / category
-        if not category_dir.is_dir():
-            continue
-        cat_count = 0
-        for path in sorted(category_dir.glob("*.md")):
-            frontmatter = parse_frontmatter(path)
+    for category, paths in index.agent_files().items():
+        for path in paths:
+            component = index.get(path)
             agents.append(
                 {
-                    "name": require_field(frontmatter, "name", path),
-                    "description": require_field(frontmatter, "description", path),
+                    "name": component.require("name"),
+                    "description": component.require("description"),
                     "category": category,
                 }
             )
-            count += 1
-            cat_count += 1
-        category_counts[category] = cat_count
+        count += len(paths)
+        category_counts[category] = len(paths)
     agents.sort(key=lambda item: (item["category"], item["name"]))
     return agents, count, category_counts
 
 
-def collect_commands(root: Path) -> tuple[list[dict[str, str]], int]:
-    command_files = sorted((root / "commands").glob("*.md"))
+def collect_commands(index: ComponentIndex) -> tuple[list[dict[str, str]], int]:
+    command_files = index.command_files()
     commands: list[dict[str, str]] = []
     for path in command_files:
-        frontmatter = parse_frontmatter(path)
+        component = index.get(path)
         commands.append(
             {
-                "name": require_field(frontmatter, "name", path),
-                "description": require_field(frontmatter, "description", path),
+                "name": component.require("name"),
+                "description": component.require("description"),
             }
         )
     commands.sort(key=lambda item: item["name"])
@@ -375,10 +309,22 @@ def build_catalog_text(
     return json.dumps(payload, indent=2) + "\n"
 
 
-def build_expected_files(root: Path) -> dict[Path, str]:
-    skills, skill_count = collect_skills(root)
-    agents, agent_count, agent_category_counts = collect_agents(root)
-    commands, command_count = collect_commands(root)
+def check_inputs(index: ComponentIndex) -> list[Path]:
+    """Everything the expected files depend on, for the fresh-check memo."""
+    return [
+        Path(__file__).resolve(),
+        CATALOG_PATH,
+        index.root / "hooks" / "hooks.json",
+        *TARGET_FILES,
+        *index.component_files(),
+    ]
+
+
+def build_expected_files(root: Path, index: ComponentIndex | None = None) -> dict[Path, str]:
+    index = index or ComponentIndex(root, persist=False)
+    skills, skill_count = collect_skills(index)
+    agents, agent_count, agent_category_counts = collect_agents(index)
+    commands, command_count = collect_commands(index)
     counts = {
         "skills": skill_count,
         "agents": agent_count,
@@ -423,8 +369,19 @@ def main() -> int:
     )
     args = parser.parse_args()
 
-    expected = build_expected_files(ROOT)
+    # Inputs stat-identical to the last fresh run: nothing can have drifted.
+    index = ComponentIndex(ROOT)
+    if index.is_fresh("gen-catalog", check_inputs(index)):
+        print("Catalog and count strings are fresh." if args.check else "Catalog and count strings are already fresh.")
+        return 0
+
+    expected = build_expected_files(ROOT, index)
     drifted = compute_drift(expected)
+    if drifted:
+        index.forget_fresh("gen-catalog")
+    else:
+        index.mark_fresh("gen-catalog", check_inputs(index))
+    index.save()
 
     if args.check:
         if drifted:
@@ -440,6 +397,8 @@ def main() -> int:
         return 0
 
     write_updates(expected, drifted)
+    index.mark_fresh("gen-catalog", check_inputs(index))
+    index.save()
     print("Updated files:")
     for path in drifted:
         print(f"- {path.relative_to(ROOT).as_posix()}")
@@ -11,6 +11,8 @@ import re
 import sys
 from pathlib import Path
 
+from component_index import ComponentIndex
+
 ROOT = Path(__file__).resolve().parent.parent
 RIG_PATH = ROOT / "agent-rig.json"
 SETUP_PATH = ROOT / "commands" / "setup.md"
@@ -309,6 +311,11 @@ def build_expected(rig: dict) -> dict[Path, str]:
     return expected
 
 
+def check_inputs() -> list[Path]:
+    """Everything build_expected() reads, for the fresh-check memo."""
+    return [Path(__file__).resolve(), RIG_PATH, SETUP_PATH, DOCTOR_PATH]
+
+
 def compute_drift(expected: dict[Path, str]) -> list[Path]:
     drifted: list[Path] = []
     for path, desired in expected.items():
@@ -333,8 +340,6 @@ def main() -> int:
     args = parser.parse_args()
 
     rig = load_rig()
-    expected = build_expected(rig)
-    drifted = compute_drift(expected)
 
     # Drift detection against marketplace
     marketplace = load_marketplace()
@@ -343,6 +348,20 @@ def main() -> int:
         for w in warnings:
             print(f"  {w}", file=sys.stderr)
 
+    # Inputs stat-identical to the last fresh run: nothing can have drifted.
+    index = ComponentIndex(ROOT)
+    if index.is_fresh("gen-rig-sync", check_inputs()):
+        print("Agent-rig sync is fresh." if args.check else "Agent-rig sync is already fresh.")
+        return 0
+
+    expected = build_expected(rig)
+    drifted = compute_drift(expected)
+    if drifted:
+        index.forget_fresh("gen-rig-sync")
+    else:
+        index.mark_fresh("gen-rig-sync", check_inputs())
+    index.save()
+
     if args.check:
         if drifted:
             print("Drift detected:")
@@ -357,6 +376,8 @@ def main() -> int:
         return 0
 
     write_updates(expected, drifted)
+    index.mark_fresh("gen-rig-sync", check_inputs())
+    index.save()
     print("Updated files:")
     for path in drifted:
         print(f"- {path.relative_to(ROOT).as_posix()}")
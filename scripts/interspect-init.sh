@@ -122,6 +122,14 @@ CREATE INDEX IF NOT EXISTS idx_evidence_event
 CREATE INDEX IF NOT EXISTS idx_evidence_ts
   ON evidence(ts);
 
+-- Covering indexes for analytics (kept in sync with scripts/interspect_db.py):
+-- override KPIs by event + time window, next seq within a session.
+CREATE INDEX IF NOT EXISTS idx_evidence_event_ts
+  ON evidence(event, ts, override_reason);
+
+CREATE INDEX IF NOT EXISTS idx_evidence_session_seq
+  ON evidence(session_id, seq);
+
 CREATE INDEX IF NOT EXISTS idx_sessions_project
   ON sessions(project);
 
@@ -0,0 +1,188 @@
+"""Shared data access for the Interspect evidence database.
+
+Used by galiana's KPI analyzer and the decomposition backfill/calibration
+scripts, so they agree on where the DB lives, how it is opened and which
+indexes the hot queries rely on:
+
+  idx_evidence_event_ts      (event, ts, override_reason) — covers the
+                             override KPI query and per-event counts
+  idx_evidence_session_seq   (session_id, seq) — next_seq() is one index
+                             probe instead of a scan of the session
+
+interspect-init.sh creates both indexes and sets the WAL journal; a
+writer that runs for real (not a dry run) can also call migrate().
+Nothing else changes the schema or journal mode: connect() only opens a
+writable connection with a busy timeout, and connect_readonly() opens a
+mode=ro URI that cannot take write locks, so analytics never block hook
+writers. Query helpers use fixed SQL text, so sqlite3's per-connection
+statement cache prepares each one once.
+
+EVIDENCE_TABLE is the evidence layout the scripts read: interspect-init.sh's
+table plus the provenance/quarantine columns lib-interspect.sh migrates in.
+create_evidence_table() builds it (without INDEXES, like a DB that predates
+them) for fixtures and fresh tooling DBs.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import subprocess
+from pathlib import Path
+from urllib.parse import quote
+
+DB_RELPATH = ".clavain/interspect/interspect.db"
+
+INDEXES = {
+    "idx_evidence_event_ts": "evidence(event, ts, override_reason)",
+    "idx_evidence_session_seq": "evidence(session_id, seq)",
+}
+
+EVIDENCE_TABLE = """CREATE TABLE IF NOT EXISTS evidence (
+  id                  INTEGER PRIMARY KEY AUTOINCREMENT,
+  ts                  TEXT    NOT NULL,
+  session_id          TEXT    NOT NULL,
+  seq                 INTEGER NOT NULL,
+  source              TEXT    NOT NULL,
+  source_version      TEXT,
+  event               TEXT    NOT NULL,
+  override_reason     TEXT,
+  context             TEXT    NOT NULL,
+  project             TEXT    NOT NULL,
+  project_lang        TEXT,
+  project_type        TEXT,
+  source_event_id     TEXT,
+  source_table        TEXT,
+  raw_override_reason TEXT,
+  quarantine_until    INTEGER DEFAULT 0
+)"""
+
+OVERRIDE_EVENTS = ("override", "disagreement_override")
+WRONG_REASONS = ("agent_wrong", "severity_miscalibrated")
+
+_OVERRIDE_SUMMARY_SQL = (
+    "SELECT override_reason, COUNT(*) FROM evidence "
+    "WHERE event IN (?, ?) AND ts >= ? AND ts <= ? "
+    "GROUP BY override_reason"
+)
+_NEXT_SEQ_SQL = "SELECT COALESCE(MAX(seq), 0) + 1 FROM evidence WHERE session_id = ?"
+_COUNT_EVENTS_SQL = "SELECT COUNT(*) FROM evidence WHERE event = ?"
+
+
+def find_db(db_path=None):
+    """Find the Interspect database path.
+
+    Mirrors lib-interspect.sh _interspect_db_path() priority:
+    explicit path > CLAUDE_PROJECT_DIR > git root > hardcoded fallback.
+    """
+    if db_path:
+        return db_path
+
+    # 1. CLAUDE_PROJECT_DIR (set by Claude Code for the active project)
+    project_dir = os.environ.get("CLAUDE_PROJECT_DIR", "")
+    if project_dir:
+        candidate = os.path.join(project_dir, DB_RELPATH)
+        if os.path.isfile(candidate):
+            return candidate
+
+    # 2. Git root
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            capture_output=True, text=True, timeout=5
+        )
+        if result.returncode == 0:
+            candidate = os.path.join(result.stdout.strip(), DB_RELPATH)
+            if os.path.isfile(candidate):
+                return candidate
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+
+    # 3. Hardcoded fallback
+    candidate = os.path.expanduser(os.path.join("~/projects/Sylveste", DB_RELPATH))
+    if os.path.isfile(candidate):
+        return candidate
+
+    return None
+
+
+def project_db(project: Path) -> Path:
+    """The evidence DB of one project checkout."""
+    return project / DB_RELPATH
+
+
+# ─── Connections ─────────────────────────────────────────────────────
+
+
+def connect(db_path, timeout: float = 5.0) -> sqlite3.Connection:
+    """Writable connection in autocommit mode (callers BEGIN explicitly)."""
+    conn = sqlite3.connect(str(db_path), timeout=timeout, isolation_level=None)
+    conn.execute(f"PRAGMA busy_timeout = {int(timeout * 1000)}")
+    return conn
+
+
+def connect_readonly(db_path, timeout: float = 5.0) -> sqlite3.Connection:
+    """Read-only connection for analytics. Never writes: on a DB that
+    interspect-init.sh has not migrated, queries work, just slower."""
+    uri = f"file:{quote(str(Path(db_path).resolve()))}?mode=ro"
+    return sqlite3.connect(uri, uri=True, timeout=timeout)
+
+
+def execute_script(conn: sqlite3.Connection, script: str) -> None:
+    """Run ;-separated DDL statement by statement, inside the caller's open
+    transaction — executescript() would commit it first."""
+    for statement in script.split(";"):
+        if statement.strip():
+            conn.execute(statement)
+
+
+def create_evidence_table(conn: sqlite3.Connection) -> None:
+    execute_script(conn, EVIDENCE_TABLE)
+
+
+def migrate(conn: sqlite3.Connection) -> None:
+    """Switch to WAL and create missing indexes — what interspect-init.sh
+    does, for writers that may run before it. Not for dry runs."""
+    if conn.execute("PRAGMA journal_mode").fetchone()[0].lower() != "wal":
+        conn.execute("PRAGMA journal_mode = WAL")
+    ensure_indexes(conn)
+
+
+def missing_indexes(conn: sqlite3.Connection) -> list[str]:
+    """Names from INDEXES that the evidence table does not have."""
+    present = {row[1] for row in conn.execute("PRAGMA index_list(evidence)")}
+    return [name for name in INDEXES if name not in present]
+
+
+def ensure_indexes(conn: sqlite3.Connection) -> None:
+    for name, target in INDEXES.items():
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+
+
+# ─── Queries ─────────────────────────────────────────────────────────
+
+
+def override_summary(conn: sqlite3.Connection, since_iso: str, until_iso: str) -> dict:
+    """Routing-override KPIs for ts in [since_iso, until_iso], in one grouped query.
+
+    Returns {"total_overrides", "agent_wrong_count", "by_reason"} with
+    by_reason ordered by count, descending (NULL reason -> "unknown")."""
+    rows = conn.execute(_OVERRIDE_SUMMARY_SQL, (*OVERRIDE_EVENTS, since_iso, until_iso)).fetchall()
+    by_reason: dict[str, int] = {}
+    for reason, count in sorted(rows, key=lambda row: -row[1]):
+        key = reason or "unknown"
+        by_reason[key] = by_reason.get(key, 0) + count
+    return {
+        "total_overrides": sum(count for _, count in rows),
+        "agent_wrong_count": sum(count for reason, count in rows if reason in WRONG_REASONS),
+        "by_reason": by_reason,
+    }
+
+
+def next_seq(conn: sqlite3.Connection, session_id: str) -> int:
+    """Next sequence number for a session."""
+    return conn.execute(_NEXT_SEQ_SQL, (session_id,)).fetchone()[0]
+
+
+def count_events(conn: sqlite3.Connection, event: str) -> int:
+    return conn.execute(_COUNT_EVENTS_SQL, (event,)).fetchone()[0]
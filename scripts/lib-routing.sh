@@ -24,6 +24,7 @@
 # Resolve our own scripts/ directory once so verification helpers can locate
 # the vendored _verification.py primitive without re-walking the tree per call.
 declare -g _ROUTING_LIB_DIR="${BASH_SOURCE[0]%/*}"
+declare -g _ROUTING_COLLECTOR_SPAWNED_AT=0  # EPOCHSECONDS of last collector spawn
 
 # --- Global cache (populated by _routing_load_cache) ---
 declare -g _ROUTING_SA_DEFAULT_MODEL=""
@@ -803,6 +804,12 @@ _routing_audit_log_path() {
 # Where:
 #   <state> ∈ {VERIFIED, FAILED_VERIFICATION, UNVERIFIABLE}
 #
+# Default path is spooled: one printf append to <log>.spool (no fork), drained
+# into the log by a resident `_verification.py collect` process that is
+# started on demand and exits when idle. CLAVAIN_VERIFICATION_EMIT=direct
+# restores the per-call `_verification.py emit` fork. Readers that need the
+# log current call _routing_flush_verification first.
+#
 # Best-effort: emission failures (no python3, log path not writable, etc.)
 # write a single [verification-emit-fail] line to stderr but do NOT fail the
 # resolver. The audit gap becomes observable instead of silent.
@@ -820,6 +827,11 @@ _routing_emit_verification() {
     return 1
   fi
 
+  if [[ "${CLAVAIN_VERIFICATION_EMIT:-spool}" != "direct" ]] \
+    && _routing_spool_verification "$log_path" "$primitive" "$name" "$state" "$evidence" "$decision_type"; then
+    return 0
+  fi
+
   local args=(
     emit
     --name "$name"
@@ -836,6 +848,81 @@ _routing_emit_verification() {
   return 0
 }
 
+# Escape one spool field (backslash, tab, CR, LF) into REPLY without forking.
+_routing_spool_escape() {
+  local s="$1"
+  s="${s//\\/\\\\}"
+  s="${s//$'\t'/\\t}"
+  s="${s//$'\n'/\\n}"
+  s="${s//$'\r'/\\r}"
+  REPLY="$s"
+}
+
+# Append one spool line (format in _verification.py) and make sure a collector
+# is draining it. Returns non-zero — so the caller falls back to a direct
+# emit — when the spooled path cannot preserve the contract: no
+# EPOCHREALTIME (bash < 5), invalid state, a line >= PIPE_BUF, or a failed
+# append.
+_routing_spool_verification() {
+  local log_path="$1" primitive="$2" name="$3" state="$4" evidence="$5" decision_type="$6"
+  [[ -n "${EPOCHREALTIME:-}" && -n "$name" ]] || return 1
+  case "$state" in
+    VERIFIED|FAILED_VERIFICATION|UNVERIFIABLE) ;;
+    *) return 1 ;;
+  esac
+
+  local ts="${EPOCHREALTIME/[.,]/}"
+  ts="${ts:0:${#ts}-3}"  # microseconds -> milliseconds
+
+  # Same single-write atomicity bound as append_to_log: the JSON line the
+  # collector writes must stay under PIPE_BUF. Count bytes (C locale), and
+  # charge JSON escaping: +1 per quote or backslash, at most +5 per control
+  # or non-ASCII byte (\u00XX; \uXXXX pairs never cost more per byte).
+  # 256 covers the keys, timestamp and step_id.
+  local LC_ALL=C
+  local raw="$name$state$decision_type${FLUX_RUN_UUID:-}$evidence"
+  local ascii="${raw//[^ -~]/}"
+  local quoted="${ascii//[^\"\\]/}"
+  (( ${#raw} + ${#quoted} + 5 * (${#raw} - ${#ascii}) + 256 < 4000 )) || return 1
+
+  local line="v1"$'\t'"$ts" field
+  for field in "$name" "$state" "$decision_type" "${FLUX_RUN_UUID:-}" "$evidence"; do
+    _routing_spool_escape "$field"
+    line+=$'\t'"$REPLY"
+  done
+
+  local spool="${log_path}.spool"
+  [[ -d "${spool%/*}" ]] || mkdir -p "${spool%/*}" 2>/dev/null || return 1
+  printf '%s\n' "$line" >> "$spool" 2>/dev/null || return 1
+
+  local pid=""
+  [[ -r "${spool}.pid" ]] && read -r pid < "${spool}.pid" 2>/dev/null
+  if [[ -z "$pid" ]] || ! kill -0 "$pid" 2>/dev/null; then
+    # A fresh collector needs ~50ms before it writes its pid; don't stampede
+    # it with one spawn per emit in the meantime. Extra spawns lose the flock
+    # and exit, so this only bounds wasted forks.
+    if (( EPOCHSECONDS - ${_ROUTING_COLLECTOR_SPAWNED_AT:-0} >= 2 )); then
+      _ROUTING_COLLECTOR_SPAWNED_AT=$EPOCHSECONDS
+      # fd 3 closed so bats (and other fd-3 watchers) don't wait on the collector.
+      python3 "$primitive" collect --log-path "$log_path" --spool "$spool" \
+        </dev/null >/dev/null 2>&1 3>&- &
+      disown 2>/dev/null || true
+    fi
+  fi
+  return 0
+}
+
+# Synchronously drain spooled VerificationSteps into the audit log.
+_routing_flush_verification() {
+  local log_path
+  log_path=$(_routing_audit_log_path) || log_path=""
+  [[ -z "$log_path" || ! -f "${log_path}.spool" ]] && return 0
+  python3 "${_ROUTING_LIB_DIR}/_verification.py" drain --log-path "$log_path" 2>/dev/null || {
+    echo "[verification-emit-fail] drain $log_path" >&2
+    return 1
+  }
+}
+
 # --- B5: Check interfer availability (cached) ---
 _routing_b5_available() {
   [[ -z "$_ROUTING_B5_ENDPOINT" ]] && { echo "no"; return; }
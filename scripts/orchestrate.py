@@ -18,18 +18,24 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import hashlib
+import itertools
 import json
 import os
 import re
 import shlex
 import shutil
+import socketserver
 import subprocess
 import sys
+import tempfile
 import textwrap
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass, field
-from graphlib import CycleError, TopologicalSorter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from uuid import uuid4
 
@@ -133,7 +139,11 @@ def load_manifest(path: str | Path) -> Manifest:
 
 def build_graph(manifest: Manifest) -> dict[str, set[str]]:
     """Build dependency graph. Stage barriers are additive: every task depends
-    on ALL tasks from prior stages PLUS any explicit depends entries."""
+    on ALL tasks from prior stages PLUS any explicit depends entries.
+
+    This is the expanded, human-readable view — its edge count grows
+    quadratically with manifest size. Scheduling runs on the compact
+    TaskGraph (compile_graph) instead."""
     graph: dict[str, set[str]] = {}
     prior_stage_tasks: set[str] = set()
 
@@ -151,25 +161,207 @@ def build_graph(manifest: Manifest) -> dict[str, set[str]]:
     return graph
 
 
-def validate_graph(graph: dict[str, set[str]], manifest: Manifest) -> list[str]:
-    """Validate the dependency graph. Returns a list of error strings (empty = valid)."""
-    errors: list[str] = []
-    all_ids = set(graph.keys())
+class TaskGraph:
+    """Compact dependency graph: integer node ids, list-backed adjacency, and
+    a reverse index built once and shared by every scheduler.
+
+    Stage barriers are modelled as synthetic barrier nodes rather than
+    all-pairs edges: barrier k depends on the tasks of stage k-1 and on
+    barrier k-1, and every task of stage k depends on barrier k. Explicit
+    depends on a task in an EARLIER stage are implied by the barrier and
+    dropped (transitive reduction); same-stage and forward references stay
+    as direct edges, so cycles still surface. Edge count is O(tasks +
+    explicit depends) instead of O(tasks²), which keeps validation,
+    scheduling and skip propagation near-linear on 1000+ task manifests.
+
+    Node ids [0, n_tasks) are tasks in manifest order; barrier nodes follow.
+    """
+
+    def __init__(
+        self,
+        names: list[str],
+        n_tasks: int,
+        preds: list[list[int]],
+        problems: list[str] | None = None,
+        stage_of: list[int] | None = None,
+    ):
+        self.names = names
+        self.n_tasks = n_tasks
+        self.preds = preds
+        self.index = {names[i]: i for i in range(n_tasks)}
+        # Unknown / self references found while compiling; edges dropped.
+        self.problems = problems or []
+        # Stage ordinal per task (manual-batching); -1 when built from a dict.
+        self.stage_of = stage_of or [-1] * n_tasks
+        self.succs: list[list[int]] = [[] for _ in names]
+        for node, ps in enumerate(preds):
+            for pred in ps:
+                self.succs[pred].append(node)
+
+    @classmethod
+    def from_manifest(cls, manifest: Manifest) -> TaskGraph:
+        names: list[str] = []
+        stage_of: list[int] = []
+        stage_members: list[list[int]] = []
+        for ordinal, stage in enumerate(manifest.stages):
+            members = []
+            for t in stage.get("tasks", []):
+                members.append(len(names))
+                names.append(t["id"])
+                stage_of.append(ordinal)
+            stage_members.append(members)
+        n_tasks = len(names)
+        index = {tid: i for i, tid in enumerate(names)}
+        preds: list[list[int]] = [[] for _ in range(n_tasks)]
+        problems: list[str] = []
+
+        barrier: int | None = None  # barrier gating the current stage
+        prev_members: list[int] = []
+        for ordinal, stage in enumerate(manifest.stages):
+            members = stage_members[ordinal]
+            if not members:
+                continue
+            if prev_members:
+                names.append(f"<stage-barrier:{ordinal}>")
+                preds.append(prev_members + ([barrier] if barrier is not None else []))
+                barrier = len(names) - 1
+            for node, t in zip(members, stage.get("tasks", [])):
+                edges: set[int] = set()
+                if barrier is not None:
+                    edges.add(barrier)
+                for dep in t.get("depends", []):
+                    d = index.get(dep)
+                    if d is None:
+                        problems.append(f"Task '{names[node]}' depends on unknown task '{dep}'")
+                    elif d == node:
+                        problems.append(f"Task '{names[node]}' depends on itself")
+                    elif stage_of[d] >= ordinal:
+                        edges.add(d)
+                    # else: prior stage — already implied by the barrier
+                preds[node] = sorted(edges)
+            prev_members = members
+        return cls(names, n_tasks, preds, problems, stage_of)
+
+    @classmethod
+    def from_mapping(cls, graph: dict[str, set[str]]) -> TaskGraph:
+        """Compile an explicit {task: deps} mapping (no barrier nodes)."""
+        names = list(graph)
+        index = {tid: i for i, tid in enumerate(names)}
+        preds: list[list[int]] = []
+        problems: list[str] = []
+        for tid in names:
+            edges: list[int] = []
+            for dep in graph[tid]:
+                d = index.get(dep)
+                if d is None:
+                    problems.append(f"Task '{tid}' depends on unknown task '{dep}'")
+                elif dep == tid:
+                    problems.append(f"Task '{tid}' depends on itself")
+                else:
+                    edges.append(d)
+            preds.append(edges)
+        return cls(names, len(names), preds, problems)
+
+    @property
+    def task_ids(self) -> list[str]:
+        return self.names[: self.n_tasks]
+
+    @property
+    def edge_count(self) -> int:
+        return sum(len(ps) for ps in self.preds)
+
+    def is_barrier(self, node: int) -> bool:
+        return node >= self.n_tasks
+
+    def topo_order(self) -> tuple[list[int], list[int]]:
+        """Kahn's algorithm over all nodes. Returns (order, stuck) — stuck
+        nodes are on or behind a cycle and empty for a valid graph."""
+        indeg = [len(ps) for ps in self.preds]
+        queue = [i for i, d in enumerate(indeg) if d == 0]
+        order: list[int] = []
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            order.append(node)
+            for s in self.succs[node]:
+                indeg[s] -= 1
+                if indeg[s] == 0:
+                    queue.append(s)
+        stuck = [i for i, d in enumerate(indeg) if d > 0]
+        return order, stuck
+
+    def deps_of(self, task_id: str) -> set[str]:
+        """Expanded dependency set — identical to build_graph()[task_id]."""
+        out: set[str] = set()
+        seen: set[int] = set()
+        stack = list(self.preds[self.index[task_id]])
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            if self.is_barrier(node):
+                stack.extend(self.preds[node])
+            else:
+                out.add(self.names[node])
+        return out
+
+    def dependents_of(self, task_id: str) -> set[str]:
+        """Tasks whose expanded dependency set (deps_of) contains task_id."""
+        out: set[str] = set()
+        seen: set[int] = set()
+        stack = list(self.succs[self.index[task_id]])
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            if self.is_barrier(node):
+                stack.extend(self.succs[node])
+            else:
+                out.add(self.names[node])
+        return out
+
+    def transitive_dependents(self, task_id: str) -> list[str]:
+        """Every task reachable downstream of task_id, barriers traversed."""
+        seen = bytearray(len(self.names))
+        out: list[str] = []
+        stack = list(self.succs[self.index[task_id]])
+        while stack:
+            node = stack.pop()
+            if seen[node]:
+                continue
+            seen[node] = 1
+            if not self.is_barrier(node):
+                out.append(self.names[node])
+            stack.extend(self.succs[node])
+        return out
+
 
-    # Check for references to non-existent tasks
-    for tid, deps in graph.items():
-        for dep in deps:
-            if dep not in all_ids:
-                errors.append(f"Task '{tid}' depends on unknown task '{dep}'")
-            if dep == tid:
-                errors.append(f"Task '{tid}' depends on itself")
+def compile_graph(manifest: Manifest) -> TaskGraph:
+    """The compact scheduling graph for a manifest (see TaskGraph)."""
+    return TaskGraph.from_manifest(manifest)
+
+
+def _as_task_graph(graph: TaskGraph | dict[str, set[str]]) -> TaskGraph:
+    return graph if isinstance(graph, TaskGraph) else TaskGraph.from_mapping(graph)
+
+
+def validate_graph(
+    graph: TaskGraph | dict[str, set[str]], manifest: Manifest
+) -> list[str]:
+    """Validate the dependency graph. Returns a list of error strings (empty = valid)."""
+    g = _as_task_graph(graph)
+    # References to non-existent tasks and self-dependencies
+    errors: list[str] = list(g.problems)
 
     # Check for cycles
-    try:
-        ts = TopologicalSorter(graph)
-        ts.prepare()
-    except CycleError as e:
-        errors.append(f"Cycle detected: {e}")
+    _, stuck = g.topo_order()
+    if stuck:
+        tasks = [g.names[i] for i in stuck if not g.is_barrier(i)]
+        shown = ", ".join(tasks[:10]) + (f" (+{len(tasks) - 10} more)" if len(tasks) > 10 else "")
+        errors.append(f"Cycle detected: tasks on or behind a cycle: {shown}")
 
     return errors
 
@@ -178,44 +370,47 @@ def validate_graph(graph: dict[str, set[str]], manifest: Manifest) -> list[str]:
 # Execution order resolution
 # ---------------------------------------------------------------------------
 
-def _resolve_all_parallel(graph: dict[str, set[str]]) -> list[list[str]]:
+def _resolve_all_parallel(graph: TaskGraph | dict[str, set[str]]) -> list[list[str]]:
     """All tasks in one batch, ignoring dependencies."""
+    if isinstance(graph, TaskGraph):
+        return [graph.task_ids]
     return [list(graph.keys())]
 
 
-def _resolve_all_sequential(graph: dict[str, set[str]]) -> list[list[str]]:
+def _resolve_all_sequential(graph: TaskGraph | dict[str, set[str]]) -> list[list[str]]:
     """Each task in its own batch, topologically sorted.
 
     Caller must have already validated the graph via validate_graph().
     """
-    ts = TopologicalSorter(graph)
-    order = list(ts.static_order())
-    return [[tid] for tid in order]
+    g = _as_task_graph(graph)
+    order, _ = g.topo_order()
+    return [[g.names[i]] for i in order if not g.is_barrier(i)]
 
 
 def _resolve_manual_batching(
-    graph: dict[str, set[str]], manifest: Manifest
+    graph: TaskGraph | dict[str, set[str]], manifest: Manifest
 ) -> list[list[str]]:
-    """Group by stage, respecting intra-stage deps with TopologicalSorter."""
+    """Group by stage, respecting intra-stage deps (Kahn waves per stage)."""
+    g = _as_task_graph(graph)
     batches: list[list[str]] = []
     for stage in manifest.stages:
-        stage_ids = [t["id"] for t in stage.get("tasks", [])]
-        if not stage_ids:
+        stage_nodes = [g.index[t["id"]] for t in stage.get("tasks", []) if t["id"] in g.index]
+        if not stage_nodes:
             continue
-        stage_set = set(stage_ids)
-        # Build intra-stage subgraph
-        sub_graph = {}
-        for tid in stage_ids:
-            intra_deps = graph.get(tid, set()) & stage_set
-            sub_graph[tid] = intra_deps
-        # Use TopologicalSorter for intra-stage ordering
-        ts = TopologicalSorter(sub_graph)
-        ts.prepare()
-        while ts.is_active():
-            ready = list(ts.get_ready())
-            batches.append(ready)
-            for tid in ready:
-                ts.done(tid)
+        in_stage = set(stage_nodes)
+        # Intra-stage subgraph: only edges between this stage's tasks
+        indeg = {n: sum(1 for p in g.preds[n] if p in in_stage) for n in stage_nodes}
+        ready = [n for n in stage_nodes if indeg[n] == 0]
+        while ready:
+            batches.append([g.names[n] for n in ready])
+            nxt = []
+            for n in ready:
+                for s in g.succs[n]:
+                    if s in in_stage:
+                        indeg[s] -= 1
+                        if indeg[s] == 0:
+                            nxt.append(s)
+            ready = nxt
     return batches
 
 
@@ -223,54 +418,82 @@ class DependencyDrivenScheduler:
     """Dynamic scheduler that yields ready tasks as dependencies complete.
 
     Unlike static batch pre-computation, this responds to actual completion
-    order for maximum parallelism.
+    order for maximum parallelism. Runs on TaskGraph's int arrays: barrier
+    nodes complete on their own once their stage drains, and failure
+    propagation walks the graph's shared reverse index.
     """
 
-    def __init__(self, graph: dict[str, set[str]]):
-        self._graph = graph
-        self._sorter = TopologicalSorter(graph)
-        self._sorter.prepare()
+    def __init__(self, graph: TaskGraph | dict[str, set[str]]):
+        self._graph = g = _as_task_graph(graph)
+        n = len(g.names)
+        self._pending = [len(ps) for ps in g.preds]
+        self._done = bytearray(n)
+        self._skip = bytearray(n)
+        self._queued: list[int] = []
+        self._in_flight = 0
         self._failed: set[str] = set()
-        self._skip_set: set[str] = set()
-        # Pre-compute reverse graph for failure propagation
-        self._dependents: dict[str, set[str]] = {}
-        for tid, deps in graph.items():
-            for dep in deps:
-                self._dependents.setdefault(dep, set()).add(tid)
+        for node in range(n):
+            if self._pending[node] == 0:
+                self._release(node)
+
+    def _release(self, node: int) -> None:
+        """A node's dependencies are all done: queue it, or complete it
+        immediately if it is a barrier."""
+        if self._graph.is_barrier(node):
+            self._complete(node)
+        else:
+            self._queued.append(node)
+
+    def _complete(self, node: int) -> None:
+        stack = [node]
+        while stack:
+            cur = stack.pop()
+            self._done[cur] = 1
+            for s in self._graph.succs[cur]:
+                self._pending[s] -= 1
+                if self._pending[s] == 0:
+                    if self._graph.is_barrier(s):
+                        stack.append(s)
+                    else:
+                        self._queued.append(s)
 
     @property
     def is_active(self) -> bool:
-        return self._sorter.is_active()
+        return bool(self._queued) or self._in_flight > 0
 
     def get_ready(self) -> list[str]:
         """Get tasks ready to dispatch (all deps satisfied, not skipped)."""
-        ready = list(self._sorter.get_ready())
-        # Filter out skipped tasks, marking them done immediately
-        actual_ready = []
-        for tid in ready:
-            if tid in self._skip_set:
-                self._sorter.done(tid)
-            else:
-                actual_ready.append(tid)
+        actual_ready: list[str] = []
+        while self._queued:
+            batch, self._queued = self._queued, []
+            for node in batch:
+                if self._skip[node]:
+                    # Skipped tasks are marked done immediately
+                    self._complete(node)
+                else:
+                    actual_ready.append(self._graph.names[node])
+        self._in_flight += len(actual_ready)
         return actual_ready
 
     def mark_done(self, task_id: str) -> None:
         """Mark a task as successfully completed."""
-        self._sorter.done(task_id)
+        node = self._graph.index[task_id]
+        if self._done[node]:
+            return
+        self._in_flight -= 1
+        self._complete(node)
 
     def mark_failed(self, task_id: str) -> list[str]:
         """Mark a task as failed. Returns list of transitively skipped task IDs."""
         self._failed.add(task_id)
-        self._sorter.done(task_id)  # unblock the sorter
+        self.mark_done(task_id)  # unblock dependents' counters
         # Propagate failure: skip all transitive dependents
         skipped = []
-        queue = list(self._dependents.get(task_id, set()))
-        while queue:
-            dependent = queue.pop()
-            if dependent not in self._skip_set:
-                self._skip_set.add(dependent)
+        for dependent in self._graph.transitive_dependents(task_id):
+            node = self._graph.index[dependent]
+            if not self._skip[node]:
+                self._skip[node] = 1
                 skipped.append(dependent)
-                queue.extend(self._dependents.get(dependent, set()))
         return skipped
 
 
@@ -295,27 +518,171 @@ def _find_dispatch_sh() -> str | None:
     return None
 
 
+PROMPT_BUDGET_CHARS = int(os.environ.get("ORC_PROMPT_BUDGET_CHARS", "24000"))
+PROMPT_CHARS_PER_TOKEN = 4  # rough estimate, for meta.json only
+DEP_CONTEXT_MIN_CHARS = 2000  # dependency context floor, however long the task
+STRUCTURED_MAX_CHARS = 1500  # per dependency: sidecar + VERDICT/FILES_CHANGED
+DEDUPE_MIN_LINE = 16  # shorter lines (blank, fences, "---") never count as repeats
+_STRUCTURED_KEY = re.compile(r"^\W*(VERDICT|FILES_CHANGED|FILES CHANGED)\W*:", re.IGNORECASE)
+_LIST_ITEM = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+\S")
+
+
+def _structured_sections(lines: list[str]) -> list[str]:
+    """The LAST VERDICT and FILES_CHANGED reports in an executor's output,
+    with FILES_CHANGED's list items — they sit at the end, where a
+    head-of-file summary cuts them off."""
+    found: dict[str, list[str]] = {}
+    i = 0
+    while i < len(lines):
+        m = _STRUCTURED_KEY.match(lines[i])
+        if not m:
+            i += 1
+            continue
+        key = m.group(1).upper().replace(" ", "_")
+        block = [lines[i].rstrip("\n")]
+        i += 1
+        if key == "FILES_CHANGED":
+            while i < len(lines) and _LIST_ITEM.match(lines[i]):
+                block.append(lines[i].rstrip("\n"))
+                i += 1
+        found[key] = block
+    return [line for key in ("VERDICT", "FILES_CHANGED") for line in found.get(key, [])]
+
+
+@dataclass
+class _DepOutput:
+    """A finished task's verdict sidecar and output, read once per prompt."""
+    verdict: str | None
+    lines: list[str] | None
+
+    @classmethod
+    def load(cls, output_path: str | None, verdict_path: str | None) -> _DepOutput:
+        verdict = lines = None
+        if verdict_path and os.path.exists(verdict_path):
+            with open(verdict_path, errors="replace") as f:
+                verdict = f.read().strip()
+        if output_path and os.path.exists(output_path):
+            with open(output_path, errors="replace") as f:
+                lines = f.readlines()
+        return cls(verdict, lines)
+
+    def need(self, max_lines: int = 50, structured_max: int = STRUCTURED_MAX_CHARS) -> int:
+        """Upper bound on the unconstrained summary's length (repeats across
+        dependencies are not subtracted), without rendering it."""
+        n = 0
+        if self.verdict is not None:
+            n += min(len(self.verdict), structured_max) + 1
+        if self.lines is not None:
+            structured = "\n".join(_structured_sections(self.lines))
+            n += min(len(structured), structured_max) + 1
+            n += sum(len(line) for line in self.lines[:max_lines]) + 96
+        return n
+
+    def summary(
+        self,
+        max_lines: int = 50,
+        max_chars: int | None = None,
+        seen: set[str] | None = None,
+        structured_max: int = STRUCTURED_MAX_CHARS,
+    ) -> str:
+        seen = seen if seen is not None else set()
+        parts: list[str] = []
+        repeated = 0
+        room = max_chars
+
+        def fresh(line: str) -> bool:
+            nonlocal repeated
+            key = line.strip()
+            if len(key) < DEDUPE_MIN_LINE:
+                return True
+            if key in seen:
+                repeated += 1
+                return False
+            seen.add(key)
+            return True
+
+        def add_structured(text: str) -> None:
+            nonlocal room
+            text = text[:structured_max if room is None else max(0, min(structured_max, room - 1))]
+            if text:
+                parts.append(text)
+                if room is not None:
+                    room -= len(text) + 1
+
+        if self.verdict is not None:
+            for line in self.verdict.splitlines():
+                seen.add(line.strip())
+            add_structured(self.verdict)
+
+        if self.lines is not None:
+            lines = self.lines
+            structured = [l for l in _structured_sections(lines) if fresh(l)]
+            add_structured("\n".join(structured))
+            shown = {l.strip() for l in structured}
+            # Reserve room for the truncation / repeat notes so they fit too.
+            body_room = None if room is None else max(0, room - 96)
+            body: list[str] = []
+            taken = 0
+            for n, line in enumerate(lines[:max_lines]):
+                if body_room is not None and len(line) > body_room:
+                    break
+                taken = n + 1
+                if line.strip() in shown or not fresh(line):
+                    continue
+                body.append(line)
+                if body_room is not None:
+                    body_room -= len(line)
+            if body:
+                parts.append("".join(body).rstrip("\n"))
+            if taken < len(lines):
+                parts.append(f"\n... ({len(lines) - taken} more lines truncated)")
+
+        if repeated:
+            parts.append(f"({repeated} line(s) repeated from other dependencies omitted)")
+        text = "\n".join(parts) if parts else "(no output)"
+        return text if max_chars is None else text[:max_chars]
+
+
 def summarize_output(
-    output_path: str | None, verdict_path: str | None, max_lines: int = 50
+    output_path: str | None,
+    verdict_path: str | None,
+    max_lines: int = 50,
+    max_chars: int | None = None,
+    seen: set[str] | None = None,
+    structured_max: int = STRUCTURED_MAX_CHARS,
 ) -> str:
-    """Summarize a completed task's output for dependency context."""
-    parts = []
-
-    if verdict_path and os.path.exists(verdict_path):
-        with open(verdict_path) as f:
-            verdict = f.read().strip()
-        parts.append(verdict)
-
-    if output_path and os.path.exists(output_path):
-        with open(output_path) as f:
-            lines = f.readlines()
-        if len(lines) > max_lines:
-            parts.append("".join(lines[:max_lines]))
-            parts.append(f"\n... ({len(lines) - max_lines} more lines truncated)")
-        else:
-            parts.append("".join(lines))
+    """Summarize a completed task's output for dependency context.
+
+    Structured parts come first: the verdict sidecar, then the output's
+    final VERDICT / FILES_CHANGED report, each cut to ``structured_max``.
+    The head of the output fills what is left. ``max_chars`` bounds the
+    whole summary, structured parts and notes included. ``seen`` is shared
+    across a prompt's dependencies: lines already emitted by another
+    dependency are dropped rather than repeated.
+    """
+    return _DepOutput.load(output_path, verdict_path).summary(
+        max_lines, max_chars, seen, structured_max,
+    )
 
-    return "\n".join(parts) if parts else "(no output)"
+
+def _allocate_budget(needs: list[int], budget: int) -> list[int]:
+    """Split ``budget`` across ``needs``: every share is capped at its need,
+    and what small ones leave over is redistributed to the rest."""
+    alloc = [0] * len(needs)
+    pending = sorted(range(len(needs)), key=lambda i: needs[i])
+    remaining = budget
+    while pending:
+        share = remaining // len(pending)
+        i = pending[0]
+        if needs[i] <= share:
+            alloc[i] = needs[i]
+            remaining -= needs[i]
+            pending.pop(0)
+        else:
+            for j in pending:
+                alloc[j] = share
+            break
+    return alloc
 
 
 def build_prompt(
@@ -323,22 +690,24 @@ def build_prompt(
     plan_path: str | None,
     dep_outputs: dict[str, TaskResult],
     all_tasks: dict[str, Task],
+    budget_chars: int | None = None,
+    stats: dict | None = None,
 ) -> str:
-    """Build the prompt for a task, including dependency context."""
+    """Build the prompt for a task, including dependency context.
+
+    Dependency context gets what ``budget_chars`` (ORC_PROMPT_BUDGET_CHARS)
+    leaves after the task's own sections, split across dependencies by
+    need, so a wide fan-in shrinks each summary instead of growing the
+    prompt. Each dependency's share covers its structured parts too, and
+    their cap shrinks with the number of dependencies. The prompt exceeds
+    the budget only when the task's own sections leave less than
+    DEP_CONTEXT_MIN_CHARS, and then by at most that floor. ``stats``, when
+    given, is filled with the prompt's size and per-dependency allocation
+    for meta.json.
+    """
+    budget = PROMPT_BUDGET_CHARS if budget_chars is None else budget_chars
     sections = []
 
-    # Dependency context
-    if dep_outputs:
-        sections.append("## Context from dependencies\n")
-        for dep_id, result in dep_outputs.items():
-            dep_task = all_tasks.get(dep_id)
-            dep_title = dep_task.title if dep_task else dep_id
-            sections.append(f"### {dep_id}: {dep_title}")
-            sections.append(f"**Status:** {result.status}")
-            summary = summarize_output(result.output_path, result.verdict_path)
-            sections.append(summary)
-            sections.append("")
-
     # Task description
     sections.append(f"## Task: {task.title}\n")
     if task.files:
@@ -368,7 +737,41 @@ def build_prompt(
         and stop. The orchestrator parks the task for the coordinator.
     """))
 
-    return "\n".join(sections)
+    # Dependency context, ahead of the task — sized to what the task left.
+    dep_sections: list[str] = []
+    dep_stats: dict[str, dict] = {}
+    if dep_outputs:
+        dep_budget = max(DEP_CONTEXT_MIN_CHARS, budget - len("\n".join(sections)))
+        headers = []
+        for dep_id, result in dep_outputs.items():
+            dep_task = all_tasks.get(dep_id)
+            dep_title = dep_task.title if dep_task else dep_id
+            headers.append(f"### {dep_id}: {dep_title}\n**Status:** {result.status}")
+        # Each dependency contributes header, summary and a blank line.
+        overhead = len("## Context from dependencies\n") + 1 + sum(len(h) + 3 for h in headers)
+        available = max(0, dep_budget - overhead)
+        # Sidecar and VERDICT/FILES_CHANGED together get at most two thirds
+        # of an even share, so the output's head is never crowded out.
+        structured_max = min(STRUCTURED_MAX_CHARS, available // (3 * len(dep_outputs)))
+        loaded = [_DepOutput.load(r.output_path, r.verdict_path) for r in dep_outputs.values()]
+        needs = [dep.need(structured_max=structured_max) for dep in loaded]
+        alloc = _allocate_budget(needs, available)
+        seen: set[str] = set()
+        dep_sections.append("## Context from dependencies\n")
+        for dep_id, header, dep, need, share in zip(dep_outputs, headers, loaded, needs, alloc):
+            summary = dep.summary(max_chars=share, seen=seen, structured_max=structured_max)
+            dep_sections += [header, summary, ""]
+            dep_stats[dep_id] = {"need": need, "allocated": share, "chars": len(summary)}
+
+    prompt = "\n".join(dep_sections + sections)
+    if stats is not None:
+        stats.update({
+            "chars": len(prompt),
+            "tokens_est": len(prompt) // PROMPT_CHARS_PER_TOKEN,
+            "budget_chars": budget,
+            "deps": dep_stats,
+        })
+    return prompt
 
 
 def _as_text(x: str | bytes | None) -> str:
@@ -433,7 +836,11 @@ REVIEW_DIFF_MAX_LINES = 600
 
 _TASK_HEADING = re.compile(r"^#{2,3}\s+Task\s+(\d+)\s*[:.]", re.MULTILINE)
 _VERIFY_BLOCK = re.compile(r"<verify>\n(.*?)</verify>", re.DOTALL)
-_VERIFY_ENTRY = re.compile(r"-\s+run:\s+`([^`]+)`\s*\n\s+expect:\s+(.+)")
+_VERIFY_ENTRY = re.compile(
+    r"-\s+run:\s+`([^`]+)`\s*\n\s+expect:\s+(.+)"
+    r"((?:\n\s+(?:independent|cache):\s+\w+)*)"
+)
+_VERIFY_OPTION = re.compile(r"(independent|cache):\s+(\w+)")
 
 
 @dataclass
@@ -462,7 +869,13 @@ def parse_plan_tasks(plan_path: str | None) -> dict[int, PlanTask]:
         verify: list[dict[str, str]] = []
         for vb in _VERIFY_BLOCK.finditer(section):
             for ve in _VERIFY_ENTRY.finditer(vb.group(1)):
-                verify.append({"run": ve.group(1), "expect": ve.group(2).strip()})
+                entry = {"run": ve.group(1), "expect": ve.group(2).strip()}
+                for opt, value in _VERIFY_OPTION.findall(ve.group(3)):
+                    if opt == "independent" and value in ("true", "yes"):
+                        entry["independent"] = True
+                    elif opt == "cache" and value in ("false", "no"):
+                        entry["cache"] = False
+                verify.append(entry)
         out[int(m.group(1))] = PlanTask(section=section, verify=verify)
     return out
 
@@ -472,50 +885,255 @@ def _task_plan_num(task_id: str) -> int | None:
     return int(m.group(1)) if m else None
 
 
+VERIFY_WORKERS = int(os.environ.get("ORC_VERIFY_WORKERS", "0")) or min(4, os.cpu_count() or 1)
+VERIFY_FINGERPRINT_MAX_FILES = 5000
+_PATH_TOKEN = re.compile(r"[\w.@+-]*[/.][\w./@+-]*")
+_FINGERPRINT_SKIP_DIRS = (".git", ".clavain")  # .clavain holds run artifacts, verify-cache.json included
+
+
+class VerifyCache:
+    """Verify-gate outcomes persisted in the run dir, keyed by
+    _verify_key(). A fix round whose commit did not touch a gate's inputs
+    reuses the earlier outcome instead of re-running the gate."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            self._entries: dict[str, dict] = data if isinstance(data, dict) else {}
+        except (OSError, json.JSONDecodeError):
+            self._entries = {}
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            return self._entries.get(key)
+
+    def put_many(self, items: dict[str, dict]) -> None:
+        if not items:
+            return
+        with self._lock:
+            self._entries.update(items)
+            snapshot = json.dumps(self._entries)
+            tmp = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp, "w") as f:
+                    f.write(snapshot)
+                os.replace(tmp, self.path)
+            except OSError:
+                pass  # the cache is an optimisation; never fail a gate over it
+
+
+_VERIFY_CACHES: dict[str, VerifyCache] = {}
+_VERIFY_CACHES_LOCK = threading.Lock()
+
+
+def _verify_cache_for(run_dir: str) -> VerifyCache:
+    with _VERIFY_CACHES_LOCK:
+        cache = _VERIFY_CACHES.get(run_dir)
+        if cache is None:
+            cache = VerifyCache(os.path.join(run_dir, "verify-cache.json"))
+            _VERIFY_CACHES[run_dir] = cache
+        return cache
+
+
+def _verify_inputs(cmd: str, project_dir: str, files: list[str]) -> list[str]:
+    """The files a gate plausibly reads: the task's declared files plus any
+    relative path in the command that exists in the project, minus .clavain/."""
+    paths = {os.path.normpath(f) for f in files}
+    for tok in _PATH_TOKEN.findall(cmd):
+        tok = tok.rstrip(".")
+        if tok and not os.path.isabs(tok) and os.path.exists(os.path.join(project_dir, tok)):
+            paths.add(os.path.normpath(tok))
+    return sorted(p for p in paths if p.split(os.sep, 1)[0] not in _FINGERPRINT_SKIP_DIRS)
+
+
+def _fingerprint_paths(project_dir: str, paths: list[str]) -> str:
+    """Content hash for files; (name, size, mtime) listing for directories."""
+    h = hashlib.sha256()
+    budget = VERIFY_FINGERPRINT_MAX_FILES
+    for rel in paths:
+        full = os.path.join(project_dir, rel)
+        h.update(f"\0{rel}\0".encode())
+        if os.path.isfile(full):
+            try:
+                with open(full, "rb") as f:
+                    for chunk in iter(lambda: f.read(1 << 16), b""):
+                        h.update(chunk)
+            except OSError:
+                h.update(b"unreadable")
+        elif os.path.isdir(full):
+            for root, dirs, names in os.walk(full):
+                dirs[:] = sorted(d for d in dirs if d not in _FINGERPRINT_SKIP_DIRS)
+                for name in sorted(names):
+                    budget -= 1
+                    if budget < 0:
+                        break
+                    try:
+                        st = os.stat(os.path.join(root, name))
+                    except OSError:
+                        continue
+                    h.update(f"{root}/{name}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+        else:
+            h.update(b"missing")
+    return h.hexdigest()
+
+
+def _verify_batches(indices: list[int], entries: list[dict]) -> list[list[int]]:
+    """Plan-order batches: each run of consecutive ``independent`` entries
+    is one concurrent batch; every other entry runs alone."""
+    batches: list[list[int]] = []
+    for i in indices:
+        if entries[i].get("independent") and batches and entries[batches[-1][0]].get("independent"):
+            batches[-1].append(i)
+        else:
+            batches.append([i])
+    return batches
+
+
+def _verify_key(entry: dict[str, str], head: str, inputs: str) -> str:
+    h = hashlib.sha256()
+    for part in (entry["run"], entry["expect"], head, inputs):
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _run_verify_entry(entry: dict[str, str], project_dir: str, timeout: int) -> dict:
+    cmd, expect = entry["run"], entry["expect"]
+    combined = ""
+    timed_out = False
+    start = time.monotonic()
+    try:
+        p = subprocess.run(
+            cmd, shell=True, cwd=project_dir,
+            capture_output=True, text=True, timeout=timeout,
+        )
+        combined = (p.stdout or "") + (p.stderr or "")
+        if expect.startswith("exit "):
+            passed = p.returncode == int(expect.split()[1])
+        elif expect.startswith("contains"):
+            m = re.search(r'contains\s+"([^"]*)"', expect)
+            passed = bool(m) and m.group(1) in combined
+        else:
+            passed = p.returncode == 0
+    except subprocess.TimeoutExpired:
+        passed = False
+        timed_out = True
+        combined = f"(timed out after {timeout}s)"
+    return {
+        "run": cmd, "expect": expect, "passed": passed,
+        "tail": "" if passed else "\n".join(combined.strip().splitlines()[-15:]),
+        "duration_s": round(time.monotonic() - start, 2),
+        "timed_out": timed_out, "cached": False,
+    }
+
+
+def run_verify_gates(
+    entries: list[dict[str, str]],
+    project_dir: str,
+    timeout: int = 600,
+    files: list[str] | None = None,
+    cache: VerifyCache | None = None,
+) -> list[dict]:
+    """Run <verify> entries in plan order, returning one result per entry.
+
+    Entries share one working tree, so they run one at a time unless marked
+    ``independent: true``; consecutive independent entries run concurrently
+    (ORC_VERIFY_WORKERS, CPU-bounded).
+
+    With a cache, each entry is keyed by (command, expect, HEAD, content
+    fingerprint of its inputs — the task's declared files plus paths named
+    in the command, never .clavain/). Unchanged gates are served from the
+    cache. A gate that reads files it does not name opts out with
+    ``cache: no``. Timeouts are never cached, and nothing is cached outside
+    a git repo, where HEAD cannot pin the tree."""
+    head = _git_head(project_dir) if cache is not None else None
+    keys: list[str | None] = [None] * len(entries)
+    results: list[dict | None] = [None] * len(entries)
+    if cache is not None and head:
+        for i, e in enumerate(entries):
+            if e.get("cache") is False:
+                continue
+            inputs = _fingerprint_paths(project_dir, _verify_inputs(e["run"], project_dir, files or []))
+            keys[i] = _verify_key(e, head, inputs)
+            hit = cache.get(keys[i])
+            if hit is not None:
+                results[i] = {**hit, "cached": True}
+
+    misses = [i for i, r in enumerate(results) if r is None]
+    if misses:
+        with repo_state(project_dir).writing():
+            for batch in _verify_batches(misses, entries):
+                if len(batch) == 1:
+                    results[batch[0]] = _run_verify_entry(entries[batch[0]], project_dir, timeout)
+                    continue
+                with ThreadPoolExecutor(max_workers=min(VERIFY_WORKERS, len(batch))) as pool:
+                    for i, res in zip(batch, pool.map(
+                        lambda i: _run_verify_entry(entries[i], project_dir, timeout), batch,
+                    )):
+                        results[i] = res
+
+    if cache is not None:
+        cache.put_many({
+            keys[i]: results[i] for i in misses
+            if keys[i] and not results[i]["timed_out"]  # type: ignore[index]
+        })
+    return results  # type: ignore[return-value]
+
+
+def format_verify_report(results: list[dict]) -> tuple[bool, str]:
+    lines: list[str] = []
+    for r in results:
+        timing = "cached" if r.get("cached") else f"{r['duration_s']:.1f}s"
+        line = f"{'PASS' if r['passed'] else 'FAIL'}: `{r['run']}` (expect {r['expect']}) [{timing}]"
+        if not r["passed"]:
+            line += f"\n{r['tail']}"
+        lines.append(line)
+    return all(r["passed"] for r in results), "\n".join(lines)
+
+
 def run_verify_entries(
-    entries: list[dict[str, str]], project_dir: str, timeout: int = 600,
+    entries: list[dict[str, str]],
+    project_dir: str,
+    timeout: int = 600,
+    *,
+    files: list[str] | None = None,
+    cache: VerifyCache | None = None,
+    record_path: str | None = None,
 ) -> tuple[bool, str]:
     """Execute a task's <verify> entries. Returns (all_passed, report).
 
     ``expect: exit N`` checks the return code; ``expect: contains "s"``
     checks combined stdout+stderr; anything else falls back to exit 0.
+    Entries run in plan order (concurrently only when marked independent)
+    and may be served from ``cache`` (see run_verify_gates); ``record_path``
+    receives per-entry timing as JSON.
     """
     if not entries:
         return True, "(no verify entries for this task)"
-    ok = True
-    lines: list[str] = []
-    for e in entries:
-        cmd, expect = e["run"], e["expect"]
-        combined = ""
-        try:
-            p = subprocess.run(
-                cmd, shell=True, cwd=project_dir,
-                capture_output=True, text=True, timeout=timeout,
-            )
-            combined = (p.stdout or "") + (p.stderr or "")
-            if expect.startswith("exit "):
-                passed = p.returncode == int(expect.split()[1])
-            elif expect.startswith("contains"):
-                m = re.search(r'contains\s+"([^"]*)"', expect)
-                passed = bool(m) and m.group(1) in combined
-            else:
-                passed = p.returncode == 0
-        except subprocess.TimeoutExpired:
-            passed = False
-            combined = f"(timed out after {timeout}s)"
-        ok = ok and passed
-        line = f"{'PASS' if passed else 'FAIL'}: `{cmd}` (expect {expect})"
-        if not passed:
-            tail = "\n".join(combined.strip().splitlines()[-15:])
-            line += f"\n{tail}"
-        lines.append(line)
-    return ok, "\n".join(lines)
+    results = run_verify_gates(entries, project_dir, timeout, files, cache)
+    if record_path:
+        _write_verify_record(record_path, results)
+    return format_verify_report(results)
+
+
+def _write_verify_record(path: str, results: list[dict]) -> None:
+    with open(path, "w") as f:
+        json.dump({
+            "entries": results,
+            "wall_s": round(max((r["duration_s"] for r in results if not r.get("cached")), default=0.0), 2),
+            "cached": sum(1 for r in results if r.get("cached")),
+        }, f, indent=2)
 
 
 def _git(project_dir: str, *args: str) -> str:
+    """One read-only git call. ``--no-optional-locks`` keeps `git status`
+    from refreshing (and locking) the index under concurrent tasks."""
     try:
         p = subprocess.run(
-            ["git", "-C", project_dir, *args],
+            ["git", "--no-optional-locks", "-C", project_dir, *args],
             capture_output=True, text=True, timeout=60,
         )
         return p.stdout if p.returncode == 0 else ""
@@ -523,45 +1141,349 @@ def _git(project_dir: str, *args: str) -> str:
         return ""
 
 
+def _stat_stamp(path: str) -> tuple:
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return ()
+
+
+class RepoState:
+    """Cheap, serialized git state probes for one repository.
+
+    HEAD is read straight from the ref files (HEAD, the loose ref, then
+    packed-refs) with no process at all; only unusual layouts (reftable)
+    fall back to `git rev-parse`. Read-only queries (`status --porcelain`,
+    `diff --name-status`, `ls-files`) are cached under a stamp of the
+    index and HEAD, plus a write generation: every orchestrator-launched
+    process that may touch the tree (dispatches, reviewers, verify gates,
+    speculative applies) runs inside ``writing()``, which bumps the
+    generation and suspends caching while it is active. All git calls for
+    the repo go through one lock, so parallel tasks never race each other
+    for index.lock.
+
+    Edits made outside the orchestrator between two probes with no
+    index or HEAD change are not seen until the next write generation.
+    """
+
+    def __init__(self, project_dir: str):
+        self.project_dir = project_dir
+        self._lock = threading.RLock()
+        self._dirs: tuple[str, str] | None = None
+        self._cache: dict[tuple, tuple[tuple, str]] = {}
+        self._generation = 0
+        self._writers = 0
+        self.spawns = 0
+
+    def _git_dirs(self) -> tuple[str, str] | None:
+        """(git dir, common dir) — discovered once per repository."""
+        if self._dirs is None:
+            self.spawns += 1
+            out = _git(self.project_dir, "rev-parse", "--absolute-git-dir", "--git-common-dir")
+            lines = out.splitlines()
+            if len(lines) < 2:
+                return None
+            git_dir, common = lines[0], lines[1]
+            if not os.path.isabs(common):
+                common = os.path.normpath(os.path.join(self.project_dir, common))
+            self._dirs = (git_dir, common)
+        return self._dirs
+
+    def _read_ref(self, dirs: tuple[str, str], ref: str) -> str | None:
+        git_dir, common = dirs
+        for base in (git_dir, common):
+            try:
+                with open(os.path.join(base, ref)) as f:
+                    return f.read().strip() or None
+            except OSError:
+                continue
+        try:
+            with open(os.path.join(common, "packed-refs")) as f:
+                for line in f:
+                    sha, _, name = line.rstrip("\n").partition(" ")
+                    if name == ref:
+                        return sha
+        except OSError:
+            pass
+        return None
+
+    def head(self) -> str | None:
+        dirs = self._git_dirs()
+        if dirs is None:
+            return None
+        with self._lock:
+            try:
+                with open(os.path.join(dirs[0], "HEAD")) as f:
+                    content = f.read().strip()
+            except OSError:
+                content = ""
+            if content and not content.startswith("ref: "):
+                return content  # detached
+            sha = self._read_ref(dirs, content[5:]) if content else None
+            if sha or not os.path.isdir(os.path.join(dirs[1], "reftable")):
+                return sha  # None: unborn branch
+            self.spawns += 1
+            return _git(self.project_dir, "rev-parse", "HEAD").strip() or None
+
+    def _stamp(self) -> tuple:
+        dirs = self._git_dirs()
+        index = _stat_stamp(os.path.join(dirs[0], "index")) if dirs else ()
+        return (index, self.head(), self._generation)
+
+    def query(self, *args: str) -> str:
+        """A read-only git command's stdout, cached while the tree is quiet."""
+        with self._lock:
+            quiet = self._writers == 0
+            stamp = self._stamp() if quiet else None
+            if quiet:
+                hit = self._cache.get(args)
+                if hit is not None and hit[0] == stamp:
+                    return hit[1]
+            self.spawns += 1
+            out = _git(self.project_dir, *args)
+            if quiet and stamp == self._stamp():
+                self._cache[args] = (stamp, out)
+            return out
+
+    def serialized(self) -> threading.RLock:
+        """The repo's git lock, for callers running git themselves."""
+        return self._lock
+
+    @contextmanager
+    def writing(self):
+        """Mark a process that may modify the working tree as running."""
+        with self._lock:
+            self._writers += 1
+            self._generation += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._writers -= 1
+                self._generation += 1
+
+
+_REPO_STATES: dict[str, RepoState] = {}
+_REPO_STATES_LOCK = threading.Lock()
+
+
+def repo_state(project_dir: str) -> RepoState:
+    """The shared RepoState for project_dir (one per resolved path)."""
+    key = os.path.realpath(project_dir)
+    with _REPO_STATES_LOCK:
+        state = _REPO_STATES.get(key)
+        if state is None:
+            state = _REPO_STATES[key] = RepoState(project_dir)
+        return state
+
+
 def _git_head(project_dir: str) -> str | None:
-    out = _git(project_dir, "rev-parse", "HEAD").strip()
-    return out or None
+    return repo_state(project_dir).head()
 
 
-def task_diff(project_dir: str, head0: str | None) -> str:
-    """The reviewer's ground truth: everything that changed since the task
-    started — committed and uncommitted — plus the contents of new untracked
-    files, which `git diff` alone would silently omit."""
-    parts: list[str] = []
-    if head0:
-        parts.append(_git(project_dir, "diff", "--stat", head0))
-        parts.append(_git(project_dir, "diff", head0))
-    else:
-        parts.append(_git(project_dir, "diff"))
-    untracked = _git(
-        project_dir, "ls-files", "--others", "--exclude-standard",
-    ).strip()
-    if untracked:
-        parts.append("## Untracked files created by this task:\n" + untracked)
-        for f in untracked.splitlines()[:5]:
-            fp = os.path.join(project_dir, f)
+REVIEW_DIFF_MAX_FILES_LISTED = 100
+REVIEW_UNTRACKED_SHOWN = 5
+REVIEW_UNTRACKED_MAX_LINES = 200
+
+
+def _diff_header_path(header: str) -> str | None:
+    """`diff --git a/P b/P` → P (renames are disabled, so both sides match).
+    Quoted headers (unusual characters) return None and are not cached."""
+    rest = header[len("diff --git "):].rstrip("\n")
+    if not rest.startswith("a/") or len(rest) < 5:
+        return None
+    path = rest[2:2 + (len(rest) - 5) // 2]
+    return path if rest == f"a/{path} b/{path}" else None
+
+
+class DiffService:
+    """Bounded, incremental diffs for the reviewer.
+
+    The old task_diff ran `git diff --stat` and a full `git diff`, read
+    untracked files whole, and only then truncated — seconds and a lot of
+    memory on big repos, repeated every fix round. Here:
+
+      - the changed-file list comes from `--name-status` (no content diff);
+      - per-file diffs stream from one `git diff` process that is killed as
+        soon as the line budget is spent;
+      - the task's declared files are diffed first, so they win the budget;
+      - each file's diff chunk is cached by (base, path, worktree stat), so
+        a fix round re-diffs only the files it actually touched and reuses
+        the previous round's chunks for the rest.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._chunks: dict[tuple, str] = {}
+
+    def _chunk_key(self, project_dir: str, base: str, path: str) -> tuple:
+        try:
+            st = os.stat(os.path.join(project_dir, path))
+            state: tuple = (st.st_size, st.st_mtime_ns)
+        except OSError:
+            state = ("absent",)
+        return (project_dir, base, path, state)
+
+    def _stream_chunks(
+        self, project_dir: str, base_args: list[str], paths: list[str], budget: int,
+    ) -> tuple[dict[str, str], bool]:
+        """Diff `paths` in one streamed git call, stopping once `budget`
+        lines are read. Returns ({path: chunk}, stopped_early); a chunk cut
+        by the budget is returned but flagged by stopped_early."""
+        cmd = [
+            "git", "--no-optional-locks", "-C", project_dir,
+            "diff", "--no-color", "--no-ext-diff", "--no-renames",
+            "--src-prefix=a/", "--dst-prefix=b/", *base_args, "--", *paths,
+        ]
+        chunks: dict[str, list[str]] = {}
+        current: list[str] | None = None
+        read = 0
+        stopped = False
+        try:
+            proc = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                text=True, errors="replace",
+            )
+        except OSError:
+            return {}, False
+        try:
+            assert proc.stdout is not None
+            for line in proc.stdout:
+                if line.startswith("diff --git "):
+                    path = _diff_header_path(line) or line.rstrip("\n")
+                    current = chunks.setdefault(path, [])
+                if current is not None:
+                    current.append(line)
+                read += 1
+                if read >= budget:
+                    stopped = True
+                    break
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+        return {p: "".join(ls).rstrip("\n") for p, ls in chunks.items()}, stopped
+
+    def task_diff(
+        self,
+        project_dir: str,
+        head0: str | None,
+        files: list[str] | None = None,
+        max_lines: int = REVIEW_DIFF_MAX_LINES,
+    ) -> str:
+        base_args = [head0] if head0 else []
+        # Diffing against the index (no head0) depends on index state too.
+        if head0:
+            base = head0
+        else:
             try:
-                with open(fp, errors="replace") as fh:
-                    content = fh.read()
+                base = f"index@{os.stat(os.path.join(project_dir, '.git', 'index')).st_mtime_ns}"
             except OSError:
+                base = "index"
+
+        repo = repo_state(project_dir)
+        name_status = repo.query("diff", "--name-status", "--no-renames", *base_args)
+        entries = [ln.split("\t") for ln in name_status.splitlines() if "\t" in ln]
+        changed = [e[-1] for e in entries]
+
+        parts: list[str] = []
+        if entries:
+            listed = [f"{e[0]}\t{e[-1]}" for e in entries[:REVIEW_DIFF_MAX_FILES_LISTED]]
+            if len(entries) > REVIEW_DIFF_MAX_FILES_LISTED:
+                listed.append(f"... ({len(entries) - REVIEW_DIFF_MAX_FILES_LISTED} more files)")
+            parts.append(f"## Changed files ({len(entries)}):\n" + "\n".join(listed))
+        budget = max_lines - sum(p.count("\n") + 1 for p in parts)
+        truncated = False
+
+        declared = [
+            p for p in changed
+            if any(p == f or p.startswith(f.rstrip("/") + "/") for f in (files or []))
+        ]
+        declared_set = set(declared)
+        groups = [declared, [p for p in changed if p not in declared_set]]
+        for group in groups:
+            if not group or budget <= 0:
+                truncated = truncated or bool(group)
                 continue
-            clines = content.splitlines()
-            if len(clines) > 200:
-                content = "\n".join(clines[:200]) + f"\n... ({len(clines) - 200} more lines)"
-            parts.append(f"### {f}\n```\n{content}\n```")
-    text = "\n".join(p for p in parts if p and p.strip())
-    tlines = text.splitlines()
-    if len(tlines) > REVIEW_DIFF_MAX_LINES:
-        text = "\n".join(tlines[:REVIEW_DIFF_MAX_LINES]) + (
-            f"\n... (truncated at {REVIEW_DIFF_MAX_LINES} lines; run"
-            f" `git diff {head0 or ''}` in the repo for the rest)"
-        )
-    return text or "(no changes detected in the repository)"
+            keys = {p: self._chunk_key(project_dir, base, p) for p in group}
+            with self._lock:
+                cached = {p: self._chunks[k] for p, k in keys.items() if k in self._chunks}
+            uncached = [p for p in group if p not in cached]
+            fetched: dict[str, str] = {}
+            if uncached:
+                with repo.serialized():
+                    repo.spawns += 1
+                    fetched, stopped = self._stream_chunks(project_dir, base_args, uncached, budget)
+                truncated = truncated or stopped
+                complete = dict(fetched)
+                if stopped and fetched:
+                    # The last chunk read was cut by the budget — never cache it.
+                    complete.pop(list(fetched)[-1], None)
+                with self._lock:
+                    for p, chunk in complete.items():
+                        if p in keys:
+                            self._chunks[keys[p]] = chunk
+            for p in group + [p for p in fetched if p not in keys]:
+                chunk = cached.get(p) or fetched.get(p)
+                if not chunk:
+                    continue
+                clines = chunk.split("\n")
+                if len(clines) > budget:
+                    if budget > 0:
+                        parts.append("\n".join(clines[:budget]))
+                    budget = 0
+                    truncated = True
+                    break
+                parts.append(chunk)
+                budget -= len(clines)
+
+        untracked = repo.query("ls-files", "--others", "--exclude-standard").strip()
+        if untracked and budget > 0:
+            names = untracked.splitlines()
+            shown = names[:REVIEW_DIFF_MAX_FILES_LISTED]
+            more = f"\n... ({len(names) - len(shown)} more)" if len(names) > len(shown) else ""
+            section = "## Untracked files created by this task:\n" + "\n".join(shown) + more
+            parts.append(section)
+            budget -= section.count("\n") + 1
+            for f in names[:REVIEW_UNTRACKED_SHOWN]:
+                if budget <= 0:
+                    truncated = True
+                    break
+                limit = min(REVIEW_UNTRACKED_MAX_LINES, budget)
+                try:
+                    with open(os.path.join(project_dir, f), errors="replace") as fh:
+                        head_lines = list(itertools.islice(fh, limit + 1))
+                except OSError:
+                    continue
+                body = "".join(head_lines[:limit]).rstrip("\n")
+                if len(head_lines) > limit:
+                    body += "\n... (more lines not shown)"
+                parts.append(f"### {f}\n```\n{body}\n```")
+                budget -= body.count("\n") + 4
+        elif untracked:
+            truncated = True
+
+        text = "\n".join(p for p in parts if p and p.strip())
+        if truncated:
+            text += (
+                f"\n... (truncated at {max_lines} lines; run"
+                f" `git diff {head0 or ''}` in the repo for the rest)"
+            )
+        return text or "(no changes detected in the repository)"
+
+
+_DIFF_SERVICE = DiffService()
+
+
+def task_diff(
+    project_dir: str, head0: str | None, files: list[str] | None = None,
+) -> str:
+    """The reviewer's ground truth: everything that changed since the task
+    started — committed and uncommitted — plus the contents of new untracked
+    files, which `git diff` alone would silently omit. Bounded at
+    REVIEW_DIFF_MAX_LINES, declared ``files`` first (see DiffService)."""
+    return _DIFF_SERVICE.task_diff(project_dir, head0, files)
 
 
 def extract_question(output_path: str | None) -> str | None:
@@ -693,7 +1615,7 @@ def dispatch_review(
 
     prompt = build_review_prompt(
         task, section, criteria_path,
-        task_diff(project_dir, head0), verify_report, self_report,
+        task_diff(project_dir, head0, task.files), verify_report, self_report,
     )
     prompt_path = os.path.join(task_dir, f"review-{round_num}.prompt.md")
     output_path = os.path.join(task_dir, f"review-{round_num}.md")
@@ -713,20 +1635,29 @@ def dispatch_review(
         # forbids edits and the dirty-tree check below catches violations.
         cmd += ["-s", "workspace-write"]
 
-    dirty_before = _git(project_dir, "status", "--porcelain")
+    timeouts = _timeout_model_for(run_dir)
+    policy = timeouts.policy(tier, engine, manifest.timeout_per_task, streaming=False)
+    repo = repo_state(project_dir)
+    dirty_before = repo.query("status", "--porcelain")
+    start_mono = time.monotonic()
     try:
-        p = subprocess.run(
-            cmd, capture_output=True, text=True,
-            timeout=manifest.timeout_per_task,
-        )
-        with open(os.path.join(task_dir, f"review-{round_num}.log"), "w") as f:
-            f.write(_as_text(p.stdout))
-            if p.stderr:
-                f.write("\n--- stderr ---\n" + _as_text(p.stderr))
-    except subprocess.TimeoutExpired:
-        return False, f"(reviewer timed out after {manifest.timeout_per_task}s — treated as not approved)"
+        with repo.writing():
+            returncode, timed_out, dog = _run_watched(
+                cmd, None, os.path.join(task_dir, f"review-{round_num}.log"), policy,
+            )
     except Exception as e:  # noqa: BLE001 — any dispatch failure is a non-approval
         return False, f"(reviewer dispatch failed: {type(e).__name__}: {e})"
+    meta = {
+        "task": task.id, "tier": tier, "engine": engine,
+        "phase": f"review-{round_num}", "cmd": cmd,
+        "returncode": returncode, "timed_out": timed_out,
+        "duration_monotonic_s": round(time.monotonic() - start_mono, 1),
+        **dog.record(),
+    }
+    _write_text(os.path.join(task_dir, f"review-{round_num}.meta.json"), json.dumps(meta, indent=2))
+    timeouts.observe(meta)
+    if timed_out:
+        return False, f"(reviewer timed out — {dog.reason} — treated as not approved)"
 
     review_text = "(reviewer produced no output)"
     if os.path.exists(output_path):
@@ -735,7 +1666,7 @@ def dispatch_review(
 
     approved = _read_verdict_status(f"{output_path}.verdict") == "pass"
 
-    dirty_after = _git(project_dir, "status", "--porcelain")
+    dirty_after = repo.query("status", "--porcelain")
     if dirty_after != dirty_before:
         approved = False
         review_text += (
@@ -763,18 +1694,39 @@ def run_task_pipeline(
     run_dir: str,
     use_tmux: bool = False,
     review_enabled: bool = True,
+    remote=None,
+    events: RunEvents | None = None,
+    implemented: TaskResult | None = None,
+    on_provisional=None,
 ) -> TaskResult:
     """implement → verify → review → (fix → verify → review)*, bounded.
 
     Falls back to plain dispatch_task semantics with --no-review.
+
+    ``remote`` (orchestrate_remote.RemoteDispatcher) ships the implement/fix
+    dispatches and <verify> runs to worker hosts; review stays local.
+    ``events`` times each phase into the run's event stream.
+    ``implemented`` is an already-applied implement result (an adopted
+    speculative dispatch) — the pipeline starts at verify. ``on_provisional``
+    is called with (task_id, result) once a clean implement has passed its
+    first verify, just before the first review (see Speculation).
     """
     task_dir = os.path.join(run_dir, task.id)
     head0 = _git_head(project_dir)
+    dispatch = remote.dispatch_task if remote is not None else dispatch_task
+    verify = remote.run_verify_entries if remote is not None else run_verify_entries
 
-    result = dispatch_task(
-        task, manifest, project_dir, plan_path,
-        dep_outputs, dispatch_sh, run_id, run_dir, use_tmux,
-    )
+    def phase(name: str):
+        return events.phase(task.id, name) if events is not None else nullcontext()
+
+    if implemented is not None:
+        result = implemented
+    else:
+        with phase("implement"):
+            result = dispatch(
+                task, manifest, project_dir, plan_path,
+                dep_outputs, dispatch_sh, run_id, run_dir, use_tmux,
+            )
     q = extract_question(result.output_path)
     if q:
         result.status = "question"
@@ -788,17 +1740,26 @@ def run_task_pipeline(
     section = plan_info.section if plan_info else ""
     verify_entries = plan_info.verify if plan_info else []
     tier = task.tier or manifest.tier
+    verify_cache = _verify_cache_for(run_dir)
 
     rounds = 0
     while True:
-        vok, vreport = run_verify_entries(verify_entries, project_dir)
+        with phase(f"verify-{rounds}"):
+            vok, vreport = verify(
+                verify_entries, project_dir,
+                files=task.files, cache=verify_cache,
+                record_path=os.path.join(task_dir, f"verify-{rounds}.json") if verify_entries else None,
+            )
         _write_text(os.path.join(task_dir, f"verify-{rounds}.txt"), vreport)
 
+        if vok and rounds == 0 and on_provisional is not None and result.status == "pass":
+            on_provisional(task.id, result)
         if vok:
-            approved, review_text = dispatch_review(
-                task, tier, section, criteria_path, project_dir, head0,
-                vreport, result, dispatch_sh, run_dir, rounds + 1, manifest,
-            )
+            with phase(f"review-{rounds + 1}"):
+                approved, review_text = dispatch_review(
+                    task, tier, section, criteria_path, project_dir, head0,
+                    vreport, result, dispatch_sh, run_dir, rounds + 1, manifest,
+                )
         else:
             # Machine gates already failed — don't pay a reviewer to say so.
             approved = False
@@ -829,11 +1790,12 @@ def run_task_pipeline(
         rounds += 1
         print(f"  [review] {task.id}: not approved — fix round {rounds}", flush=True)
         fix_prompt = build_fix_prompt(task, section, review_text, vreport)
-        result = dispatch_task(
-            task, manifest, project_dir, plan_path,
-            dep_outputs, dispatch_sh, run_id, run_dir, use_tmux,
-            prompt_text=fix_prompt, phase=f"fix-{rounds}",
-        )
+        with phase(f"fix-{rounds}"):
+            result = dispatch(
+                task, manifest, project_dir, plan_path,
+                dep_outputs, dispatch_sh, run_id, run_dir, use_tmux,
+                prompt_text=fix_prompt, phase=f"fix-{rounds}",
+            )
         q = extract_question(result.output_path)
         if q:
             result.status = "question"
@@ -847,20 +1809,236 @@ def run_task_pipeline(
             return result
 
 
+# ---------------------------------------------------------------------------
+# Adaptive dispatch timeouts — learned from prior meta.json, per tier/engine
+# ---------------------------------------------------------------------------
+
+TIMEOUT_MIN_SAMPLES = int(os.environ.get("ORC_TIMEOUT_MIN_SAMPLES", "5"))
+TIMEOUT_HISTORY_MAX_FILES = 2000
+STALL_QUIET_FACTOR = 3.0  # × the p95 longest output gap of healthy dispatches
+STALL_FLOOR_S = 60.0
+WALL_BACKSTOP_FACTOR = 6  # × timeout_per_task, the absolute ceiling
+DISPATCH_POLL_S = 0.5
+
+
+def _dispatch_engine(cmd: list[str]) -> str:
+    """Engine a dispatch.sh command line routes to (its default: codex)."""
+    try:
+        return cmd[cmd.index("--to") + 1]
+    except (ValueError, IndexError):
+        return "codex"
+
+
+def _p95(values: list[float]) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+
+@dataclass
+class TimeoutPolicy:
+    """Kill rules for one dispatch: ``stall_s`` without log growth, or
+    ``hard_s`` of wall time. ``soft_s`` is the manifest's timeout_per_task;
+    a learned policy lets a dispatch that is still producing output run
+    past it (up to the backstop) and kills a silent one well before it."""
+
+    key: str
+    samples: int
+    soft_s: float
+    stall_s: float | None
+    hard_s: float
+    learned: bool
+
+    def check(self, elapsed: float, quiet: float) -> str | None:
+        """Kill reason, or None to keep running."""
+        if self.stall_s is not None and quiet > self.stall_s:
+            return f"stalled: no output for {quiet:.0f}s (limit {self.stall_s:.0f}s)"
+        if elapsed > self.hard_s:
+            return f"wall-clock limit: {elapsed:.0f}s (limit {self.hard_s:.0f}s)"
+        return None
+
+    def to_json(self) -> dict:
+        return {
+            "key": self.key, "samples": self.samples, "learned": self.learned,
+            "soft_s": round(self.soft_s, 1), "hard_s": round(self.hard_s, 1),
+            "stall_s": round(self.stall_s, 1) if self.stall_s is not None else None,
+        }
+
+
+class TimeoutModel:
+    """Per (tier, engine) history of healthy dispatches: wall duration and
+    longest gap between log growth (``max_quiet_s``). Seeded from the
+    meta.json files of prior runs, updated live as dispatches finish.
+
+    With fewer than TIMEOUT_MIN_SAMPLES samples a key keeps the fixed
+    behaviour (stall = timeout_per_task with a 6x backstop under tmux, a
+    flat timeout_per_task otherwise). Once learned, the stall limit is
+    STALL_QUIET_FACTOR × the p95 longest gap, clamped to
+    [STALL_FLOOR_S, timeout_per_task], with the 6x backstop everywhere.
+    Metas written before max_quiet_s existed count their whole duration as
+    one gap — conservative, it only ever loosens the stall limit.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples: dict[str, list[tuple[float, float]]] = {}
+
+    @classmethod
+    def from_runs(cls, runs_root: str) -> TimeoutModel:
+        model = cls()
+        metas = list(Path(runs_root).glob("*/*/*meta.json"))
+        metas.sort(key=lambda p: p.stat().st_mtime if p.exists() else 0, reverse=True)
+        for path in metas[:TIMEOUT_HISTORY_MAX_FILES]:
+            try:
+                meta = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            model.observe(meta)
+        return model
+
+    def observe(self, meta: dict) -> None:
+        """Learn from one finished dispatch's meta (healthy ones only)."""
+        if meta.get("timed_out") or meta.get("returncode") != 0:
+            return
+        duration = meta.get("duration_monotonic_s", meta.get("duration_s"))
+        if not isinstance(duration, (int, float)):
+            return
+        quiet = meta.get("max_quiet_s")
+        if not isinstance(quiet, (int, float)):
+            quiet = duration
+        engine = meta.get("engine") or _dispatch_engine(meta.get("cmd") or [])
+        key = f"{meta.get('tier') or 'default'}/{engine}"
+        with self._lock:
+            self._samples.setdefault(key, []).append((float(duration), float(quiet)))
+
+    def policy(self, tier: str, engine: str, timeout: float, streaming: bool) -> TimeoutPolicy:
+        """``streaming`` — the legacy stall watch applies (tmux mode)."""
+        key = f"{tier}/{engine}"
+        with self._lock:
+            samples = list(self._samples.get(key, ()))
+        if len(samples) < TIMEOUT_MIN_SAMPLES:
+            if streaming:
+                return TimeoutPolicy(key, len(samples), timeout, timeout,
+                                     timeout * WALL_BACKSTOP_FACTOR, False)
+            return TimeoutPolicy(key, len(samples), timeout, None, timeout, False)
+        quiet95 = _p95([q for _, q in samples])
+        stall = min(float(timeout), max(STALL_FLOOR_S, STALL_QUIET_FACTOR * quiet95))
+        return TimeoutPolicy(key, len(samples), timeout, stall,
+                             timeout * WALL_BACKSTOP_FACTOR, True)
+
+
+_TIMEOUT_MODELS: dict[str, TimeoutModel] = {}
+_TIMEOUT_MODELS_LOCK = threading.Lock()
+
+
+def _timeout_model_for(run_dir: str) -> TimeoutModel:
+    """One model per runs root (the parent of run_dir), loaded once."""
+    root = os.path.dirname(os.path.abspath(run_dir))
+    with _TIMEOUT_MODELS_LOCK:
+        model = _TIMEOUT_MODELS.get(root)
+        if model is None:
+            model = _TIMEOUT_MODELS[root] = TimeoutModel.from_runs(root)
+        return model
+
+
+class _Watchdog:
+    """Tracks output growth across ``paths`` and applies a TimeoutPolicy."""
+
+    def __init__(self, policy: TimeoutPolicy, paths: list[str]):
+        self.policy = policy
+        self.paths = paths
+        # Monotonic clock: it pauses during system sleep (macOS and Linux),
+        # so a closed lid doesn't read as an output stall and falsely kill
+        # the task on wake (goal e453fc6a).
+        self.start = self.last_change = time.monotonic()
+        self.last_size = -1
+        self.max_quiet = 0.0
+        self.reason: str | None = None
+
+    def _size(self) -> int:
+        total = 0
+        for p in self.paths:
+            try:
+                total += os.path.getsize(p)
+            except OSError:
+                pass
+        return total
+
+    def tick(self) -> str | None:
+        """Sample output; return a kill reason once the policy says so."""
+        now = time.monotonic()
+        size = self._size()
+        if size != self.last_size:
+            self.max_quiet = max(self.max_quiet, now - self.last_change)
+            self.last_size, self.last_change = size, now
+        self.reason = self.policy.check(now - self.start, now - self.last_change)
+        return self.reason
+
+    def record(self) -> dict:
+        """The decision, for the dispatch's meta.json."""
+        now = time.monotonic()
+        self.max_quiet = max(self.max_quiet, now - self.last_change)
+        elapsed = now - self.start
+        if self.reason:
+            decision = f"killed — {self.reason}"
+        elif elapsed > self.policy.soft_s:
+            decision = (f"extended {elapsed - self.policy.soft_s:.0f}s past "
+                        f"timeout_per_task — output still growing")
+        else:
+            decision = "completed"
+        return {
+            "timeout_policy": self.policy.to_json(),
+            "timeout_decision": decision,
+            "max_quiet_s": round(self.max_quiet, 1),
+        }
+
+
+def _run_watched(
+    cmd: list[str], env: dict[str, str] | None, log_path: str, policy: TimeoutPolicy,
+) -> tuple[int | None, bool, _Watchdog]:
+    """Run cmd with stdout streamed to log_path and stderr appended after it,
+    killing it when the policy fires. Returns (returncode, timed_out, dog)."""
+    err_path = f"{log_path}.stderr"
+    with open(log_path, "wb") as out, open(err_path, "wb") as err:
+        proc = subprocess.Popen(cmd, env=env, stdout=out, stderr=err)
+        dog = _Watchdog(policy, [log_path, err_path])
+        while True:
+            try:
+                proc.wait(timeout=DISPATCH_POLL_S)
+                break
+            except subprocess.TimeoutExpired:
+                if dog.tick():
+                    proc.kill()
+                    proc.wait()
+                    break
+    try:
+        with open(err_path, errors="replace") as f:
+            stderr = f.read()
+        os.unlink(err_path)
+    except OSError:
+        stderr = ""
+    timed_out = dog.reason is not None
+    if timed_out or stderr:
+        marker = "\n--- stderr (partial, timeout) ---\n" if timed_out else "\n--- stderr ---\n"
+        with open(log_path, "a") as f:
+            f.write(marker + stderr)
+    return (None if timed_out else proc.returncode), timed_out, dog
+
+
 def _dispatch_via_tmux(
     cmd: list[str],
     env: dict[str, str],
     task_dir: str,
     task_id: str,
-    stall_timeout: int,
+    policy: TimeoutPolicy,
     session: str,
     stem: str = "",
-) -> tuple[int, bool]:
+) -> tuple[int | None, bool, _Watchdog]:
     """Run cmd in a dedicated tmux window; timeout on OUTPUT STALL, not wall
-    clock — no log growth for stall_timeout seconds kills the task, but a
-    slow-and-steady task runs up to a 6x wall-clock backstop (Sylveste-e9y
-    stage 2). Returns (returncode, timed_out). ``stem`` keeps pipeline fix
-    rounds from clobbering the implement round's artifact names."""
+    clock — no log growth for the policy's stall limit kills the task, but a
+    slow-and-steady task runs up to the wall-clock backstop (Sylveste-e9y
+    stage 2). Returns (returncode, timed_out, watchdog). ``stem`` keeps
+    pipeline fix rounds from clobbering the implement round's artifact
+    names."""
     exit_file = os.path.join(task_dir, f"{stem}exit")
     log_path = os.path.join(task_dir, f"{stem}dispatch.log")
     runner = os.path.join(task_dir, f"{stem}runner.sh")
@@ -887,28 +2065,20 @@ def _dispatch_via_tmux(
         check=True, capture_output=True,
     )
 
-    # Monotonic clock: it pauses during system sleep (macOS and Linux), so a
-    # closed lid doesn't read as an output stall and falsely kill the task
-    # on wake (goal e453fc6a).
-    start = time.monotonic()
-    last_size, last_change = -1, start
+    dog = _Watchdog(policy, [log_path])
     while True:
         if os.path.exists(exit_file):
             try:
                 with open(exit_file) as f:
-                    return int(f.read().strip() or "1"), False
+                    return int(f.read().strip() or "1"), False, dog
             except ValueError:
-                return 1, False
-        now = time.monotonic()
-        size = os.path.getsize(log_path) if os.path.exists(log_path) else -1
-        if size != last_size:
-            last_size, last_change = size, now
-        if now - last_change > stall_timeout or now - start > stall_timeout * 6:
+                return 1, False, dog
+        if dog.tick():
             subprocess.run(
                 ["tmux", "kill-window", "-t", f"{session}:{task_id}"],
                 capture_output=True,
             )
-            return -1, True
+            return -1, True, dog
         time.sleep(2)
 
 
@@ -942,9 +2112,14 @@ def dispatch_task(
     verdict_path = f"{output_path}.verdict"
     log_path = os.path.join(task_dir, f"{stem}dispatch.log")
 
-    prompt = prompt_text or build_prompt(task, plan_path, dep_outputs, manifest.tasks)
+    prompt_stats: dict = {}
+    prompt = prompt_text or build_prompt(
+        task, plan_path, dep_outputs, manifest.tasks, stats=prompt_stats,
+    )
     with open(prompt_path, "w") as f:
         f.write(prompt)
+    prompt_stats.setdefault("chars", len(prompt))
+    prompt_stats.setdefault("tokens_est", len(prompt) // PROMPT_CHARS_PER_TOKEN)
 
     tier = task.tier or manifest.tier
     cmd = [
@@ -962,33 +2137,22 @@ def dispatch_task(
     if os.path.exists(flag_file):
         env["CLAVAIN_DISPATCH_PROFILE"] = "interserve"
 
+    engine = _dispatch_engine(cmd)
+    timeouts = _timeout_model_for(run_dir)
+    policy = timeouts.policy(tier, engine, manifest.timeout_per_task, streaming=use_tmux)
+
     start = time.time()
     start_mono = time.monotonic()
-    timed_out = False
-    returncode: int | None = None
     try:
-        if use_tmux:
-            returncode, timed_out = _dispatch_via_tmux(
-                cmd, env, task_dir, task.id,
-                manifest.timeout_per_task,
-                _tmux_session_name(project_dir, run_id),
-                stem=stem,
-            )
-        else:
-            result = subprocess.run(
-                cmd, env=env, capture_output=True, text=True,
-                timeout=manifest.timeout_per_task,
-            )
-            returncode = result.returncode
-            with open(log_path, "w") as f:
-                f.write(_as_text(result.stdout))
-                if result.stderr:
-                    f.write("\n--- stderr ---\n" + _as_text(result.stderr))
-    except subprocess.TimeoutExpired as e:
-        timed_out = True
-        with open(log_path, "w") as f:
-            f.write(_as_text(e.stdout))
-            f.write("\n--- stderr (partial, timeout) ---\n" + _as_text(e.stderr))
+        with repo_state(project_dir).writing():
+            if use_tmux:
+                returncode, timed_out, dog = _dispatch_via_tmux(
+                    cmd, env, task_dir, task.id, policy,
+                    _tmux_session_name(project_dir, run_id),
+                    stem=stem,
+                )
+            else:
+                returncode, timed_out, dog = _run_watched(cmd, env, log_path, policy)
     except Exception as e:
         with open(log_path, "a") as f:
             f.write(f"\n--- dispatch exception ---\n{type(e).__name__}: {e}\n")
@@ -1011,7 +2175,7 @@ def dispatch_task(
         if timed_out:
             note = "timed out after verdict was written"
     elif timed_out or (returncode is not None and returncode != 0):
-        cause = "timeout (no output movement)" if timed_out else f"dispatch exit {returncode}"
+        cause = f"timeout ({dog.reason})" if timed_out else f"dispatch exit {returncode}"
         if _outcome_check(task, project_dir, since=start):
             status = "warn"
             note = (f"{cause}, but outcome-check passed (declared files present "
@@ -1034,15 +2198,19 @@ def dispatch_task(
         )
         note = f"{note}; {sleep_note}" if note else sleep_note
 
+    meta = {
+        "task": task.id, "title": task.title, "tier": tier, "engine": engine,
+        "phase": phase or "implement",
+        "cmd": cmd, "returncode": returncode, "timed_out": timed_out,
+        "duration_s": round(duration, 1),
+        "duration_monotonic_s": round(duration_mono, 1),
+        "status": status, "note": note,
+        "prompt": prompt_stats,
+        **dog.record(),
+    }
     with open(os.path.join(task_dir, f"{stem}meta.json"), "w") as f:
-        json.dump({
-            "task": task.id, "title": task.title, "tier": tier,
-            "phase": phase or "implement",
-            "cmd": cmd, "returncode": returncode, "timed_out": timed_out,
-            "duration_s": round(duration, 1),
-            "duration_monotonic_s": round(duration_mono, 1),
-            "status": status, "note": note,
-        }, f, indent=2)
+        json.dump(meta, f, indent=2)
+    timeouts.observe(meta)
 
     return TaskResult(
         task_id=task.id,
@@ -1054,10 +2222,15 @@ def dispatch_task(
     )
 
 
+class RunCancelled(Exception):
+    """Raised by an agent pool's slot() when the run was cancelled while the
+    task waited for an agent. The task is recorded as skipped, never run."""
+
+
 def dispatch_batch(
     task_ids: list[str],
     manifest: Manifest,
-    graph: dict[str, set[str]],
+    graph: TaskGraph,
     project_dir: str,
     plan_path: str | None,
     completed: dict[str, TaskResult],
@@ -1069,13 +2242,25 @@ def dispatch_batch(
     criteria_path: str | None = None,
     review_enabled: bool = True,
     journal_path: str | None = None,
+    pool=None,
+    remote=None,
+    events: RunEvents | None = None,
+    speculation: Speculation | None = None,
 ) -> dict[str, TaskResult]:
     """Dispatch a batch of tasks in parallel, collecting ALL results.
 
     Prints a flushed per-task completion line as each task finishes so the
     output stream carries live progress (Sylveste-e9y). Each completion is
     journaled immediately (not at batch end) so a kill mid-wave loses only
-    in-flight tasks, never finished ones (goal e453fc6a)."""
+    in-flight tasks, never finished ones (goal e453fc6a).
+
+    ``pool`` is an optional shared agent pool (orchestrate_service.AgentPool)
+    whose ``slot(run_id)`` context manager must be held for the task's whole
+    pipeline — that is how concurrent runs share one machine's capacity.
+    ``remote`` is passed through to run_task_pipeline; ``events`` records
+    each task's queued → started (slot granted) → finished transitions.
+    ``speculation`` (--speculate) hands tasks their adopted speculative
+    implement and learns each finished task's outcome."""
     results: dict[str, TaskResult] = {}
 
     def _dispatch_one(tid: str) -> TaskResult:
@@ -1083,19 +2268,32 @@ def dispatch_batch(
         # Gather outputs from this task's direct dependencies
         dep_outputs = {
             dep_id: completed[dep_id]
-            for dep_id in graph.get(tid, set())
+            for dep_id in graph.deps_of(tid)
             if dep_id in completed and completed[dep_id].status in ("pass", "warn")
         }
-        return run_task_pipeline(
-            task, manifest, project_dir, plan_path,
-            plan_tasks or {}, criteria_path,
-            dep_outputs, dispatch_sh, run_id, run_dir, use_tmux,
-            review_enabled=review_enabled,
-        )
+        try:
+            with pool.slot(run_id) if pool is not None else nullcontext():
+                if events is not None:
+                    events.started(tid)
+                implemented = speculation.adopt(tid) if speculation is not None else None
+                return run_task_pipeline(
+                    task, manifest, project_dir, plan_path,
+                    plan_tasks or {}, criteria_path,
+                    dep_outputs, dispatch_sh, run_id, run_dir, use_tmux,
+                    review_enabled=review_enabled, remote=remote, events=events,
+                    implemented=implemented,
+                    on_provisional=speculation.on_provisional if speculation is not None else None,
+                )
+        except RunCancelled:
+            return TaskResult(task_id=tid, status="skipped", error="run cancelled")
 
     max_workers = min(manifest.max_parallel, len(task_ids))
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(_dispatch_one, tid): tid for tid in task_ids}
+        futures = {}
+        for tid in task_ids:
+            if events is not None:
+                events.queued(tid)
+            futures[executor.submit(_dispatch_one, tid)] = tid
         for future in as_completed(futures):
             tid = futures[future]
             try:
@@ -1106,6 +2304,10 @@ def dispatch_batch(
                     error=f"{type(e).__name__}: {e}",
                 )
             res = results[tid]
+            if events is not None:
+                events.finished(tid, res.status, res.rounds)
+            if speculation is not None:
+                speculation.resolve(tid, res)
             note = f" — {res.error}" if res.error else ""
             print(
                 f"  [{res.status.upper()}] {tid} ({res.duration_s:.0f}s){note}",
@@ -1120,6 +2322,528 @@ def dispatch_batch(
     return results
 
 
+# ---------------------------------------------------------------------------
+# Speculative dispatch — start dependents while a predecessor is in review
+# ---------------------------------------------------------------------------
+
+SPECULATE_MIN_P = float(os.environ.get("ORC_SPECULATE_MIN_P", "0.6"))
+SPECULATE_MAX = int(os.environ.get("ORC_SPECULATE_MAX", "2"))
+_SPEC_GIT_IDENTITY = ("-c", "user.name=orchestrate", "-c", "user.email=orchestrate@localhost")
+
+
+class RoundsModel:
+    """First-review approval odds from journaled ``rounds``.
+
+    Speculative work survives only when the predecessor is approved with
+    zero fix rounds, so that is the rate that decides whether starting a
+    dependent early is worth an agent. Seeded from every prior run's
+    journal under the project (entries that reached a reviewer) and
+    updated live as this run's tasks finish. Beta(1, 1) smoothing puts an
+    empty history at 0.5 — below the default threshold, so a project
+    speculates only once its history says it pays.
+    """
+
+    def __init__(self, first_pass: int = 0, total: int = 0):
+        self.first_pass = first_pass
+        self.total = total
+
+    @classmethod
+    def from_runs(cls, runs_root: str) -> RoundsModel:
+        model = cls()
+        try:
+            run_ids = sorted(os.listdir(runs_root))
+        except OSError:
+            return model
+        for rid in run_ids:
+            for e in _read_journal(os.path.join(runs_root, rid)):
+                if e.get("event") == "task" and e.get("review_verdict"):
+                    model.observe(e.get("status", ""), e.get("rounds") or 0)
+        return model
+
+    def observe(self, status: str, rounds: int) -> None:
+        # error / question / skipped never reached a reviewer.
+        if status not in ("pass", "warn", "escalated"):
+            return
+        self.total += 1
+        if status in ("pass", "warn") and rounds == 0:
+            self.first_pass += 1
+
+    @property
+    def p_first_pass(self) -> float:
+        return (self.first_pass + 1) / (self.total + 2)
+
+
+@dataclass
+class _Spec:
+    task_id: str
+    basis: str  # the predecessor whose review decides this work's fate
+    worktree: str
+    base: str = ""  # commit in the worktree holding the predecessor's tree
+    future: object = None
+    patch: bytes = b""
+    discarded: str | None = None
+    removed: bool = False
+
+
+class Speculation:
+    """Opt-in speculative dispatch (``--speculate``).
+
+    When a task's implement phase comes back with a clean verdict and green
+    <verify> gates, its dependents whose other dependencies are already
+    complete start their implement phase in an isolated git worktree
+    snapshotted from the current tree, while the predecessor sits in
+    review. If the predecessor is approved with no fix rounds, the
+    dependent's delta is applied to the project when the scheduler reaches
+    it and its pipeline continues from verify; otherwise (fix round,
+    escalation, failure) the worktree is discarded and the dependent is
+    dispatched normally. A delta that no longer applies is discarded the
+    same way. On deep chains this overlaps each link's implement with the
+    previous link's review.
+
+    Speculation runs only while ``RoundsModel.p_first_pass`` clears
+    ``min_p``; at most ``max_workers`` speculative agents run at once, on
+    top of max_parallel (and inside the shared agent pool, if any).
+    """
+
+    def __init__(
+        self,
+        graph: TaskGraph,
+        manifest: Manifest,
+        project_dir: str,
+        plan_path: str | None,
+        completed: dict[str, TaskResult],
+        dispatch_sh: str,
+        run_id: str,
+        run_dir: str,
+        model: RoundsModel,
+        events: RunEvents | None = None,
+        pool=None,
+        min_p: float = SPECULATE_MIN_P,
+        max_workers: int = SPECULATE_MAX,
+    ):
+        self.graph = graph
+        self.manifest = manifest
+        self.project_dir = project_dir
+        self.plan_path = plan_path
+        self.completed = completed
+        self.dispatch_sh = dispatch_sh
+        self.run_id = run_id
+        self.run_dir = run_dir
+        self.model = model
+        self.events = events
+        self.pool = pool
+        self.min_p = min_p
+        self._lock = threading.Lock()
+        self._specs: dict[str, _Spec] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="speculate",
+        )
+        self.counts = {"started": 0, "adopted": 0, "discarded": 0}
+
+    def _emit(self, event: str, **fields) -> None:
+        if self.events is not None:
+            self.events.emit(event, **fields)
+
+    # -- predecessor side ---------------------------------------------------
+
+    def on_provisional(self, task_id: str, result: TaskResult) -> None:
+        """Pipeline hook: task_id's implement is clean and verify-0 green."""
+        p = self.model.p_first_pass
+        if p < self.min_p:
+            return
+        for dep in sorted(self.graph.dependents_of(task_id)):
+            with self._lock:
+                if dep in self.completed or dep in self._specs:
+                    continue
+                others = self.graph.deps_of(dep) - {task_id}
+                if any(
+                    o not in self.completed or self.completed[o].status not in ("pass", "warn")
+                    for o in others
+                ):
+                    continue
+                spec = _Spec(task_id=dep, basis=task_id,
+                             worktree=tempfile.mkdtemp(prefix="orc-spec-"))
+                self._specs[dep] = spec
+            try:
+                spec.base = _snapshot_worktree(self.project_dir, spec.worktree)
+            except (OSError, subprocess.SubprocessError) as e:
+                with self._lock:
+                    self._specs.pop(dep, None)
+                self._remove(spec)
+                print(f"  [speculate] {dep}: worktree snapshot failed ({e}) — not speculating", flush=True)
+                continue
+            dep_outputs = {
+                d: self.completed[d] for d in self.graph.deps_of(dep) if d in self.completed
+            }
+            dep_outputs[task_id] = result
+            spec.future = self._executor.submit(self._run, spec, dep_outputs)
+            self.counts["started"] += 1
+            print(f"  [speculate] {dep}: started while {task_id} is in review "
+                  f"(first-review approval p={p:.2f})", flush=True)
+            self._emit("speculate_start", task=dep, on=task_id, p=round(p, 3))
+
+    def _run(self, spec: _Spec, dep_outputs: dict[str, TaskResult]) -> TaskResult:
+        task = self.manifest.tasks[spec.task_id]
+        with self.pool.slot(self.run_id) if self.pool is not None else nullcontext():
+            if spec.discarded:
+                return TaskResult(task_id=spec.task_id, status="skipped", error=spec.discarded)
+            result = dispatch_task(
+                task, self.manifest, spec.worktree, self.plan_path,
+                dep_outputs, self.dispatch_sh, self.run_id, self.run_dir,
+                phase="speculative",
+            )
+        if result.status in ("pass", "warn"):
+            spec.patch = _worktree_delta(spec.worktree, spec.base)
+        return result
+
+    def resolve(self, task_id: str, result: TaskResult) -> None:
+        """A task finished its pipeline: keep or roll back what rode on it."""
+        self.model.observe(result.status, result.rounds)
+        if result.status in ("pass", "warn") and result.rounds == 0:
+            return
+        with self._lock:
+            doomed = [s for s in self._specs.values() if s.basis == task_id]
+            for s in doomed:
+                del self._specs[s.task_id]
+        reason = f"{task_id} ended {result.status} after {result.rounds} fix round(s)"
+        for spec in doomed:
+            self._discard(spec, reason)
+
+    # -- dependent side -----------------------------------------------------
+
+    def adopt(self, task_id: str) -> TaskResult | None:
+        """The scheduler reached task_id: return its speculative implement
+        result with the delta applied to the project, or None to dispatch
+        it normally."""
+        with self._lock:
+            spec = self._specs.pop(task_id, None)
+        if spec is None:
+            return None
+        try:
+            result = spec.future.result()  # type: ignore[attr-defined]
+        except Exception as e:
+            self._discard(spec, f"speculative dispatch raised {type(e).__name__}: {e}")
+            return None
+        if result.status not in ("pass", "warn") or extract_question(result.output_path):
+            self._discard(spec, f"speculative implement ended {result.status}")
+            return None
+        if spec.patch:
+            check = subprocess.run(
+                ["git", "-C", self.project_dir, "apply", "--binary", "--check", "-"],
+                input=spec.patch, capture_output=True,
+            )
+            if check.returncode != 0:
+                err = check.stderr.decode(errors="replace").strip().splitlines()
+                self._discard(spec, "delta no longer applies: " + (err[0] if err else "git apply failed"))
+                return None
+            with repo_state(self.project_dir).writing():
+                subprocess.run(
+                    ["git", "-C", self.project_dir, "apply", "--binary", "-"],
+                    input=spec.patch, capture_output=True, check=True,
+                )
+        self._remove(spec)
+        self.counts["adopted"] += 1
+        note = f"speculative implement adopted (started during {spec.basis}'s review)"
+        result.error = f"{result.error}; {note}" if result.error else note
+        print(f"  [speculate] {task_id}: adopted speculative implement", flush=True)
+        self._emit("speculate_adopted", task=task_id, on=spec.basis)
+        return result
+
+    def _discard(self, spec: _Spec, reason: str) -> None:
+        spec.discarded = reason
+        self.counts["discarded"] += 1
+        print(f"  [speculate] {spec.task_id}: rolled back ({reason}) — will re-dispatch", flush=True)
+        self._emit("speculate_discarded", task=spec.task_id, on=spec.basis, reason=reason)
+        future = spec.future
+        if future is None or future.cancel() or future.done():  # type: ignore[attr-defined]
+            self._remove(spec)
+        else:
+            future.add_done_callback(lambda _f: self._remove(spec))  # type: ignore[attr-defined]
+
+    def _remove(self, spec: _Spec) -> None:
+        with self._lock:
+            if spec.removed:
+                return
+            spec.removed = True
+        subprocess.run(
+            ["git", "-C", self.project_dir, "worktree", "remove", "--force", spec.worktree],
+            capture_output=True,
+        )
+        shutil.rmtree(spec.worktree, ignore_errors=True)
+        subprocess.run(["git", "-C", self.project_dir, "worktree", "prune"], capture_output=True)
+
+    def close(self) -> None:
+        """Discard anything never adopted and wait out running speculation."""
+        with self._lock:
+            leftover = list(self._specs.values())
+            self._specs.clear()
+        for spec in leftover:
+            self._discard(spec, "run ended before the scheduler reached it")
+        self._executor.shutdown(wait=True)
+
+
+def _snapshot_worktree(project_dir: str, worktree: str) -> str:
+    """Check out a detached worktree of HEAD carrying project_dir's current
+    tracked and untracked changes, committed as a base. Returns its sha."""
+    def git(cwd: str, *args: str, data: bytes | None = None) -> bytes:
+        return subprocess.run(
+            ["git", "-C", cwd, *args], input=data,
+            capture_output=True, check=True, timeout=120,
+        ).stdout
+
+    git(project_dir, "worktree", "add", "--detach", "-q", worktree, "HEAD")
+    diff = git(project_dir, "diff", "--binary", "HEAD")
+    if diff.strip():
+        git(worktree, "apply", "--binary", "--whitespace=nowarn", "-", data=diff)
+    untracked = git(project_dir, "ls-files", "--others", "--exclude-standard", "-z")
+    for rel in untracked.decode(errors="surrogateescape").split("\0"):
+        if not rel or rel.startswith(".clavain/"):
+            continue  # run artifacts, including this run's
+        dest = os.path.join(worktree, rel)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        shutil.copy2(os.path.join(project_dir, rel), dest)
+    git(worktree, "add", "-A")
+    git(worktree, *_SPEC_GIT_IDENTITY, "commit", "-q", "--no-verify",
+        "--allow-empty", "-m", "orchestrate speculative base")
+    return git(worktree, "rev-parse", "HEAD").decode().strip()
+
+
+def _worktree_delta(worktree: str, base: str) -> bytes:
+    """Everything the speculative agent changed on top of the base."""
+    subprocess.run(["git", "-C", worktree, "add", "-A"], capture_output=True, check=True)
+    return subprocess.run(
+        ["git", "-C", worktree, "diff", "--binary", "--cached", base],
+        capture_output=True, check=True,
+    ).stdout
+
+
+# ---------------------------------------------------------------------------
+# Run events & metrics — structured progress beyond the completion journal
+# ---------------------------------------------------------------------------
+
+HISTOGRAM_BUCKETS_S = (1, 5, 15, 30, 60, 120, 300, 600, 1200, 1800, 3600)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus exposition shape."""
+
+    def __init__(self, buckets: tuple[float, ...] = HISTOGRAM_BUCKETS_S):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.total += 1
+        self.sum += value
+        for i, le in enumerate(self.buckets):
+            if value <= le:
+                self.counts[i] += 1
+
+    def to_json(self) -> dict:
+        return {
+            "count": self.total, "sum": round(self.sum, 3),
+            "buckets": {str(le): c for le, c in zip(self.buckets, self.counts)},
+        }
+
+
+class RunEvents:
+    """Structured event stream plus live metrics for one run.
+
+    Every event is one JSON line in <run_dir>/events.jsonl stamped with
+    ``t`` (monotonic seconds since run start) — task queued / started /
+    phase_start / phase_end / finished, waves, run start/end. The same
+    calls feed counters, gauges and histograms served by serve_metrics().
+
+    The journal stays the kill-safe resume record; this stream is for
+    telling "agents are slow" (dispatch/review latency) apart from "the
+    scheduler is starving" (idle slot-seconds with an empty queue).
+    """
+
+    PHASE_HISTOGRAMS = {
+        "implement": "dispatch_latency_seconds",
+        "fix": "dispatch_latency_seconds",
+        "verify": "verify_seconds",
+        "review": "review_latency_seconds",
+    }
+
+    def __init__(self, path: str | None, max_parallel: int = 1):
+        self.max_parallel = max(1, max_parallel)
+        self._t0 = time.monotonic()
+        self._lock = threading.Lock()
+        self._fh = open(path, "a", buffering=1) if path else None
+        self._queued_at: dict[str, float] = {}
+        self._started_at: dict[str, float] = {}
+        self._running = 0
+        self._last_change = self._t0
+        self.counters: dict[str, float] = {
+            "tasks_queued_total": 0, "tasks_started_total": 0,
+            "tasks_finished_total": 0, "fix_rounds_total": 0,
+            "idle_slot_seconds_total": 0.0,
+        }
+        self.status_counts: dict[str, int] = {}
+        self.histograms = {
+            name: Histogram() for name in (
+                "queue_wait_seconds", "task_seconds", "dispatch_latency_seconds",
+                "review_latency_seconds", "verify_seconds",
+            )
+        }
+
+    def _now(self) -> float:
+        return time.monotonic() - self._t0
+
+    def emit(self, event: str, **fields) -> None:
+        with self._lock:
+            self._write(event, fields)
+
+    def _write(self, event: str, fields: dict) -> None:
+        if self._fh is None:
+            return
+        rec = {"event": event, "t": round(self._now(), 3), **fields}
+        try:
+            self._fh.write(json.dumps(rec) + "\n")
+        except (OSError, ValueError):
+            pass  # observability must never take a run down
+
+    def _account_idle(self, now: float) -> None:
+        self.counters["idle_slot_seconds_total"] += (
+            max(0, self.max_parallel - self._running) * (now - self._last_change)
+        )
+        self._last_change = now
+
+    def queued(self, task_id: str) -> None:
+        with self._lock:
+            self._queued_at[task_id] = time.monotonic()
+            self.counters["tasks_queued_total"] += 1
+            self._write("task_queued", {"task": task_id})
+
+    def started(self, task_id: str) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._account_idle(now)
+            self._running += 1
+            self._started_at[task_id] = now
+            self.counters["tasks_started_total"] += 1
+            wait = now - self._queued_at.pop(task_id, now)
+            self.histograms["queue_wait_seconds"].observe(wait)
+            self._write("task_started", {"task": task_id, "queue_wait_s": round(wait, 3)})
+
+    def finished(self, task_id: str, status: str, rounds: int = 0) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if task_id in self._started_at:
+                self._account_idle(now)
+                self._running -= 1
+                self.histograms["task_seconds"].observe(now - self._started_at.pop(task_id))
+            self._queued_at.pop(task_id, None)
+            self.counters["tasks_finished_total"] += 1
+            self.counters["fix_rounds_total"] += rounds
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+            self._write("task_finished", {"task": task_id, "status": status, "rounds": rounds})
+
+    @contextmanager
+    def phase(self, task_id: str, name: str):
+        """Time one pipeline phase (implement, fix-N, verify-N, review-N)."""
+        kind = name.split("-", 1)[0]
+        start = time.monotonic()
+        self.emit("phase_start", task=task_id, phase=name)
+        try:
+            yield
+        finally:
+            dur = time.monotonic() - start
+            with self._lock:
+                hist = self.PHASE_HISTOGRAMS.get(kind)
+                if hist:
+                    self.histograms[hist].observe(dur)
+                self._write("phase_end", {"task": task_id, "phase": name, "duration_s": round(dur, 3)})
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            self._account_idle(time.monotonic())
+            return {
+                "uptime_s": round(self._now(), 3),
+                "gauges": {
+                    "queue_depth": len(self._queued_at),
+                    "running": self._running,
+                    "idle_slots": max(0, self.max_parallel - self._running),
+                    "max_parallel": self.max_parallel,
+                },
+                "counters": {k: round(v, 3) for k, v in self.counters.items()},
+                "status": dict(self.status_counts),
+                "histograms": {k: h.to_json() for k, h in self.histograms.items()},
+            }
+
+    def prometheus(self) -> str:
+        snap = self.snapshot()
+        out: list[str] = []
+        for name, value in snap["gauges"].items():
+            out += [f"# TYPE orchestrate_{name} gauge", f"orchestrate_{name} {value}"]
+        for name, value in snap["counters"].items():
+            out += [f"# TYPE orchestrate_{name} counter", f"orchestrate_{name} {value}"]
+        out.append("# TYPE orchestrate_tasks_by_status counter")
+        for status, n in sorted(snap["status"].items()):
+            out.append(f'orchestrate_tasks_by_status{{status="{status}"}} {n}')
+        with self._lock:
+            for name, h in self.histograms.items():
+                out.append(f"# TYPE orchestrate_{name} histogram")
+                for le, c in zip(h.buckets, h.counts):
+                    out.append(f'orchestrate_{name}_bucket{{le="{le}"}} {c}')
+                out.append(f'orchestrate_{name}_bucket{{le="+Inf"}} {h.total}')
+                out.append(f"orchestrate_{name}_sum {round(h.sum, 3)}")
+                out.append(f"orchestrate_{name}_count {h.total}")
+        return "\n".join(out) + "\n"
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802 — http.server naming
+        events: RunEvents = self.server.events  # type: ignore[attr-defined]
+        if self.path.startswith("/metrics.json"):
+            body, ctype = json.dumps(events.snapshot()).encode(), "application/json"
+        elif self.path.startswith("/metrics"):
+            body, ctype = events.prometheus().encode(), "text/plain; version=0.0.4"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        pass
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        sock, _ = super().get_request()
+        return sock, ("unix", 0)  # BaseHTTPRequestHandler expects a tuple
+
+
+def serve_metrics(addr: str, events: RunEvents):
+    """Serve /metrics (Prometheus text) and /metrics.json on ``host:port``
+    or ``unix:/path.sock``, from a daemon thread. Returns the server."""
+    if addr.startswith("unix:"):
+        path = addr[len("unix:"):]
+        if os.path.exists(path):
+            os.unlink(path)
+        server = _UnixHTTPServer(path, _MetricsHandler)
+    else:
+        host, _, port = addr.rpartition(":")
+        server = ThreadingHTTPServer((host or "127.0.0.1", int(port)), _MetricsHandler)
+    server.events = events  # type: ignore[attr-defined]
+    threading.Thread(target=server.serve_forever, daemon=True, name="metrics").start()
+    return server
+
+
 # ---------------------------------------------------------------------------
 # Run journal — kill-safe record of per-task completion (goal e453fc6a)
 # ---------------------------------------------------------------------------
@@ -1347,13 +3071,32 @@ def orchestrate(
     no_push_guard: bool = False,
     review_enabled: bool = True,
     resume_run_id: str | None = None,
+    run_id: str | None = None,
+    pool=None,
+    remote=None,
+    metrics_addr: str | None = None,
+    speculate: bool = False,
 ) -> dict[str, TaskResult]:
     """Run the full orchestration loop.
 
     ``resume_run_id`` resumes a prior (killed or partially failed) run: the
     prior run's journal.jsonl identifies terminal-complete tasks, which are
     skipped with their dependency edges treated as satisfied; everything
-    else re-dispatches into the SAME run dir (goal e453fc6a)."""
+    else re-dispatches into the SAME run dir (goal e453fc6a).
+
+    ``run_id`` pins a new run's id (the orchestration service assigns ids up
+    front so clients can watch the journal); ``pool`` is the shared agent
+    pool every dispatch must hold a slot from (see dispatch_batch);
+    ``remote`` fans dispatches and <verify> gates out to registered workers
+    (see orchestrate_remote.py) — the journal and run dir stay here.
+
+    Every run writes a structured event stream to <run_dir>/events.jsonl;
+    ``metrics_addr`` (``host:port`` or ``unix:/path``) additionally serves
+    live counters and histograms over HTTP (see RunEvents).
+
+    ``speculate`` starts dependents of a task under review in isolated
+    worktrees when journaled first-review approval rates say it pays (see
+    Speculation); dependency-driven mode with the review pipeline only."""
     # Live progress even when stdout is a redirected file (Sylveste-e9y).
     try:
         sys.stdout.reconfigure(line_buffering=True)  # type: ignore[union-attr]
@@ -1361,7 +3104,7 @@ def orchestrate(
         pass
     manifest = load_manifest(manifest_path)
     mode = mode_override or manifest.mode
-    graph = build_graph(manifest)
+    graph = compile_graph(manifest)
 
     # Validate
     errors = validate_graph(graph, manifest)
@@ -1406,7 +3149,7 @@ def orchestrate(
                 rounds=e.get("rounds", 0) or 0,
             )
     else:
-        run_id = uuid4().hex[:8]
+        run_id = run_id or uuid4().hex[:8]
         run_dir = os.path.join(project_dir, ".clavain", "orchestrate-runs", run_id)
 
     # Review-pipeline inputs: the plan's per-task sections + <verify> blocks,
@@ -1494,7 +3237,43 @@ def orchestrate(
         print(f"Dry run: {len(dry_waves)} wave(s), max parallelism: {max_par}")
     print()
 
+    events = RunEvents(
+        None if dry_run else os.path.join(run_dir, "events.jsonl"),
+        manifest.max_parallel,
+    )
+    events.emit("run_start", run_id=run_id, mode=mode, tasks=total_tasks,
+                max_parallel=manifest.max_parallel)
+    metrics_server = None
+    speculation: Speculation | None = None
     try:
+        # Inside the try: a failure here must still remove the push guards.
+        if metrics_addr and not dry_run:
+            metrics_server = serve_metrics(metrics_addr, events)
+            print(f"Metrics: serving /metrics on {metrics_addr}")
+
+        if speculate and not dry_run:
+            why_not = (
+                "needs dependency-driven mode" if mode != "dependency-driven"
+                else "needs the review pipeline" if not review_enabled
+                else "not supported with remote workers" if remote is not None
+                else "project is not a git repository" if _git_head(project_dir) is None
+                else None
+            )
+            if why_not:
+                print(f"Speculation: off — {why_not}")
+            else:
+                model = RoundsModel.from_runs(os.path.dirname(run_dir))
+                speculation = Speculation(
+                    graph, manifest, project_dir, plan_path, completed,
+                    dispatch_sh, run_id, run_dir, model,  # type: ignore[arg-type]
+                    events=events, pool=pool,
+                )
+                print(
+                    f"Speculation: on — first-review approval p={model.p_first_pass:.2f} "
+                    f"from {model.total} journaled review(s); speculating while "
+                    f"p >= {speculation.min_p:.2f}"
+                )
+
         if mode == "dependency-driven":
             scheduler = DependencyDrivenScheduler(graph)
             wave = 0
@@ -1512,6 +3291,7 @@ def orchestrate(
                     continue
                 wave += 1
                 _print_wave(wave, ready, manifest.tasks, dry_run)
+                events.emit("wave", wave=wave, tasks=ready)
                 if dry_run:
                     for tid in ready:
                         scheduler.mark_done(tid)
@@ -1522,6 +3302,7 @@ def orchestrate(
                     ready, manifest, graph, project_dir, plan_path,
                     completed, dispatch_sh, run_id, run_dir, use_tmux,  # type: ignore[arg-type]
                     plan_tasks, criteria_path, review_enabled, journal_path,
+                    pool, remote, events, speculation,
                 )
                 for tid, result in batch_results.items():
                     completed[tid] = result
@@ -1554,6 +3335,7 @@ def orchestrate(
                 if not active:
                     continue
                 _print_wave(wave, active, manifest.tasks, dry_run)
+                events.emit("wave", wave=wave, tasks=active)
                 if dry_run:
                     for tid in active:
                         completed[tid] = TaskResult(task_id=tid, status="pass (dry-run)")
@@ -1563,6 +3345,7 @@ def orchestrate(
                     active, manifest, graph, project_dir, plan_path,
                     completed, dispatch_sh, run_id, run_dir, use_tmux,  # type: ignore[arg-type]
                     plan_tasks, criteria_path, review_enabled, journal_path,
+                    pool, remote, events,
                 )
                 for tid, result in batch_results.items():
                     completed[tid] = result
@@ -1572,6 +3355,11 @@ def orchestrate(
     finally:
         # Artifacts in run_dir persist deliberately (Sylveste-e9y) — only the
         # push guards and (on clean runs) the tmux session are torn down.
+        if speculation is not None:
+            speculation.close()
+            c = speculation.counts
+            print(f"Speculation: {c['started']} started, {c['adopted']} adopted, "
+                  f"{c['discarded']} rolled back")
         _remove_push_guards(guards)
         if journal_path:
             _journal_append(journal_path, {
@@ -1579,6 +3367,11 @@ def orchestrate(
                 "counts": count_verdicts(completed),
                 "ts": _now_iso(),
             })
+        events.emit("run_end", counts=count_verdicts(completed))
+        if metrics_server is not None:
+            metrics_server.shutdown()
+            metrics_server.server_close()
+        events.close()
         if use_tmux and not dry_run and not keep_tmux:
             all_ok = all(
                 r.status in ("pass", "warn") or r.status.startswith("pass")
@@ -1598,7 +3391,7 @@ def orchestrate(
 
 
 def _compute_waves(
-    graph: dict[str, set[str]],
+    graph: TaskGraph,
     mode: str,
     manifest: Manifest,
 ) -> list[list[str]]:
@@ -1611,41 +3404,35 @@ def _compute_waves(
         return _resolve_manual_batching(graph, manifest)
     else:  # dependency-driven
         waves: list[list[str]] = []
-        ts = TopologicalSorter(dict(graph))
-        ts.prepare()
-        while ts.is_active():
-            ready = list(ts.get_ready())
+        scheduler = DependencyDrivenScheduler(graph)
+        while scheduler.is_active:
+            ready = scheduler.get_ready()
             if not ready:
                 break
             waves.append(ready)
             for tid in ready:
-                ts.done(tid)
+                scheduler.mark_done(tid)
         return waves
 
 
 def _propagate_failure(
     failed_id: str,
-    graph: dict[str, set[str]],
+    graph: TaskGraph | dict[str, set[str]],
     completed: dict[str, TaskResult],
 ) -> None:
     """For static batch modes, mark transitive dependents as skipped.
 
-    NOTE: mirrors DependencyDrivenScheduler.mark_failed — keep in sync.
+    Walks the graph's shared reverse index — the same one
+    DependencyDrivenScheduler.mark_failed uses — so nothing is rebuilt per
+    failure.
     """
-    reverse: dict[str, set[str]] = {}
-    for tid, deps in graph.items():
-        for dep in deps:
-            reverse.setdefault(dep, set()).add(tid)
-
-    queue = list(reverse.get(failed_id, set()))
-    while queue:
-        dependent = queue.pop()
+    g = _as_task_graph(graph)
+    for dependent in g.transitive_dependents(failed_id):
         if dependent not in completed:
             completed[dependent] = TaskResult(
                 task_id=dependent, status="skipped",
                 error=f"Dependency {failed_id} failed",
             )
-            queue.extend(reverse.get(dependent, set()))
 
 
 def _print_wave(
@@ -1812,12 +3599,32 @@ def main() -> None:
              "(pass/warn) are skipped with dependency edges satisfied; "
              "everything else re-dispatches into the same run dir",
     )
+    parser.add_argument(
+        "--coordinator", metavar="HOST:PORT",
+        help="Distributed mode: listen for orchestrate_remote.py workers and "
+             "run implement/fix dispatches and <verify> gates on them "
+             "(ORC_WORKER_TOKEN must match on every worker; required for "
+             "non-loopback addresses)",
+    )
+    parser.add_argument(
+        "--speculate", action="store_true",
+        help="Start a task's dependents in isolated git worktrees while it is "
+             "in review, when journaled first-review approval rates clear "
+             "ORC_SPECULATE_MIN_P (default 0.6); rolled back and re-dispatched "
+             "if the review asks for fixes",
+    )
+    parser.add_argument(
+        "--metrics", metavar="ADDR",
+        help="Serve live run metrics (Prometheus text at /metrics, JSON at "
+             "/metrics.json) on HOST:PORT or unix:/path.sock for the run's "
+             "duration; the event stream is always written to events.jsonl",
+    )
 
     args = parser.parse_args()
 
     if args.validate:
         manifest = load_manifest(args.manifest)
-        graph = build_graph(manifest)
+        graph = compile_graph(manifest)
         errors = validate_graph(graph, manifest)
         if errors:
             print(f"Manifest INVALID: {len(errors)} error(s)")
@@ -1828,18 +3635,43 @@ def main() -> None:
             print(f"Manifest valid: {len(manifest.tasks)} tasks, 0 cycles, mode: {manifest.mode}")
             sys.exit(0)
 
-    orchestrate(
-        manifest_path=args.manifest,
-        plan_path=args.plan,
-        project_dir=args.project_dir,
-        mode_override=args.mode,
-        dry_run=args.dry_run,
-        use_tmux=args.tmux,
-        keep_tmux=args.keep_tmux,
-        no_push_guard=args.no_push_guard,
-        review_enabled=not args.no_review,
-        resume_run_id=args.resume,
-    )
+    server = remote = None
+    if args.coordinator and not args.dry_run:
+        # Let orchestrate_remote's `import orchestrate` resolve to this module
+        # rather than loading a second copy when run as a script.
+        sys.modules.setdefault("orchestrate", sys.modules[__name__])
+        from orchestrate_remote import start_coordinator
+
+        try:
+            server, remote = start_coordinator(
+                args.coordinator, token=os.environ.get("ORC_WORKER_TOKEN"),
+            )
+        except ValueError as e:
+            sys.exit(f"ERROR: {e}")
+        host, port = server.server_address[:2]
+        print(f"Coordinator listening on {host}:{port} — start workers with "
+              f"orchestrate_remote.py worker --coordinator {host}:{port}")
+
+    try:
+        orchestrate(
+            manifest_path=args.manifest,
+            plan_path=args.plan,
+            project_dir=args.project_dir,
+            mode_override=args.mode,
+            dry_run=args.dry_run,
+            use_tmux=args.tmux,
+            keep_tmux=args.keep_tmux,
+            no_push_guard=args.no_push_guard,
+            review_enabled=not args.no_review,
+            resume_run_id=args.resume,
+            remote=remote,
+            metrics_addr=args.metrics,
+            speculate=args.speculate,
+        )
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""orchestrate_remote.py — coordinator/worker split for orchestrate.py.
+
+Every dispatch and every <verify> gate normally runs on the orchestrator's
+own host, which caps a run at one machine. In distributed mode the
+orchestrator (`orchestrate.py --coordinator HOST:PORT`) becomes a
+coordinator: it keeps the scheduler, review pipeline, run dir and journal,
+and queues implement/fix dispatches and <verify> runs as work items.
+Workers register their capacity, pull items, execute them with the same
+dispatch_task / run_verify_entries code, and ship back the result plus the
+task's artifacts (prompt, output, verdict sidecar, dispatch log, meta.json),
+which the coordinator writes into its own run dir.
+
+    ORC_WORKER_TOKEN=... python3 orchestrate.py plan.exec.yaml --coordinator 0.0.0.0:7788
+    python3 orchestrate_remote.py worker --coordinator host:7788 \\
+        --project-dir /path/to/checkout --capacity 4
+
+Workers execute in THEIR --project-dir. The coordinator's reviewer and
+outcome checks read the coordinator's tree, so workers must operate on the
+same working tree (shared filesystem) — a worker on a private clone is only
+useful for <verify> gates that read, not write.
+
+Transport: one JSON request line per TCP connection, one JSON reply line.
+When ORC_WORKER_TOKEN is set on the coordinator, every request must carry
+the same token; the coordinator refuses to bind a non-loopback address
+without one, since a worker item is arbitrary shell on the worker. A work
+item whose worker stops responding is re-queued once its lease (the task's
+timeout backstop) expires, then failed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import hmac
+import ipaddress
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from uuid import uuid4
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import orchestrate as orc  # noqa: E402
+
+MAX_ATTEMPTS = 2
+PULL_WAIT_S = 10.0
+ARTIFACT_MAX_BYTES = 5 * 1024 * 1024
+
+
+def _parse_addr(addr: str) -> tuple[str, int]:
+    host, _, port = addr.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def _is_loopback(host: str) -> bool:
+    """True when every address host resolves to is a loopback address."""
+    try:
+        infos = socket.getaddrinfo(host, None)
+    except socket.gaierror:
+        return False
+    return bool(infos) and all(ipaddress.ip_address(info[4][0]).is_loopback for info in infos)
+
+
+# ---------------------------------------------------------------------------
+# Coordinator side
+# ---------------------------------------------------------------------------
+
+@dataclass
+class WorkItem:
+    id: str
+    kind: str  # dispatch | verify
+    payload: dict
+    lease_s: float
+    attempts: int = 0
+    worker: str | None = None
+    leased_until: float = 0.0
+    result: dict | None = None
+    done: threading.Event = field(default_factory=threading.Event)
+
+
+class Coordinator:
+    """Pull-based work queue with leases. Workers' capacity is honoured by
+    construction: a worker only pulls when one of its slots is free."""
+
+    def __init__(self, token: str | None = None, max_attempts: int = MAX_ATTEMPTS):
+        self.token = token
+        self.max_attempts = max_attempts
+        self._cond = threading.Condition()
+        self._queue: deque[WorkItem] = deque()
+        self._leased: dict[str, WorkItem] = {}
+        self._workers: dict[str, dict] = {}
+
+    def authorized(self, token: str | None) -> bool:
+        if not self.token:
+            return True
+        return hmac.compare_digest(self.token, token or "")
+
+    def register(self, worker_id: str, capacity: int, host: str) -> None:
+        with self._cond:
+            self._workers[worker_id] = {
+                "capacity": capacity, "host": host,
+                "registered": orc._now_iso(), "completed": 0,
+            }
+
+    def _reap(self, now: float) -> None:
+        """Re-queue (or fail) items whose worker outlived its lease."""
+        for item_id, item in list(self._leased.items()):
+            if now < item.leased_until:
+                continue
+            del self._leased[item_id]
+            if item.attempts >= self.max_attempts:
+                item.result = {"error": (
+                    f"worker {item.worker} lost its lease after {item.lease_s:.0f}s "
+                    f"({item.attempts} attempt(s))"
+                )}
+                item.done.set()
+            else:
+                self._queue.appendleft(item)
+        self._cond.notify_all()
+
+    def submit(self, kind: str, payload: dict, lease_s: float) -> dict:
+        """Queue one work item and block until a worker completes it."""
+        item = WorkItem(id=uuid4().hex[:12], kind=kind, payload=payload, lease_s=lease_s)
+        with self._cond:
+            self._queue.append(item)
+            self._cond.notify_all()
+        while not item.done.wait(5.0):
+            with self._cond:
+                self._reap(time.monotonic())
+        return item.result or {"error": "work item completed without a result"}
+
+    def pull(self, worker_id: str, wait: float = PULL_WAIT_S) -> dict | None:
+        deadline = time.monotonic() + wait
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._reap(now)
+                if self._queue:
+                    item = self._queue.popleft()
+                    item.attempts += 1
+                    item.worker = worker_id
+                    item.leased_until = now + item.lease_s
+                    self._leased[item.id] = item
+                    return {"id": item.id, "kind": item.kind, "payload": item.payload}
+                if now >= deadline:
+                    return None
+                self._cond.wait(deadline - now)
+
+    def complete(self, worker_id: str, item_id: str, result: dict) -> bool:
+        with self._cond:
+            item = self._leased.get(item_id)
+            if item is None or item.worker != worker_id:
+                return False  # lease expired and the item moved on
+            del self._leased[item_id]
+            if worker_id in self._workers:
+                self._workers[worker_id]["completed"] += 1
+        item.result = {**result, "worker": worker_id}
+        item.done.set()
+        return True
+
+    def status(self) -> dict:
+        with self._cond:
+            return {
+                "workers": dict(self._workers),
+                "queued": len(self._queue),
+                "leased": len(self._leased),
+            }
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        coord: Coordinator = self.server.coordinator  # type: ignore[attr-defined]
+        try:
+            req = json.loads(self.rfile.readline() or b"{}")
+        except json.JSONDecodeError:
+            return self._send({"ok": False, "error": "request is not JSON"})
+        if not coord.authorized(req.get("token")):
+            return self._send({"ok": False, "error": "bad worker token"})
+        op = req.get("op")
+        try:
+            if op == "register":
+                coord.register(req["worker_id"], int(req.get("capacity", 1)), req.get("host", ""))
+                self._send({"ok": True})
+            elif op == "pull":
+                item = coord.pull(req["worker_id"], min(float(req.get("wait", PULL_WAIT_S)), 30.0))
+                self._send({"ok": True, "item": item})
+            elif op == "complete":
+                accepted = coord.complete(req["worker_id"], req["item_id"], req.get("result") or {})
+                self._send({"ok": accepted})
+            elif op == "status":
+                self._send({"ok": True, **coord.status()})
+            else:
+                self._send({"ok": False, "error": f"unknown op {op!r}"})
+        except (KeyError, ValueError, TypeError) as e:
+            self._send({"ok": False, "error": f"bad request: {e}"})
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _send(self, obj: dict) -> None:
+        self.wfile.write((json.dumps(obj) + "\n").encode())
+        self.wfile.flush()
+
+
+class CoordinatorServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, addr: tuple[str, int], coordinator: Coordinator):
+        self.coordinator = coordinator
+        super().__init__(addr, _Handler)
+
+
+class RemoteDispatcher:
+    """Drop-in for orchestrate's dispatch_task / run_verify_entries that
+    runs the work on a worker and lands its artifacts in the local run dir."""
+
+    def __init__(self, coordinator: Coordinator):
+        self.coordinator = coordinator
+
+    def dispatch_task(
+        self,
+        task: orc.Task,
+        manifest: orc.Manifest,
+        project_dir: str,
+        plan_path: str | None,
+        dep_outputs: dict[str, orc.TaskResult],
+        dispatch_sh: str,
+        run_id: str,
+        run_dir: str,
+        use_tmux: bool = False,
+        prompt_text: str | None = None,
+        phase: str | None = None,
+    ) -> orc.TaskResult:
+        # The prompt is built here: dependency outputs and the plan live in
+        # the coordinator's run dir, not on the worker.
+        prompt_stats: dict = {}
+        prompt = prompt_text or orc.build_prompt(
+            task, plan_path, dep_outputs, manifest.tasks, stats=prompt_stats,
+        )
+        payload = {
+            "task": asdict(task),
+            "tier": manifest.tier,
+            "timeout_per_task": manifest.timeout_per_task,
+            "run_id": run_id,
+            "prompt_text": prompt,
+            "phase": phase,
+        }
+        start = time.time()
+        reply = self.coordinator.submit(
+            "dispatch", payload, lease_s=manifest.timeout_per_task * 6 + 120,
+        )
+        task_dir = os.path.join(run_dir, task.id)
+        os.makedirs(task_dir, exist_ok=True)
+        if "error" in reply:
+            return orc.TaskResult(
+                task_id=task.id, status="error",
+                error=f"remote dispatch failed: {reply['error']} (artifacts: {task_dir})",
+                duration_s=time.time() - start,
+            )
+
+        for name, blob in (reply.get("artifacts") or {}).items():
+            name = os.path.basename(name)
+            with open(os.path.join(task_dir, name), "wb") as f:
+                f.write(base64.b64decode(blob))
+        stem = f"{phase}." if phase else ""
+        meta_path = os.path.join(task_dir, f"{stem}meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+            meta["worker"] = reply.get("worker")
+            if prompt_stats:
+                meta["prompt"] = prompt_stats
+            with open(meta_path, "w") as f:
+                json.dump(meta, f, indent=2)
+
+        r = reply["result"]
+        output_path = os.path.join(task_dir, f"{stem}output.md")
+        verdict_path = f"{output_path}.verdict"
+        return orc.TaskResult(
+            task_id=task.id,
+            status=r["status"],
+            output_path=output_path if os.path.exists(output_path) else None,
+            verdict_path=verdict_path if os.path.exists(verdict_path) else None,
+            error=r.get("error"),
+            duration_s=r.get("duration_s", time.time() - start),
+        )
+
+    def run_verify_entries(
+        self,
+        entries: list[dict[str, str]],
+        project_dir: str,
+        timeout: int = 600,
+        *,
+        files: list[str] | None = None,
+        cache: orc.VerifyCache | None = None,
+        record_path: str | None = None,
+    ) -> tuple[bool, str]:
+        """Run the gates on one worker. The verify cache is local-only: a
+        worker's tree state is not visible here, so every gate ships."""
+        if not entries:
+            return orc.run_verify_entries(entries, project_dir, timeout)
+        reply = self.coordinator.submit(
+            "verify", {"entries": entries, "timeout": timeout},
+            lease_s=timeout * len(entries) + 120,
+        )
+        if "error" in reply:
+            return False, f"(remote verify failed: {reply['error']})"
+        if record_path:
+            orc._write_verify_record(record_path, reply["results"])
+        ok, report = orc.format_verify_report(reply["results"])
+        return ok, f"{report}\n(verified on worker {reply.get('worker')})"
+
+
+def start_coordinator(
+    addr: str, token: str | None = None,
+) -> tuple[CoordinatorServer, RemoteDispatcher]:
+    """Bind the coordinator and serve it on a daemon thread.
+
+    Raises ValueError for a non-loopback address without a token."""
+    host, port = _parse_addr(addr)
+    if not token and not _is_loopback(host):
+        raise ValueError(
+            f"refusing to listen on {host}:{port} without ORC_WORKER_TOKEN — "
+            f"set a token or bind 127.0.0.1"
+        )
+    coordinator = Coordinator(token=token)
+    server = CoordinatorServer((host, port), coordinator)
+    threading.Thread(target=server.serve_forever, daemon=True, name="coordinator").start()
+    return server, RemoteDispatcher(coordinator)
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+def call(addr: tuple[str, int], payload: dict, timeout: float = 60.0) -> dict:
+    with socket.create_connection(addr, timeout=timeout) as s:
+        s.sendall((json.dumps(payload) + "\n").encode())
+        with s.makefile("r") as f:
+            line = f.readline()
+    if not line:
+        raise ConnectionError("coordinator closed the connection")
+    return json.loads(line)
+
+
+def _collect_artifacts(task_dir: str, since: float) -> dict[str, str]:
+    out: dict[str, str] = {}
+    try:
+        names = os.listdir(task_dir)
+    except OSError:
+        return out
+    for name in names:
+        path = os.path.join(task_dir, name)
+        try:
+            if not os.path.isfile(path) or os.path.getmtime(path) < since:
+                continue
+            with open(path, "rb") as f:
+                data = f.read(ARTIFACT_MAX_BYTES)
+        except OSError:
+            continue
+        out[name] = base64.b64encode(data).decode()
+    return out
+
+
+def execute_item(
+    item: dict, project_dir: str, work_dir: str, dispatch_sh: str | None,
+) -> dict:
+    """Run one work item locally; the reply the coordinator expects."""
+    payload = item["payload"]
+    if item["kind"] == "verify":
+        return {"results": orc.run_verify_gates(payload["entries"], project_dir, payload["timeout"])}
+    if item["kind"] != "dispatch":
+        return {"error": f"unknown work item kind {item['kind']!r}"}
+    if not dispatch_sh:
+        return {"error": "dispatch.sh not found on worker"}
+
+    task = orc.Task(**payload["task"])
+    manifest = orc.Manifest(
+        version=1, mode="dependency-driven", tier=payload["tier"], max_parallel=1,
+        timeout_per_task=payload["timeout_per_task"], stages=[], tasks={task.id: task},
+    )
+    run_dir = os.path.join(work_dir, payload["run_id"])
+    since = time.time() - 1  # mtime granularity
+    result = orc.dispatch_task(
+        task, manifest, project_dir, None, {}, dispatch_sh,
+        payload["run_id"], run_dir, False,
+        prompt_text=payload["prompt_text"], phase=payload.get("phase"),
+    )
+    return {
+        "result": asdict(result),
+        "artifacts": _collect_artifacts(os.path.join(run_dir, task.id), since),
+    }
+
+
+def run_worker(
+    coordinator: str,
+    project_dir: str,
+    capacity: int = 1,
+    work_dir: str | None = None,
+    worker_id: str | None = None,
+    token: str | None = None,
+    exit_when_idle: float | None = None,
+) -> None:
+    """Register, then pull/execute/complete on `capacity` threads until
+    interrupted (or idle for exit_when_idle seconds)."""
+    addr = _parse_addr(coordinator)
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    work_dir = work_dir or os.path.join(
+        os.path.expanduser("~"), ".clavain", "orchestrate-worker", worker_id,
+    )
+    project_dir = os.path.abspath(project_dir)
+    dispatch_sh = orc._find_dispatch_sh()
+    # Lets <verify> commands and dispatch logs identify where they ran.
+    os.environ["ORC_WORKER_ID"] = worker_id
+
+    reply = call(addr, {
+        "op": "register", "token": token, "worker_id": worker_id,
+        "capacity": capacity, "host": socket.gethostname(),
+    })
+    if not reply.get("ok"):
+        raise SystemExit(f"ERROR: coordinator refused registration: {reply.get('error')}")
+    print(f"Worker {worker_id} registered with {coordinator} (capacity {capacity})", flush=True)
+
+    last_work = [time.monotonic()]
+    stop = threading.Event()
+
+    def loop() -> None:
+        while not stop.is_set():
+            try:
+                reply = call(addr, {"op": "pull", "token": token, "worker_id": worker_id,
+                                    "wait": PULL_WAIT_S if exit_when_idle is None
+                                    else min(PULL_WAIT_S, exit_when_idle)})
+            except OSError:
+                if exit_when_idle is not None and time.monotonic() - last_work[0] > exit_when_idle:
+                    stop.set()
+                time.sleep(1)
+                continue
+            item = reply.get("item")
+            if not item:
+                if exit_when_idle is not None and time.monotonic() - last_work[0] > exit_when_idle:
+                    stop.set()
+                continue
+            print(f"  [{item['kind']}] {item['payload'].get('task', {}).get('id', item['id'])}",
+                  flush=True)
+            try:
+                result = execute_item(item, project_dir, work_dir, dispatch_sh)
+            except Exception as e:  # noqa: BLE001 — report, never drop, the item
+                result = {"error": f"{type(e).__name__}: {e}"}
+            last_work[0] = time.monotonic()
+            try:
+                call(addr, {"op": "complete", "token": token, "worker_id": worker_id,
+                            "item_id": item["id"], "result": result})
+            except OSError as e:
+                print(f"  WARN: could not report item {item['id']}: {e}", file=sys.stderr)
+
+    threads = [threading.Thread(target=loop, daemon=True) for _ in range(max(1, capacity))]
+    for t in threads:
+        t.start()
+    try:
+        for t in threads:
+            while t.is_alive():
+                t.join(1.0)
+    except KeyboardInterrupt:
+        stop.set()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="orchestrate.py distributed worker")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_worker = sub.add_parser("worker", help="Pull and run work items from a coordinator")
+    p_worker.add_argument("--coordinator", required=True, metavar="HOST:PORT")
+    p_worker.add_argument("--project-dir", default=os.getcwd(),
+                          help="Working tree the work runs in (default: cwd)")
+    p_worker.add_argument("--capacity", type=int, default=1, help="Concurrent work items")
+    p_worker.add_argument("--work-dir", help="Scratch run dir root for artifacts")
+    p_worker.add_argument("--worker-id")
+    p_worker.add_argument("--exit-when-idle", type=float, metavar="SECONDS",
+                          help="Exit after this long with no work")
+    p_status = sub.add_parser("status", help="Show a coordinator's workers and queue")
+    p_status.add_argument("--coordinator", required=True, metavar="HOST:PORT")
+    args = parser.parse_args()
+    token = os.environ.get("ORC_WORKER_TOKEN")
+
+    if args.cmd == "status":
+        print(json.dumps(call(_parse_addr(args.coordinator), {"op": "status", "token": token}),
+                         indent=2))
+        return
+    run_worker(
+        args.coordinator, args.project_dir, args.capacity, args.work_dir,
+        args.worker_id, token, args.exit_when_idle,
+    )
+
+
+if __name__ == "__main__":
+    main()
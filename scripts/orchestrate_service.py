@@ -0,0 +1,528 @@
+#!/usr/bin/env python3
+"""orchestrate_service.py — long-running multi-manifest orchestration service.
+
+Every `orchestrate.py` invocation owns a private ThreadPoolExecutor, so two
+sprints running on one box each dispatch up to their own max_parallel and
+together oversubscribe the machine. This service runs many manifests in one
+process and gates EVERY dispatch through a single AgentPool: a global agent
+cap, a per-run cap, and fair-share granting (a free agent goes to the
+waiting run holding the fewest agents, oldest request first).
+
+Operators drive it over a local Unix socket:
+
+    python3 orchestrate_service.py serve [--max-agents N]
+    python3 orchestrate_service.py submit <manifest.exec.yaml> [--plan P] [--max-parallel N]
+    python3 orchestrate_service.py status
+    python3 orchestrate_service.py watch <run_id>
+    python3 orchestrate_service.py pause|resume|cancel <run_id>
+
+Each run is an ordinary orchestrate() run — same run dir, journal, push
+guards and review pipeline — so `watch` simply streams the run's
+journal.jsonl. Pause stops new dispatches (in-flight tasks finish); cancel
+additionally turns every not-yet-started task into `skipped`.
+
+Wire protocol: one JSON request line per connection; the reply is one JSON
+line, or for `watch` a stream of JSON lines ending with {"event": "end"}.
+The socket defaults to ~/.clavain/orchestrate.sock (ORC_SERVICE_SOCKET).
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import orchestrate as orc  # noqa: E402
+
+DEFAULT_MAX_AGENTS = int(os.environ.get("ORC_MAX_AGENTS", "4"))
+WATCH_POLL_S = 0.5
+
+
+def default_socket_path() -> str:
+    return os.environ.get("ORC_SERVICE_SOCKET") or str(
+        Path.home() / ".clavain" / "orchestrate.sock"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Shared agent pool
+# ---------------------------------------------------------------------------
+
+class AgentPool:
+    """Global + per-run agent caps with fair-share granting.
+
+    A slot is granted to a waiter only when (a) fewer than max_agents slots
+    are held overall, (b) its run is neither paused nor at its own cap, and
+    (c) among all such eligible waiters it belongs to the run holding the
+    fewest slots (ties: oldest request). A run that submits 50 tasks thus
+    cannot starve a run that submits 2.
+    """
+
+    def __init__(self, max_agents: int = DEFAULT_MAX_AGENTS):
+        self.max_agents = max(1, max_agents)
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._in_use = 0
+        self._held: dict[str, int] = {}
+        self._caps: dict[str, int] = {}
+        self._paused: set[str] = set()
+        self._cancelled: set[str] = set()
+        self._waiting: list[tuple[int, str]] = []
+
+    def register(self, run_id: str, cap: int) -> None:
+        with self._cond:
+            self._caps[run_id] = max(1, cap)
+            self._held.setdefault(run_id, 0)
+
+    def unregister(self, run_id: str) -> None:
+        with self._cond:
+            self._caps.pop(run_id, None)
+            self._held.pop(run_id, None)
+            self._paused.discard(run_id)
+            self._cancelled.discard(run_id)
+            self._cond.notify_all()
+
+    def _eligible(self, run_id: str) -> bool:
+        return (
+            run_id not in self._paused
+            and self._held.get(run_id, 0) < self._caps.get(run_id, self.max_agents)
+        )
+
+    def _next_ticket(self) -> int | None:
+        best: tuple[int, int] | None = None
+        for seq, run_id in self._waiting:
+            if not self._eligible(run_id):
+                continue
+            key = (self._held.get(run_id, 0), seq)
+            if best is None or key < best:
+                best = key
+        return best[1] if best else None
+
+    def acquire(self, run_id: str) -> None:
+        """Block until this run is granted an agent. Raises RunCancelled if
+        the run is cancelled while waiting."""
+        with self._cond:
+            ticket = (next(self._seq), run_id)
+            self._waiting.append(ticket)
+            try:
+                while True:
+                    if run_id in self._cancelled:
+                        raise orc.RunCancelled(run_id)
+                    if self._in_use < self.max_agents and self._next_ticket() == ticket[0]:
+                        break
+                    self._cond.wait()
+            finally:
+                self._waiting.remove(ticket)
+            self._in_use += 1
+            self._held[run_id] = self._held.get(run_id, 0) + 1
+            # The fair-share winner changed — let the others re-evaluate.
+            self._cond.notify_all()
+
+    def release(self, run_id: str) -> None:
+        with self._cond:
+            self._in_use -= 1
+            if run_id in self._held:
+                self._held[run_id] -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, run_id: str):
+        self.acquire(run_id)
+        try:
+            yield
+        finally:
+            self.release(run_id)
+
+    def pause(self, run_id: str) -> None:
+        with self._cond:
+            self._paused.add(run_id)
+
+    def resume(self, run_id: str) -> None:
+        with self._cond:
+            self._paused.discard(run_id)
+            self._cond.notify_all()
+
+    def cancel(self, run_id: str) -> None:
+        with self._cond:
+            self._cancelled.add(run_id)
+            self._cond.notify_all()
+
+    def snapshot(self) -> dict:
+        with self._cond:
+            return {
+                "max_agents": self.max_agents,
+                "in_use": self._in_use,
+                "waiting": len(self._waiting),
+                "held": dict(self._held),
+            }
+
+
+# ---------------------------------------------------------------------------
+# Runs
+# ---------------------------------------------------------------------------
+
+TERMINAL_STATES = ("done", "cancelled", "failed")
+
+
+@dataclass
+class RunHandle:
+    run_id: str
+    manifest: str
+    project_dir: str
+    plan: str | None = None
+    mode: str | None = None
+    review_enabled: bool = True
+    no_push_guard: bool = False
+    cap: int = 1
+    state: str = "running"  # running, paused, done, cancelled, failed
+    error: str | None = None
+    counts: dict[str, int] = field(default_factory=dict)
+    submitted: str = ""
+    finished: threading.Event = field(default_factory=threading.Event)
+
+    @property
+    def run_dir(self) -> str:
+        return os.path.join(self.project_dir, ".clavain", "orchestrate-runs", self.run_id)
+
+    def to_json(self) -> dict:
+        return {
+            "run_id": self.run_id,
+            "manifest": self.manifest,
+            "project_dir": self.project_dir,
+            "state": self.state,
+            "cap": self.cap,
+            "counts": self.counts,
+            "error": self.error,
+            "submitted": self.submitted,
+            "run_dir": self.run_dir,
+        }
+
+
+class OrchestrateService:
+    """Owns the shared pool and one thread per submitted run."""
+
+    def __init__(self, max_agents: int = DEFAULT_MAX_AGENTS):
+        self.pool = AgentPool(max_agents)
+        self._runs: dict[str, RunHandle] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, req: dict) -> dict:
+        manifest_path = os.path.abspath(req["manifest"])
+        project_dir = os.path.abspath(req.get("project_dir") or os.path.dirname(manifest_path))
+        # Validate up front so a bad manifest is the submitter's error, not a
+        # dead run thread. load_manifest/_require_yaml report via sys.exit.
+        try:
+            manifest = orc.load_manifest(manifest_path)
+        except SystemExit:
+            return {"ok": False, "error": f"cannot load manifest {manifest_path}"}
+        except OSError as e:
+            return {"ok": False, "error": f"cannot read manifest: {e}"}
+        errors = orc.validate_graph(orc.compile_graph(manifest), manifest)
+        if errors:
+            return {"ok": False, "error": "manifest invalid: " + "; ".join(errors)}
+
+        cap = manifest.max_parallel
+        if req.get("max_parallel"):
+            cap = min(cap, int(req["max_parallel"]))
+        handle = RunHandle(
+            run_id=uuid4().hex[:8],
+            manifest=manifest_path,
+            project_dir=project_dir,
+            plan=os.path.abspath(req["plan"]) if req.get("plan") else None,
+            mode=req.get("mode"),
+            review_enabled=not req.get("no_review", False),
+            no_push_guard=bool(req.get("no_push_guard", False)),
+            cap=cap,
+            submitted=orc._now_iso(),
+        )
+        self.pool.register(handle.run_id, cap)
+        with self._lock:
+            self._runs[handle.run_id] = handle
+        threading.Thread(
+            target=self._run, args=(handle,), name=f"run-{handle.run_id}", daemon=True,
+        ).start()
+        return {"ok": True, "run_id": handle.run_id, "run_dir": handle.run_dir}
+
+    def _run(self, handle: RunHandle) -> None:
+        try:
+            results = orc.orchestrate(
+                handle.manifest,
+                plan_path=handle.plan,
+                project_dir=handle.project_dir,
+                mode_override=handle.mode,
+                no_push_guard=handle.no_push_guard,
+                review_enabled=handle.review_enabled,
+                run_id=handle.run_id,
+                pool=self.pool,
+            )
+            handle.counts = orc.count_verdicts(results)
+            handle.state = "cancelled" if handle.state == "cancelled" else "done"
+        except SystemExit as e:
+            handle.state, handle.error = "failed", f"orchestrate exited ({e.code})"
+        except Exception as e:  # noqa: BLE001 — a run's crash must not kill the service
+            handle.state, handle.error = "failed", f"{type(e).__name__}: {e}"
+        finally:
+            self.pool.unregister(handle.run_id)
+            handle.finished.set()
+
+    def _get(self, run_id: str) -> RunHandle | None:
+        with self._lock:
+            return self._runs.get(run_id)
+
+    def control(self, op: str, run_id: str) -> dict:
+        handle = self._get(run_id)
+        if handle is None:
+            return {"ok": False, "error": f"unknown run {run_id}"}
+        if handle.state in TERMINAL_STATES:
+            return {"ok": False, "error": f"run {run_id} is already {handle.state}"}
+        if op == "pause":
+            self.pool.pause(run_id)
+            handle.state = "paused"
+        elif op == "resume":
+            self.pool.resume(run_id)
+            handle.state = "running"
+        elif op == "cancel":
+            # Paused waiters must wake to observe the cancel.
+            self.pool.resume(run_id)
+            self.pool.cancel(run_id)
+            handle.state = "cancelled"
+        return {"ok": True, "run_id": run_id, "state": handle.state}
+
+    def status(self) -> dict:
+        with self._lock:
+            runs = [h.to_json() for h in self._runs.values()]
+        return {"ok": True, "pool": self.pool.snapshot(), "runs": runs}
+
+    def watch(self, run_id: str):
+        """Yield journal entries as they land, then a final end event."""
+        handle = self._get(run_id)
+        if handle is None:
+            yield {"ok": False, "error": f"unknown run {run_id}"}
+            return
+        journal = os.path.join(handle.run_dir, "journal.jsonl")
+        offset = 0
+        buf = ""
+        while True:
+            done = handle.finished.is_set()
+            try:
+                with open(journal) as f:
+                    f.seek(offset)
+                    chunk = f.read()
+                    offset = f.tell()
+            except OSError:
+                chunk = ""
+            buf += chunk
+            *lines, buf = buf.split("\n")
+            for line in lines:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                yield {"event": "journal", "run_id": run_id, "entry": entry}
+            if done:
+                yield {"event": "end", **handle.to_json()}
+                return
+            handle.finished.wait(WATCH_POLL_S)
+
+
+# ---------------------------------------------------------------------------
+# Socket server
+# ---------------------------------------------------------------------------
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        service: OrchestrateService = self.server.service  # type: ignore[attr-defined]
+        try:
+            req = json.loads(self.rfile.readline() or b"{}")
+        except json.JSONDecodeError:
+            self._send({"ok": False, "error": "request is not JSON"})
+            return
+        op = req.get("op")
+        try:
+            if op == "submit":
+                self._send(service.submit(req))
+            elif op == "status":
+                self._send(service.status())
+            elif op in ("pause", "resume", "cancel"):
+                self._send(service.control(op, req.get("run_id", "")))
+            elif op == "watch":
+                for event in service.watch(req.get("run_id", "")):
+                    self._send(event)
+            else:
+                self._send({"ok": False, "error": f"unknown op {op!r}"})
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # watcher went away
+        except (KeyError, ValueError) as e:
+            self._send({"ok": False, "error": f"bad request: {e}"})
+
+    def _send(self, obj: dict) -> None:
+        self.wfile.write((json.dumps(obj) + "\n").encode())
+        self.wfile.flush()
+
+
+class ServiceServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, service: OrchestrateService):
+        self.service = service
+        super().__init__(path, _Handler)
+
+
+def _socket_live(path: str) -> bool:
+    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        s.connect(path)
+        return True
+    except OSError:
+        return False
+    finally:
+        s.close()
+
+
+def make_server(path: str, max_agents: int = DEFAULT_MAX_AGENTS) -> ServiceServer:
+    """Bind the service socket, clearing a stale one left by a killed daemon."""
+    if os.path.exists(path):
+        if _socket_live(path):
+            raise RuntimeError(f"an orchestration service is already listening on {path}")
+        os.unlink(path)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    server = ServiceServer(path, OrchestrateService(max_agents))
+    os.chmod(path, 0o600)
+    return server
+
+
+def request(path: str, payload: dict):
+    """Send one request; yield each JSON reply line."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(path)
+        s.sendall((json.dumps(payload) + "\n").encode())
+        with s.makefile("r") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _print_event(ev: dict) -> None:
+    if ev.get("event") == "journal":
+        entry = ev["entry"]
+        if entry.get("event") == "task":
+            note = f" — {entry['error']}" if entry.get("error") else ""
+            print(f"  [{str(entry.get('status', '')).upper()}] {entry['task']}{note}", flush=True)
+        else:
+            print(f"  ({entry.get('event', 'journal')}) {entry.get('ts', '')}", flush=True)
+    elif ev.get("event") == "end":
+        print(f"Run {ev['run_id']} {ev['state']}: {ev.get('counts') or ev.get('error')}", flush=True)
+    else:
+        print(json.dumps(ev), flush=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Multi-manifest orchestration service")
+    parser.add_argument("--socket", default=default_socket_path(), help="Service socket path")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p_serve = sub.add_parser("serve", help="Run the service in the foreground")
+    p_serve.add_argument("--max-agents", type=int, default=DEFAULT_MAX_AGENTS,
+                         help="Global concurrent-agent cap across all runs")
+
+    p_submit = sub.add_parser("submit", help="Submit a manifest as a new run")
+    p_submit.add_argument("manifest")
+    p_submit.add_argument("--plan")
+    p_submit.add_argument("--project-dir")
+    p_submit.add_argument("--mode", choices=["all-parallel", "all-sequential",
+                                             "dependency-driven", "manual-batching"])
+    p_submit.add_argument("--max-parallel", type=int,
+                          help="Per-run agent cap (default: the manifest's max_parallel)")
+    p_submit.add_argument("--no-review", action="store_true")
+    p_submit.add_argument("--no-push-guard", action="store_true")
+    p_submit.add_argument("--watch", action="store_true", help="Stream progress after submitting")
+
+    sub.add_parser("status", help="List runs and pool usage")
+    for op in ("watch", "pause", "resume", "cancel"):
+        sub.add_parser(op).add_argument("run_id")
+
+    args = parser.parse_args()
+
+    if args.cmd == "serve":
+        try:
+            server = make_server(args.socket, args.max_agents)
+        except RuntimeError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Orchestration service on {args.socket} (max agents: {args.max_agents})", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            try:
+                os.unlink(args.socket)
+            except OSError:
+                pass
+        return
+
+    if not os.path.exists(args.socket):
+        print(f"ERROR: no orchestration service at {args.socket} (start one with `serve`)",
+              file=sys.stderr)
+        sys.exit(1)
+
+    if args.cmd == "submit":
+        payload = {
+            "op": "submit", "manifest": os.path.abspath(args.manifest),
+            "plan": os.path.abspath(args.plan) if args.plan else None,
+            "project_dir": os.path.abspath(args.project_dir or os.getcwd()),
+            "mode": args.mode, "max_parallel": args.max_parallel,
+            "no_review": args.no_review, "no_push_guard": args.no_push_guard,
+        }
+        reply = next(request(args.socket, payload))
+        if not reply.get("ok"):
+            print(f"ERROR: {reply.get('error')}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Submitted run {reply['run_id']} ({reply['run_dir']})", flush=True)
+        if args.watch:
+            for ev in request(args.socket, {"op": "watch", "run_id": reply["run_id"]}):
+                _print_event(ev)
+        return
+
+    if args.cmd == "status":
+        reply = next(request(args.socket, {"op": "status"}))
+        pool = reply["pool"]
+        print(f"Agents: {pool['in_use']}/{pool['max_agents']} in use, {pool['waiting']} waiting")
+        for run in reply["runs"]:
+            print(f"  {run['run_id']}  {run['state']:<9} cap={run['cap']}  "
+                  f"{run['manifest']}  {run['counts'] or ''}")
+        return
+
+    if args.cmd == "watch":
+        for ev in request(args.socket, {"op": "watch", "run_id": args.run_id}):
+            if ev.get("ok") is False:
+                print(f"ERROR: {ev.get('error')}", file=sys.stderr)
+                sys.exit(1)
+            _print_event(ev)
+        return
+
+    reply = next(request(args.socket, {"op": args.cmd, "run_id": args.run_id}))
+    if not reply.get("ok"):
+        print(f"ERROR: {reply.get('error')}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Run {reply['run_id']}: {reply['state']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,16 @@ Compares lastSyncedCommit to upstream HEAD for each configured upstream and repo
 - commit/file counts
 - mapped-file impact (fileMap coverage)
 - feature/breaking signals inferred from commit headlines
+
+Upstreams are collected concurrently. The branch head always comes from
+the GitHub API with a conditional (ETag) request, so an unchanged head is
+a free 304. The commit log and file list for base..head then come from the
+local clone used by clavain_sync when it contains both commits (no further
+network), otherwise from the compare API via an on-disk cache keyed by
+(repo, base, head) — both SHAs are immutable, so entries never expire.
+
+--source local is the offline opt-in: it takes the head from the clone's
+unfetched HEAD, and marks those rows as possibly stale.
 """
 
 from __future__ import annotations
@@ -12,10 +22,14 @@ from __future__ import annotations
 import argparse
 import datetime as dt
 import fnmatch
+import hashlib
 import json
+import os
 import re
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -33,6 +47,11 @@ def utc_now_iso() -> str:
     return dt.datetime.now(dt.UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
+GIT_TIMEOUT = 60
+DEFAULT_JOBS = 8
+SOURCES = ("auto", "local", "api")
+
+
 def run_gh_json(path: str) -> Any:
     result = subprocess.run(
         ["gh", "api", path],
@@ -45,6 +64,156 @@ def run_gh_json(path: str) -> Any:
     return json.loads(result.stdout)
 
 
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "clavain" / "upstream-impact"
+
+
+def find_upstreams_dir(project_root: Path) -> Path | None:
+    """The clavain_sync clone directory, same search order, or None."""
+    env_dir = os.environ.get("CLAVAIN_UPSTREAMS_DIR")
+    candidates = [Path(env_dir)] if env_dir else []
+    candidates += [project_root / ".upstream-work", Path("/root/projects/upstreams")]
+    for candidate in candidates:
+        if candidate.is_dir():
+            return candidate
+    return None
+
+
+class GitHubSource:
+    """`gh api` with a conditional branch-head lookup and a compare cache.
+
+    Cache files are one JSON document per key, written atomically, so
+    concurrent workers never share a file handle."""
+
+    def __init__(self, cache_dir: Path | None, gh_json=run_gh_json):
+        self.cache_dir = cache_dir
+        self.gh_json = gh_json
+        self.api_calls = 0
+        self.cache_hits = 0
+
+    def _path(self, kind: str, *key: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha256("\0".join(key).encode()).hexdigest()[:24]
+        return self.cache_dir / kind / f"{digest}.json"
+
+    def _read(self, path: Path | None) -> Any:
+        if path is None:
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, path: Path | None, payload: Any) -> None:
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", dir=path.parent, suffix=".tmp", delete=False) as tmp:
+                json.dump(payload, tmp)
+            os.replace(tmp.name, path)
+        except OSError:
+            pass  # caching is best-effort
+
+    def head(self, repo: str, branch: str) -> str:
+        """Branch head SHA; revalidated with If-None-Match when cached.
+
+        GitHub does not count 304 responses against the rate limit."""
+        path = self._path("head", repo, branch)
+        cached = self._read(path)
+        headers = ["-H", f"If-None-Match: {cached['etag']}"] if cached and cached.get("etag") else []
+        self.api_calls += 1
+        result = subprocess.run(
+            ["gh", "api", "--include", *headers, f"repos/{repo}/commits/{branch}"],
+            capture_output=True, text=True, check=False,
+        )
+        status, etag, body = parse_included_response(result.stdout)
+        if status == 304 and cached:
+            self.cache_hits += 1
+            return cached["sha"]
+        if result.returncode != 0 or status != 200:
+            raise RuntimeError(f"gh api failed for repos/{repo}/commits/{branch}: {result.stderr.strip()}")
+        sha = json.loads(body)["sha"]
+        if etag:
+            self._write(path, {"etag": etag, "sha": sha})
+        return sha
+
+    def compare(self, repo: str, base: str, head: str) -> dict[str, Any]:
+        """The compare payload, trimmed to what the report reads."""
+        path = self._path("compare", repo, base, head)
+        cached = self._read(path)
+        if cached is not None:
+            self.cache_hits += 1
+            return cached
+        self.api_calls += 1
+        raw = self.gh_json(f"repos/{repo}/compare/{base}...{head}")
+        compare = {
+            "total_commits": raw.get("total_commits", 0),
+            "files": [{"filename": f["filename"]} for f in raw.get("files", [])],
+            "commits": [
+                {"sha": c["sha"], "commit": {"message": c["commit"]["message"]}}
+                for c in raw.get("commits", [])
+            ],
+        }
+        self._write(path, compare)
+        return compare
+
+
+def parse_included_response(output: str) -> tuple[int, str, str]:
+    """Split `gh api --include` output into (status, etag, body)."""
+    head, _, body = output.replace("\r\n", "\n").partition("\n\n")
+    lines = head.splitlines()
+    status = 0
+    if lines and lines[0].startswith("HTTP/"):
+        parts = lines[0].split()
+        status = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
+    etag = ""
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        if name.strip().lower() == "etag":
+            etag = value.strip()
+    return status, etag, body
+
+
+def _git(clone_dir: Path, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["git", "-C", str(clone_dir), *args],
+        capture_output=True, text=True, check=False, timeout=GIT_TIMEOUT,
+    )
+
+
+def local_head(clone_dir: Path) -> str | None:
+    result = _git(clone_dir, "rev-parse", "HEAD")
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def local_compare(clone_dir: Path, base: str, head: str) -> dict[str, Any] | None:
+    """A compare payload shaped like the API's, from `git log`/`git diff`.
+
+    None when the base or head commit is not in the clone (the caller falls
+    back to the API). Renames report the new path, as the API does."""
+    for sha in (base, head):
+        if _git(clone_dir, "cat-file", "-e", f"{sha}^{{commit}}").returncode != 0:
+            return None
+    log = _git(clone_dir, "log", "--reverse", "--format=%H%x1f%B%x1e", f"{base}..{head}")
+    diff = _git(clone_dir, "diff", "--name-status", base, head)
+    if log.returncode != 0 or diff.returncode != 0:
+        return None
+    commits = []
+    for record in log.stdout.split("\x1e"):
+        sha, sep, message = record.strip("\n").partition("\x1f")
+        if sep:
+            commits.append({"sha": sha, "commit": {"message": message.strip()}})
+    files = [
+        {"filename": line.split("\t")[-1]}
+        for line in diff.stdout.splitlines()
+        if "\t" in line
+    ]
+    return {"total_commits": len(commits), "files": files, "commits": commits}
+
+
 def repo_from_url(url: str) -> str:
     if url.endswith(".git"):
         url = url[:-4]
@@ -74,15 +243,34 @@ def matches_any(path: str, patterns: list[str]) -> bool:
     return False
 
 
-def collect_impact(upstream: dict[str, Any]) -> dict[str, Any]:
+def collect_impact(
+    upstream: dict[str, Any],
+    github: GitHubSource | None = None,
+    clone_dir: Path | None = None,
+    source: str = "auto",
+) -> dict[str, Any]:
     name = upstream["name"]
     repo = repo_from_url(upstream["url"])
     branch = upstream.get("branch", "main")
     floating = bool(upstream.get("floating", False)) and not bool(upstream.get("fileMap", {}))
-
-    head = run_gh_json(f"repos/{repo}/commits/{branch}")["sha"]
+    github = github or GitHubSource(None)
+
+    has_clone = source != "api" and clone_dir is not None and (clone_dir / ".git").exists()
+    if source == "local":
+        # Offline: the clone is not fetched here, so its HEAD may lag the branch.
+        head = local_head(clone_dir) if has_clone else None
+        if head is None:
+            raise RuntimeError(f"no usable local clone for {name} (looked in {clone_dir})")
+    else:
+        head = github.head(repo, branch)
     base_commit = head if floating else upstream["lastSyncedCommit"]
-    compare = run_gh_json(f"repos/{repo}/compare/{base_commit}...{head}")
+
+    compare = local_compare(clone_dir, base_commit, head) if has_clone else None
+    used = "local" if compare is not None else "api"
+    if compare is None:
+        if source == "local":
+            raise RuntimeError(f"no usable local clone for {name} (looked in {clone_dir})")
+        compare = github.compare(repo, base_commit, head)
 
     changed_files = [entry["filename"] for entry in compare.get("files", [])]
     patterns = mapped_patterns(upstream)
@@ -109,6 +297,8 @@ def collect_impact(upstream: dict[str, Any]) -> dict[str, Any]:
     return {
         "name": name,
         "repo": repo,
+        "source": used,
+        "possibly_stale": source == "local",
         "tracking_mode": "floating-head" if floating else "pinned",
         "base_commit": base_commit,
         "head_commit": head,
@@ -133,18 +323,24 @@ def to_markdown(report: list[dict[str, Any]]) -> str:
     lines.append("|---|---|---:|---:|---:|---:|---:|")
 
     for row in report:
+        tracking = row["tracking_mode"] + (" (local HEAD, possibly stale)" if row.get("possibly_stale") else "")
         lines.append(
-            "| `{name}` | {tracking_mode} | {ahead_commits} | {changed_file_count} | {mapped_changed_count} | {feature_signal_count} | {breaking_signal_count} |".format(
-                **row
+            "| `{name}` | {tracking} | {ahead_commits} | {changed_file_count} | {mapped_changed_count} | {feature_signal_count} | {breaking_signal_count} |".format(
+                **{**row, "tracking": tracking}
             )
         )
 
     for row in report:
         lines.append("")
         lines.append(f"### `{row['name']}`")
+        if row.get("error"):
+            lines.append(f"Error: {row['error']}")
+            continue
         lines.append(
             f"Base `{row['base_commit'][:7]}` -> Head `{row['head_commit'][:7]}` ({row['ahead_commits']} commits)"
         )
+        if row.get("possibly_stale"):
+            lines.append("Head taken from the unfetched local clone; the upstream branch may be further ahead.")
 
         if row["mapped_changed_files"]:
             lines.append("Mapped file changes:")
@@ -173,32 +369,52 @@ def main() -> int:
     parser.add_argument("--config", default="upstreams.json")
     parser.add_argument("--json-out", default="")
     parser.add_argument("--markdown-out", default="")
+    parser.add_argument(
+        "--source", choices=SOURCES, default="auto",
+        help="auto: head from the API, log/diff from the clavain_sync clone when it has that head (default); "
+        "api: GitHub only; local: clone only, offline, rows marked possibly stale",
+    )
+    parser.add_argument("--upstreams-dir", default="", help="Clone directory (default: clavain_sync's search order)")
+    parser.add_argument("--cache-dir", default="", help=f"API response cache (default: {default_cache_dir()})")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the API response cache")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS, help="Upstreams collected concurrently")
     args = parser.parse_args()
 
     upstreams_path = Path(args.config)
     payload = json.loads(upstreams_path.read_text(encoding="utf-8"))
 
-    report: list[dict[str, Any]] = []
-    for upstream in payload.get("upstreams", []):
+    upstreams_dir = (
+        Path(args.upstreams_dir) if args.upstreams_dir
+        else find_upstreams_dir(upstreams_path.resolve().parent)
+    )
+    cache_dir = None if args.no_cache else Path(args.cache_dir) if args.cache_dir else default_cache_dir()
+    github = GitHubSource(cache_dir)
+
+    def collect(upstream: dict[str, Any]) -> dict[str, Any]:
+        clone_dir = upstreams_dir / upstream["name"] if upstreams_dir and upstream.get("name") else None
         try:
-            report.append(collect_impact(upstream))
+            return collect_impact(upstream, github, clone_dir, args.source)
         except Exception as exc:  # pragma: no cover - defensive reporting path
-            report.append(
-                {
-                    "name": upstream.get("name", "unknown"),
-                    "repo": repo_from_url(upstream.get("url", "")),
-                    "error": str(exc),
-                    "ahead_commits": 0,
-                    "changed_file_count": 0,
-                    "mapped_changed_count": 0,
-                    "feature_signal_count": 0,
-                    "breaking_signal_count": 0,
-                    "mapped_changed_files": [],
-                    "feature_signals": [],
-                    "breaking_signals": [],
-                    "meaningful_change": True,
-                }
-            )
+            return {
+                "name": upstream.get("name", "unknown"),
+                "repo": repo_from_url(upstream.get("url", "")),
+                "error": str(exc),
+                "tracking_mode": "error",
+                "base_commit": "",
+                "head_commit": "",
+                "ahead_commits": 0,
+                "changed_file_count": 0,
+                "mapped_changed_count": 0,
+                "feature_signal_count": 0,
+                "breaking_signal_count": 0,
+                "mapped_changed_files": [],
+                "feature_signals": [],
+                "breaking_signals": [],
+                "meaningful_change": True,
+            }
+
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        report = list(pool.map(collect, payload.get("upstreams", [])))
 
     output = {"generated_at": utc_now_iso(), "upstreams": report}
 
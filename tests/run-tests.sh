@@ -15,7 +15,16 @@ FAILED=0
 
 run_structural() {
   echo "=== Tier 1: Structural Tests (pytest) ==="
-  cd "$PROJECT_ROOT/tests" && uv run pytest structural/ -v --tb=short || FAILED=1
+  cd "$PROJECT_ROOT/tests"
+  # Parallel when pytest-xdist is available; --shard K/N (CI) and other
+  # pytest args pass through via PYTEST_ARGS. --durations ranks the slowest.
+  local args=(structural/ -v --tb=short --durations=15)
+  if uv run python -c "import xdist" &>/dev/null; then
+    args+=(-n auto)
+  fi
+  # shellcheck disable=SC2206
+  args+=(${PYTEST_ARGS:-})
+  uv run pytest "${args[@]}" || FAILED=1
   cd "$PROJECT_ROOT"
 }
 
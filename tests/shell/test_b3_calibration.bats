@@ -626,6 +626,7 @@ JSON
     source "$SCRIPTS_DIR/lib-routing.sh"
 
     routing_resolve_model --agent fd-game-design >/dev/null 2>&1
+    _routing_flush_verification
 
     local log="$TEST_DIR/.clavain/interspect/microrouter-shadow.jsonl"
     [[ -f "$log" ]]
@@ -645,6 +646,7 @@ JSON
     source "$SCRIPTS_DIR/lib-routing.sh"
 
     routing_resolve_model --agent fd-game-design >/dev/null 2>&1
+    _routing_flush_verification
 
     local log="$TEST_DIR/.clavain/interspect/microrouter-shadow.jsonl"
     [[ -f "$log" ]]
@@ -663,6 +665,7 @@ JSON
     source "$SCRIPTS_DIR/lib-routing.sh"
 
     FLUX_RUN_UUID="audit-run-xyz" routing_resolve_model --agent fd-game-design >/dev/null 2>&1
+    _routing_flush_verification
 
     local log="$TEST_DIR/.clavain/interspect/microrouter-shadow.jsonl"
     local line; line=$(tail -n 1 "$log")
@@ -681,6 +684,40 @@ JSON
     [[ ! -f "$log" ]]
 }
 
+@test "audit: spooled emit reaches the log after a flush, direct emit immediately" {
+    _setup_shadow_audit "sonnet" "sonnet"
+    source "$SCRIPTS_DIR/lib-routing.sh"
+    local log="$TEST_DIR/.clavain/interspect/microrouter-shadow.jsonl"
+
+    CLAVAIN_VERIFICATION_EMIT=direct routing_resolve_model --agent fd-game-design >/dev/null 2>&1
+    [[ $(wc -l < "$log") -eq 1 ]]
+
+    routing_resolve_model --agent fd-game-design >/dev/null 2>&1
+    [[ -f "${log}.spool" ]]
+    _routing_flush_verification
+    [[ $(wc -l < "$log") -eq 2 ]]
+    [[ $(tail -n 1 "$log" | jq -r '.name') == "calibration-passthrough" ]]
+}
+
+@test "audit: spool rejects lines whose JSON would exceed PIPE_BUF in bytes" {
+    source "$SCRIPTS_DIR/lib-routing.sh"
+    export LANG=C.UTF-8
+    local log="$TEST_DIR/.clavain/interspect/microrouter-shadow.jsonl"
+    local primitive="$SCRIPTS_DIR/_verification.py"
+    local wide quotes
+    wide=$(printf 'é%.0s' {1..1000})    # 1000 chars, 2000 bytes, ~6000 as JSON
+    quotes=$(printf '"%.0s' {1..2000})  # 2000 bytes, 4000 as JSON
+
+    run _routing_spool_verification "$log" "$primitive" probe VERIFIED "$wide" ""
+    [[ "$status" -ne 0 ]]
+    run _routing_spool_verification "$log" "$primitive" probe VERIFIED "$quotes" ""
+    [[ "$status" -ne 0 ]]
+    [[ ! -s "${log}.spool" ]]
+
+    _routing_spool_verification "$log" "$primitive" probe VERIFIED "short é evidence" ""
+    [[ $(wc -l < "${log}.spool") -eq 1 ]]
+}
+
 @test "audit: emit failure (missing primitive) writes diagnostic to stderr" {
     _setup_shadow_audit "sonnet" "sonnet"
     source "$SCRIPTS_DIR/lib-routing.sh"
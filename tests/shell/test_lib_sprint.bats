@@ -1181,3 +1181,21 @@ MOCKEOF
 
     [[ ! -f "$ckpt_file" ]]
 }
+
+# ─── 41. spec sourced lazily keeps its index global ──────────────
+
+@test "_sprint_ensure_spec loads lib-spec with a global index" {
+    _source_sprint_lib
+    unset _SPEC_LIB_SOURCED _SPEC_INDEX
+
+    # Sourced from inside a function: a plain `declare -A` would make the
+    # index function-local and turn lookups into arithmetic on "stage:ship".
+    _sprint_ensure_spec
+    spec_get_budget ship >/dev/null
+
+    [[ "$(declare -p _SPEC_INDEX)" == "declare -A"* ]]
+    [[ "$_SPEC_LOADED" == "ok" ]]
+    run spec_get_budget ship
+    assert_success
+    [[ "$output" == '{"share":20,'* ]]
+}
@@ -1,10 +1,126 @@
-"""Shared fixtures for Clavain structural tests."""
+"""Shared fixtures for Clavain structural tests.
 
-import json
+Also provides deterministic, duration-balanced sharding for CI:
+
+    pytest structural/ --shard 2/4        # this job runs shard 2 of 4
+
+Per-test durations from previous runs are kept in the pytest cache
+(`clavain/durations`) and used to balance shards; `--durations=N` ranks
+the slowest tests. Both work with and without pytest-xdist (`-n auto`).
+
+Every shard job must see the same durations: restore one shared
+`.pytest_cache` into all of them, or none. With no cache (first run, or
+`-p no:cacheprovider`) all tests weigh the same and the partition
+depends on node ids alone, which is identical across jobs.
+"""
+
+import hashlib
 from pathlib import Path
 
 import pytest
 
+from helpers import CORPUS, INDEX
+
+DURATIONS_KEY = "clavain/durations"
+DEFAULT_DURATION_S = 0.05  # tests with no recorded timing yet
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--shard", default=None, metavar="K/N",
+        help="Run only shard K of N (1-based), balanced by recorded test durations.",
+    )
+
+
+def _shard_spec(value):
+    try:
+        k, n = (int(x) for x in value.split("/"))
+    except ValueError:
+        raise pytest.UsageError(f"--shard expects K/N, got {value!r}") from None
+    if not 1 <= k <= n:
+        raise pytest.UsageError(f"--shard {value}: K must be between 1 and N")
+    return k, n
+
+
+def assign_shards(nodeids, durations, n):
+    """Longest-processing-time-first assignment of test ids to n shards.
+
+    Deterministic for a given (nodeids, durations): ties break on a hash
+    of the node id, so jobs that read the same durations compute the same
+    partition without coordinating. Jobs with diverging caches do not.
+    """
+    loads = [0.0] * n
+    shard_of = {}
+    order = sorted(
+        nodeids,
+        key=lambda nid: (-durations.get(nid, DEFAULT_DURATION_S), hashlib.sha1(nid.encode()).hexdigest()),
+    )
+    for nid in order:
+        target = min(range(n), key=lambda i: (loads[i], i))
+        shard_of[nid] = target
+        loads[target] += durations.get(nid, DEFAULT_DURATION_S)
+    return shard_of
+
+
+def pytest_collection_modifyitems(config, items):
+    value = config.getoption("--shard")
+    if not value:
+        return
+    k, n = _shard_spec(value)
+    cache = getattr(config, "cache", None)  # absent under -p no:cacheprovider
+    durations = cache.get(DURATIONS_KEY, {}) if cache is not None else {}
+    shard_of = assign_shards([item.nodeid for item in items], durations, n)
+    keep, drop = [], []
+    for item in items:
+        (keep if shard_of[item.nodeid] == k - 1 else drop).append(item)
+    if drop:
+        config.hook.pytest_deselected(items=drop)
+        items[:] = keep
+
+
+class DurationRecorder:
+    """Collects per-test call durations into the pytest cache.
+
+    Under xdist the controller receives every worker's reports, so only
+    the controller (or a plain run) writes; workers have no cache."""
+
+    def __init__(self, config):
+        self.config = config
+        self.durations = {}
+
+    def pytest_runtest_logreport(self, report):
+        if report.when == "call":
+            self.durations[report.nodeid] = round(report.duration, 4)
+
+    def pytest_sessionfinish(self, session):
+        cache = getattr(self.config, "cache", None)
+        if hasattr(self.config, "workerinput") or cache is None or not self.durations:
+            return
+        merged = cache.get(DURATIONS_KEY, {})
+        merged.update(self.durations)
+        cache.set(DURATIONS_KEY, merged)
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(DurationRecorder(config), "clavain-durations")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Persist whatever the component index (re)parsed this session."""
+    INDEX.save()
+
+
+@pytest.fixture(scope="session")
+def corpus():
+    """Session-wide parsed component tree: file lists, frontmatter, reference graph."""
+    return CORPUS
+
+
+@pytest.fixture(scope="session")
+def component_index():
+    """The shared component index (frontmatter, body hashes, clavain: refs)."""
+    return INDEX
+
 
 @pytest.fixture(scope="session")
 def project_root() -> Path:
@@ -33,40 +149,30 @@ def hooks_dir(project_root: Path) -> Path:
 
 
 @pytest.fixture(scope="session")
-def all_agent_files(agents_dir: Path) -> list[Path]:
+def all_agent_files(corpus) -> list[Path]:
     """All agent .md files from explicit category dirs (excludes references/)."""
-    agent_files = []
-    for category in ["review", "research", "workflow"]:
-        category_dir = agents_dir / category
-        if category_dir.is_dir():
-            agent_files.extend(sorted(category_dir.glob("*.md")))
-    return agent_files
+    return corpus.agent_files
 
 
 @pytest.fixture(scope="session")
-def all_skill_dirs(skills_dir: Path) -> list[Path]:
+def all_skill_dirs(corpus) -> list[Path]:
     """All skill directories that contain a SKILL.md file."""
-    return sorted(
-        d for d in skills_dir.iterdir()
-        if d.is_dir() and (d / "SKILL.md").exists()
-    )
+    return corpus.skill_dirs
 
 
 @pytest.fixture(scope="session")
-def all_command_files(commands_dir: Path) -> list[Path]:
+def all_command_files(corpus) -> list[Path]:
     """All command .md files."""
-    return sorted(commands_dir.glob("*.md"))
+    return corpus.command_files
 
 
 @pytest.fixture(scope="session")
-def plugin_json(project_root: Path) -> dict:
+def plugin_json(corpus) -> dict:
     """Parsed plugin.json."""
-    with open(project_root / ".claude-plugin" / "plugin.json") as f:
-        return json.load(f)
+    return corpus.json(".claude-plugin/plugin.json")
 
 
 @pytest.fixture(scope="session")
-def hooks_json(project_root: Path) -> dict:
+def hooks_json(corpus) -> dict:
     """Parsed hooks.json."""
-    with open(project_root / "hooks" / "hooks.json") as f:
-        return json.load(f)
+    return corpus.json("hooks/hooks.json")
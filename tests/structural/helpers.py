@@ -1,6 +1,100 @@
 """Shared helpers for Clavain structural tests."""
 
-import yaml
+import json
+import sqlite3
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+
+import interspect_db
+from component_index import ComponentIndex, split_frontmatter
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# One index per session; frontmatter YAML is parsed once per file and
+# cached on disk across runs (see scripts/component_index.py).
+INDEX = ComponentIndex(PROJECT_ROOT)
+
+
+@dataclass(frozen=True)
+class Doc:
+    """A markdown file as the tests see it."""
+
+    path: Path
+    text: str
+    frontmatter: dict | None
+    body: str
+
+
+class Corpus:
+    """In-memory view of the component tree, built once per session.
+
+    Holds the component file lists, each file's text and parsed
+    frontmatter, parsed JSON manifests, and the clavain: reference graph,
+    so test modules share one walk of the tree instead of each re-globbing
+    and re-reading it. Docs are revalidated by stat through the index, so
+    a file a test rewrites is re-read.
+    """
+
+    def __init__(self, index: ComponentIndex):
+        self.index = index
+        self.root = index.root
+        self._docs: dict[Path, tuple[list[int], Doc]] = {}
+        self._json: dict[str, object] = {}
+
+    @cached_property
+    def agent_files(self) -> list[Path]:
+        """Agent .md files from explicit category dirs (excludes references/)."""
+        return [p for paths in self.index.agent_files().values() for p in paths]
+
+    @cached_property
+    def skill_dirs(self) -> list[Path]:
+        return sorted(p.parent for p in self.index.skill_files())
+
+    @cached_property
+    def skill_files(self) -> list[Path]:
+        return [d / "SKILL.md" for d in self.skill_dirs]
+
+    @cached_property
+    def command_files(self) -> list[Path]:
+        return self.index.command_files()
+
+    @cached_property
+    def component_names(self) -> frozenset[str]:
+        """Names a clavain:<name> reference may resolve to (skills + commands)."""
+        return frozenset(d.name for d in self.skill_dirs) | frozenset(p.stem for p in self.command_files)
+
+    @cached_property
+    def refs(self) -> dict[str, list[str]]:
+        """Reference graph: component path (root-relative) → clavain: names it mentions."""
+        return {
+            self.index.get(path).path: self.index.get(path).refs
+            for path in self.skill_files + self.command_files + self.agent_files
+        }
+
+    def doc(self, path: Path) -> Doc:
+        stamp = self.index.get(path).stamp
+        cached = self._docs.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        text = path.read_text(encoding="utf-8")
+        block, body = split_frontmatter(text)
+        if block is None:
+            doc = Doc(path, text, None, text)
+        else:
+            doc = Doc(path, text, self.index.meta(path), body)
+        self._docs[path] = (stamp, doc)
+        return doc
+
+    def json(self, rel: str):
+        """A parsed JSON file under the root (memoized for the session)."""
+        if rel not in self._json:
+            with open(self.root / rel) as f:
+                self._json[rel] = json.load(f)
+        return self._json[rel]
+
+
+CORPUS = Corpus(INDEX)
 
 
 def parse_frontmatter(path):
@@ -8,12 +102,18 @@ def parse_frontmatter(path):
 
     Returns (frontmatter_dict, body_text) or (None, full_text) if no frontmatter.
     """
-    text = path.read_text(encoding="utf-8")
-    if not text.startswith("---"):
-        return None, text
-    parts = text.split("---", 2)
-    if len(parts) < 3:
-        return None, text
-    fm = yaml.safe_load(parts[1])
-    body = parts[2]
-    return fm, body
+    doc = CORPUS.doc(path)
+    return doc.frontmatter, doc.body
+
+
+def evidence_db(path):
+    """A fresh Interspect DB at path: the evidence table only, no indexes or
+    WAL, as a DB that predates interspect_db.migrate() looks."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    try:
+        interspect_db.create_evidence_table(conn)
+        conn.commit()
+    finally:
+        conn.close()
+    return path
@@ -0,0 +1,133 @@
+"""Tests for scripts/agency-spec-helper.py compiled cache, batched query and resident mode."""
+
+import importlib.util
+import json
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "agency-spec-helper.py"
+
+_spec = importlib.util.spec_from_file_location("agency_spec_helper", SCRIPT)
+helper = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(helper)
+
+SPEC = """defaults:
+  capability_mode: shadow
+  gate_mode: enforce
+stages:
+  build:
+    budget: {share: 60, min_tokens: 1000}
+    gates:
+      tests_pass: {command: "make test"}
+    agents:
+      required: [{role: implementer}]
+      optional: [{role: reviewer}]
+  ship:
+    budget: {share: 60}
+companions:
+  interflux: {required: false}
+"""
+
+
+@pytest.fixture
+def spec_file(tmp_path, monkeypatch):
+    pytest.importorskip("yaml")
+    monkeypatch.setenv("CLAVAIN_SPEC_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "agency-spec.yaml"
+    path.write_text(SPEC)
+    return path
+
+
+def test_cache_hit_skips_yaml_and_replays_warnings(spec_file, monkeypatch):
+    spec, warnings, cache = helper.load_compiled(str(spec_file))
+    assert spec["stages"]["build"]["budget"]["share"] == 50
+    assert any("normalizing" in w for w in warnings)
+    assert cache and Path(cache).exists()
+
+    def boom(*a, **k):
+        raise AssertionError("cache hit must not re-parse YAML")
+
+    monkeypatch.setattr(helper, "compile_spec", boom)
+    again, replayed, hit = helper.load_compiled(str(spec_file))
+    assert (again, replayed, hit) == (spec, warnings, cache)
+
+    # Editing the spec changes the key — the stale entry is never served.
+    spec_file.write_text(SPEC.replace("share: 60, min", "share: 40, min"))
+    monkeypatch.undo()
+    monkeypatch.setenv("CLAVAIN_SPEC_CACHE_DIR", str(Path(cache).parent))
+    fresh, _, other = helper.load_compiled(str(spec_file))
+    assert other != cache and fresh["stages"]["build"]["budget"]["share"] == 40
+
+
+def test_override_participates_in_key(spec_file, tmp_path):
+    override = tmp_path / "override.yaml"
+    override.write_text("defaults:\n  gate_mode: shadow\n")
+    base, _, _ = helper.load_compiled(str(spec_file))
+    merged, _, _ = helper.load_compiled(str(spec_file), str(override))
+    assert base["defaults"]["gate_mode"] == "enforce"
+    assert merged["defaults"]["gate_mode"] == "shadow"
+
+
+def test_resolve_follows_jq_alternative_semantics():
+    spec = {"a": {"b": 1, "off": False, "none": None}}
+    assert helper.resolve(spec, "a.b") == 1
+    assert helper.resolve(spec, "a.missing//{}") == {}
+    assert helper.resolve(spec, "a.off//\"x\"") == "x"
+    assert helper.resolve(spec, "a.none") is None
+    assert helper.resolve(spec, "a.b.c//[]") == []
+
+
+def test_index_keys_match_accessors(spec_file):
+    spec, _, _ = helper.load_compiled(str(spec_file))
+    index = helper.build_index(spec)
+    assert json.loads(index["gate:build:tests_pass"]) == {"command": "make test"}
+    assert index["roles:build"] == " implementer reviewer "
+    assert index["default:gate_mode"] == "enforce"
+    assert "agents:ship" not in index and "gates:ship" not in index
+    assert json.loads(index["@spec"]) == spec
+
+
+def test_index_cli_emits_nul_records(spec_file):
+    out = subprocess.run(
+        [sys.executable, str(SCRIPT), "index", str(spec_file)],
+        capture_output=True, check=True,
+    ).stdout.decode()
+    fields = out.split("\0")
+    records = dict(zip(fields[0::2], fields[1::2]))
+    assert records["@status"] == "ok"
+    assert records["stage:build"].startswith("{")
+    assert Path(records["@cache"]).exists()
+
+
+def test_query_batches_paths(spec_file):
+    out = subprocess.run(
+        [sys.executable, str(SCRIPT), "query", "--raw", str(spec_file),
+         "defaults.gate_mode", "stages.ship.agents//{}", "companions.interflux"],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    assert out.splitlines() == ["enforce", "{}", '{"required":false}']
+
+
+def test_resident_server_roundtrip(spec_file, tmp_path):
+    sock = str(tmp_path / "spec.sock")
+    server = helper.SpecServer(sock)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    try:
+        client = helper.SpecClient(sock)
+        try:
+            assert client.query(str(spec_file), ["stages.build.budget.share"]) == ["50"]
+            # A spec edit is picked up on the next request (stat-keyed memo).
+            spec_file.write_text(SPEC.replace("gate_mode: enforce", "gate_mode: shadow"))
+            assert client.query(str(spec_file), ["defaults.gate_mode"], raw=True) == ["shadow"]
+            with pytest.raises(helper.SpecError):
+                client.query(str(tmp_path / "missing.yaml"), ["defaults"])
+        finally:
+            client.close()
+    finally:
+        server.shutdown()
+        server.server_close()
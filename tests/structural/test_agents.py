@@ -4,22 +4,12 @@ import re
 
 import pytest
 
-from helpers import parse_frontmatter as _parse_frontmatter
+from helpers import CORPUS, parse_frontmatter as _parse_frontmatter
 
 
-def _get_agent_files(agents_dir):
-    """Get all agent .md files from explicit category dirs."""
-    agent_files = []
-    for category in ["review", "research", "workflow"]:
-        category_dir = agents_dir / category
-        if category_dir.is_dir():
-            agent_files.extend(sorted(category_dir.glob("*.md")))
-    return agent_files
-
-
-def test_agent_count(agents_dir, plugin_json):
+def test_agent_count(corpus, plugin_json):
     """Agent count on filesystem matches plugin.json manifest."""
-    agent_files = _get_agent_files(agents_dir)
+    agent_files = corpus.agent_files
     expected = len(plugin_json.get("agents", []))
     assert len(agent_files) == expected, (
         f"plugin.json lists {expected} agents, filesystem has {len(agent_files)}: "
@@ -33,19 +23,7 @@ def agent_files_for_param(request):
     pass
 
 
-def _agent_ids():
-    """Generate agent file paths for parametrize at collection time."""
-    from pathlib import Path
-    agents_dir = Path(__file__).resolve().parent.parent.parent / "agents"
-    files = []
-    for category in ["review", "research", "workflow"]:
-        category_dir = agents_dir / category
-        if category_dir.is_dir():
-            files.extend(sorted(category_dir.glob("*.md")))
-    return files
-
-
-AGENT_FILES = _agent_ids()
+AGENT_FILES = CORPUS.agent_files
 
 
 @pytest.mark.parametrize("agent_file", AGENT_FILES, ids=lambda p: p.stem)
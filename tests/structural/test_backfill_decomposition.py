@@ -0,0 +1,131 @@
+"""Tests for scripts/backfill-decomposition-events.py incremental ingestion."""
+
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+from helpers import evidence_db
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "backfill-decomposition-events.py"
+
+
+def _issue(iid, status="closed", **extra):
+    return json.dumps({"id": iid, "status": status, "title": f"task {iid}", "priority": 2, **extra})
+
+
+def _setup(tmp_path):
+    home = tmp_path / "home"
+    beads = home / "projects" / "demo" / ".beads"
+    beads.mkdir(parents=True)
+    return home, beads / "issues.jsonl", evidence_db(tmp_path / "interspect.db")
+
+
+def _run(home, db, *args):
+    env = {**os.environ, "HOME": str(home)}
+    return subprocess.run(
+        [sys.executable, str(SCRIPT), "--db", str(db), *args],
+        capture_output=True, text=True, env=env, timeout=30,
+    )
+
+
+def _events(db):
+    conn = sqlite3.connect(db)
+    rows = conn.execute(
+        "SELECT seq, context FROM evidence WHERE event = 'decomposition_outcome' ORDER BY seq"
+    ).fetchall()
+    conn.close()
+    return [(seq, json.loads(ctx)) for seq, ctx in rows]
+
+
+def test_rerun_is_idempotent_and_picks_up_appends(tmp_path):
+    home, jsonl, db = _setup(tmp_path)
+    lines = [_issue("demo-a")] + [_issue(f"demo-a.{i}") for i in range(1, 4)]
+    lines.append(_issue("demo-b", status="open"))
+    lines += [_issue(f"demo-b.{i}") for i in range(1, 4)]
+    jsonl.write_text("\n".join(lines) + "\n")
+
+    first = _run(home, db)
+    assert first.returncode == 0, first.stderr
+    assert [ctx["epic_id"] for _, ctx in _events(db)] == ["demo-a"]
+
+    second = _run(home, db)
+    assert second.returncode == 0, second.stderr
+    assert "Parsed 0 new/changed" in second.stdout
+    assert len(_events(db)) == 1
+
+    # demo-b closes: only the appended line is parsed, and demo-a is not re-emitted.
+    with jsonl.open("a") as fh:
+        fh.write(_issue("demo-b") + "\n")
+    third = _run(home, db)
+    assert third.returncode == 0, third.stderr
+    assert "Parsed 1 new/changed" in third.stdout
+    events = _events(db)
+    assert [ctx["epic_id"] for _, ctx in events] == ["demo-a", "demo-b"]
+    assert [seq for seq, _ in events] == [1, 2]
+
+
+def test_dry_run_writes_nothing(tmp_path):
+    home, jsonl, db = _setup(tmp_path)
+    jsonl.write_text("\n".join([_issue("demo-a")] + [_issue(f"demo-a.{i}") for i in range(1, 4)]) + "\n")
+
+    dry = _run(home, db, "--dry-run")
+    assert dry.returncode == 0, dry.stderr
+    assert "[DRY RUN] Would insert 1 events" in dry.stdout
+    assert _events(db) == []
+    conn = sqlite3.connect(db)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    assert conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'index'").fetchone()[0] == 0
+    conn.close()
+
+    real = _run(home, db)
+    assert "Parsed 4 new/changed" in real.stdout
+    assert len(_events(db)) == 1
+
+
+def test_rewritten_file_is_reparsed(tmp_path):
+    home, jsonl, db = _setup(tmp_path)
+    jsonl.write_text("\n".join([_issue("demo-a", status="open")] + [_issue(f"demo-a.{i}") for i in range(1, 4)]) + "\n")
+    assert _run(home, db).returncode == 0
+    assert _events(db) == []
+
+    # bd export rewrites the whole file rather than appending.
+    jsonl.write_text("\n".join([_issue("demo-a")] + [_issue(f"demo-a.{i}") for i in range(1, 4)]) + "\n")
+    result = _run(home, db)
+    assert "Parsed 4 new/changed" in result.stdout
+    assert [ctx["epic_id"] for _, ctx in _events(db)] == ["demo-a"]
+
+
+def test_same_length_edit_before_offset_is_reparsed(tmp_path):
+    home, jsonl, db = _setup(tmp_path)
+    # Pad past a few KB so the edit sits well before the end of the file.
+    filler = [_issue(f"demo-z{i}", status="open") for i in range(200)]
+    lines = [_issue("demo-a", status="opened")] + [_issue(f"demo-a.{i}") for i in range(1, 4)] + filler
+    jsonl.write_text("\n".join(lines) + "\n")
+    assert _run(home, db).returncode == 0
+    assert _events(db) == []
+
+    jsonl.write_text(jsonl.read_text().replace('"status": "opened"', '"status": "closed"', 1))
+    result = _run(home, db)
+    assert "Parsed 204 new/changed" in result.stdout
+    assert [ctx["epic_id"] for _, ctx in _events(db)] == ["demo-a"]
+
+
+def test_issue_in_live_and_backup_survives_live_rewrite(tmp_path):
+    home, jsonl, db = _setup(tmp_path)
+    backup = jsonl.parent / "backup" / "issues.jsonl"
+    backup.parent.mkdir()
+    epic = [_issue("demo-a", status="open")] + [_issue(f"demo-a.{i}") for i in range(1, 4)]
+    jsonl.write_text("\n".join(epic) + "\n")
+    backup.write_text("\n".join(epic) + "\n")
+    assert _run(home, db).returncode == 0
+
+    # The backup records the close; the live export is rewritten without the epic.
+    with backup.open("a") as fh:
+        fh.write(_issue("demo-a") + "\n")
+    jsonl.write_text(_issue("demo-other", status="open") + "\n")
+    result = _run(home, db)
+    assert result.returncode == 0, result.stderr
+    assert [ctx["epic_id"] for _, ctx in _events(db)] == ["demo-a"]
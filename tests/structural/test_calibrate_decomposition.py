@@ -0,0 +1,139 @@
+"""Tests for scripts/calibrate-decomposition.py SQL-side, incremental calibration."""
+
+import importlib.util
+import json
+import random
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+from helpers import evidence_db
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "calibrate-decomposition.py"
+
+_spec = importlib.util.spec_from_file_location("calibrate_decomposition", SCRIPT)
+calibrate = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(calibrate)
+
+
+def _sorted_percentile(values, p):
+    """The pre-sketch reference implementation."""
+    arr = sorted(values)
+    return arr[min(int(len(arr) * p / 100), len(arr) - 1)]
+
+
+def _db(tmp_path, events, quarantine=0):
+    db = evidence_db(tmp_path / "interspect.db")
+    conn = sqlite3.connect(db)
+    _add(conn, events, quarantine)
+    conn.close()
+    return db
+
+
+def _add(conn, events, quarantine=0):
+    conn.executemany(
+        "INSERT INTO evidence (ts, session_id, seq, source, event, context, project, quarantine_until)"
+        " VALUES ('t', 's', 1, 'decomposition', 'decomposition_outcome', ?, 'Sylveste', ?)",
+        [(json.dumps(e), quarantine) for e in events],
+    )
+    conn.commit()
+
+
+def _events(n, seed=1, **extra):
+    rng = random.Random(seed)
+    return [
+        {
+            "actual_children": rng.randint(3, 24),
+            "completion_rate": round(rng.random(), 3),
+            "replan_count": rng.randint(0, 6),
+            "complexity": rng.randint(1, 5),
+            "source_project": rng.choice(["alpha", "beta"]),
+            **extra,
+        }
+        for _ in range(n)
+    ]
+
+
+def test_sketch_quantiles_match_sorted_arrays():
+    values = [random.Random(3).randint(0, 40) for _ in range(257)]
+    sketch = calibrate.QuantileSketch()
+    for v in values:
+        sketch.add(v)
+    for p in (5, 25, 50, 75, 90, 100):
+        assert sketch.quantile(p) == _sorted_percentile(values, p)
+    merged = calibrate.QuantileSketch.from_json(json.loads(json.dumps(sketch.to_json())))
+    merged.merge(sketch)
+    assert merged.n == 2 * len(values)
+    assert merged.quantile(50) == _sorted_percentile(values * 2, 50)
+
+
+def test_incremental_matches_full_rebuild(tmp_path):
+    db = _db(tmp_path, _events(40, seed=1))
+    conn = sqlite3.connect(db)
+    calibrate.ensure_schema(conn)
+    _, added = calibrate.aggregate_new_events(conn, now_epoch=100)
+    assert added == 40
+
+    _add(conn, _events(25, seed=2))
+    _add(conn, _events(5, seed=3), quarantine=150)  # not yet eligible
+    sketches, added = calibrate.aggregate_new_events(conn, now_epoch=120)
+    assert added == 25
+    _, added = calibrate.aggregate_new_events(conn, now_epoch=200)
+    assert added == 5  # quarantine expired since the last run
+
+    incremental = calibrate.load_sketches(conn)
+    rebuilt, added = calibrate.aggregate_new_events(conn, now_epoch=200, rebuild=True)
+    assert added == 70
+    for key, sketch in rebuilt.items():
+        assert incremental[key].child.counts == sketch.child.counts
+        assert incremental[key].completion.counts == sketch.completion.counts
+
+    overall = rebuilt[("all", "*")]
+    children = [e["actual_children"] for e in _events(40, 1) + _events(25, 2) + _events(5, 3)]
+    calibrated = calibrate.compute_calibration(overall)
+    assert calibrated["child_count"]["p90"] == _sorted_percentile(children, 90)
+    assert calibrated["event_count"] == 70
+    assert {k[1] for k in rebuilt if k[0] == "project"} == {"alpha", "beta"}
+    index = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_evidence_event_quarantine'"
+    ).fetchone()
+    assert index is not None
+    conn.close()
+
+
+def test_deleted_or_requarantined_rows_trigger_rebuild(tmp_path, capsys):
+    db = _db(tmp_path, _events(40, seed=1))
+    conn = sqlite3.connect(db)
+    calibrate.ensure_schema(conn)
+    calibrate.aggregate_new_events(conn, now_epoch=100)
+
+    conn.execute("DELETE FROM evidence WHERE id <= 5")
+    conn.execute("UPDATE evidence SET quarantine_until = 500 WHERE id IN (6, 7)")
+    sketches, added = calibrate.aggregate_new_events(conn, now_epoch=120)
+    assert "rebuilding" in capsys.readouterr().out
+    assert added == 33 and sketches[("all", "*")].n == 33
+
+    _, added = calibrate.aggregate_new_events(conn, now_epoch=130)
+    assert added == 0 and "rebuilding" not in capsys.readouterr().out
+    conn.close()
+
+
+def test_cli_dry_run_leaves_no_state(tmp_path):
+    db = _db(tmp_path, _events(35))
+    config = tmp_path / "decomposition-calibration.yaml"
+    config.write_text("defaults:\n  child_count:\n    p50: 5\n")
+    result = subprocess.run(
+        [sys.executable, str(SCRIPT), "--db", str(db), "--config", str(config), "--dry-run", "--by", "complexity"],
+        capture_output=True, text=True, timeout=30,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "By complexity" in result.stdout
+    assert "calibrated:" in result.stdout
+    conn = sqlite3.connect(db)
+    tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master")}
+    journal = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    conn.close()
+    assert "decomposition_calibration_sketches" not in tables
+    assert not tables & set(calibrate.interspect_db.INDEXES) and journal == "delete"
+    assert "calibrated:" not in config.read_text()
@@ -0,0 +1,105 @@
+"""Tests for cache.py — persistent AI conflict decision cache."""
+import json
+from unittest.mock import patch, MagicMock
+from clavain_sync.cache import DecisionCache
+from clavain_sync.resolve import analyze_conflict, conflict_key, ConflictDecision
+
+
+def _claude_stdout(decision="needs_human", risk="medium"):
+    return json.dumps({"decision": decision, "risk": risk, "rationale": "diverged", "blocklist_found": []})
+
+
+def _analyze(cache, blocklist=None):
+    return analyze_conflict(
+        local_path="skills/foo.md",
+        local_content="local",
+        upstream_content="upstream",
+        ancestor_content="ancestor",
+        blocklist=blocklist or [],
+        cache=cache,
+    )
+
+
+def test_key_changes_with_each_input():
+    base = dict(local_content="a", upstream_content="b", ancestor_content="c", blocklist=["x"])
+    key = conflict_key(**base)
+    assert key == conflict_key(**base)
+    assert key != conflict_key(**{**base, "local_content": "a2"})
+    assert key != conflict_key(**{**base, "blocklist": ["y"]})
+    assert key != conflict_key(**base, prompt_version="other")
+    # Field boundaries are length-prefixed, so shifting text between fields differs.
+    assert conflict_key(local_content="ab", upstream_content="", ancestor_content="", blocklist=[]) != \
+        conflict_key(local_content="a", upstream_content="b", ancestor_content="", blocklist=[])
+
+
+@patch("clavain_sync.resolve.shutil.which", return_value="/usr/bin/claude")
+@patch("clavain_sync.resolve.subprocess.run")
+def test_second_run_hits_cache(mock_run, mock_which, tmp_path):
+    mock_run.return_value = MagicMock(returncode=0, stdout=_claude_stdout())
+    path = tmp_path / "cache.json"
+
+    first = DecisionCache(path)
+    assert _analyze(first).cached is False
+    first.save()
+    assert (first.hits, first.misses) == (0, 1)
+
+    second = DecisionCache(path)
+    result = _analyze(second)
+    assert result.cached is True
+    assert result.decision == "needs_human"
+    assert (second.hits, second.misses) == (1, 0)
+    assert mock_run.call_count == 1
+
+
+@patch("clavain_sync.resolve.shutil.which", return_value="/usr/bin/claude")
+@patch("clavain_sync.resolve.subprocess.run")
+def test_refresh_bypasses_cache(mock_run, mock_which, tmp_path):
+    mock_run.return_value = MagicMock(returncode=0, stdout=_claude_stdout())
+    path = tmp_path / "cache.json"
+    cache = DecisionCache(path)
+    _analyze(cache)
+    cache.save()
+
+    refreshed = DecisionCache(path, refresh=True)
+    assert _analyze(refreshed).cached is False
+    assert mock_run.call_count == 2
+
+
+def test_expired_entries_miss_and_are_pruned(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = DecisionCache(path, ttl_seconds=60)
+    cache.put("k", ConflictDecision("keep_local", "low", "r", []), now=1000.0)
+    assert cache.get("k", now=1030.0) is not None
+    assert cache.get("k", now=1100.0) is None
+    cache.save(now=1100.0)
+    assert json.loads(path.read_text())["entries"] == {}
+
+
+@patch("clavain_sync.resolve.shutil.which", return_value="/usr/bin/claude")
+@patch("clavain_sync.resolve.subprocess.run")
+def test_fallback_is_not_cached(mock_run, mock_which, tmp_path):
+    mock_run.return_value = MagicMock(returncode=0, stdout="not json")
+    cache = DecisionCache(tmp_path / "cache.json")
+    assert _analyze(cache).rationale == "AI analysis failed"
+    cache.save()
+    assert not (tmp_path / "cache.json").exists()
+
+
+def test_deterministic_cases_skip_cache(tmp_path):
+    cache = DecisionCache(tmp_path / "cache.json")
+    result = analyze_conflict(
+        local_path="f.md",
+        local_content="same",
+        upstream_content="new",
+        ancestor_content="same",
+        blocklist=[],
+        cache=cache,
+    )
+    assert result.decision == "accept_upstream"
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_corrupt_cache_file_is_empty(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("{not json")
+    assert DecisionCache(path).get("anything") is None
@@ -29,3 +29,11 @@ def test_report_includes_ai_decisions():
     assert "AI Decisions" in output
     assert "accept_upstream" in output
     assert "file.md" in output
+
+
+def test_report_includes_ai_cache_counts():
+    report = SyncReport()
+    report.ai_cache_hits = 3
+    report.ai_cache_misses = 1
+    output = report.generate()
+    assert "3 hit(s), 1 miss(es)" in output
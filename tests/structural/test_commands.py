@@ -1,25 +1,18 @@
 """Tests for command markdown files."""
 
 import re
-from pathlib import Path
 
 import pytest
 
-from helpers import parse_frontmatter as _parse_frontmatter
+from helpers import CORPUS, parse_frontmatter as _parse_frontmatter
 
 
-def _get_command_files():
-    """Get all command .md files at collection time."""
-    commands_dir = Path(__file__).resolve().parent.parent.parent / "commands"
-    return sorted(commands_dir.glob("*.md"))
+COMMAND_FILES = CORPUS.command_files
 
 
-COMMAND_FILES = _get_command_files()
-
-
-def test_command_count(commands_dir, plugin_json):
+def test_command_count(corpus, plugin_json):
     """Command count on filesystem matches plugin.json manifest."""
-    files = sorted(commands_dir.glob("*.md"))
+    files = corpus.command_files
     expected = len(plugin_json.get("commands", []))
     assert len(files) == expected, (
         f"plugin.json lists {expected} commands, filesystem has {len(files)}: {[f.stem for f in files]}"
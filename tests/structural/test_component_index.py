@@ -0,0 +1,69 @@
+"""Tests for scripts/component_index.py incremental parsing and fresh-check memo."""
+
+import os
+
+import pytest
+
+from component_index import ComponentIndex
+
+SKILL = """---
+name: demo
+description: |
+  Uses clavain:other and /clavain:write-plan.
+---
+Body mentions clavain:third.
+"""
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "skills" / "demo").mkdir(parents=True)
+    (tmp_path / "skills" / "demo" / "SKILL.md").write_text(SKILL)
+    (tmp_path / "commands").mkdir()
+    (tmp_path / "commands" / "broken.md").write_text("no frontmatter\n")
+    return tmp_path
+
+
+def test_entries_reparse_only_on_stat_change(tree, tmp_path):
+    cache = tmp_path / "cache" / "index.json"
+    skill = tree / "skills" / "demo" / "SKILL.md"
+    index = ComponentIndex(tree, cache_file=cache)
+    comp = index.get(skill)
+    assert comp.fields["name"] == "demo"
+    assert comp.refs == ["other", "third", "write-plan"]
+    assert comp.slash_refs == ["write-plan"]
+    assert index.meta(skill)["description"].startswith("Uses")
+    index.save()
+
+    warm = ComponentIndex(tree, cache_file=cache)
+    assert warm.get(skill).body_sha == comp.body_sha
+    assert warm.meta(skill) == index.meta(skill)
+    assert warm.parsed == 0
+
+    skill.write_text(SKILL.replace("name: demo", "name: renamed"))
+    st = skill.stat()
+    os.utime(skill, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert warm.get(skill).fields["name"] == "renamed"
+    assert warm.parsed == 1
+
+
+def test_require_reports_flat_parse_errors(tree):
+    index = ComponentIndex(tree, persist=False)
+    with pytest.raises(ValueError, match="start marker"):
+        index.get(tree / "commands" / "broken.md").require("name")
+    with pytest.raises(ValueError, match="field 'title'"):
+        index.get(tree / "skills" / "demo" / "SKILL.md").require("title")
+
+
+def test_fresh_memo_tracks_input_stats(tree, tmp_path):
+    cache = tmp_path / "cache" / "index.json"
+    index = ComponentIndex(tree, cache_file=cache)
+    inputs = index.component_files()
+    assert not index.is_fresh("gen", inputs)
+    index.mark_fresh("gen", inputs)
+    index.save()
+
+    assert ComponentIndex(tree, cache_file=cache).is_fresh("gen", inputs)
+    (tree / "commands" / "new.md").write_text("---\nname: new\n---\n")
+    reloaded = ComponentIndex(tree, cache_file=cache)
+    assert not reloaded.is_fresh("gen", reloaded.component_files())
@@ -1,6 +1,5 @@
 """Tests for cross-references between plugin components."""
 
-import re
 from pathlib import Path
 
 
@@ -38,45 +37,30 @@ def test_lib_sourced_by_hooks(project_root):
             )
 
 
-def test_routing_table_references(project_root):
+def test_routing_table_references(corpus):
     """Parse using-clavain/SKILL.md for clavain: refs, verify each resolves."""
-    skill_md = project_root / "skills" / "using-clavain" / "SKILL.md"
-    assert skill_md.exists(), "using-clavain/SKILL.md not found"
+    skill_md = "skills/using-clavain/SKILL.md"
+    assert skill_md in corpus.refs, "using-clavain/SKILL.md not found"
 
-    text = skill_md.read_text(encoding="utf-8")
-
-    # Find all clavain: references (e.g., /clavain:write-plan, clavain:flux-drive)
-    refs = re.findall(r"clavain:([a-z0-9][-a-z0-9]*)", text)
+    # All clavain: references (e.g., /clavain:write-plan, clavain:flux-drive)
+    refs = corpus.refs[skill_md]
     assert len(refs) > 0, "No clavain: references found in using-clavain/SKILL.md"
 
-    skills_dir = project_root / "skills"
-    commands_dir = project_root / "commands"
-
-    unresolved = []
-    for ref in set(refs):
-        # A clavain: reference can resolve to a skill directory or command file
-        skill_exists = (skills_dir / ref / "SKILL.md").exists()
-        command_exists = (commands_dir / f"{ref}.md").exists()
-        if not skill_exists and not command_exists:
-            unresolved.append(ref)
+    # A clavain: reference can resolve to a skill directory or command file
+    unresolved = [ref for ref in refs if ref not in corpus.component_names]
 
     assert not unresolved, (
         f"Unresolved clavain: references in using-clavain/SKILL.md: {sorted(unresolved)}"
     )
 
 
-def test_command_clavain_references_resolve(project_root):
+def test_command_clavain_references_resolve(corpus, component_index):
     """Every clavain: reference in a command resolves to a command or skill."""
-    skills_dir = project_root / "skills"
-    commands_dir = project_root / "commands"
     unresolved = set()
 
-    for command_path in commands_dir.glob("*.md"):
-        text = command_path.read_text(encoding="utf-8")
-        for ref in re.findall(r"/clavain:([a-z0-9][-a-z0-9]*)", text):
-            skill_exists = (skills_dir / ref / "SKILL.md").exists()
-            command_exists = (commands_dir / f"{ref}.md").exists()
-            if not skill_exists and not command_exists:
+    for command_path in corpus.command_files:
+        for ref in component_index.get(command_path).slash_refs:
+            if ref not in corpus.component_names:
                 unresolved.add((command_path.name, ref))
 
     assert not unresolved, f"Unresolved command clavain: references: {sorted(unresolved)}"
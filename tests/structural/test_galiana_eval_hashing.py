@@ -0,0 +1,91 @@
+"""Tests for galiana/eval.py content hashing and --changed-only mode."""
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+GALIANA = Path(__file__).resolve().parents[2] / "galiana"
+sys.path.insert(0, str(GALIANA))
+
+_spec = importlib.util.spec_from_file_location("galiana_eval", GALIANA / "eval.py")
+galiana_eval = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(galiana_eval)
+
+
+def _fixture(golden, name, body="SELECT 1"):
+    root = golden / name
+    (root / "input").mkdir(parents=True)
+    (root / "input" / "main.go").write_text(body)
+    (root / "meta.json").write_text(json.dumps({"expected_properties": [{"min_findings": 1}]}))
+    (root / "baseline.json").write_text(json.dumps({"findings": [{"severity": "P0", "title": "sql injection"}]}))
+    return root
+
+
+def _agent_root(tmp_path, body="You review safety."):
+    agent = tmp_path / "plugins" / "interflux" / "agents" / "review" / "fd-safety.md"
+    agent.parent.mkdir(parents=True, exist_ok=True)
+    agent.write_text(body)
+    return agent
+
+
+def test_hashes_track_content(tmp_path):
+    golden = tmp_path / "golden"
+    root = _fixture(golden, "a")
+    first = galiana_eval.load_fixtures(golden)[0]["hash"]
+    assert galiana_eval.load_fixtures(golden)[0]["hash"] == first
+    (root / "input" / "main.go").write_text("SELECT 2")
+    assert galiana_eval.load_fixtures(golden)[0]["hash"] != first
+
+    agent = _agent_root(tmp_path)
+    roots = [tmp_path / "plugins" / "interflux"]
+    assert galiana_eval.resolve_agent_file("interflux:review:fd-safety", roots) == agent
+    assert galiana_eval.resolve_agent_file("other:review:fd-safety", roots) is None
+    topo = galiana_eval.hash_topology(["interflux:review:fd-safety"], GALIANA, roots)
+    assert galiana_eval.hash_topology(["interflux:review:fd-safety"], GALIANA, roots) == topo
+    agent.write_text("You review safety, carefully.")
+    assert galiana_eval.hash_topology(["interflux:review:fd-safety"], GALIANA, roots) != topo
+
+
+def test_plugin_cache_versions_newest_first(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("GALIANA_AGENT_ROOTS", raising=False)
+    plugin = tmp_path / ".claude" / "plugins" / "cache" / "market" / "interflux"
+    for version in ("0.9.0", "0.10.0", "0.2.1"):
+        (plugin / version).mkdir(parents=True)
+    roots = galiana_eval.agent_search_roots(GALIANA)
+    assert [r.name for r in roots if r.parent == plugin] == ["0.10.0", "0.9.0", "0.2.1"]
+
+
+def test_changed_only_reruns_affected_pairs(tmp_path, monkeypatch, capsys):
+    golden = tmp_path / "golden"
+    _fixture(golden, "a")
+    changed = _fixture(golden, "b")
+    _agent_root(tmp_path)
+    monkeypatch.setenv("GALIANA_AGENT_ROOTS", str(tmp_path / "plugins" / "interflux"))
+    monkeypatch.setattr(galiana_eval, "EVAL_RESULTS_FILE", tmp_path / "eval-results.jsonl")
+    calls = []
+
+    def fake_run(fixture, topology_name, **kwargs):
+        calls.append((fixture["name"], topology_name))
+        return {"findings": [{"severity": "P0", "title": "sql injection"}], "agents_completed": ["fd-safety"], "duration_seconds": 1}
+
+    monkeypatch.setattr(galiana_eval, "run_fixture_eval", fake_run)
+    topologies = {"T1": {"agents": ["interflux:review:fd-safety"]}, "T2": {"agents": ["interflux:review:fd-quality"]}}
+
+    def run():
+        calls.clear()
+        return galiana_eval.run_eval(golden, topologies, "*", False, False, tmp_path, changed_only=True)
+
+    assert run() == 0 and len(calls) == 4
+    assert run() == 0 and calls == []
+    assert "unchanged, from" in capsys.readouterr().out
+
+    (changed / "input" / "main.go").write_text("SELECT 3")
+    assert run() == 0 and sorted(calls) == [("b", "T1"), ("b", "T2")]
+
+    _agent_root(tmp_path, body="Edited safety agent.")
+    assert run() == 0 and sorted(calls) == [("a", "T1"), ("b", "T1")]
+
+    records = [json.loads(line) for line in (tmp_path / "eval-results.jsonl").read_text().splitlines()]
+    assert len(records) == 8 and all(r["fixture_hash"] and r["topology_hash"] for r in records)
@@ -0,0 +1,124 @@
+"""Tests for galiana/eventstore.py and the KPI queries that run over it."""
+
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+GALIANA = Path(__file__).resolve().parents[2] / "galiana"
+sys.path.insert(0, str(GALIANA))
+
+import analyze  # noqa: E402
+import eventstore  # noqa: E402
+
+NOW = datetime(2026, 3, 10, 12, tzinfo=timezone.utc)
+
+
+def _at(days_ago, **event):
+    return {"timestamp": (NOW - timedelta(days=days_ago)).isoformat(), **event}
+
+
+TELEMETRY = [
+    _at(40, event="phase_transition", phase="done", bead="old"),
+    _at(3, event="workflow_start", bead="b1", session_id="s1"),
+    _at(3, event="phase_transition", phase="done", bead="b1", session_id="s1"),
+    _at(2, event="gate_enforce", decision="SKIP", tier="hard", session_id="s1"),
+    _at(2, event="gate_enforce", decision="pass", tier="hard"),
+    _at(2, event="gate_enforce", decision="skip"),
+    _at(1, event="phase_transition", phase="done", bead=" b2 ", session_id="s2"),
+    _at(1, event="workflow_end", session_id="s2"),
+    _at(1, event="defect_report", bead="b1"),
+    {"event": "gate_enforce", "timestamp": "not a time"},
+]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(eventstore, "np", None)
+    return request.param
+
+
+@pytest.fixture
+def telemetry(tmp_path, monkeypatch):
+    path = tmp_path / "telemetry.jsonl"
+    path.write_text("".join(json.dumps(e) + "\n" for e in TELEMETRY))
+    monkeypatch.setattr(analyze, "TELEMETRY_FILE", path)
+    return path
+
+
+def _kpis(events):
+    defect, shipped, _ = analyze.compute_defect_escape_rate(events)
+    override, _, _ = analyze.compute_human_override_rate(events)
+    return defect, shipped, override, analyze.workflow_sessions(events)
+
+
+def test_kpis_from_store_match_scan(backend, telemetry, tmp_path):
+    since = NOW - timedelta(days=30)
+    stored, sessions = analyze.load_telemetry_events(since, NOW, None, tmp_path / "store")
+    scanned, _ = analyze.load_telemetry_events(since, NOW, None, None)
+    assert len(stored) == len(scanned) == 8
+    assert _kpis(stored) == _kpis(scanned)
+
+    defect, shipped, override, workflow = _kpis(stored)
+    assert shipped == {"b1", "b2"}
+    assert defect["numerator"] == 1 and defect["denominator"] == 2
+    assert (override["numerator"], override["denominator"]) == (2, 3)
+    assert override["by_type"]["hard"] == {"value": 0.5, "numerator": 1, "denominator": 2}
+    assert override["by_type"]["unknown"]["numerator"] == 1
+    assert workflow == {"s1", "s2"}
+    assert sessions == {"s1": "b1", "s2": "b2"}
+
+
+def test_ingest_is_incremental_and_rebuilds_on_truncate(backend, telemetry, tmp_path):
+    store = eventstore.EventStore(tmp_path / "store", analyze.TELEMETRY, telemetry)
+    assert store.ingest() == 9
+    assert store.ingest() == 0
+
+    with open(telemetry, "a") as f:
+        f.write(json.dumps(_at(0, event="defect_report", bead="b2")) + "\n")
+        f.write('{"event": "defect_re')  # partial line waits for its newline
+    assert store.ingest() == 1
+    frame = store.query(NOW - timedelta(days=30), NOW)
+    assert frame.count(frame.eq("event", "defect_report")) == 2
+    assert sorted(p.name for p in (tmp_path / "store" / "telemetry").iterdir() if p.is_dir()) == [
+        "2026-01-29", "2026-03-07", "2026-03-08", "2026-03-09", "2026-03-10",
+    ]
+
+    telemetry.write_text(json.dumps(_at(1, event="defect_report")) + "\n")
+    assert store.ingest() == 1
+    assert len(store.query(NOW - timedelta(days=60), NOW)) == 1
+
+
+def test_bead_filter_follows_session_links(backend, telemetry, tmp_path):
+    events, sessions = analyze.load_telemetry_events(NOW - timedelta(days=30), NOW, "b1", tmp_path / "store")
+    assert sessions == {"s1": "b1"}
+    # b1's own events plus the s1 gate event that names no bead.
+    assert len(events) == 4
+    assert analyze.compute_human_override_rate(events)[0]["by_type"] == {
+        "hard": {"value": 1.0, "numerator": 1, "denominator": 1},
+    }
+
+
+def test_tool_time_cost_proxy_scopes_to_bead_sessions(backend, tmp_path, monkeypatch):
+    path = tmp_path / "events.jsonl"
+    ts = (NOW - timedelta(hours=1)).isoformat()
+    rows = [
+        {"event": "PreToolUse", "id": "s1-1", "ts": ts},
+        {"event": "ToolUse", "id": "s1-2", "ts": ts},
+        {"event": "PostToolUse", "id": "s1-3", "ts": ts},
+        {"event": "ToolUse", "id": "s9-1", "ts": ts},
+    ]
+    path.write_text("".join(json.dumps(r) + "\n" for r in rows))
+    monkeypatch.setattr(analyze, "TOOL_TIME_EVENTS_FILE", path)
+
+    tools = analyze.load_tool_time_events(NOW - timedelta(days=1), NOW, tmp_path / "store")
+    result = analyze.compute_cost_per_landed_change(tools, {"b1"}, {"s1"}, landed=None, interstat_rows=None)
+    assert (result["avg_tools"], result["avg_sessions"], result["source"]) == (2.0, 1.0, "tool-time")
+
+    unlinked = analyze.compute_cost_per_landed_change(tools, {"b1"}, {"nope"}, landed=None, interstat_rows=None)
+    assert unlinked["avg_tools"] == 3.0 and "used full period" in unlinked["note"]
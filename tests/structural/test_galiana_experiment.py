@@ -0,0 +1,72 @@
+"""Tests for the galiana/experiment.py shadow-agent scheduler."""
+
+import stat
+import sys
+import time
+from pathlib import Path
+
+GALIANA = Path(__file__).resolve().parents[2] / "galiana"
+sys.path.insert(0, str(GALIANA))
+
+import experiment  # noqa: E402
+
+# Fake shadow-review.sh: logs each call, sleeps, writes one finding named
+# after the agent. fd-flaky fails its first attempt on each input.
+FAKE_SHADOW = """#!/usr/bin/env bash
+set -euo pipefail
+name="${1##*:}"
+echo "$1 $2" >> "$(dirname "$0")/calls.log"
+sleep 0.3
+once="$(dirname "$0")/flaky-$2"
+if [[ "$name" == fd-flaky && ! -e "$once" ]]; then
+    touch "$once"
+    exit 1
+fi
+printf '{"findings":[{"severity":"P1","title":"%s on %s"}]}' "$name" "$2" > "$3"
+"""
+
+TOPOLOGIES = {
+    "T2": ["x:review:fd-architecture", "x:review:fd-quality"],
+    "T4": ["x:review:fd-architecture", "x:review:fd-quality", "x:review:fd-flaky", "x:review:fd-safety"],
+}
+
+
+def _script_dir(tmp_path):
+    script = tmp_path / "bin" / "shadow-review.sh"
+    script.parent.mkdir()
+    script.write_text(FAKE_SHADOW)
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return script.parent
+
+
+def test_shared_agents_run_once_concurrently_with_retries(tmp_path):
+    script_dir = _script_dir(tmp_path)
+    tasks = [("00-a", "a.md"), ("01-a", "b.md")]
+    jobs = experiment.plan_agent_jobs(tasks, TOPOLOGIES)
+    assert len(jobs) == 8  # 2 reviews × 4 distinct agents, not 2 × (2 + 4)
+
+    start = time.monotonic()
+    outcomes = experiment.run_agent_pool(
+        jobs, tmp_path / "run", tmp_path, script_dir, max_workers=8, timeout_s=10, retries=1,
+    )
+    assert time.monotonic() - start < 2.0
+    calls = (script_dir / "calls.log").read_text().splitlines()
+    assert len(calls) == 10  # plus one fd-flaky retry per review
+    assert sorted(o["attempts"] for o in outcomes.values()) == [1] * 6 + [2] * 2
+    assert (tmp_path / "run" / "01-a" / "fd-quality.json").exists()
+
+    t2 = experiment.assemble_shadow_review("01-a", "b.md", TOPOLOGIES["T2"], outcomes)
+    t4 = experiment.assemble_shadow_review("01-a", "b.md", TOPOLOGIES["T4"], outcomes)
+    assert t2["agents_completed"] == ["fd-architecture", "fd-quality"]
+    assert [f["title"] for f in t2["findings"]] == ["fd-architecture on b.md", "fd-quality on b.md"]
+    assert t4["agents_completed"] == ["fd-architecture", "fd-quality", "fd-flaky", "fd-safety"]
+
+
+def test_agent_without_output_reports_failure(tmp_path):
+    script_dir = _script_dir(tmp_path)
+    (script_dir / "shadow-review.sh").write_text("#!/usr/bin/env bash\nsleep 5\n")
+    job = experiment.AgentJob("00-a", "a.md", "x:review:fd-quality")
+    outcomes = experiment.run_agent_pool([job], tmp_path / "run", tmp_path, script_dir, timeout_s=0.2, retries=1)
+    assert outcomes[job]["findings"] is None and outcomes[job]["attempts"] == 2
+    assert "timed out" in outcomes[job]["error"]
+    assert experiment.assemble_shadow_review("00-a", "a.md", [job.agent], outcomes)["agents_completed"] == []
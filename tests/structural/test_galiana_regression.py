@@ -0,0 +1,61 @@
+"""Tests for galiana/regression.py native eval regression detection."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+GALIANA = Path(__file__).resolve().parents[2] / "galiana"
+sys.path.insert(0, str(GALIANA))
+
+from regression import Baseline, ResultIndex, detect_regressions  # noqa: E402
+
+
+def _record(date, recall, fixture="synth-sql-injection", topology="T4", pass_rate=1.0, precision=0.8):
+    return {
+        "date": date, "fixture": fixture, "topology": topology,
+        "avg_recall": recall, "precision": precision, "property_pass_rate": pass_rate,
+    }
+
+
+HISTORY = [_record(f"2026-03-{d:02d}", r) for d, r in zip(range(1, 9), [0.9, 0.92, 0.88, 0.91, 0.9, 0.89, 0.93, 0.9])]
+
+
+def test_significant_drop_is_flagged_noise_is_not():
+    records = HISTORY + [_record("2026-03-09", 0.6), _record("2026-03-09", 0.62, topology="T2")]
+    regressions = detect_regressions(ResultIndex(records))
+    assert [(r["topology"], r["metric"]) for r in regressions] == [("T4", "recall")]
+    r = regressions[0]
+    assert r["date"] == "2026-03-09" and r["current"] == 0.6
+    assert r["baseline"]["n"] == 8 and r["baseline"]["ci_low"] < 0.9 < r["baseline"]["ci_high"]
+
+    # Within the baseline's spread: no flag.
+    assert detect_regressions(ResultIndex(HISTORY + [_record("2026-03-09", 0.88)])) == []
+
+
+def test_flat_baseline_needs_min_delta_and_min_runs():
+    flat = [_record(f"2026-03-0{d}", 1.0) for d in range(1, 5)]
+    assert detect_regressions(ResultIndex(flat + [_record("2026-03-05", 0.98)])) == []
+    assert len(detect_regressions(ResultIndex(flat + [_record("2026-03-05", 0.9)]))) == 1
+    assert detect_regressions(ResultIndex(flat[:2] + [_record("2026-03-05", 0.1)])) == []
+
+
+def test_same_day_runs_average_and_window_limits_history():
+    index = ResultIndex(HISTORY + [_record("2026-03-08", 0.5)])
+    assert index.value("synth-sql-injection", "T4", "recall", "2026-03-08") == 0.7
+    assert len(index.history("synth-sql-injection", "T4", "recall", "2026-03-09", window=3)) == 3
+    assert Baseline.of([0.5]).floor == 0.5
+
+
+def test_eval_check_mode_gates_without_agents(tmp_path):
+    results = tmp_path / ".clavain" / "eval-results.jsonl"
+    results.parent.mkdir()
+    results.write_text("".join(json.dumps(r) + "\n" for r in HISTORY + [_record("2026-03-09", 0.5)]))
+    run = lambda *args: subprocess.run(  # noqa: E731
+        [sys.executable, str(GALIANA / "eval.py"), "--check", *args],
+        capture_output=True, text=True, env={"HOME": str(tmp_path), "PATH": "/usr/bin:/bin"},
+    )
+    flagged = run()
+    assert flagged.returncode == 2 and "synth-sql-injection" in flagged.stdout
+    assert run("--topologies", "T2").returncode == 0
+    assert run("--date", "2026-03-08").returncode == 0
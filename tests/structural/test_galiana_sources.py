@@ -0,0 +1,112 @@
+"""Tests for galiana/sources.py concurrent collection and run_analysis source status."""
+
+import shutil
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+GALIANA = Path(__file__).resolve().parents[2] / "galiana"
+sys.path.insert(0, str(GALIANA))
+
+import analyze  # noqa: E402
+from sources import Source, SourceCache, collect  # noqa: E402
+
+
+def _slow(value, delay):
+    def fetch():
+        time.sleep(delay)
+        return value
+    return fetch
+
+
+def _boom():
+    raise RuntimeError("provider down")
+
+
+def test_sources_run_concurrently_with_deadlines(tmp_path):
+    start = time.monotonic()
+    values, status = collect([
+        Source("a", _slow(1, 0.2)),
+        Source("b", _slow(2, 0.2)),
+        Source("hung", _slow(3, 5), deadline_s=0.3),
+        Source("broken", _boom),
+    ])
+    assert time.monotonic() - start < 1.0
+    assert values == {"a": 1, "b": 2, "hung": None, "broken": None}
+    assert status["hung"]["status"] == "timeout"
+    assert status["broken"]["status"] == "error" and "provider down" in status["broken"]["error"]
+
+
+def test_cache_freshness_and_stale_fallback(tmp_path):
+    cache = SourceCache(tmp_path)
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return {"rows": len(calls)}
+
+    source = Source("landed", fetch, deadline_s=1, ttl_s=60, key=["x"])
+    assert collect([source], cache)[0]["landed"] == {"rows": 1}
+    values, status = collect([source], cache)
+    assert values["landed"] == {"rows": 1} and status["landed"]["status"] == "cached"
+    assert len(calls) == 1
+
+    # Past its freshness window and failing live: the old entry stands in.
+    expired = Source("landed", _boom, deadline_s=1, ttl_s=0, key=["x"])
+    values, status = collect([expired], cache)
+    assert values["landed"] == {"rows": 1}
+    assert status["landed"]["status"] == "stale" and status["landed"]["reason"] == "error"
+
+
+def test_run_analysis_writes_partial_kpis_when_a_source_hangs(tmp_path, monkeypatch):
+    monkeypatch.setattr(analyze, "TELEMETRY_FILE", tmp_path / "telemetry.jsonl")
+    monkeypatch.setattr(analyze, "TOOL_TIME_EVENTS_FILE", tmp_path / "events.jsonl")
+    monkeypatch.setattr(analyze, "TOPOLOGY_RESULTS_FILE", tmp_path / "topology.jsonl")
+    monkeypatch.setattr(analyze, "EVAL_RESULTS_FILE", tmp_path / "eval.jsonl")
+    monkeypatch.setattr(analyze, "CASS_DEADLINE_S", 0.2)
+    monkeypatch.setattr(analyze, "_query_cass_analytics", lambda **kw: time.sleep(3))
+    monkeypatch.setattr(analyze, "_query_landed_changes", lambda bead: {"total": 3, "reverted": 1, "by_bead": {}})
+    monkeypatch.setattr(analyze, "_fetch_interstat_rows", lambda: None)
+    (tmp_path / "telemetry.jsonl").write_text(
+        '{"event": "phase_transition", "phase": "done", "bead": "b1", "timestamp": "%s"}\n'
+        % datetime.now(timezone.utc).isoformat()
+    )
+
+    start = time.monotonic()
+    result = analyze.run_analysis(
+        datetime.now(timezone.utc) - timedelta(days=1), tmp_path, cache_dir=None, store_dir=tmp_path / "store",
+    )
+    assert time.monotonic() - start < 2.0
+    assert result["sources"]["cass"]["status"] == "timeout"
+    assert result["sources"]["telemetry"]["status"] == "ok"
+    assert result["kpis"]["cost_per_landed_change"]["landed_changes"] == 2
+    assert result["summary"]["total_beads_shipped"] == 1
+    assert any("cass" in a["message"] for a in result["advisories"] if a["level"] == "warning")
+
+
+@pytest.fixture(autouse=True)
+def _no_real_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(analyze, "SOURCE_CACHE_DIR", tmp_path / "source-cache")
+
+
+def test_failed_external_query_falls_back_to_stale_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(shutil, "which", lambda name: f"/usr/bin/{name}")
+    outcome = {"returncode": 0, "stdout": '{"total": 2, "reverted": 0}'}
+    monkeypatch.setattr(
+        analyze.subprocess, "run",
+        lambda cmd, **kw: subprocess.CompletedProcess(cmd, outcome["returncode"], outcome["stdout"], "ic: db locked\n"),
+    )
+    cache = SourceCache(tmp_path / "cache")
+    source = Source("landed", analyze._query_landed_changes, deadline_s=1, ttl_s=0, key=[None])
+    assert collect([source], cache)[0]["landed"] == {"total": 2, "reverted": 0}
+
+    outcome.update(returncode=1, stdout="")
+    values, status = collect([source], cache)
+    assert status["landed"]["status"] == "stale" and "db locked" in status["landed"]["error"]
+    assert values["landed"] == {"total": 2, "reverted": 0}
+    # Inline callers still see a failed query as "no data".
+    assert analyze._or_none(analyze._query_landed_changes, None) is None
@@ -0,0 +1,114 @@
+"""Tests for scripts/interspect_db.py shared evidence access."""
+
+import re
+import sqlite3
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+import interspect_db
+from helpers import PROJECT_ROOT, evidence_db
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "galiana"))
+
+import analyze  # noqa: E402
+
+ROWS = [
+    ("2026-03-01T10:00:00Z", "s1", 1, "override", "agent_wrong"),
+    ("2026-03-02T10:00:00Z", "s1", 2, "disagreement_override", "severity_miscalibrated"),
+    ("2026-03-02T11:00:00Z", "s1", 3, "override", "deprioritized"),
+    ("2026-03-03T10:00:00Z", "s2", 1, "override", "deprioritized"),
+    ("2026-03-03T10:00:00Z", "s2", 2, "override", None),
+    ("2026-03-03T12:00:00Z", "s2", 7, "false_positive", "agent_wrong"),
+    ("2026-04-01T10:00:00Z", "s2", 8, "override", "agent_wrong"),
+]
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = evidence_db(tmp_path / ".clavain" / "interspect" / "interspect.db")
+    conn = sqlite3.connect(path)
+    conn.executemany(
+        "INSERT INTO evidence (ts, session_id, seq, source, event, override_reason, context, project)"
+        " VALUES (?, ?, ?, 'fd-quality', ?, ?, '{}', 'demo')",
+        ROWS,
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def _journal_mode(db):
+    conn = sqlite3.connect(db)
+    try:
+        return conn.execute("PRAGMA journal_mode").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_evidence_table_matches_interspect_init():
+    init = (PROJECT_ROOT / "scripts" / "interspect-init.sh").read_text()
+    table = re.search(r"CREATE TABLE IF NOT EXISTS evidence \((.*?)\n\);", init, re.S).group(1)
+    init_columns = {line.split()[0] for line in table.splitlines() if line.strip() and not line.strip().startswith("--")}
+    conn = sqlite3.connect(":memory:")
+    interspect_db.create_evidence_table(conn)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(evidence)")}
+    assert init_columns <= columns
+    for name in interspect_db.INDEXES:
+        assert f"CREATE INDEX IF NOT EXISTS {name}" in init
+
+
+def test_readonly_analytics_never_writes(db):
+    conn = interspect_db.connect_readonly(db)
+    try:
+        assert interspect_db.missing_indexes(conn) == list(interspect_db.INDEXES)
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM evidence")
+        assert interspect_db.override_summary(conn, "2026-03-01T00:00:00Z", "2026-03-31T00:00:00Z")["total_overrides"] == 5
+    finally:
+        conn.close()
+    assert _journal_mode(db) == "delete"
+
+
+def test_migrate_sets_wal_and_covering_index(db):
+    conn = interspect_db.connect(db)
+    assert interspect_db.missing_indexes(conn) == list(interspect_db.INDEXES)
+    interspect_db.migrate(conn)
+    conn.close()
+    assert _journal_mode(db) == "wal"
+    conn = interspect_db.connect_readonly(db)
+    try:
+        assert interspect_db.missing_indexes(conn) == []
+        plan = " ".join(row[-1] for row in conn.execute(
+            "EXPLAIN QUERY PLAN " + interspect_db._OVERRIDE_SUMMARY_SQL, (*interspect_db.OVERRIDE_EVENTS, "a", "b"),
+        ))
+        assert "COVERING INDEX idx_evidence_event_ts" in plan
+    finally:
+        conn.close()
+
+
+def test_override_summary_single_grouped_query(db):
+    conn = interspect_db.connect(db)
+    summary = interspect_db.override_summary(conn, "2026-03-01T00:00:00Z", "2026-03-31T00:00:00Z")
+    assert summary == {
+        "total_overrides": 5,
+        "agent_wrong_count": 2,
+        "by_reason": {"deprioritized": 2, "agent_wrong": 1, "severity_miscalibrated": 1, "unknown": 1},
+    }
+    assert interspect_db.next_seq(conn, "s2") == 9
+    assert interspect_db.next_seq(conn, "new") == 1
+    assert interspect_db.count_events(conn, "override") == 5
+    conn.close()
+
+
+def test_galiana_override_kpis(db, tmp_path):
+    result = analyze.load_interspect_overrides(
+        tmp_path, datetime(2026, 3, 1, tzinfo=timezone.utc), datetime(2026, 3, 31, tzinfo=timezone.utc),
+    )
+    assert result["available"] and result["total_overrides"] == 5
+    assert result["wrong_rate"] == 0.4
+    assert analyze.load_interspect_overrides(tmp_path / "nowhere", datetime.now(timezone.utc), datetime.now(timezone.utc)) == {
+        "available": False,
+    }
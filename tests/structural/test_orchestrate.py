@@ -9,8 +9,10 @@ from orchestrate import (
     DependencyDrivenScheduler,
     Manifest,
     Task,
+    TaskGraph,
     TaskResult,
     build_graph,
+    compile_graph,
     build_prompt,
     count_verdicts,
     load_manifest,
@@ -19,6 +21,7 @@ from orchestrate import (
     _resolve_all_parallel,
     _resolve_all_sequential,
     _resolve_manual_batching,
+    _propagate_failure,
 )
 
 
@@ -348,6 +351,103 @@ class TestDependencyDrivenScheduler:
         assert ready == []  # task-4 was already marked done (skipped)
 
 
+def _staged_manifest(n_stages: int, per_stage: int) -> Manifest:
+    """Synthetic manifest: each task also depends on its predecessor in the
+    prior stage and (within a stage) on the previous task every 5th slot."""
+    stages = []
+    for s in range(n_stages):
+        tasks = []
+        for i in range(per_stage):
+            deps = []
+            if s:
+                deps.append(f"s{s - 1}-t{i}")
+            if i % 5:
+                deps.append(f"s{s}-t{i - 1}")
+            tasks.append({"id": f"s{s}-t{i}", "title": "t", "depends": deps})
+        stages.append({"name": f"S{s}", "tasks": tasks})
+    return _make_manifest(stages)
+
+
+class TestTaskGraph:
+    def test_expanded_deps_match_build_graph(self):
+        for stages in (SIMPLE_LINEAR, FAN_OUT, FAN_IN, DIAMOND, INTRA_STAGE_DEPS):
+            m = _make_manifest(stages)
+            legacy = build_graph(m)
+            g = compile_graph(m)
+            assert {tid: g.deps_of(tid) for tid in g.task_ids} == legacy
+
+    def test_edge_count_is_linear(self):
+        m = _staged_manifest(n_stages=20, per_stage=50)
+        legacy_edges = sum(len(d) for d in build_graph(m).values())
+        g = compile_graph(m)
+        # Barrier nodes replace the all-pairs stage edges; prior-stage
+        # explicit depends are implied and dropped.
+        assert g.edge_count < 3 * len(m.tasks)
+        assert legacy_edges > 100 * g.edge_count
+
+    def test_schedule_waves_match_legacy_semantics(self):
+        m = _staged_manifest(n_stages=4, per_stage=10)
+        legacy = build_graph(m)
+        scheduler = DependencyDrivenScheduler(compile_graph(m))
+        done: set[str] = set()
+        while scheduler.is_active:
+            ready = scheduler.get_ready()
+            assert ready
+            for tid in ready:
+                assert legacy[tid] <= done
+            for tid in ready:
+                scheduler.mark_done(tid)
+                done.add(tid)
+        assert done == set(m.tasks)
+
+    def test_failure_skips_across_barriers(self):
+        m = _staged_manifest(n_stages=3, per_stage=3)
+        g = compile_graph(m)
+        scheduler = DependencyDrivenScheduler(g)
+        scheduler.get_ready()
+        skipped = scheduler.mark_failed("s0-t0")
+        # Intra-stage chain s0-t1, s0-t2 plus every later-stage task.
+        assert set(skipped) == {"s0-t1", "s0-t2"} | {
+            f"s{s}-t{i}" for s in (1, 2) for i in range(3)
+        }
+        assert scheduler.get_ready() == []
+        assert not scheduler.is_active
+
+    def test_static_propagation_uses_shared_index(self):
+        m = _make_manifest(DIAMOND)
+        g = compile_graph(m)
+        completed = {"task-1": TaskResult("task-1", "pass"), "task-3": TaskResult("task-3", "pass")}
+        _propagate_failure("task-2", g, completed)
+        assert completed["task-4"].status == "skipped"
+        assert completed["task-3"].status == "pass"
+
+    def test_forward_reference_cycle_through_barrier(self):
+        stages = [
+            {"name": "S1", "tasks": [{"id": "task-1", "title": "A", "depends": ["task-2"]}]},
+            {"name": "S2", "tasks": [{"id": "task-2", "title": "B"}]},
+        ]
+        m = _make_manifest(stages)
+        errors = validate_graph(compile_graph(m), m)
+        assert any("ycle" in e for e in errors)
+
+    def test_unknown_and_self_deps_reported(self):
+        stages = [{"name": "S1", "tasks": [
+            {"id": "task-1", "title": "A", "depends": ["task-1", "task-9"]},
+        ]}]
+        m = _make_manifest(stages)
+        errors = validate_graph(compile_graph(m), m)
+        assert any("itself" in e for e in errors)
+        assert any("task-9" in e for e in errors)
+
+    def test_manual_batching_on_compact_graph(self):
+        m = _make_manifest(INTRA_STAGE_DEPS + [
+            {"name": "S2", "tasks": [{"id": "task-4", "title": "D"}]},
+        ], mode="manual-batching")
+        g = compile_graph(m)
+        assert isinstance(g, TaskGraph)
+        assert _resolve_manual_batching(g, m) == [["task-1"], ["task-2"], ["task-3"], ["task-4"]]
+
+
 # ---------------------------------------------------------------------------
 # TestOutputRouting
 # ---------------------------------------------------------------------------
@@ -404,6 +504,77 @@ class TestOutputRouting:
         assert "VERDICT:" in prompt
 
 
+    def test_summarize_surfaces_trailing_report(self, tmp_path):
+        output = tmp_path / "output.md"
+        body = [f"Line {i}\n" for i in range(100)]
+        output.write_text("".join(body) + "FILES_CHANGED:\n- api.go\n- api_test.go\n\nVERDICT: CLEAN\n")
+
+        result = summarize_output(str(output), None, max_lines=10)
+        assert result.index("VERDICT: CLEAN") < result.index("Line 0")
+        assert "- api_test.go" in result
+        assert "Line 50" not in result
+
+    def test_fan_in_prompt_stays_within_budget(self, tmp_path):
+        task = Task(id="task-9", title="Fan-in", stage="S2")
+        all_tasks = {"task-9": task}
+        deps = {}
+        for i in range(8):
+            out = tmp_path / f"dep{i}.md"
+            out.write_text(
+                "Shared boilerplate that every executor repeats verbatim\n"
+                + "".join(f"dep {i} detail line {n}\n" for n in range(200))
+                + f"FILES_CHANGED:\n- pkg{i}.go\nVERDICT: CLEAN\n"
+            )
+            deps[f"task-{i}"] = TaskResult(task_id=f"task-{i}", status="pass", output_path=str(out))
+            all_tasks[f"task-{i}"] = Task(id=f"task-{i}", title=f"Dep {i}", stage="S1")
+
+        stats: dict = {}
+        prompt = build_prompt(task, "plan.md", deps, all_tasks, budget_chars=6000, stats=stats)
+        assert len(prompt) <= 6000
+        assert stats["chars"] == len(prompt) and stats["budget_chars"] == 6000
+        assert set(stats["deps"]) == set(deps)
+        for i in range(8):
+            assert f"- pkg{i}.go" in prompt
+        assert prompt.count("Shared boilerplate that every executor") == 1
+        assert "repeated from other dependencies omitted" in prompt
+        assert "VERDICT:" in prompt.split("## Task: Fan-in")[1]
+
+    def test_structured_parts_count_against_budget(self, tmp_path):
+        task = Task(id="task-99", title="Wide fan-in", stage="S2")
+        all_tasks = {"task-99": task}
+        deps = {}
+        for i in range(20):
+            out = tmp_path / f"dep{i}.md"
+            out.write_text(
+                "".join(f"dep {i} detail line {n}\n" for n in range(100))
+                + "FILES_CHANGED:\n" + "".join(f"- pkg{i}/file{n}.go\n" for n in range(120))
+                + f"VERDICT: CLEAN dep {i}\n"
+            )
+            verdict = tmp_path / f"dep{i}.md.verdict"
+            verdict.write_text(f"STATUS: pass\nSUMMARY: dep {i} " + "x" * 3000 + "\n")
+            deps[f"task-{i}"] = TaskResult(
+                task_id=f"task-{i}", status="pass",
+                output_path=str(out), verdict_path=str(verdict),
+            )
+            all_tasks[f"task-{i}"] = Task(id=f"task-{i}", title=f"Dep {i}", stage="S1")
+
+        stats: dict = {}
+        prompt = build_prompt(task, "plan.md", deps, all_tasks, budget_chars=24000, stats=stats)
+        assert len(prompt) <= 24000
+        assert all(d["chars"] <= d["allocated"] for d in stats["deps"].values())
+        for i in range(20):
+            assert f"### task-{i}: Dep {i}" in prompt
+
+        bounded = summarize_output(str(tmp_path / "dep0.md"), str(tmp_path / "dep0.md.verdict"), max_chars=500)
+        assert len(bounded) <= 500 and bounded.startswith("STATUS: pass")
+
+    def test_budget_shares_leftover_with_larger_dependencies(self):
+        from orchestrate import _allocate_budget
+
+        assert _allocate_budget([100, 5000, 5000], 3100) == [100, 1500, 1500]
+        assert _allocate_budget([10, 20], 1000) == [10, 20]
+
+
 # ---------------------------------------------------------------------------
 # TestLoadManifest (integration with YAML file)
 # ---------------------------------------------------------------------------
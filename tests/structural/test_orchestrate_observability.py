@@ -13,9 +13,12 @@ The real dispatch.sh is replaced by stubs via CLAVAIN_DISPATCH_SH.
 """
 
 import importlib.util
+import json
 import re
 import subprocess
 import sys
+import time
+import urllib.request
 from pathlib import Path
 
 import pytest
@@ -137,6 +140,65 @@ def test_progress_lines_emitted_per_task(orc, tmp_path, monkeypatch, capsys):
     assert "line_buffering=True" in src
 
 
+def test_event_stream_records_task_lifecycle(orc, tmp_path, monkeypatch):
+    """events.jsonl traces queued -> started -> phases -> finished per task."""
+    project = tmp_path / "proj"
+    project.mkdir()
+    stub = _write_stub(
+        tmp_path / "stub.sh",
+        'echo done > "$OUT"; printf "STATUS: pass\\n" > "$OUT.verdict"; exit 0',
+    )
+    manifest = _write_manifest(
+        tmp_path / "m.yaml",
+        """      - id: task-1
+        title: "first"
+        files: []
+        depends: []
+      - id: task-2
+        title: "second"
+        files: []
+        depends: [task-1]
+""",
+    )
+    monkeypatch.setenv("CLAVAIN_DISPATCH_SH", str(stub))
+
+    orc.orchestrate(str(manifest), project_dir=str(project), metrics_addr="127.0.0.1:0")
+
+    lines = (_run_dir(project) / "events.jsonl").read_text().splitlines()
+    events = [json.loads(l) for l in lines]
+    assert events[0]["event"] == "run_start" and events[-1]["event"] == "run_end"
+    assert [e["wave"] for e in events if e["event"] == "wave"] == [1, 2]
+    task1 = [e["event"] for e in events if e.get("task") == "task-1"]
+    assert task1[:3] == ["task_queued", "task_started", "phase_start"]
+    assert task1[-1] == "task_finished"
+    implement = next(e for e in events if e["event"] == "phase_end" and e["phase"] == "implement")
+    assert implement["duration_s"] >= 0
+    assert all(e["t"] >= 0 for e in events)
+
+
+def test_metrics_endpoint_serves_prometheus_and_json(orc):
+    events = orc.RunEvents(None, max_parallel=2)
+    events.queued("task-1")
+    events.started("task-1")
+    with events.phase("task-1", "review-0"):
+        pass
+    events.finished("task-1", "pass", rounds=1)
+    server = orc.serve_metrics("127.0.0.1:0", events)
+    try:
+        base = "http://127.0.0.1:%d" % server.server_address[1]
+        text = urllib.request.urlopen(base + "/metrics", timeout=5).read().decode()
+        snap = json.loads(urllib.request.urlopen(base + "/metrics.json", timeout=5).read())
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert "orchestrate_tasks_finished_total 1" in text
+    assert 'orchestrate_tasks_by_status{status="pass"} 1' in text
+    assert "orchestrate_review_latency_seconds_count 1" in text
+    assert snap["gauges"]["running"] == 0 and snap["gauges"]["idle_slots"] == 2
+    assert snap["counters"]["fix_rounds_total"] == 1
+    assert snap["histograms"]["queue_wait_seconds"]["count"] == 1
+
+
 def test_timeout_after_work_is_warn_and_dependents_run(orc, tmp_path, monkeypatch):
     """(c) Timeout with declared files on disk -> WARN, dependent executes."""
     project = tmp_path / "proj"
@@ -201,6 +263,99 @@ def test_missing_verdict_nonzero_exit_with_work_is_warn(orc, tmp_path, monkeypat
     assert results["task-1"].status == "warn"
 
 
+def _seed_timeout_history(project: Path, n: int = 5, quiet: float = 0.1) -> None:
+    for i in range(n):
+        d = project / ".clavain" / "orchestrate-runs" / "prior" / f"task-{i}"
+        d.mkdir(parents=True)
+        (d / "meta.json").write_text(json.dumps({
+            "tier": "fast", "engine": "codex", "returncode": 0, "timed_out": False,
+            "duration_s": 1.0, "max_quiet_s": quiet,
+        }))
+
+
+def _this_run(project: Path) -> str:
+    return next(p.name for p in (project / ".clavain" / "orchestrate-runs").iterdir() if p.name != "prior")
+
+
+def test_timeout_policy_learns_per_tier_and_engine(orc):
+    model = orc.TimeoutModel()
+    plain = model.policy("fast", "codex", 600, streaming=False)
+    assert (plain.learned, plain.stall_s, plain.hard_s) == (False, None, 600)
+    tmux = model.policy("fast", "codex", 600, streaming=True)
+    assert (tmux.stall_s, tmux.hard_s) == (600, 3600)
+
+    for quiet in (5, 10, 20, 30, 40):
+        model.observe({"tier": "fast", "cmd": ["dispatch.sh"], "returncode": 0,
+                       "duration_s": 100, "max_quiet_s": quiet})
+    model.observe({"tier": "fast", "engine": "codex", "returncode": -1,
+                   "timed_out": True, "duration_s": 600, "max_quiet_s": 600})
+    learned = model.policy("fast", "codex", 600, streaming=False)
+    assert learned.learned and learned.samples == 5
+    assert learned.stall_s == 120  # 3 × p95 gap of healthy runs
+    assert learned.hard_s == 3600
+    assert not model.policy("deep", "codex", 600, streaming=False).learned
+    assert not model.policy("fast", "claude", 600, streaming=False).learned
+
+
+def test_learned_stall_limit_kills_hung_dispatch_early(orc, tmp_path, monkeypatch):
+    project = tmp_path / "proj"
+    project.mkdir()
+    _seed_timeout_history(project)
+    monkeypatch.setattr(orc, "STALL_FLOOR_S", 1.0)
+    stub = _write_stub(tmp_path / "stub.sh", 'echo "thinking"; sleep 30')
+    manifest = _write_manifest(
+        tmp_path / "m.yaml",
+        """      - id: task-1
+        title: "hangs after one line"
+        files: [never.txt]
+        depends: []
+""",
+        timeout=20,
+    )
+    monkeypatch.setenv("CLAVAIN_DISPATCH_SH", str(stub))
+
+    start = time.monotonic()
+    results = orc.orchestrate(str(manifest), project_dir=str(project), review_enabled=False)
+
+    assert time.monotonic() - start < 10
+    assert results["task-1"].status == "error"
+    runs = project / ".clavain" / "orchestrate-runs"
+    meta = json.loads((runs / _this_run(project) / "task-1" / "meta.json").read_text())
+    assert meta["timed_out"] and meta["timeout_decision"].startswith("killed — stalled")
+    assert meta["timeout_policy"]["learned"] and meta["timeout_policy"]["stall_s"] == 1.0
+
+
+def test_learned_policy_extends_productive_dispatch(orc, tmp_path, monkeypatch):
+    project = tmp_path / "proj"
+    project.mkdir()
+    _seed_timeout_history(project)
+    monkeypatch.setattr(orc, "STALL_FLOOR_S", 1.0)
+    stub = _write_stub(
+        tmp_path / "stub.sh",
+        """for i in 1 2 3 4 5 6 7 8 9 10; do echo "step $i"; sleep 0.25; done
+echo done > "$OUT"; printf "STATUS: pass\\n" > "$OUT.verdict" """,
+    )
+    manifest = _write_manifest(
+        tmp_path / "m.yaml",
+        """      - id: task-1
+        title: "slow and steady"
+        files: []
+        depends: []
+""",
+        timeout=1,
+    )
+    monkeypatch.setenv("CLAVAIN_DISPATCH_SH", str(stub))
+
+    results = orc.orchestrate(str(manifest), project_dir=str(project), review_enabled=False)
+
+    assert results["task-1"].status == "pass", results["task-1"].error
+    runs = project / ".clavain" / "orchestrate-runs"
+    meta = json.loads((runs / _this_run(project) / "task-1" / "meta.json").read_text())
+    assert not meta["timed_out"]
+    assert meta["timeout_decision"].startswith("extended")
+    assert meta["max_quiet_s"] < 1.0
+
+
 def test_outcome_check_rejects_untouched_preexisting_files(orc, tmp_path):
     """(c) Pre-existing but untouched files do not fake a completed outcome."""
     project = tmp_path / "proj"
@@ -0,0 +1,142 @@
+"""Tests for orchestrate_remote.py — coordinator/worker dispatch split."""
+
+import json
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import orchestrate
+from orchestrate_remote import Coordinator, start_coordinator
+
+
+def test_expired_lease_requeues_to_another_worker():
+    coord = Coordinator()
+    results = []
+    t = threading.Thread(
+        target=lambda: results.append(coord.submit("verify", {"entries": []}, lease_s=0.1)),
+        daemon=True,
+    )
+    t.start()
+    first = coord.pull("w1", wait=2)
+    assert first is not None
+    time.sleep(0.2)
+    second = coord.pull("w2", wait=2)
+    assert second is not None and second["id"] == first["id"]
+
+    # The lapsed worker's late completion is refused; the new holder's lands.
+    assert not coord.complete("w1", first["id"], {"ok": True, "report": "late"})
+    assert coord.complete("w2", second["id"], {"ok": True, "report": "fresh"})
+    t.join(2)
+    assert results == [{"ok": True, "report": "fresh", "worker": "w2"}]
+
+
+def test_lease_exhaustion_fails_item():
+    coord = Coordinator(max_attempts=1)
+    results = []
+    t = threading.Thread(
+        target=lambda: results.append(coord.submit("verify", {}, lease_s=0.05)),
+        daemon=True,
+    )
+    t.start()
+    assert coord.pull("w1", wait=2) is not None
+    time.sleep(0.1)
+    assert coord.pull("w1", wait=0.1) is None
+    t.join(2)
+    assert "lost its lease" in results[0]["error"]
+
+
+def test_token_is_enforced():
+    assert Coordinator(token="s3cret").authorized("s3cret")
+    assert not Coordinator(token="s3cret").authorized("wrong")
+    assert Coordinator().authorized(None)
+
+
+def test_non_loopback_bind_requires_token():
+    with pytest.raises(ValueError, match="ORC_WORKER_TOKEN"):
+        start_coordinator("0.0.0.0:0")
+    server, _ = start_coordinator("localhost:0")
+    server.shutdown()
+    server.server_close()
+
+
+STUB = """#!/bin/bash
+while [[ $# -gt 0 ]]; do
+  case "$1" in
+    -o) OUT="$2"; shift 2;;
+    *) shift;;
+  esac
+done
+echo "dispatched by ${ORC_WORKER_ID:-coordinator}" > "$OUT"
+printf "STATUS: pass\\n" > "$OUT.verdict"
+"""
+
+PLAN = """# Plan
+
+## Task 1: first
+<verify>
+- run: `echo ran-on-$ORC_WORKER_ID`
+  expect: contains "ran-on-w"
+</verify>
+
+## Task 2: second
+"""
+
+
+def test_workers_run_dispatch_and_verify(project_root: Path, tmp_path, monkeypatch):
+    pytest.importorskip("yaml")
+    stub = tmp_path / "stub.sh"
+    stub.write_text(STUB)
+    stub.chmod(0o755)
+    monkeypatch.setenv("CLAVAIN_DISPATCH_SH", str(stub))
+    project = tmp_path / "proj"
+    project.mkdir()
+    plan = tmp_path / "plan.md"
+    plan.write_text(PLAN)
+    manifest = tmp_path / "m.yaml"
+    manifest.write_text(
+        "version: 1\nmode: dependency-driven\ntier: fast\nmax_parallel: 2\n"
+        "timeout_per_task: 30\nstages:\n  - name: s1\n    tasks:\n"
+        "      - id: task-1\n        title: first\n"
+        "  - name: s2\n    tasks:\n"
+        "      - id: task-2\n        title: second\n"
+    )
+
+    server, remote = start_coordinator("127.0.0.1:0")
+    port = server.server_address[1]
+    workers = [
+        subprocess.Popen(
+            [sys.executable, str(project_root / "scripts" / "orchestrate_remote.py"),
+             "worker", "--coordinator", f"127.0.0.1:{port}", "--project-dir", str(project),
+             "--work-dir", str(tmp_path / f"work-{i}"), "--worker-id", f"w{i}",
+             "--exit-when-idle", "2"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        for i in (1, 2)
+    ]
+    try:
+        results = orchestrate.orchestrate(
+            str(manifest), plan_path=str(plan), project_dir=str(project),
+            no_push_guard=True, remote=remote,
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+        for w in workers:
+            w.wait(timeout=30)
+
+    assert results["task-1"].status == "pass"
+    assert results["task-2"].status == "pass"
+    run_dir = next((project / ".clavain" / "orchestrate-runs").iterdir())
+    meta = json.loads((run_dir / "task-1" / "meta.json").read_text())
+    assert meta["worker"] in ("w1", "w2")
+    assert (run_dir / "task-1" / "output.md").read_text().startswith("dispatched by w")
+    # The <verify> gate ran on a worker; the report landed on the coordinator.
+    verify = (run_dir / "task-1" / "verify-0.txt").read_text()
+    assert verify.startswith("PASS") and "verified on worker w" in verify
+    # The journal stays on the coordinator.
+    entries = [json.loads(l) for l in (run_dir / "journal.jsonl").read_text().splitlines()]
+    assert {e["task"] for e in entries if e.get("event") == "task"} == {"task-1", "task-2"}
@@ -394,3 +394,31 @@ def test_live_guard_of_concurrent_run_left_alone(orc, tmp_path):
 
     orc._sweep_stranded_guards({str(project)})
     assert (hooks / "pre-push").read_text() == guard_text
+
+
+def test_setup_failure_after_guard_install_removes_guard(orc, tmp_path, monkeypatch):
+    """The metrics server failing to bind must not strand the push guard."""
+    import socket
+
+    project = tmp_path / "proj"
+    project.mkdir()
+    _git_repo(project)
+    stub = _write_stub(tmp_path / "stub.sh", 'echo ok > "$OUT"')
+    manifest = _write_manifest(
+        tmp_path / "m.yaml",
+        """      - id: task-1
+        title: "t"
+        depends: []
+""",
+    )
+    monkeypatch.setenv("CLAVAIN_DISPATCH_SH", str(stub))
+    with socket.socket() as busy:
+        busy.bind(("127.0.0.1", 0))
+        busy.listen()
+        port = busy.getsockname()[1]
+        with pytest.raises(OSError):
+            orc.orchestrate(
+                str(manifest), project_dir=str(project), review_enabled=False,
+                metrics_addr=f"127.0.0.1:{port}",
+            )
+    assert not (project / ".git" / "hooks" / "pre-push").exists()
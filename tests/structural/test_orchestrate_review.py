@@ -11,7 +11,10 @@ technique as test_orchestrate_observability.py.
 """
 
 import importlib.util
+import json
+import subprocess
 import sys
+import time
 from pathlib import Path
 
 import pytest
@@ -51,6 +54,18 @@ Words about the thing.
 ## Task 2: Docs only
 
 No verify block here.
+
+## Task 3: Checks
+
+<verify>
+- run: `lint`
+  expect: exit 0
+  independent: true
+- run: `test`
+  expect: exit 0
+  cache: no
+  independent: yes
+</verify>
 """
 
 
@@ -59,13 +74,17 @@ class TestParsePlanTasks:
         plan = tmp_path / "plan.md"
         plan.write_text(PLAN)
         parsed = orc.parse_plan_tasks(str(plan))
-        assert set(parsed) == {1, 2}
+        assert set(parsed) == {1, 2, 3}
         assert "Build the thing" in parsed[1].section
         assert parsed[1].verify == [
             {"run": "true", "expect": "exit 0"},
             {"run": "echo hello world", "expect": 'contains "hello"'},
         ]
         assert parsed[2].verify == []
+        assert parsed[3].verify == [
+            {"run": "lint", "expect": "exit 0", "independent": True},
+            {"run": "test", "expect": "exit 0", "cache": False, "independent": True},
+        ]
         # Sections must not bleed into each other.
         assert "Docs only" not in parsed[1].section
 
@@ -111,6 +130,197 @@ class TestRunVerifyEntries:
         assert not ok
 
 
+    def test_entries_run_concurrently_with_timing(self, orc, tmp_path, monkeypatch):
+        monkeypatch.setattr(orc, "VERIFY_WORKERS", 2)
+        record = tmp_path / "verify-0.json"
+        start = time.monotonic()
+        ok, report = orc.run_verify_entries(
+            [{"run": "sleep 0.6", "expect": "exit 0", "independent": True}] * 2,
+            str(tmp_path), record_path=str(record),
+        )
+        assert ok
+        assert time.monotonic() - start < 1.1
+        data = json.loads(record.read_text())
+        assert [e["duration_s"] >= 0.5 for e in data["entries"]] == [True, True]
+        assert "s]" in report  # per-entry timing in the report
+
+    def test_unmarked_entries_run_in_plan_order(self, orc, tmp_path, monkeypatch):
+        monkeypatch.setattr(orc, "VERIFY_WORKERS", 4)
+        log = tmp_path / "order.log"
+        entries = [
+            {"run": f"sleep 0.3 && echo first >> {log}", "expect": "exit 0"},
+            {"run": f"echo second >> {log}", "expect": "exit 0"},
+        ]
+        ok, _ = orc.run_verify_entries(entries, str(tmp_path))
+        assert ok
+        assert log.read_text().split() == ["first", "second"]
+
+    def test_cache_keys_on_named_inputs_only(self, orc, tmp_path):
+        repo = tmp_path / "repo"
+        _diff_repo(repo, {"a.txt": "one\n", "helper.sh": "echo v1\n"})
+        (repo / "helper.sh").write_text("echo v2\n")
+        run_dir = repo / ".clavain" / "orchestrate-runs" / "r1"
+        run_dir.mkdir(parents=True)
+        cache = orc.VerifyCache(str(run_dir / "verify-cache.json"))
+        entries = [
+            {"run": "sh helper.sh", "expect": 'contains "v2"'},
+            {"run": "ls ./", "expect": "exit 0"},
+            {"run": "cat a.txt", "expect": "exit 0", "cache": False},
+        ]
+
+        ok1, _ = orc.run_verify_entries(entries, str(repo), files=["a.txt"], cache=cache)
+        # The cache file written into the (untracked) run dir and unrelated
+        # untracked files must not change any key.
+        (repo / "notes.txt").write_text("draft\n")
+        _, report2 = orc.run_verify_entries(entries, str(repo), files=["a.txt"], cache=cache)
+        assert ok1 and report2.count("[cached]") == 1
+        assert "`sh helper.sh` (expect contains \"v2\") [cached]" in report2
+        assert "`cat a.txt` (expect exit 0) [cached]" not in report2
+
+        # Re-editing an already-dirty input must not reuse the earlier PASS.
+        (repo / "helper.sh").write_text("echo v3\n")
+        ok3, report3 = orc.run_verify_entries(entries[:1], str(repo), files=["a.txt"], cache=cache)
+        assert not ok3 and "[cached]" not in report3
+
+    def test_whole_project_gate_ignores_run_dir(self, orc, tmp_path):
+        repo = tmp_path / "repo"
+        _diff_repo(repo, {"a.txt": "one\n"})
+        run_dir = repo / ".clavain" / "orchestrate-runs" / "r1"
+        run_dir.mkdir(parents=True)
+        cache = orc.VerifyCache(str(run_dir / "verify-cache.json"))
+        entries = [{"run": "ls ./", "expect": "exit 0"}]
+
+        orc.run_verify_entries(entries, str(repo), cache=cache)
+        (run_dir / "task-1.log").write_text("more artifacts\n")
+        _, report = orc.run_verify_entries(entries, str(repo), cache=cache)
+        assert "[cached]" in report
+
+    def test_unchanged_gate_is_cached_until_input_changes(self, orc, tmp_path):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        (repo / "a.txt").write_text("one\n")
+        git = ["git", "-C", str(repo), "-c", "user.email=t@t", "-c", "user.name=t"]
+        subprocess.run(git + ["init", "-q"], check=True)
+        subprocess.run(git + ["add", "a.txt"], check=True)
+        subprocess.run(git + ["commit", "-qm", "init"], check=True)
+
+        counter = tmp_path / "runs"
+        entries = [{"run": f"cat a.txt && echo x >> {counter}", "expect": 'contains "one"'}]
+        cache = orc.VerifyCache(str(tmp_path / "verify-cache.json"))
+
+        ok1, _ = orc.run_verify_entries(entries, str(repo), files=["a.txt"], cache=cache)
+        ok2, report2 = orc.run_verify_entries(entries, str(repo), files=["a.txt"], cache=cache)
+        assert ok1 and ok2
+        assert "[cached]" in report2
+        assert counter.read_text().count("x") == 1
+
+        # A reloaded cache (resumed run) still hits.
+        reloaded = orc.VerifyCache(str(tmp_path / "verify-cache.json"))
+        _, report3 = orc.run_verify_entries(entries, str(repo), files=["a.txt"], cache=reloaded)
+        assert "[cached]" in report3
+
+        (repo / "a.txt").write_text("two\n")
+        subprocess.run(git + ["commit", "-qam", "change"], check=True)
+        ok4, report4 = orc.run_verify_entries(entries, str(repo), files=["a.txt"], cache=cache)
+        assert not ok4
+        assert "[cached]" not in report4
+        assert counter.read_text().count("x") == 2
+
+
+def _diff_repo(path: Path, files: dict[str, str]) -> list[str]:
+    path.mkdir()
+    git = ["git", "-C", str(path), "-c", "user.email=t@t", "-c", "user.name=t"]
+    subprocess.run(git + ["init", "-q"], check=True)
+    for name, text in files.items():
+        (path / name).write_text(text)
+    subprocess.run(git + ["add", "."], check=True)
+    subprocess.run(git + ["commit", "-qm", "init"], check=True)
+    return git
+
+
+class TestTaskDiff:
+    def test_declared_files_first_and_bounded(self, orc, tmp_path):
+        repo = tmp_path / "repo"
+        git = _diff_repo(repo, {"aaa_generated.txt": "x\n", "zz_real.py": "a = 1\n"})
+        head0 = subprocess.run(git + ["rev-parse", "HEAD"], capture_output=True, text=True).stdout.strip()
+        (repo / "aaa_generated.txt").write_text("".join(f"line {i}\n" for i in range(5000)))
+        (repo / "zz_real.py").write_text("a = 2\n")
+
+        text = orc.DiffService().task_diff(str(repo), head0, ["zz_real.py"], max_lines=60)
+        assert len(text.splitlines()) <= 62
+        assert text.index("zz_real.py b/zz_real.py") < text.index("aaa_generated.txt b/")
+        assert "+a = 2" in text
+        assert "truncated at 60 lines" in text
+
+    def test_fix_round_rediffs_only_touched_files(self, orc, tmp_path, monkeypatch):
+        repo = tmp_path / "repo"
+        git = _diff_repo(repo, {"a.py": "a\n", "b.py": "b\n"})
+        head0 = subprocess.run(git + ["rev-parse", "HEAD"], capture_output=True, text=True).stdout.strip()
+        (repo / "a.py").write_text("a2\n")
+        (repo / "b.py").write_text("b2\n")
+        (repo / "new.txt").write_text("fresh\n")
+
+        svc = orc.DiffService()
+        fetched: list[list[str]] = []
+        real = svc._stream_chunks
+
+        def spy(project_dir, base_args, paths, budget):
+            fetched.append(list(paths))
+            return real(project_dir, base_args, paths, budget)
+
+        monkeypatch.setattr(svc, "_stream_chunks", spy)
+        first = svc.task_diff(str(repo), head0, ["a.py"])
+        assert "+a2" in first and "+b2" in first and "fresh" in first
+
+        subprocess.run(git + ["commit", "-qam", "fix"], check=True)
+        (repo / "b.py").write_text("b3\n")
+        second = svc.task_diff(str(repo), head0, ["a.py"])
+        assert "+b3" in second and "+a2" in second
+        assert fetched == [["a.py"], ["b.py"], ["b.py"]]
+
+
+class TestRepoState:
+    def _rev_parse(self, git, ref="HEAD"):
+        return subprocess.run(git + ["rev-parse", ref], capture_output=True, text=True).stdout.strip()
+
+    def test_head_read_without_spawning_git(self, orc, tmp_path):
+        repo = tmp_path / "repo"
+        git = _diff_repo(repo, {"a.py": "a\n"})
+        state = orc.RepoState(str(repo))
+        assert state.head() == self._rev_parse(git)
+        subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", "two"], check=True)
+        assert state.head() == self._rev_parse(git)
+        subprocess.run(git + ["pack-refs", "--all", "--prune"], check=True)
+        assert state.head() == self._rev_parse(git)
+        subprocess.run(git + ["checkout", "-q", "--detach", "HEAD~1"], check=True)
+        assert state.head() == self._rev_parse(git)
+        assert state.spawns == 1  # git-dir discovery only
+
+        (tmp_path / "plain").mkdir()
+        assert orc.RepoState(str(tmp_path / "plain")).head() is None
+        subprocess.run(["git", "init", "-q", str(tmp_path / "unborn")], check=True)
+        assert orc.RepoState(str(tmp_path / "unborn")).head() is None
+
+    def test_status_cached_until_index_head_or_write(self, orc, tmp_path):
+        repo = tmp_path / "repo"
+        git = _diff_repo(repo, {"a.py": "a\n"})
+        state = orc.RepoState(str(repo))
+        (repo / "a.py").write_text("a2\n")
+        assert state.query("status", "--porcelain") == " M a.py\n"
+        before = state.spawns
+        assert state.query("status", "--porcelain") == " M a.py\n"
+        assert state.spawns == before
+
+        with state.writing():
+            (repo / "b.py").write_text("b\n")
+            assert "?? b.py" in state.query("status", "--porcelain")
+            assert "?? b.py" in state.query("status", "--porcelain")
+        assert state.spawns == before + 2  # never cached while a writer runs
+
+        subprocess.run(git + ["add", "b.py"], check=True)
+        assert "A  b.py" in state.query("status", "--porcelain")
+
+
 class TestExtractQuestion:
     def test_question_line(self, orc, tmp_path):
         out = tmp_path / "output.md"
@@ -406,3 +616,109 @@ printf "STATUS: pass\\n" > "$OUT.verdict" """,
     assert results["task-1"].status == "pass"
     run_dir = next((project / ".clavain" / "orchestrate-runs").iterdir())
     assert not (run_dir / "task-1" / "review-1.prompt.md").exists()
+
+
+# ---------------------------------------------------------------------------
+# Speculative dispatch (--speculate)
+# ---------------------------------------------------------------------------
+
+SPEC_STUB = """case "$BASE" in
+  review-1.md) {review1};;
+  review-*) echo "VERDICT: CLEAN" > "$OUT"
+            printf -- "--- VERDICT ---\\nSTATUS: pass\\n---\\n" > "$OUT.verdict";;
+  *) echo "$TID $BASE" > "$PROJ/$TID.txt"; echo "VERDICT: CLEAN" > "$OUT"
+     printf "STATUS: pass\\n" > "$OUT.verdict";;
+esac"""
+
+CLEAN_REVIEW = """echo "VERDICT: CLEAN" > "$OUT"
+               printf -- "--- VERDICT ---\\nSTATUS: pass\\n---\\n" > "$OUT.verdict\""""
+
+
+def _speculation_setup(tmp_path: Path, review1: str) -> tuple[Path, Path]:
+    project = tmp_path / "proj"
+    project.mkdir()
+    _git_repo(project)
+    # Journaled history: four first-review approvals → p = 5/6.
+    prior = project / ".clavain" / "orchestrate-runs" / "prior"
+    prior.mkdir(parents=True)
+    (prior / "journal.jsonl").write_text("".join(
+        json.dumps({"event": "task", "task": f"t{i}", "status": "pass",
+                    "rounds": 0, "review_verdict": "r.verdict"}) + "\n"
+        for i in range(4)
+    ))
+    _write_stub(tmp_path / "stub.sh", SPEC_STUB.replace("{review1}", review1))
+    manifest = _write_manifest(
+        tmp_path / "m.yaml",
+        """      - id: task-1
+        title: "predecessor"
+        files: [task-1.txt]
+        depends: []
+      - id: task-2
+        title: "dependent"
+        files: [task-2.txt]
+        depends: [task-1]
+""",
+    )
+    return project, manifest
+
+
+def _this_run(project: Path) -> Path:
+    return next(p for p in (project / ".clavain" / "orchestrate-runs").iterdir() if p.name != "prior")
+
+
+def test_rounds_model_reads_reviewed_journal_entries(orc, tmp_path):
+    run = tmp_path / "runs" / "r1"
+    run.mkdir(parents=True)
+    (run / "journal.jsonl").write_text("\n".join(json.dumps(e) for e in [
+        {"event": "task", "task": "a", "status": "pass", "rounds": 0, "review_verdict": "v"},
+        {"event": "task", "task": "b", "status": "pass", "rounds": 1, "review_verdict": "v"},
+        {"event": "task", "task": "c", "status": "escalated", "rounds": 2, "review_verdict": "v"},
+        {"event": "task", "task": "d", "status": "pass", "rounds": 0, "review_verdict": None},
+        {"event": "task", "task": "e", "status": "error", "rounds": 0, "review_verdict": "v"},
+    ]))
+    model = orc.RoundsModel.from_runs(str(tmp_path / "runs"))
+    assert (model.first_pass, model.total) == (1, 3)
+    assert model.p_first_pass == pytest.approx(2 / 5)
+    assert orc.RoundsModel().p_first_pass == 0.5  # no history: below threshold
+
+
+def test_speculative_dependent_adopted_when_predecessor_approved(orc, tmp_path, monkeypatch):
+    project, manifest = _speculation_setup(tmp_path, CLEAN_REVIEW)
+    monkeypatch.setenv("CLAVAIN_DISPATCH_SH", str(tmp_path / "stub.sh"))
+    results = orc.orchestrate(str(manifest), project_dir=str(project), speculate=True)
+
+    assert results["task-1"].status == "pass"
+    assert results["task-2"].status == "pass", results["task-2"].error
+    assert "speculative implement adopted" in (results["task-2"].error or "")
+    # task-2's implement ran once, in the worktree; its delta landed here.
+    assert (project / "task-2.txt").read_text() == "task-2 speculative.output.md\n"
+    task2 = _this_run(project) / "task-2"
+    assert (task2 / "speculative.meta.json").exists()
+    assert not (task2 / "meta.json").exists()
+    assert (task2 / "review-1.prompt.md").exists()
+    worktrees = subprocess.run(["git", "-C", str(project), "worktree", "list"],
+                               capture_output=True, text=True).stdout
+    assert len(worktrees.splitlines()) == 1
+
+
+def test_speculative_dependent_rolled_back_when_review_needs_fixes(orc, tmp_path, monkeypatch):
+    project, manifest = _speculation_setup(
+        tmp_path,
+        """if [ "$TID" = task-2 ]; then """ + CLEAN_REVIEW + """
+               else echo "VERDICT: NEEDS_ATTENTION redo it" > "$OUT"
+               printf -- "--- VERDICT ---\\nSTATUS: warn\\n---\\n" > "$OUT.verdict"; fi""",
+    )
+    monkeypatch.setenv("CLAVAIN_DISPATCH_SH", str(tmp_path / "stub.sh"))
+    results = orc.orchestrate(str(manifest), project_dir=str(project), speculate=True)
+
+    assert results["task-1"].rounds == 1
+    assert results["task-2"].status == "pass", results["task-2"].error
+    assert "speculative" not in (results["task-2"].error or "")
+    # Re-dispatched for real after task-1's fix round; nothing leaked.
+    assert (project / "task-2.txt").read_text() == "task-2 output.md\n"
+    task2 = _this_run(project) / "task-2"
+    assert (task2 / "speculative.meta.json").exists()
+    assert (task2 / "meta.json").exists()
+    events = [json.loads(l) for l in (_this_run(project) / "events.jsonl").read_text().splitlines()]
+    kinds = [e["event"] for e in events if e["event"].startswith("speculate")]
+    assert kinds == ["speculate_start", "speculate_discarded"]
@@ -0,0 +1,148 @@
+"""Tests for orchestrate_service.py — shared agent pool across concurrent runs."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import orchestrate
+from orchestrate_service import AgentPool, make_server, request
+
+
+def _start(pool: AgentPool, run_id: str, log: list[str]) -> threading.Thread:
+    def body():
+        try:
+            pool.acquire(run_id)
+            log.append(run_id)
+        except orchestrate.RunCancelled:
+            log.append(f"{run_id}:cancelled")
+
+    t = threading.Thread(target=body, daemon=True)
+    t.start()
+    return t
+
+
+def _wait_for(cond, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not cond():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.01)
+
+
+def test_fair_share_prefers_run_holding_fewer_agents():
+    pool = AgentPool(max_agents=2)
+    pool.register("a", 5)
+    pool.register("b", 5)
+    pool.acquire("a")
+    pool.acquire("a")
+    log: list[str] = []
+    a3 = _start(pool, "a", log)
+    _wait_for(lambda: pool.snapshot()["waiting"] == 1)
+    b1 = _start(pool, "b", log)
+    _wait_for(lambda: pool.snapshot()["waiting"] == 2)
+
+    # a's third request is older, but b holds nothing — b goes first.
+    pool.release("a")
+    b1.join(2)
+    assert log == ["b"]
+    pool.release("a")
+    a3.join(2)
+    assert log == ["b", "a"]
+
+
+def test_per_run_cap_and_pause_and_cancel():
+    pool = AgentPool(max_agents=4)
+    pool.register("a", 1)
+    pool.acquire("a")
+    log: list[str] = []
+    waiter = _start(pool, "a", log)
+    _wait_for(lambda: pool.snapshot()["waiting"] == 1)
+    assert pool.snapshot()["in_use"] == 1  # per-run cap holds despite free agents
+
+    pool.release("a")
+    waiter.join(2)
+    assert log == ["a"]
+
+    pool.pause("a")
+    pool.release("a")
+    paused = _start(pool, "a", log)
+    _wait_for(lambda: pool.snapshot()["waiting"] == 1)
+    assert log == ["a"]
+    pool.cancel("a")
+    paused.join(2)
+    assert log == ["a", "a:cancelled"]
+
+
+STUB = """#!/bin/bash
+while [[ $# -gt 0 ]]; do
+  case "$1" in
+    -o) OUT="$2"; shift 2;;
+    *) shift;;
+  esac
+done
+echo "start $(date +%s%N)" >> "{log}"
+sleep 0.4
+printf "STATUS: pass\\n" > "$OUT.verdict"
+echo "end $(date +%s%N)" >> "{log}"
+"""
+
+
+def _manifest(path: Path, n: int) -> Path:
+    tasks = "".join(
+        f"      - id: task-{i}\n        title: \"t{i}\"\n" for i in range(1, n + 1)
+    )
+    path.write_text(
+        "version: 1\nmode: dependency-driven\ntier: fast\nmax_parallel: 3\n"
+        "timeout_per_task: 30\nstages:\n  - name: s\n    tasks:\n" + tasks
+    )
+    return path
+
+
+def test_concurrent_runs_share_global_cap(tmp_path, monkeypatch):
+    pytest.importorskip("yaml")
+    log = tmp_path / "dispatch.log"
+    stub = tmp_path / "stub.sh"
+    stub.write_text(STUB.replace("{log}", str(log)))
+    stub.chmod(0o755)
+    monkeypatch.setenv("CLAVAIN_DISPATCH_SH", str(stub))
+
+    sock = str(tmp_path / "svc.sock")
+    server = make_server(sock, max_agents=2)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        run_ids = []
+        for name in ("p1", "p2"):
+            project = tmp_path / name
+            project.mkdir()
+            reply = next(request(sock, {
+                "op": "submit", "manifest": str(_manifest(tmp_path / f"{name}.yaml", 3)),
+                "project_dir": str(project), "no_review": True, "no_push_guard": True,
+            }))
+            assert reply["ok"], reply
+            run_ids.append(reply["run_id"])
+
+        for run_id in run_ids:
+            events = list(request(sock, {"op": "watch", "run_id": run_id}))
+            assert events[-1]["event"] == "end"
+            assert events[-1]["state"] == "done"
+            assert events[-1]["counts"]["pass"] == 3
+            tasks = [e["entry"]["task"] for e in events if e.get("entry", {}).get("event") == "task"]
+            assert sorted(tasks) == ["task-1", "task-2", "task-3"]
+
+        status = next(request(sock, {"op": "status"}))
+        assert {r["run_id"] for r in status["runs"]} == set(run_ids)
+        bad = next(request(sock, {"op": "cancel", "run_id": run_ids[0]}))
+        assert not bad["ok"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # Six tasks, each manifest allowing 3 — the global cap of 2 still held.
+    live = peak = 0
+    stamps = sorted((int(ts), kind) for kind, ts in (l.split() for l in log.read_text().splitlines()))
+    for _, kind in stamps:
+        live += 1 if kind == "start" else -1
+        peak = max(peak, live)
+    assert peak == 2
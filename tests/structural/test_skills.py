@@ -1,31 +1,18 @@
 """Tests for skill directories and SKILL.md files."""
 
 import re
-from pathlib import Path
 
 import pytest
 
-from helpers import parse_frontmatter as _parse_frontmatter
+from helpers import CORPUS, parse_frontmatter as _parse_frontmatter
 
 
-def _get_skill_dirs():
-    """Get all skill directories containing SKILL.md at collection time."""
-    skills_dir = Path(__file__).resolve().parent.parent.parent / "skills"
-    return sorted(
-        d for d in skills_dir.iterdir()
-        if d.is_dir() and (d / "SKILL.md").exists()
-    )
-
+SKILL_DIRS = CORPUS.skill_dirs
 
-SKILL_DIRS = _get_skill_dirs()
 
-
-def test_skill_count(skills_dir, plugin_json):
+def test_skill_count(corpus, plugin_json):
     """Skill count on filesystem matches plugin.json manifest."""
-    dirs = sorted(
-        d for d in skills_dir.iterdir()
-        if d.is_dir() and (d / "SKILL.md").exists()
-    )
+    dirs = corpus.skill_dirs
     expected = len(plugin_json.get("skills", []))
     assert len(dirs) == expected, (
         f"plugin.json lists {expected} skills, filesystem has {len(dirs)}: {[d.name for d in dirs]}"
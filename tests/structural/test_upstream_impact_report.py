@@ -0,0 +1,128 @@
+"""Tests for scripts/upstream-impact-report.py local-clone mode and API caching."""
+
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "upstream-impact-report.py"
+
+_spec = importlib.util.spec_from_file_location("upstream_impact_report", SCRIPT)
+impact = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(impact)
+
+
+def _git(repo, *args):
+    return subprocess.run(
+        ["git", "-C", str(repo), *args], capture_output=True, text=True, check=True,
+    ).stdout.strip()
+
+
+def _clone(tmp_path):
+    repo = tmp_path / "upstreams" / "demo"
+    repo.mkdir(parents=True)
+    _git(repo, "init", "-q", "-b", "main")
+    _git(repo, "config", "user.email", "t@example.com")
+    _git(repo, "config", "user.name", "t")
+    (repo / "docs").mkdir()
+    (repo / "docs" / "guide.md").write_text("one\n")
+    (repo / "old.md").write_text("rename me\n" * 20)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "initial")
+    base = _git(repo, "rev-parse", "HEAD")
+    (repo / "docs" / "guide.md").write_text("two\n")
+    _git(repo, "commit", "-q", "-am", "feat: add guide section\n\nlonger body")
+    _git(repo, "mv", "old.md", "new.md")
+    _git(repo, "commit", "-q", "-m", "Remove deprecated flag")
+    return repo, base
+
+
+def _upstream(base):
+    return {
+        "name": "demo", "url": "https://github.com/acme/demo.git", "branch": "main",
+        "lastSyncedCommit": base, "basePath": "", "fileMap": {"docs/*.md": "x"},
+    }
+
+
+class _Head(impact.GitHubSource):
+    """Branch head from a fixed SHA; compare goes through gh_json."""
+
+    def __init__(self, sha, cache_dir=None, gh_json=None):
+        super().__init__(cache_dir, gh_json or self._no_compare)
+        self.sha = sha
+
+    def head(self, repo, branch):
+        return self.sha
+
+    @staticmethod
+    def _no_compare(path):
+        raise AssertionError(f"compare API used: {path}")
+
+
+def test_local_clone_matches_api_shape(tmp_path):
+    repo, base = _clone(tmp_path)
+    row = impact.collect_impact(_upstream(base), _Head(_git(repo, "rev-parse", "HEAD")), repo)
+    assert row["source"] == "local" and not row["possibly_stale"]
+    assert row["ahead_commits"] == 2
+    assert row["head_commit"] == _git(repo, "rev-parse", "HEAD")
+    assert row["mapped_changed_files"] == ["docs/guide.md"]
+    assert row["changed_file_count"] == 2  # guide + the rename's new path
+    assert [c["headline"] for c in row["top_commits"]] == ["feat: add guide section", "Remove deprecated flag"]
+    assert row["feature_signal_count"] == 1 and row["breaking_signal_count"] == 1
+
+
+def test_unfetched_clone_uses_api_head(tmp_path):
+    # The branch moved past the clone's HEAD: the clone cannot answer base..head.
+    repo, base = _clone(tmp_path)
+    calls = []
+
+    def gh_json(path):
+        calls.append(path)
+        return {"total_commits": 3, "files": [], "commits": []}
+
+    row = impact.collect_impact(_upstream(base), _Head("c" * 40, gh_json=gh_json), repo)
+    assert row["source"] == "api" and row["head_commit"] == "c" * 40
+    assert row["ahead_commits"] == 3
+    assert calls == [f"repos/acme/demo/compare/{base}...{'c' * 40}"]
+
+
+def test_unknown_base_falls_back_to_api_and_caches_compare(tmp_path):
+    repo, _ = _clone(tmp_path)
+    calls = []
+
+    def gh_json(path):
+        calls.append(path)
+        return {"total_commits": 1, "files": [{"filename": "docs/a.md", "status": "added"}],
+                "commits": [{"sha": "f" * 40, "commit": {"message": "add a", "author": {}}}]}
+
+    upstream = _upstream("a" * 40)
+    first = impact.collect_impact(upstream, _Head("b" * 40, tmp_path / "cache", gh_json), repo)
+    second = impact.collect_impact(upstream, _Head("b" * 40, tmp_path / "cache", gh_json), repo)
+    assert first["source"] == "api" and first == second
+    assert calls == [f"repos/acme/demo/compare/{'a' * 40}...{'b' * 40}"]
+
+
+def test_parse_included_response():
+    out = 'HTTP/2.0 304 Not Modified\r\nEtag: W/"abc"\r\n\r\n'
+    assert impact.parse_included_response(out) == (304, 'W/"abc"', "")
+    out = 'HTTP/2.0 200 OK\nETag: "x"\n\n{"sha": "1"}'
+    assert impact.parse_included_response(out) == (200, '"x"', '{"sha": "1"}')
+
+
+def test_cli_offline_report(tmp_path):
+    repo, base = _clone(tmp_path)
+    config = tmp_path / "upstreams.json"
+    config.write_text(json.dumps({"upstreams": [_upstream(base), {**_upstream(base), "name": "absent"}]}))
+    out = subprocess.run(
+        [sys.executable, str(SCRIPT), "--config", str(config), "--source", "local",
+         "--upstreams-dir", str(repo.parent), "--no-cache", "--markdown-out", str(tmp_path / "r.md")],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    rows = json.loads(out)["upstreams"]
+    assert [r["name"] for r in rows] == ["demo", "absent"]
+    assert rows[0]["ahead_commits"] == 2 and rows[0]["possibly_stale"]
+    assert "no usable local clone" in rows[1]["error"]
+    markdown = (tmp_path / "r.md").read_text()
+    assert "Error: no usable local clone" in markdown
+    assert "pinned (local HEAD, possibly stale)" in markdown
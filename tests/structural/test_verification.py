@@ -332,3 +332,72 @@ def test_cli_emit_picks_up_run_uuid_env(
     assert result.returncode == 0
     parsed = json.loads(log.read_text().strip())
     assert parsed["run_uuid"] == "env-pickup-456"
+
+
+# --- spooled emission (drain / collect) -------------------------------------
+
+
+def _spool_line(name: str, state: str, evidence: str, *, decision: str = "",
+                run_uuid: str = "", ts: int = 1700000000000) -> str:
+    def esc(s: str) -> str:
+        return (s.replace("\\", "\\\\").replace("\t", "\\t")
+                .replace("\n", "\\n").replace("\r", "\\r"))
+    return "\t".join(["v1", str(ts), esc(name), state, esc(decision), esc(run_uuid), esc(evidence)])
+
+
+def test_parse_spool_line_round_trips_escapes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("FLUX_RUN_UUID", raising=False)
+    evidence = 'tab\there "quote" back\\slash\nnewline'
+    step = v.parse_spool_line(
+        _spool_line("calibration-passthrough", "VERIFIED", evidence,
+                    decision="passthrough", run_uuid="run-7", ts=42)
+    )
+    assert step.evidence == evidence
+    assert step.decision_type == "passthrough"
+    assert step.run_uuid == "run-7"
+    assert step.timestamp_ms == 42
+
+
+def test_parse_spool_line_rejects_malformed() -> None:
+    with pytest.raises(ValueError):
+        v.parse_spool_line("v1\tnot-enough-fields")
+    with pytest.raises(ValueError):
+        v.parse_spool_line(_spool_line("x", "MAYBE", "ev"))
+
+
+def test_drain_is_incremental_and_skips_partial_tail(tmp_path: Path) -> None:
+    log = tmp_path / "shadow.jsonl"
+    spool = Path(v.spool_path_for(str(log)))
+    spool.write_text(_spool_line("a", "VERIFIED", "1") + "\n" + _spool_line("b", "UNVERIFIABLE", "2"))
+
+    assert v.drain_spool(str(log)) == 1  # "b" has no newline yet
+    with spool.open("a") as f:
+        f.write("\n" + _spool_line("c", "FAILED_VERIFICATION", "3") + "\n")
+    assert v.drain_spool(str(log)) == 2
+    assert v.drain_spool(str(log)) == 0
+
+    names = [json.loads(line)["name"] for line in log.read_text().splitlines()]
+    assert names == ["a", "b", "c"]
+
+
+def test_write_batch_chunks_below_pipe_buf(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    sizes: list[int] = []
+    real_write = v.os.write
+    monkeypatch.setattr(v.os, "write", lambda fd, data: sizes.append(len(data)) or real_write(fd, data))
+    lines = [v.VerificationStep.verified(f"s{i}", "x" * 300).to_jsonl_line() for i in range(40)]
+    v._write_batch(str(tmp_path / "log.jsonl"), lines)
+    assert len(sizes) > 1
+    assert all(size < v._PIPE_BUF for size in sizes)
+    assert len((tmp_path / "log.jsonl").read_text().splitlines()) == 40
+
+
+def test_cli_collect_drains_and_exits_when_idle(tmp_path: Path) -> None:
+    log = tmp_path / "shadow.jsonl"
+    spool = Path(v.spool_path_for(str(log)))
+    spool.write_text(_spool_line("x", "VERIFIED", "ev", run_uuid="from-spool") + "\n")
+    result = _run_cli("collect", "--log-path", str(log), "--interval", "0.01", "--idle-exit", "0.05")
+    assert result.returncode == 0
+    parsed = json.loads(log.read_text().strip())
+    assert parsed["name"] == "x"
+    assert parsed["run_uuid"] == "from-spool"
+    assert not Path(str(spool) + ".pid").exists()